@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+🏁 RADIOX API GATEWAY PROXY BENCHMARK
+Measures what the gateway adds per request. A local upstream stands in for
+the services (small JSON, a large show listing, an MP3 upload/download, an
+SSE show stream); each endpoint is called directly, through the gateway
+(services/api-gateway, pooled streaming proxy) and through a replica of the
+previous forwarding (new client per request, body .json()-decoded and
+re-encoded).
+
+Reports p50/p95 per path, the latency the gateway adds end to end (gateway
+minus direct, client-measured through the last body byte - the number that
+matters) and the gateway's own /proxy timings (time to headers only).
+
+Usage:
+    python benchmarks/bench_gateway_proxy.py [--requests 300] [--concurrency 10]
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from loguru import logger
+
+from config.reverse_proxy import _percentile
+from standins import StandinServer
+
+UPSTREAM_PORT = 9141
+GATEWAY_PORT = 9142
+LEGACY_PORT = 9143
+
+SHOWS = [{"session_id": f"show-{i}", "title": f"Zürich am Morgen {i}", "script": "[MARCEL] Guten Morgen. " * 40,
+          "created_at": "2026-01-01T06:00:00"} for i in range(400)]
+AUDIO = bytes(range(256)) * 8192   # 2 MB
+
+
+def create_upstream_app() -> FastAPI:
+    app = FastAPI(title="Gateway benchmark upstream")
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.get("/speakers")
+    async def speakers():
+        return {"speakers": [{"name": "marcel"}, {"name": "jarvis"}]}
+
+    @app.get("/shows")
+    async def shows(limit: int = 10):
+        return {"shows": SHOWS[:limit], "next_cursor": None}
+
+    @app.post("/script")
+    async def script(request: Request):
+        size = len(await request.body())
+        return StreamingResponse(iter([AUDIO]), media_type="audio/mpeg", headers={"X-Request-Bytes": str(size)})
+
+    @app.post("/generate/stream")
+    async def generate_stream():
+        async def events():
+            for i in range(20):
+                yield f"event: token\ndata: {json.dumps({'text': f'Wort {i} '})}\n\n"
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+def create_legacy_app(upstream: str) -> FastAPI:
+    """The previous gateway forwarding - client per request, JSON decoded and re-encoded"""
+    app = FastAPI(title="Legacy forwarding")
+
+    @app.get("/speakers")
+    async def speakers():
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            response = await client.get(f"{upstream}/speakers")
+            return response.json()
+
+    @app.get("/shows")
+    async def shows(limit: int = 10):
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            response = await client.get(f"{upstream}/shows", params={"limit": limit})
+            return response.json()
+
+    @app.post("/audio/script")
+    async def script(request: Dict[str, Any]):
+        async with httpx.AsyncClient(timeout=300.0) as client:
+            response = await client.post(f"{upstream}/script", json=request)
+            if response.status_code != 200:
+                raise HTTPException(status_code=response.status_code, detail=response.text)
+            return {"bytes": len(response.content)}
+
+    return app
+
+
+def load_gateway(upstream: str):
+    spec = importlib.util.spec_from_file_location("api_gateway", ROOT / "services" / "api-gateway" / "main.py")
+    gateway = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(gateway)
+    for name in gateway.HARDCODED_SERVICES:
+        gateway.HARDCODED_SERVICES[name] = upstream
+    gateway.HARDCODED_SERVICES["data"] = upstream
+    return gateway
+
+
+CASES = {
+    # name: (method, gateway path, direct path, body)
+    "speakers": ("GET", "/speakers", "/speakers", None),
+    "shows_400": ("GET", "/shows?limit=400", "/shows?limit=400", None),
+    "audio_2mb": ("POST", "/audio/script", "/script", {"script": "[MARCEL] Hallo " * 200}),
+    "sse_stream": ("POST", "/shows/generate/stream", "/generate/stream", {"preset_name": "zurich"}),
+}
+
+
+async def measure(base: str, path: str, method: str, body, requests: int, concurrency: int) -> Dict[str, float]:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    samples: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(base_url=base, timeout=60.0, limits=limits) as client:
+        async def one():
+            async with semaphore:
+                start = time.perf_counter()
+                async with client.stream(method, path, json=body) as response:
+                    async for _ in response.aiter_raw():
+                        pass
+                    if response.status_code != 200:
+                        raise RuntimeError(f"{base}{path}: HTTP {response.status_code}")
+                samples.append((time.perf_counter() - start) * 1000)
+
+        await asyncio.gather(*(one() for _ in range(requests)))
+    return {"p50_ms": round(_percentile(samples, 50), 2), "p95_ms": round(_percentile(samples, 95), 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RadioX API gateway proxy benchmark")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+    logger.remove()
+
+    upstream = StandinServer("upstream", create_upstream_app(), UPSTREAM_PORT)
+    upstream.start()
+    os.environ.setdefault("HEALTH_PROBE_INTERVAL", "3600")
+    gateway_module = load_gateway(upstream.url)
+    servers = [StandinServer("gateway", gateway_module.app, GATEWAY_PORT),
+               StandinServer("legacy", create_legacy_app(upstream.url), LEGACY_PORT)]
+    for server in servers:
+        server.start()
+    gateway, legacy = servers
+
+    async def run() -> Dict[str, Any]:
+        results = {}
+        for name, (method, gateway_path, direct_path, body) in CASES.items():
+            row = {
+                "direct": await measure(upstream.url, direct_path, method, body, args.requests, args.concurrency),
+                "gateway": await measure(gateway.url, gateway_path, method, body, args.requests, args.concurrency),
+            }
+            if name != "sse_stream":
+                row["legacy"] = await measure(legacy.url, gateway_path, method, body, args.requests, args.concurrency)
+            results[name] = row
+        async with httpx.AsyncClient() as client:
+            results["proxy"] = (await client.get(f"{gateway.url}/proxy")).json()
+        return results
+
+    try:
+        results = asyncio.run(run())
+    finally:
+        for server in servers + [upstream]:
+            server.stop()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"🏁 {args.requests} requests per path, concurrency {args.concurrency}")
+    for name, row in results.items():
+        if name == "proxy":
+            continue
+        print(f"   {name:<11} " + "   ".join(
+            f"{path} p50 {values['p50_ms']:>7.2f} / p95 {values['p95_ms']:>7.2f} ms" for path, values in row.items()))
+    print("   added latency through the gateway (gateway - direct, full response):")
+    for name, row in results.items():
+        if name == "proxy":
+            continue
+        print(f"   {name:<11} p50 +{row['gateway']['p50_ms'] - row['direct']['p50_ms']:.2f} ms, "
+              f"p95 +{row['gateway']['p95_ms'] - row['direct']['p95_ms']:.2f} ms")
+    for service, stats in results["proxy"]["upstreams"].items():
+        overhead = stats["headers_overhead_ms"]
+        print(f"   /proxy {service}: time-to-headers overhead p50 {overhead['p50']:.3f} ms, "
+              f"p95 {overhead['p95']:.3f} ms (excludes body); total in gateway p50 {stats['total_ms']['p50']:.1f} ms "
+              f"over {stats['requests']} requests")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+🏁 RADIOX LLM HEDGING BENCHMARK
+Runs chat completions through config.llm_client against two OpenAI stand-ins
+with a latency tail (a share of responses delayed by --tail-ms) and compares:
+
+- single     one route, no hedging (the pre-client behaviour)
+- hedged     one route, second request after --hedge-ms (hedge_same_route - for
+             non-streamed calls the duplicate is booked at prompt + max_tokens)
+- multi      two routes (the second one slower but tail-free), hedged
+
+Reports p50/p95/max latency, upstream requests per call and cost per call.
+
+Usage:
+    python benchmarks/bench_llm_hedging.py
+    python benchmarks/bench_llm_hedging.py --calls 200 --tail-probability 0.1 --tail-ms 3000 --stream
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from loguru import logger
+
+from config.llm_client import LLMClient, LLMRoute, _percentile
+from standins import StandinConfig, StandinServer, create_openai_app
+
+PAYLOAD = {
+    "messages": [
+        {"role": "system", "content": "Du bist ein professioneller Schweizer Radio-Redakteur."},
+        {"role": "user", "content": "VERFÜGBARE NACHRICHTEN:\n" + "\n".join(
+            f"{i}. Zürich Meldung {i} - Kurzbeschreibung der Nachricht" for i in range(1, 16))},
+    ],
+    "max_tokens": 50,
+    "temperature": 0.3,
+}
+
+
+async def run(client: LLMClient, calls: int, concurrency: int, stream: bool) -> Dict[str, Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    requests = 0
+    cost = 0.0
+
+    async def one():
+        nonlocal requests, cost
+        async with semaphore:
+            if stream:
+                llm_stream = client.stream_chat(PAYLOAD, timeout=30)
+                async for _ in llm_stream:
+                    pass
+                call = llm_stream.call
+            else:
+                call = (await client.chat(PAYLOAD, timeout=30)).call
+            latencies.append(call.latency_ms)
+            requests += len(call.attempts)
+
+    await asyncio.gather(*(one() for _ in range(calls)))
+    summary = client.summary()
+    return {
+        "p50_ms": round(_percentile(latencies, 50), 1),
+        "p95_ms": round(_percentile(latencies, 95), 1),
+        "max_ms": round(max(latencies), 1),
+        "requests_per_call": round(requests / calls, 2),
+        "hedges": summary["hedges"],
+        "hedge_wins": summary["hedge_wins"],
+        "cost_per_call_usd": round(summary["cost_usd"] / calls, 6),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RadioX LLM hedging benchmark")
+    parser.add_argument("--calls", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--tail-probability", type=float, default=0.1)
+    parser.add_argument("--tail-ms", type=float, default=3000.0)
+    parser.add_argument("--hedge-ms", type=float, default=800.0, help="Hedge delay (single route / multi)")
+    parser.add_argument("--stream", action="store_true", help="Streamed completions (hedged on first token)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+    logger.remove()
+
+    tailed = StandinConfig(openai_latency_ms=args.latency_ms, openai_tokens_per_second=400,
+                           openai_tail_probability=args.tail_probability, openai_tail_ms=args.tail_ms)
+    steady = StandinConfig(openai_latency_ms=args.latency_ms * 1.5, openai_tokens_per_second=400, seed=7)
+    servers = [StandinServer("openai-a", create_openai_app(tailed), 9111),
+               StandinServer("openai-b", create_openai_app(steady), 9112)]
+    for server in servers:
+        server.start()
+
+    primary = LLMRoute("primary", f"{servers[0].url}/v1", "gpt-4", api_key="sk-bench-openai")
+    secondary = LLMRoute("secondary", f"{servers[1].url}/v1", "gpt-4o", api_key="sk-bench-openai")
+    hedge = args.hedge_ms / 1000
+    clients = {
+        "single": LLMClient("single", [primary], max_hedges=0),
+        "hedged": LLMClient("hedged", [primary], hedge_after=hedge, hedge_same_route=True),
+        "multi": LLMClient("multi", [primary, secondary], hedge_after=hedge),
+    }
+
+    try:
+        results = {name: asyncio.run(run(client, args.calls, args.concurrency, args.stream))
+                   for name, client in clients.items()}
+    finally:
+        for server in servers:
+            server.stop()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"🏁 {args.calls} calls, {args.tail_probability:.0%} delayed by {args.tail_ms:.0f} ms, "
+          f"hedge after {args.hedge_ms:.0f} ms{' (streamed)' if args.stream else ''}")
+    for name, result in results.items():
+        print(f"   {name:<7} p50 {result['p50_ms']:>7.1f} ms   p95 {result['p95_ms']:>7.1f} ms   "
+              f"max {result['max_ms']:>7.1f} ms   {result['requests_per_call']:.2f} req/call   "
+              f"${result['cost_per_call_usd']:.6f}/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+🏁 RADIOX PRONUNCIATION LEXICON MICRO-BENCHMARK
+Compares the compiled Aho-Corasick lexicon with a chained str.replace loop
+(the legacy _enhance_text_for_speech approach) as the lexicon grows.
+
+Segments are the spoken texts of the saved *-show.txt scripts in the repo root.
+
+Usage:
+    python benchmarks/bench_pronunciation_lexicon.py [--iterations 20]
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+
+from config.pronunciation_lexicon import DEFAULT_LEXICONS, PronunciationAutomaton
+from config.script_tokenizer import tokenize_script
+
+LEXICON_SIZES = [3, 100, 1000, 5000]
+
+
+def build_lexicon(size: int, seed: int = 42) -> Dict[str, str]:
+    """Built-in German entries padded with synthetic brand names / acronyms"""
+    rng = random.Random(seed)
+    lexicon = dict(DEFAULT_LEXICONS[("de", None)])
+    while len(lexicon) < size:
+        length = rng.randint(3, 10)
+        word = rng.choice(string.ascii_uppercase) + "".join(rng.choices(string.ascii_lowercase, k=length))
+        lexicon[word] = " ".join(word)
+    return lexicon
+
+
+def chained_replace(text: str, lexicon: Dict[str, str]) -> str:
+    for pattern, replacement in lexicon.items():
+        text = text.replace(pattern, replacement)
+    return text
+
+
+def time_per_segment(func, segments: List[str], iterations: int) -> float:
+    """Return microseconds per segment"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for segment in segments:
+            func(segment)
+    elapsed = time.perf_counter() - start
+    return elapsed / (iterations * len(segments)) * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RadioX pronunciation lexicon micro-benchmark")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    files = sorted(ROOT.glob("*-show.txt"))
+    if not files:
+        print("❌ No *-show.txt scripts found in repo root")
+        return
+
+    segments = [
+        segment.text
+        for f in files
+        for segment in tokenize_script(f.read_text(encoding="utf-8"))
+    ]
+    mean_chars = sum(len(s) for s in segments) / len(segments)
+
+    print(f"📄 {len(segments)} segments, {mean_chars:.0f} characters mean, {args.iterations} iterations")
+    print()
+    print(f"   {'entries':>8s} {'build ms':>10s} {'automaton µs/seg':>18s} {'str.replace µs/seg':>20s}")
+
+    for size in LEXICON_SIZES:
+        lexicon = build_lexicon(size)
+
+        start = time.perf_counter()
+        automaton = PronunciationAutomaton(lexicon)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        automaton_us = time_per_segment(automaton.apply, segments, args.iterations)
+        replace_us = time_per_segment(lambda text: chained_replace(text, lexicon), segments, args.iterations)
+        print(f"   {size:8d} {build_ms:10.1f} {automaton_us:18.1f} {replace_us:20.1f}")
+
+
+if __name__ == "__main__":
+    main()
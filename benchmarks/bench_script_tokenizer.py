@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+🏁 RADIOX SCRIPT TOKENIZER MICRO-BENCHMARK
+Compares the shared single-pass tokenizer with the legacy show-service and
+audio-service parsers over the saved *-show.txt scripts in the repo root.
+
+Usage:
+    python benchmarks/bench_script_tokenizer.py [--iterations 2000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+
+from config.script_tokenizer import ScriptTokenizer, tokenize_script
+
+
+def legacy_show_service_parse(script: str) -> List[Dict[str, Any]]:
+    """Pre-tokenizer show-service path: chained tag replaces + line parser"""
+    script = script.replace("[Marcel]", "[MARCEL]")
+    script = script.replace("[marcel]", "[MARCEL]")
+    script = script.replace("[Jarvis]", "[JARVIS]")
+    script = script.replace("[jarvis]", "[JARVIS]")
+    if not script.startswith("[MARCEL]") and not script.startswith("[JARVIS]"):
+        script = "[MARCEL] " + script
+    script = script.strip()
+
+    segments = []
+    current_speaker = None
+    current_text = ""
+    for line in script.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith('[MARCEL]') or line.startswith('[JARVIS]'):
+            if current_speaker and current_text:
+                segments.append({"speaker": current_speaker, "text": current_text.strip()})
+            current_speaker = line[1:7].lower()
+            current_text = line[8:].strip()
+        else:
+            current_text += " " + line
+    if current_speaker and current_text:
+        segments.append({"speaker": current_speaker, "text": current_text.strip()})
+    return segments
+
+
+def legacy_audio_service_parse(script: str) -> List[Dict[str, Any]]:
+    """Pre-tokenizer audio-service path: "SPEAKER: text" split per line"""
+    mappings = {"marcel": "marcel", "jarvis": "jarvis", "brad": "brad", "lucy": "lucy"}
+    segments = []
+    for line in script.strip().split('\n'):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if ':' in line:
+            speaker_raw, text = (part.strip() for part in line.split(':', 1))
+            if text:
+                lower = speaker_raw.lower()
+                speaker = mappings.get(lower) or next((v for k, v in mappings.items() if k in lower), "marcel")
+                segments.append({"speaker": speaker, "text": text})
+        else:
+            segments.append({"speaker": "marcel", "text": line})
+    return segments
+
+
+def time_it(func, scripts: List[str], iterations: int) -> float:
+    """Return microseconds per script"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for script in scripts:
+            func(script)
+    elapsed = time.perf_counter() - start
+    return elapsed / (iterations * len(scripts)) * 1_000_000
+
+
+def streamed(script: str, chunk_size: int = 16):
+    """Feed the script in small chunks like a streaming GPT response"""
+    tokenizer = ScriptTokenizer()
+    segments = []
+    for i in range(0, len(script), chunk_size):
+        segments.extend(tokenizer.feed(script[i:i + chunk_size]))
+    segments.extend(tokenizer.close())
+    return segments
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RadioX script tokenizer micro-benchmark")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    files = sorted(ROOT.glob("*-show.txt"))
+    if not files:
+        print("❌ No *-show.txt scripts found in repo root")
+        return
+
+    scripts = [f.read_text(encoding="utf-8") for f in files]
+    total_chars = sum(len(s) for s in scripts)
+
+    print(f"📄 {len(scripts)} scripts, {total_chars} characters, {args.iterations} iterations")
+    print()
+
+    for name, script in zip(files, scripts):
+        new = tokenize_script(script)
+        old_show = legacy_show_service_parse(script)
+        old_audio = legacy_audio_service_parse(script)
+        print(f"   {name.name:45s} tokenizer={len(new):3d}  legacy_show={len(old_show):3d}  legacy_audio={len(old_audio):3d} segments")
+    print()
+
+    parsers = {
+        "legacy show-service (replace + parse)": (legacy_show_service_parse, args.iterations),
+        "legacy audio-service (split on ':')": (legacy_audio_service_parse, args.iterations),
+        "shared tokenizer (tokenize)": (tokenize_script, args.iterations),
+        "shared tokenizer (16-char stream)": (streamed, max(1, args.iterations // 4)),
+    }
+
+    print("⏱️ Mean cost per script / per recognised segment:")
+    for name, (func, iterations) in parsers.items():
+        micros = time_it(func, scripts, iterations)
+        segments = sum(len(func(script)) for script in scripts) / len(scripts)
+        print(f"   {name:40s} {micros:8.1f} µs  {micros / max(segments, 1):6.2f} µs/segment")
+
+
+if __name__ == "__main__":
+    main()
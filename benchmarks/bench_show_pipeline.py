@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+🏁 RADIOX END-TO-END SHOW PIPELINE BENCHMARK
+Drives the full path through the API Gateway - collect → script → TTS →
+combine → upload - against local stand-ins for OpenAI, ElevenLabs, Supabase and
+the RSS / weather / bitcoin sources (benchmarks/standins.py), so results are
+reproducible offline and comparable between commits.
+
+Reports p50/p95 per stage (stage_timings_ms of the show and audio services) and
+end-to-end, per show length. --max-p95 turns it into a CI regression gate.
+
+Requirements: Redis on localhost:6379 and ffmpeg on PATH (audio combine).
+
+Usage:
+    python benchmarks/bench_show_pipeline.py --start-services
+    python benchmarks/bench_show_pipeline.py --lengths 1 3 --iterations 5 --json
+    python benchmarks/bench_show_pipeline.py --start-services --max-p95 total=20000 tts=8000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from standins import Standins, StandinConfig
+
+GATEWAY_URL = "http://localhost:8000"
+
+# Services on the gateway show path (name, port) - started in this order
+PIPELINE_SERVICES = [
+    ("key-service", 8002),
+    ("database-service", 8001),
+    ("data-collector-service", 8004),
+    ("audio-service", 8007),
+    ("show-service", 8008),
+    ("api-gateway", 8000),
+]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def wait_for_health(url: str, timeout: float) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{url}/health/live", timeout=2).status_code == 200 or \
+               httpx.get(f"{url}/health", timeout=2).status_code == 200:
+                return True
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    return False
+
+
+def start_services(env: Dict[str, str], log_dir: Path) -> List[subprocess.Popen]:
+    """Launch the pipeline services as subprocesses pointed at the stand-ins"""
+    log_dir.mkdir(parents=True, exist_ok=True)
+    service_env = {
+        **os.environ,
+        **env,
+        "REDIS_URL": os.getenv("REDIS_URL", "redis://localhost:6379"),
+        "DATABASE_SERVICE_URL": "http://localhost:8001",
+        "DATA_COLLECTOR_SERVICE_URL": "http://localhost:8004",
+        "AUDIO_SERVICE_URL": "http://localhost:8007",
+        "KEY_SERVICE_URL": "http://localhost:8002",
+        "ELEVENLABS_API_KEY": "bench-elevenlabs",
+    }
+
+    processes = []
+    for name, port in PIPELINE_SERVICES:
+        log = open(log_dir / f"{name}.log", "w")
+        processes.append(subprocess.Popen(
+            [sys.executable, "main.py"],
+            cwd=ROOT / "services" / name,
+            env=service_env,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        ))
+        if not wait_for_health(f"http://localhost:{port}", timeout=60):
+            stop_services(processes)
+            raise RuntimeError(f"{name} did not become healthy - see {log_dir / (name + '.log')}")
+        print(f"   ✅ {name} on :{port}")
+    return processes
+
+
+def stop_services(processes: List[subprocess.Popen]):
+    for process in reversed(processes):
+        process.terminate()
+    for process in processes:
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def run_once(client: httpx.Client, minutes: int) -> Dict[str, float]:
+    """One full show: script via /shows/generate, then audio via /audio/script"""
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+
+    response = client.post(f"{GATEWAY_URL}/shows/generate", json={
+        "duration_minutes": minutes,
+        "generate_audio": False,
+    })
+    response.raise_for_status()
+    show = response.json()
+    timings["show_total"] = (time.perf_counter() - start) * 1000
+    for stage, ms in (show.get("metadata", {}).get("stage_timings_ms") or {}).items():
+        timings[f"show.{stage}"] = ms
+
+    audio_start = time.perf_counter()
+    response = client.post(f"{GATEWAY_URL}/audio/script", json={
+        "session_id": show.get("session_id"),
+        "script_content": show.get("script_content", ""),
+        "language": "de",
+    })
+    response.raise_for_status()
+    audio = response.json()
+    timings["audio_total"] = (time.perf_counter() - audio_start) * 1000
+    for stage, ms in (audio.get("stage_timings_ms") or {}).items():
+        timings[f"audio.{stage}"] = ms
+
+    timings["total"] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+def summarize(samples: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    stages = sorted({stage for sample in samples for stage in sample})
+    summary = {}
+    for stage in stages:
+        values = [sample[stage] for sample in samples if stage in sample]
+        summary[stage] = {
+            "p50": round(statistics.median(values), 1),
+            "p95": round(percentile(values, 95), 1),
+            "n": len(values),
+        }
+    return summary
+
+
+def parse_thresholds(items: Optional[List[str]]) -> Dict[str, float]:
+    """"total=20000 audio.tts=8000" -> {"total": 20000.0, "audio.tts": 8000.0}"""
+    thresholds = {}
+    for item in items or []:
+        stage, _, value = item.partition("=")
+        thresholds[stage] = float(value)
+    return thresholds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RadioX end-to-end show pipeline benchmark")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[1, 3, 5], help="Show lengths in minutes")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--start-services", action="store_true", help="Launch the pipeline services locally")
+    parser.add_argument("--log-dir", default="/tmp/radiox-bench", help="Service logs with --start-services")
+    parser.add_argument("--openai-latency-ms", type=float, default=StandinConfig.openai_latency_ms)
+    parser.add_argument("--tts-latency-ms", type=float, default=StandinConfig.tts_latency_ms)
+    parser.add_argument("--tts-realtime-factor", type=float, default=StandinConfig.tts_realtime_factor)
+    parser.add_argument("--max-p95", nargs="*", metavar="STAGE=MS", help="Fail if a stage p95 exceeds MS")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    thresholds = parse_thresholds(args.max_p95)
+    standins = Standins(StandinConfig(
+        openai_latency_ms=args.openai_latency_ms,
+        tts_latency_ms=args.tts_latency_ms,
+        tts_realtime_factor=args.tts_realtime_factor,
+    )).start()
+    processes: List[subprocess.Popen] = []
+
+    try:
+        if args.start_services:
+            print("🚀 Starting pipeline services against stand-ins...")
+            processes = start_services(standins.env(), Path(args.log_dir))
+        elif not wait_for_health(GATEWAY_URL, timeout=5):
+            print("❌ API Gateway not reachable - start the services with the stand-in env or use --start-services")
+            print("   " + " ".join(f"{k}={v}" for k, v in standins.env().items()))
+            sys.exit(2)
+
+        results = {}
+        with httpx.Client(timeout=600) as client:
+            for minutes in args.lengths:
+                for _ in range(args.warmup):
+                    run_once(client, minutes)
+                samples = [run_once(client, minutes) for _ in range(args.iterations)]
+                results[f"{minutes}min"] = summarize(samples)
+    finally:
+        stop_services(processes)
+        standins.stop()
+
+    failures = [
+        f"{length} {stage} p95 {stats[stage]['p95']:.0f}ms > {limit:.0f}ms"
+        for length, stats in results.items()
+        for stage, limit in thresholds.items()
+        if stage in stats and stats[stage]["p95"] > limit
+    ]
+
+    if args.json:
+        print(json.dumps({"results": results, "thresholds": thresholds, "failures": failures}, indent=2))
+    else:
+        for length, stats in results.items():
+            print(f"\n📻 {length} show ({args.iterations} iterations)")
+            print(f"   {'stage':<20s} {'p50 ms':>10s} {'p95 ms':>10s}")
+            for stage, values in stats.items():
+                print(f"   {stage:<20s} {values['p50']:10.1f} {values['p95']:10.1f}")
+        for failure in failures:
+            print(f"❌ {failure}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+⏱️ RADIOX DEADLINE LADDER CHECK
+Validates deadline-aware show generation against deliberately slow stand-in
+upstreams (slow OpenAI token rate, slow RSS / weather / bitcoin fixtures).
+
+Scenarios (each a POST /shows/generate through the API Gateway):
+- relaxed   deadline far away         -> no degradations, deadline met
+- tight     deadline below full cost  -> shorter script / fewer articles, deadline met
+- hopeless  deadline in ~2 seconds    -> whole ladder incl. cached content, reported honestly
+
+A few warm-up shows run first so the show service's stage latency model has
+seen the slow upstreams (and a content snapshot exists for cached_content).
+Exit code 1 if an expectation fails.
+
+Requirements: Redis on localhost:6379 (same as the pipeline benchmark).
+
+Usage:
+    python benchmarks/check_deadline_ladder.py --start-services
+    python benchmarks/check_deadline_ladder.py --start-services --openai-tokens-per-second 20 --json
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from bench_show_pipeline import GATEWAY_URL, start_services, stop_services, wait_for_health
+from standins import Standins, StandinConfig
+
+
+def generate(client: httpx.Client, minutes: int, deadline_in: float) -> Dict[str, Any]:
+    started = time.time()
+    response = client.post(f"{GATEWAY_URL}/shows/generate", json={
+        "duration_minutes": minutes,
+        "generate_audio": False,
+        "deadline": datetime.fromtimestamp(started + deadline_in).isoformat(),
+    })
+    response.raise_for_status()
+    metadata = response.json().get("metadata", {})
+    return {
+        "deadline_in_s": deadline_in,
+        "elapsed_s": round(time.time() - started, 2),
+        "degradations": metadata.get("degradations", []),
+        "deadline_met": metadata.get("deadline_met"),
+        "news_count": metadata.get("news_count"),
+        "stage_timings_ms": metadata.get("stage_timings_ms", {}),
+    }
+
+
+def check(name: str, result: Dict[str, Any], expectations: List[tuple]) -> List[str]:
+    return [f"{name}: {message}" for ok, message in expectations if not ok]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RadioX deadline ladder check (slow stand-in upstreams)")
+    parser.add_argument("--start-services", action="store_true", help="Launch the pipeline services locally")
+    parser.add_argument("--log-dir", default="/tmp/radiox-deadline", help="Service logs with --start-services")
+    parser.add_argument("--minutes", type=int, default=5, help="Requested show length")
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--openai-latency-ms", type=float, default=1500.0)
+    parser.add_argument("--openai-tokens-per-second", type=float, default=25.0)
+    parser.add_argument("--fixtures-latency-ms", type=float, default=800.0)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    standins = Standins(StandinConfig(
+        openai_latency_ms=args.openai_latency_ms,
+        openai_tokens_per_second=args.openai_tokens_per_second,
+        fixtures_latency_ms=args.fixtures_latency_ms,
+    )).start()
+    processes = []
+
+    try:
+        if args.start_services:
+            print("🚀 Starting pipeline services against slow stand-ins...")
+            processes = start_services(standins.env(), Path(args.log_dir))
+        elif not wait_for_health(GATEWAY_URL, timeout=5):
+            print("❌ API Gateway not reachable - start the services with the stand-in env or use --start-services")
+            sys.exit(2)
+
+        with httpx.Client(timeout=600) as client:
+            for _ in range(args.warmup):
+                generate(client, args.minutes, deadline_in=3600)
+
+            relaxed = generate(client, args.minutes, deadline_in=3600)
+            full_cost = relaxed["elapsed_s"]
+            tight = generate(client, args.minutes, deadline_in=max(3.0, full_cost * 0.5))
+            hopeless = generate(client, args.minutes, deadline_in=2.0)
+    finally:
+        stop_services(processes)
+        standins.stop()
+
+    results = {"relaxed": relaxed, "tight": tight, "hopeless": hopeless}
+    failures = (
+        check("relaxed", relaxed, [
+            (not relaxed["degradations"], f"unexpected degradations {relaxed['degradations']}"),
+            (relaxed["deadline_met"] is True, "deadline missed"),
+        ])
+        + check("tight", tight, [
+            (bool(tight["degradations"]), "no degradation applied"),
+            (tight["deadline_met"] is True, f"deadline missed ({tight['elapsed_s']}s > {tight['deadline_in_s']:.1f}s)"),
+        ])
+        + check("hopeless", hopeless, [
+            ("cached_content" in hopeless["degradations"], f"ladder not exhausted: {hopeless['degradations']}"),
+        ])
+    )
+
+    if args.json:
+        print(json.dumps({"results": results, "failures": failures}, indent=2))
+    else:
+        for name, result in results.items():
+            status = "✅" if result["deadline_met"] else "⏰"
+            print(f"{status} {name:<9s} deadline {result['deadline_in_s']:6.1f}s  took {result['elapsed_s']:6.2f}s  "
+                  f"degradations: {', '.join(result['degradations']) or '-'}")
+        for failure in failures:
+            print(f"❌ {failure}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
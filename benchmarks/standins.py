@@ -0,0 +1,618 @@
+#!/usr/bin/env python3
+"""
+🧪 RADIOX LOCAL STAND-INS
+Local replacements for every external dependency of the show pipeline, so the
+full collect → script → TTS → combine → upload path can be benchmarked offline.
+
+- OpenAI        POST /v1/chat/completions (configurable latency, latency tail, token rate, SSE streaming)
+- ElevenLabs    POST /v1/text-to-speech/{voice_id} (valid MP3 frames, duration ∝ text length)
+- Supabase      in-memory PostgREST (/rest/v1) + storage (/storage/v1) double, seeded from fixtures/seed.json
+- Fixtures      static RSS feeds (pubDates rebased to "now"), OpenWeather and CoinGecko responses
+
+Services are pointed at the stand-ins through environment variables (see standin_env()).
+
+Usage:
+    python benchmarks/standins.py                  # run all stand-ins until Ctrl+C
+    python benchmarks/standins.py --openai-latency-ms 800 --tts-realtime-factor 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import uvicorn
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+DEFAULT_PORTS = {
+    "openai": 9101,
+    "elevenlabs": 9102,
+    "supabase": 9103,
+    "fixtures": 9104,
+}
+
+# Stand-in keys must look like JWTs for supabase-py's key validation
+STANDIN_SUPABASE_KEY = "standin.anon.key"
+STANDIN_SUPABASE_SERVICE_KEY = "standin.service.key"
+
+
+@dataclass
+class StandinConfig:
+    """Latency model of the stand-ins"""
+    openai_latency_ms: float = 400.0       # time to first token
+    openai_tokens_per_second: float = 80.0
+    openai_tail_probability: float = 0.0   # share of completions delayed by openai_tail_ms (latency tail)
+    openai_tail_ms: float = 0.0
+    tts_latency_ms: float = 250.0          # time to first byte
+    tts_realtime_factor: float = 0.1       # synthesis time / audio duration
+    tts_chars_per_second: float = 15.0     # speaking rate of the generated audio
+    supabase_latency_ms: float = 5.0
+    fixtures_latency_ms: float = 0.0       # per RSS / weather / bitcoin response
+    seed: int = 42
+
+
+# ----------------------------------------------------------------------------
+# OpenAI
+# ----------------------------------------------------------------------------
+
+_WORDS = (
+    "heute zürich schweiz news wetter sonne regen bitcoin markt stadt velo tram limmat see "
+    "bundesrat budget bahn rekord forschung zentrum technologie zukunft musik kultur sport "
+    "meinung analyse prognose spannend interessant wichtig gleich danach zurück willkommen"
+).split()
+
+
+def _fake_script(prompt: str, rng: random.Random) -> str:
+    """Script of roughly the requested length ("Zieldauer: N Minuten", 150 words/minute)"""
+    match = re.search(r"Zieldauer:\s*(\d+)", prompt)
+    minutes = int(match.group(1)) if match else 3
+    target_words = minutes * 150
+
+    lines, words, speaker = [], 0, "MARCEL"
+    while words < target_words:
+        count = rng.randint(18, 45)
+        sentence = " ".join(rng.choice(_WORDS) for _ in range(count)).capitalize()
+        lines.append(f"[{speaker}] {sentence}.")
+        words += count
+        speaker = "JARVIS" if speaker == "MARCEL" else "MARCEL"
+    return "\n".join(lines)
+
+
+def _fake_selection(prompt: str, rng: random.Random) -> str:
+    """News curation answer - comma separated article numbers"""
+    available = [int(n) for n in re.findall(r"^(\d+)\.", prompt, re.MULTILINE)] or [1, 2, 3]
+    picked = sorted(rng.sample(available, min(len(available), rng.randint(3, 5))))
+    return ",".join(str(n) for n in picked)
+
+
+def create_openai_app(config: StandinConfig) -> FastAPI:
+    app = FastAPI(title="OpenAI stand-in")
+    rng = random.Random(config.seed)
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", []))
+        max_tokens = int(body.get("max_tokens") or 1000)
+
+        content = _fake_selection(prompt, rng) if max_tokens <= 100 else _fake_script(prompt, rng)
+        completion_tokens = max(1, int(len(content.split()) * 1.3))
+        prompt_tokens = max(1, int(len(prompt.split()) * 1.3))
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        model = body.get("model", "gpt-4o")
+
+        delay_ms = config.openai_latency_ms
+        if config.openai_tail_probability and rng.random() < config.openai_tail_probability:
+            delay_ms += config.openai_tail_ms
+        await asyncio.sleep(delay_ms / 1000)
+
+        if body.get("stream"):
+            async def events():
+                words = content.split(" ")
+                chunk_words = 4
+                delay = chunk_words * 1.3 / config.openai_tokens_per_second
+                for i in range(0, len(words), chunk_words):
+                    piece = " ".join(words[i:i + chunk_words]) + (" " if i + chunk_words < len(words) else "")
+                    chunk = {
+                        "id": completion_id, "object": "chat.completion.chunk", "model": model,
+                        "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}],
+                    }
+                    yield f"data: {json.dumps(chunk)}\n\n"
+                    await asyncio.sleep(delay)
+                final = {
+                    "id": completion_id, "object": "chat.completion.chunk", "model": model,
+                    "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                }
+                yield f"data: {json.dumps(final)}\n\n"
+                yield "data: [DONE]\n\n"
+
+            return StreamingResponse(events(), media_type="text/event-stream")
+
+        await asyncio.sleep(completion_tokens / config.openai_tokens_per_second)
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    return app
+
+
+# ----------------------------------------------------------------------------
+# ElevenLabs
+# ----------------------------------------------------------------------------
+
+# MPEG-1 Layer III, 32 kbps, 44.1 kHz, mono: 104-byte frames of 1152 samples
+_MP3_FRAME_HEADER = bytes([0xFF, 0xFB, 0x10, 0xC4])
+_MP3_FRAME_BYTES = 104
+_MP3_FRAME_SECONDS = 1152 / 44100
+_MP3_FRAME = _MP3_FRAME_HEADER + bytes(_MP3_FRAME_BYTES - len(_MP3_FRAME_HEADER))
+
+
+def silent_mp3(seconds: float) -> bytes:
+    """Valid (silent) MP3 stream of the given duration"""
+    return _MP3_FRAME * max(1, math.ceil(seconds / _MP3_FRAME_SECONDS))
+
+
+def create_elevenlabs_app(config: StandinConfig) -> FastAPI:
+    app = FastAPI(title="ElevenLabs stand-in")
+
+    @app.post("/v1/text-to-speech/{voice_id}")
+    async def text_to_speech(voice_id: str, request: Request):
+        body = await request.json()
+        text = body.get("text", "")
+        seconds = max(0.5, len(text) / config.tts_chars_per_second)
+
+        await asyncio.sleep(config.tts_latency_ms / 1000 + seconds * config.tts_realtime_factor)
+        return Response(content=silent_mp3(seconds), media_type="audio/mpeg")
+
+    @app.get("/v1/voices")
+    async def voices():
+        return {"voices": [{"voice_id": "bench-voice-marcel", "name": "Marcel"},
+                           {"voice_id": "bench-voice-jarvis", "name": "Jarvis"}]}
+
+    @app.get("/v1/models")
+    async def models():
+        return [{"model_id": "eleven_multilingual_v2"}, {"model_id": "eleven_turbo_v2_5"}]
+
+    return app
+
+
+# ----------------------------------------------------------------------------
+# Supabase (PostgREST + storage)
+# ----------------------------------------------------------------------------
+
+_RESERVED_PARAMS = {"select", "order", "limit", "offset", "or", "and", "on_conflict", "columns"}
+
+
+def _split_top_level(text: str) -> List[str]:
+    """Split "a,b(c,d),e" on commas outside parentheses / quotes"""
+    parts, depth, quoted, current = [], 0, False, []
+    for char in text:
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char == "(":
+            depth += 1
+        elif not quoted and char == ")":
+            depth -= 1
+        elif not quoted and char == "," and depth == 0:
+            parts.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    if current:
+        parts.append("".join(current))
+    return parts
+
+
+def _coerce(value: Any, raw: str) -> Any:
+    """Coerce a filter argument to the type of the stored value"""
+    raw = raw.strip('"')
+    if raw == "null":
+        return None
+    if isinstance(value, bool):
+        return raw.lower() == "true"
+    if isinstance(value, int):
+        try:
+            return int(raw)
+        except ValueError:
+            return raw
+    if isinstance(value, float):
+        try:
+            return float(raw)
+        except ValueError:
+            return raw
+    return raw
+
+
+def _matches(row: Dict[str, Any], column: str, expression: str) -> bool:
+    negate = expression.startswith("not.")
+    if negate:
+        expression = expression[4:]
+    operator, _, argument = expression.partition(".")
+    value = row.get(column)
+
+    if operator == "is":
+        result = (value is None) if argument == "null" else (value is (argument == "true"))
+    elif operator == "in":
+        options = [_coerce(value, item) for item in _split_top_level(argument.strip("()"))]
+        result = value in options
+    elif operator in ("like", "ilike"):
+        pattern = "^" + re.escape(argument).replace(r"\*", ".*").replace("%", ".*") + "$"
+        result = value is not None and re.match(pattern, str(value), re.IGNORECASE if operator == "ilike" else 0) is not None
+    else:
+        target = _coerce(value, argument)
+        if value is None or target is None:
+            result = operator == "eq" and value == target
+        else:
+            try:
+                result = {
+                    "eq": value == target, "neq": value != target,
+                    "gt": value > target, "gte": value >= target,
+                    "lt": value < target, "lte": value <= target,
+                }[operator]
+            except (KeyError, TypeError):
+                result = False
+    return not result if negate else result
+
+
+def _matches_logic(row: Dict[str, Any], expression: str, conjunction: str) -> bool:
+    """Evaluate an or=(...) / and=(...) group"""
+    results = []
+    for term in _split_top_level(expression.strip()[1:-1]):
+        if term.startswith(("and(", "or(")):
+            inner = term[term.index("("):]
+            results.append(_matches_logic(row, inner, term[:term.index("(")]))
+        else:
+            column, _, condition = term.partition(".")
+            results.append(_matches(row, column, condition))
+    return any(results) if conjunction == "or" else all(results)
+
+
+def _project(row: Dict[str, Any], select: str) -> Dict[str, Any]:
+    if not select or select == "*":
+        return dict(row)
+    projected = {}
+    for item in _split_top_level(select):
+        item = item.strip()
+        if item == "*":
+            projected.update(row)
+            continue
+        alias, _, path = item.partition(":") if ":" in item else (None, "", item)
+        steps = re.split(r"->>?", path)
+        value: Any = row.get(steps[0])
+        for step in steps[1:]:
+            if isinstance(value, str):
+                try:
+                    value = json.loads(value)
+                except json.JSONDecodeError:
+                    value = None
+            value = value.get(step) if isinstance(value, dict) else None
+        projected[alias or steps[-1]] = value
+    return projected
+
+
+class InMemoryPostgrest:
+    """Tiny PostgREST double - enough of the filter/order/range grammar for the RadioX services"""
+
+    def __init__(self, tables: Dict[str, List[Dict[str, Any]]]):
+        self.tables = tables
+        self.storage: Dict[str, bytes] = {}
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def _filter(self, table: str, params: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        rows = self.tables.setdefault(table, [])
+        for key, value in params:
+            if key in ("or", "and"):
+                rows = [row for row in rows if _matches_logic(row, value, key)]
+            elif key not in _RESERVED_PARAMS:
+                rows = [row for row in rows if _matches(row, key, value)]
+        return rows
+
+    @staticmethod
+    def _order(rows: List[Dict[str, Any]], order: Optional[str]) -> List[Dict[str, Any]]:
+        if not order:
+            return rows
+        for term in reversed(order.split(",")):
+            column, *modifiers = term.split(".")
+            descending = "desc" in modifiers
+            present = [row for row in rows if row.get(column) is not None]
+            missing = [row for row in rows if row.get(column) is None]
+            present.sort(key=lambda row: row[column], reverse=descending)
+            rows = present + missing
+        return rows
+
+    def select(self, table: str, params: List[Tuple[str, str]], range_header: Optional[str]) -> Tuple[List[Dict[str, Any]], int]:
+        query = dict(params)
+        rows = self._order(self._filter(table, params), query.get("order"))
+        total = len(rows)
+
+        offset = int(query.get("offset", 0))
+        limit = int(query["limit"]) if "limit" in query else None
+        if range_header and "-" in range_header:
+            start, end = range_header.split("-", 1)
+            offset, limit = int(start), int(end) - int(start) + 1
+        rows = rows[offset:offset + limit] if limit is not None else rows[offset:]
+
+        return [_project(row, query.get("select", "*")) for row in rows], total
+
+    def insert(self, table: str, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self.tables.setdefault(table, [])
+            next_id = max((row.get("id", 0) for row in rows if isinstance(row.get("id"), int)), default=0) + 1
+            inserted = []
+            for record in records:
+                row = dict(record)
+                if "id" not in row:
+                    row["id"] = next_id
+                    next_id += 1
+                row.setdefault("created_at", datetime.now(timezone.utc).isoformat())
+                rows.append(row)
+                inserted.append(row)
+            return inserted
+
+    def update(self, table: str, params: List[Tuple[str, str]], changes: Dict[str, Any]) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._filter(table, params)
+            for row in rows:
+                row.update(changes)
+            return rows
+
+    def delete(self, table: str, params: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        with self._lock:
+            doomed = self._filter(table, params)
+            ids = {id(row) for row in doomed}
+            self.tables[table] = [row for row in self.tables.get(table, []) if id(row) not in ids]
+            return doomed
+
+
+def load_seed(fixtures_url: str, seed_path: Path = FIXTURES_DIR / "seed.json") -> Dict[str, List[Dict[str, Any]]]:
+    """Load seed tables, pointing RSS feed URLs at the fixtures stand-in"""
+    raw = seed_path.read_text(encoding="utf-8").replace("{fixtures_url}", fixtures_url)
+    return json.loads(raw)
+
+
+def create_supabase_app(config: StandinConfig, database: InMemoryPostgrest) -> FastAPI:
+    app = FastAPI(title="Supabase stand-in")
+
+    def _response(rows: List[Dict[str, Any]], request: Request, total: Optional[int] = None, status: int = 200):
+        headers = {}
+        if total is not None and "count=" in request.headers.get("prefer", ""):
+            headers["Content-Range"] = f"0-{max(len(rows) - 1, 0)}/{total}"
+        if "vnd.pgrst.object" in request.headers.get("accept", ""):
+            if len(rows) != 1:
+                return JSONResponse(
+                    {"code": "PGRST116", "message": "JSON object requested, multiple (or no) rows returned",
+                     "details": f"The result contains {len(rows)} rows", "hint": None},
+                    status_code=406,
+                )
+            return JSONResponse(rows[0], status_code=status, headers=headers)
+        return JSONResponse(rows, status_code=status, headers=headers)
+
+    @app.api_route("/rest/v1/{table}", methods=["GET", "HEAD", "POST", "PATCH", "DELETE"])
+    async def rest(table: str, request: Request):
+        database.requests += 1
+        await asyncio.sleep(config.supabase_latency_ms / 1000)
+        params = list(request.query_params.multi_items())
+
+        if request.method in ("GET", "HEAD"):
+            rows, total = database.select(table, params, request.headers.get("range"))
+            return _response(rows, request, total)
+
+        if request.method == "POST":
+            body = await request.json()
+            inserted = database.insert(table, body if isinstance(body, list) else [body])
+            return _response(inserted, request, status=201)
+
+        if request.method == "PATCH":
+            return _response(database.update(table, params, await request.json()), request)
+
+        return _response(database.delete(table, params), request)
+
+    @app.post("/rest/v1/rpc/{function}")
+    async def rpc(function: str):
+        # No SQL engine behind the double - RPCs return an empty result set
+        database.requests += 1
+        return JSONResponse([])
+
+    @app.api_route("/storage/v1/object/{bucket}/{path:path}", methods=["POST", "PUT"])
+    async def upload(bucket: str, path: str, request: Request):
+        database.storage[f"{bucket}/{path}"] = await request.body()
+        return {"Key": f"{bucket}/{path}", "Id": str(uuid.uuid4())}
+
+    @app.get("/storage/v1/object/public/{bucket}/{path:path}")
+    async def download(bucket: str, path: str):
+        data = database.storage.get(f"{bucket}/{path}")
+        if data is None:
+            return JSONResponse({"statusCode": "404", "error": "not_found"}, status_code=404)
+        return Response(content=data, media_type="audio/mpeg")
+
+    @app.get("/storage/v1/object/{bucket}/{path:path}")
+    async def authenticated_download(bucket: str, path: str):
+        return await download(bucket, path)
+
+    @app.get("/standin/stats")
+    async def stats():
+        return {
+            "requests": database.requests,
+            "tables": {name: len(rows) for name, rows in database.tables.items()},
+            "storage_objects": len(database.storage),
+            "storage_bytes": sum(len(data) for data in database.storage.values()),
+        }
+
+    return app
+
+
+# ----------------------------------------------------------------------------
+# Static fixtures (RSS, weather, bitcoin)
+# ----------------------------------------------------------------------------
+
+_PUBDATE = re.compile(r"<pubDate>[^<]*</pubDate>")
+
+
+def create_fixtures_app(config: Optional[StandinConfig] = None) -> FastAPI:
+    app = FastAPI(title="Fixture stand-in")
+    latency = (config.fixtures_latency_ms if config else 0.0) / 1000
+
+    @app.middleware("http")
+    async def slow_upstream(request: Request, call_next):
+        if latency:
+            await asyncio.sleep(latency)
+        return await call_next(request)
+
+    @app.get("/rss/{name}")
+    async def rss(name: str):
+        path = FIXTURES_DIR / "rss" / Path(name).name
+        if not path.exists():
+            return Response(status_code=404)
+
+        # Rebase pubDates to "now" so the collector's 24h window keeps them
+        now = datetime.now(timezone.utc)
+        counter = iter(range(10_000))
+        body = _PUBDATE.sub(
+            lambda _: f"<pubDate>{format_datetime(now - timedelta(minutes=30 * next(counter)))}</pubDate>",
+            path.read_text(encoding="utf-8"),
+        )
+        return Response(content=body, media_type="application/rss+xml")
+
+    @app.get("/data/2.5/weather")
+    async def weather(q: str = "Zurich"):
+        return {
+            "name": q,
+            "main": {"temp": 21.4, "humidity": 58},
+            "weather": [{"description": "leicht bewölkt"}],
+            "wind": {"speed": 3.1},
+        }
+
+    @app.get("/api/v3/simple/price")
+    async def price():
+        return {"bitcoin": {
+            "usd": 61234.0, "eur": 56321.0, "chf": 54210.0,
+            "usd_24h_change": 2.4, "usd_market_cap": 1.2e12, "usd_24h_vol": 3.1e10,
+        }}
+
+    return app
+
+
+# ----------------------------------------------------------------------------
+# Runner
+# ----------------------------------------------------------------------------
+
+class StandinServer:
+    """Runs one stand-in app with uvicorn in a background thread"""
+
+    def __init__(self, name: str, app: FastAPI, port: int, host: str = "127.0.0.1"):
+        self.name = name
+        self.url = f"http://{host}:{port}"
+        self._server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+        self._thread = threading.Thread(target=self._server.run, name=f"standin-{name}", daemon=True)
+
+    def start(self, timeout: float = 10.0):
+        self._thread.start()
+        deadline = time.time() + timeout
+        while not self._server.started:
+            if time.time() > deadline or not self._thread.is_alive():
+                raise RuntimeError(f"Stand-in {self.name} failed to start on {self.url}")
+            time.sleep(0.02)
+
+    def stop(self):
+        self._server.should_exit = True
+        self._thread.join(timeout=5)
+
+
+class Standins:
+    """All stand-ins of the show pipeline"""
+
+    def __init__(self, config: Optional[StandinConfig] = None, ports: Optional[Dict[str, int]] = None):
+        self.config = config or StandinConfig()
+        self.ports = {**DEFAULT_PORTS, **(ports or {})}
+        fixtures_url = f"http://127.0.0.1:{self.ports['fixtures']}"
+        self.database = InMemoryPostgrest(load_seed(fixtures_url))
+        self.servers = {
+            "openai": StandinServer("openai", create_openai_app(self.config), self.ports["openai"]),
+            "elevenlabs": StandinServer("elevenlabs", create_elevenlabs_app(self.config), self.ports["elevenlabs"]),
+            "supabase": StandinServer("supabase", create_supabase_app(self.config, self.database), self.ports["supabase"]),
+            "fixtures": StandinServer("fixtures", create_fixtures_app(self.config), self.ports["fixtures"]),
+        }
+
+    def start(self) -> "Standins":
+        for server in self.servers.values():
+            server.start()
+        return self
+
+    def stop(self):
+        for server in self.servers.values():
+            server.stop()
+
+    def env(self) -> Dict[str, str]:
+        """Environment that points the services at the stand-ins"""
+        urls = {name: server.url for name, server in self.servers.items()}
+        return {
+            "OPENAI_API_KEY": "sk-bench-openai",
+            "OPENAI_BASE_URL": f"{urls['openai']}/v1",
+            "ELEVENLABS_BASE_URL": f"{urls['elevenlabs']}/v1",
+            "SUPABASE_URL": urls["supabase"],
+            "SUPABASE_ANON_KEY": STANDIN_SUPABASE_KEY,
+            "SUPABASE_SERVICE_KEY": STANDIN_SUPABASE_SERVICE_KEY,
+            "OPENWEATHER_BASE_URL": f"{urls['fixtures']}/data/2.5",
+            "COINGECKO_BASE_URL": f"{urls['fixtures']}/api/v3",
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RadioX local stand-ins")
+    parser.add_argument("--openai-latency-ms", type=float, default=StandinConfig.openai_latency_ms)
+    parser.add_argument("--openai-tokens-per-second", type=float, default=StandinConfig.openai_tokens_per_second)
+    parser.add_argument("--openai-tail-probability", type=float, default=StandinConfig.openai_tail_probability)
+    parser.add_argument("--openai-tail-ms", type=float, default=StandinConfig.openai_tail_ms)
+    parser.add_argument("--tts-latency-ms", type=float, default=StandinConfig.tts_latency_ms)
+    parser.add_argument("--tts-realtime-factor", type=float, default=StandinConfig.tts_realtime_factor)
+    parser.add_argument("--supabase-latency-ms", type=float, default=StandinConfig.supabase_latency_ms)
+    parser.add_argument("--fixtures-latency-ms", type=float, default=StandinConfig.fixtures_latency_ms)
+    args = parser.parse_args()
+
+    standins = Standins(StandinConfig(
+        openai_latency_ms=args.openai_latency_ms,
+        openai_tokens_per_second=args.openai_tokens_per_second,
+        openai_tail_probability=args.openai_tail_probability,
+        openai_tail_ms=args.openai_tail_ms,
+        tts_latency_ms=args.tts_latency_ms,
+        tts_realtime_factor=args.tts_realtime_factor,
+        supabase_latency_ms=args.supabase_latency_ms,
+        fixtures_latency_ms=args.fixtures_latency_ms,
+    )).start()
+
+    print("🧪 Stand-ins running - export these for the services:")
+    for key, value in standins.env().items():
+        print(f"   export {key}={value}")
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        standins.stop()
+
+
+if __name__ == "__main__":
+    main()
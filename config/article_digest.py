@@ -0,0 +1,187 @@
+"""
+RadioX Article Digests - Condensed, Radio-Ready Article Summaries
+Condensed once per article content, reused by every show and preset
+
+The same RSS articles feed many shows a day. Instead of sending their raw
+summaries (often HTML) or scraped full text to every script prompt, each
+article is condensed once into a short digest:
+
+- keyed by a hash of the article content (title + text) - an edited article
+  gets a new digest, a re-collected unchanged one hits the cache
+- stored in memory and in Redis (article:digest:<hash>), shared by replicas
+- articles without a digest are condensed in batches - one LLM call for up
+  to batch_size articles; concurrent shows needing the same article wait for
+  the same call instead of starting their own
+
+Callers give condensation a bounded wait - wait=0 is a lookup that starts
+condensing the missing articles in the background (the show path uses it).
+Articles still in flight fall back to their plain summary for this prompt -
+the condensation keeps running and the next show gets the digest.
+"""
+
+import asyncio
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+
+from config.prompt_budget import count_tokens, truncate_tokens
+
+DIGEST_PREFIX = "article:digest:"
+
+_HTML_TAG = re.compile(r"<[^>]+>")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def clean_text(text: Optional[str]) -> str:
+    """Plain text of an RSS field - tags removed, whitespace collapsed"""
+    if not text:
+        return ""
+    return _WHITESPACE.sub(" ", _HTML_TAG.sub(" ", str(text))).strip()
+
+
+def article_text(article: Dict[str, Any]) -> str:
+    """Best available body of an article (scraped full text > summary > description)"""
+    return clean_text(article.get("full_content") or article.get("summary") or article.get("description"))
+
+
+def article_hash(article: Dict[str, Any]) -> str:
+    """Content hash of an article - same title and text, same digest"""
+    payload = f"{clean_text(article.get('title')).lower()}\n{article_text(article).lower()}"
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:20]
+
+
+class ArticleDigestCache:
+    """Digest per article content hash - memory, then Redis, then batched condensation
+
+    condense(items, **context) receives [{"id", "title", "text"}] and returns
+    {id: digest}; context is passed through from digests() (priority, deadline).
+    """
+
+    def __init__(self, condense: Callable[..., Awaitable[Dict[str, str]]], redis_client=None,
+                 ttl: int = 259200, batch_size: int = 20, source_tokens: int = 600,
+                 memory_size: int = 2000, model: str = "gpt-4o"):
+        self.condense = condense
+        self.redis = redis_client
+        self.ttl = ttl
+        self.batch_size = batch_size
+        self.source_tokens = source_tokens
+        self.memory_size = memory_size
+        self.model = model
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Task] = {}
+        self.stats = {"memory_hits": 0, "redis_hits": 0, "condensed": 0, "batches": 0,
+                      "failed_batches": 0, "fallbacks": 0, "source_tokens": 0, "digest_tokens": 0}
+
+    def attach(self, redis_client):
+        """Share digests across replicas (services connect Redis at startup)"""
+        self.redis = redis_client
+
+    def _remember(self, key: str, digest: str):
+        self._memory[key] = digest
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    async def lookup(self, keys: List[str]) -> Dict[str, str]:
+        """Known digests of the given hashes (no condensation)"""
+        found: Dict[str, str] = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                found[key] = self._memory[key]
+                self.stats["memory_hits"] += 1
+            else:
+                missing.append(key)
+
+        if missing and self.redis:
+            try:
+                values = await self.redis.mget([DIGEST_PREFIX + key for key in missing])
+            except Exception as e:
+                logger.warning(f"⚠️ Article digest lookup failed: {e}")
+                values = []
+            for key, value in zip(missing, values):
+                if value:
+                    self._remember(key, value)
+                    found[key] = value
+                    self.stats["redis_hits"] += 1
+        return found
+
+    async def digests(self, articles: List[Dict[str, Any]], wait: Optional[float] = None,
+                      **context) -> Dict[str, str]:
+        """Digests of the articles by article_hash - condenses the missing ones
+
+        Waits up to wait seconds (None: until done) for condensation; articles
+        not done by then are missing from the result.
+        """
+        by_key = {article_hash(article): article for article in articles}
+        found = await self.lookup(list(by_key))
+
+        new = [key for key in by_key if key not in found and key not in self._pending]
+        for start in range(0, len(new), self.batch_size):
+            chunk = {key: by_key[key] for key in new[start:start + self.batch_size]}
+            task = asyncio.create_task(self._condense_batch(chunk, context))
+            for key in chunk:
+                self._pending[key] = task
+
+        waiting = {self._pending[key] for key in by_key if key not in found and key in self._pending}
+        if waiting and wait != 0:
+            await asyncio.wait(waiting, timeout=wait)
+
+        for key in by_key:
+            if key not in found and key in self._memory:
+                found[key] = self._memory[key]
+        self.stats["fallbacks"] += len(by_key) - len(found)
+        return found
+
+    async def _condense_batch(self, chunk: Dict[str, Dict[str, Any]], context: Dict[str, Any]):
+        items = [{
+            "id": key,
+            "title": clean_text(article.get("title")),
+            "text": truncate_tokens(article_text(article), self.source_tokens, self.model),
+        } for key, article in chunk.items()]
+        start = time.perf_counter()
+        try:
+            digests = await self.condense(items, **context)
+        except Exception as e:
+            self.stats["failed_batches"] += 1
+            logger.warning(f"⚠️ Article condensation failed ({len(items)} articles): {e}")
+            return
+        finally:
+            for key in chunk:
+                self._pending.pop(key, None)
+
+        self.stats["batches"] += 1
+        stored = {}
+        for item in items:
+            digest = clean_text(digests.get(item["id"]))
+            if not digest:
+                continue
+            stored[item["id"]] = digest
+            self._remember(item["id"], digest)
+            self.stats["condensed"] += 1
+            self.stats["source_tokens"] += count_tokens(f"{item['title']} {item['text']}", self.model)
+            self.stats["digest_tokens"] += count_tokens(digest, self.model)
+        logger.info(f"📝 Condensed {len(stored)}/{len(items)} articles in "
+                    f"{(time.perf_counter() - start) * 1000:.0f} ms")
+
+        if stored and self.redis:
+            try:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for key, digest in stored.items():
+                        pipe.setex(DIGEST_PREFIX + key, self.ttl, digest)
+                    await pipe.execute()
+            except Exception as e:
+                logger.warning(f"⚠️ Article digests not shared: {e}")
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "cached": len(self._memory),
+            "pending": len(self._pending),
+            "cross_replica": self.redis is not None,
+            **self.stats,
+        }
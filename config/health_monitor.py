@@ -0,0 +1,183 @@
+"""
+RadioX Health Monitor - Cached Dependency Health Snapshots
+Background prober that refreshes dependency health on an interval
+
+/health serves the latest snapshot instantly (no live Supabase/Redis/HTTP
+calls per probe request), /health/live touches nothing external.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from loguru import logger
+
+from config.http_cassette import create_async_client
+
+# A probe returns True/False or a dict with details ("status" optional)
+HealthProbe = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class DependencyHealth:
+    """Last probe result of one dependency"""
+    name: str
+    critical: bool = True
+    status: str = "unknown"  # healthy, unhealthy, unknown
+    latency_ms: Optional[float] = None
+    checked_at: Optional[float] = None
+    error: Optional[str] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self, now: float) -> Dict[str, Any]:
+        result = {
+            "status": self.status,
+            "critical": self.critical,
+            "latency_ms": self.latency_ms,
+            "checked_at": datetime.fromtimestamp(self.checked_at).isoformat() if self.checked_at else None,
+            "age_seconds": round(now - self.checked_at, 1) if self.checked_at else None,
+        }
+        if self.error:
+            result["error"] = self.error
+        if self.details:
+            result.update(self.details)
+        return result
+
+
+class HealthMonitor:
+    """Runs registered dependency probes in the background and keeps a snapshot"""
+
+    def __init__(self, service_name: str, interval: float = 15.0, probe_timeout: float = 5.0):
+        self.service_name = service_name
+        self.interval = interval
+        self.probe_timeout = probe_timeout
+        self.stale_after = interval * 3
+        self.started_at = time.time()
+        self._probes: Dict[str, HealthProbe] = {}
+        self._results: Dict[str, DependencyHealth] = {}
+        self._last_refresh: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._failing: Set[str] = set()
+
+    def register(self, name: str, probe: HealthProbe, critical: bool = True):
+        """Register a dependency probe"""
+        self._probes[name] = probe
+        self._results[name] = DependencyHealth(name=name, critical=critical)
+
+    def register_http(self, name: str, url: str, critical: bool = True):
+        """Register a downstream service /health probe"""
+        async def probe() -> Dict[str, Any]:
+            async with create_async_client(timeout=self.probe_timeout) as client:
+                response = await client.get(url)
+            return {"status": "healthy" if response.status_code == 200 else "unhealthy",
+                    "status_code": response.status_code, "url": url}
+
+        self.register(name, probe, critical)
+
+    async def _run_probe(self, name: str):
+        result = self._results[name]
+        start = time.perf_counter()
+        try:
+            outcome = await asyncio.wait_for(self._probes[name](), timeout=self.probe_timeout)
+            if isinstance(outcome, dict):
+                details = dict(outcome)
+                result.status = details.pop("status", "healthy")
+                result.details = details
+            else:
+                result.status = "healthy" if outcome else "unhealthy"
+                result.details = {}
+            result.error = None
+        except asyncio.TimeoutError:
+            result.status, result.error = "unhealthy", f"timeout after {self.probe_timeout}s"
+        except Exception as e:
+            result.status, result.error = "unhealthy", str(e)
+        result.latency_ms = round((time.perf_counter() - start) * 1000, 1)
+        result.checked_at = time.time()
+
+    async def refresh(self):
+        """Probe all dependencies once (in parallel)"""
+        await asyncio.gather(*(self._run_probe(name) for name in self._probes))
+        self._last_refresh = time.time()
+
+        # Log transitions only - the prober runs every few seconds
+        failing = {name for name, result in self._results.items() if result.status != "healthy"}
+        if failing != self._failing:
+            if failing:
+                logger.warning(f"⚠️ {self.service_name} dependencies unhealthy: {', '.join(sorted(failing))}")
+            else:
+                logger.info(f"✅ {self.service_name} dependencies healthy")
+            self._failing = failing
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"❌ {self.service_name} health refresh failed: {e}")
+
+    async def start(self):
+        """Take the first snapshot, then keep refreshing in the background"""
+        await self.refresh()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+        logger.info(f"✅ {self.service_name} health monitor started ({len(self._probes)} probes every {self.interval:.0f}s)")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def is_stale(self) -> bool:
+        return self._last_refresh is None or time.time() - self._last_refresh > self.stale_after
+
+    def dependency_healthy(self, name: str) -> bool:
+        result = self._results.get(name)
+        return bool(result and result.status == "healthy")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Latest health snapshot with staleness metadata - never probes"""
+        now = time.time()
+        critical_failing = [
+            name for name, result in self._results.items()
+            if result.critical and result.status != "healthy"
+        ]
+
+        if self._last_refresh is None:
+            status = "unknown"
+        elif critical_failing:
+            status = "unhealthy"
+        elif any(result.status != "healthy" for result in self._results.values()):
+            status = "degraded"
+        else:
+            status = "healthy"
+
+        return {
+            "status": status,
+            "service": self.service_name,
+            "dependencies": {name: result.to_dict(now) for name, result in self._results.items()},
+            "snapshot": {
+                "refreshed_at": datetime.fromtimestamp(self._last_refresh).isoformat() if self._last_refresh else None,
+                "age_seconds": round(now - self._last_refresh, 1) if self._last_refresh else None,
+                "interval_seconds": self.interval,
+                "stale": self.is_stale,
+            },
+            "timestamp": datetime.now().isoformat()
+        }
+
+    def liveness(self) -> Dict[str, Any]:
+        """Process liveness - no external calls"""
+        return {
+            "status": "alive",
+            "service": self.service_name,
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "health_monitor_running": bool(self._task and not self._task.done()),
+            "timestamp": datetime.now().isoformat()
+        }
@@ -0,0 +1,463 @@
+"""
+RadioX HTTP Cassette - Record/Replay Transport for Outbound HTTP
+Captures a real generation run and replays it offline with the original timings
+
+Every outbound client (HTTPClientFactory, ad-hoc AsyncClients, Supabase) is built
+through create_async_client() / create_sync_client() / supabase_client_options().
+With the cassette off (default) these are plain httpx clients.
+
+Environment:
+- RADIOX_CASSETTE_MODE              off | record | replay
+- RADIOX_CASSETTE_DIR               cassette directory (default ./cassettes)
+- RADIOX_CASSETTE_NAME              cassette name (default SERVICE_NAME, or the directory of services/<svc>/main.py)
+- RADIOX_CASSETTE_LATENCY_SCALE     replay latency factor (1.0 original, 0 instant, 2.0 twice as slow)
+- RADIOX_CASSETTE_PASSTHROUGH       comma separated host / host:port never recorded or replayed
+                                    (e.g. internal services when replaying only external APIs)
+
+Cassette format: gzip'ed JSON lines (<dir>/<name>.cassette.jsonl.gz), one header
+line then one line per interaction, appended as calls complete. Request headers
+are never stored, secret query parameters are redacted, and so are credentials
+in JSON response bodies (key-service /keys, database-service /api-keys, the
+Supabase keys table, fields such as api_key / access_token anywhere).
+
+Matching on replay: method + URL + request body hash in recorded order, falling
+back to method + URL in recorded order (prompts with timestamps still replay).
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+import zlib
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+from loguru import logger
+
+CASSETTE_VERSION = 1
+
+# Query parameters that carry credentials (OpenWeather appid, API keys)
+REDACTED_PARAMS = {"appid", "api_key", "apikey", "key", "token", "access_token"}
+
+# JSON response fields that carry credentials wherever they appear
+REDACTED_FIELDS = {"key_value", "api_key", "apikey", "secret", "client_secret", "password",
+                   "access_token", "refresh_token"}
+
+# Responses whose plain "value" fields are credentials (key-service /keys/{name} and
+# /env/{var}, database-service /api-keys, the Supabase keys table)
+SECRET_VALUE_PATHS = re.compile(r"^(/keys(/|$)|/env/|/api-keys$|/rest/v1/keys$)")
+
+# Response headers that are volatile or irrelevant for replay
+DROPPED_RESPONSE_HEADERS = {"date", "server", "set-cookie", "x-request-id", "cf-ray", "alt-svc", "via"}
+
+
+class CassetteMissError(httpx.TransportError):
+    """Replay found no recorded interaction for a request"""
+
+
+@dataclass
+class CassetteInteraction:
+    """One recorded request/response pair with timings"""
+    method: str
+    url: str
+    body_hash: str
+    status: int
+    headers: List[Tuple[str, str]]
+    body: str
+    body_encoding: str  # utf-8 | base64
+    offset_ms: float     # request start since recording start
+    ttfb_ms: float       # until response headers
+    elapsed_ms: float    # until response body fully read
+
+    @property
+    def content(self) -> bytes:
+        if self.body_encoding == "base64":
+            return base64.b64decode(self.body)
+        return self.body.encode("utf-8")
+
+
+def _normalize_url(url: httpx.URL) -> str:
+    """URL with secret query params redacted and params sorted"""
+    parts = urlsplit(str(url))
+    params = sorted(
+        (key, "REDACTED" if key.lower() in REDACTED_PARAMS else value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+    )
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(params), ""))
+
+
+def _redact_json(value: Any, secret_values: bool) -> Tuple[Any, bool]:
+    if isinstance(value, list):
+        items = [_redact_json(item, secret_values) for item in value]
+        return [item for item, _ in items], any(changed for _, changed in items)
+    if not isinstance(value, dict):
+        return value, False
+    redacted, changed = {}, False
+    for key, item in value.items():
+        name = str(key).lower()
+        if (name in REDACTED_FIELDS or (secret_values and name == "value")) and isinstance(item, str):
+            redacted[key], changed = "REDACTED", True
+        else:
+            redacted[key], nested = _redact_json(item, secret_values)
+            changed = changed or nested
+    return redacted, changed
+
+
+def _redact_response(url: httpx.URL, headers: List[Tuple[str, str]], content: bytes) -> Tuple[List[Tuple[str, str]], bytes]:
+    """Credentials in a JSON response body replaced by REDACTED (headers adjusted to the new body)"""
+    header_map = {key.lower(): value for key, value in headers}
+    if "json" not in header_map.get("content-type", ""):
+        return headers, content
+    encoding = header_map.get("content-encoding", "").strip().lower()
+    try:
+        if encoding in ("gzip", "deflate"):
+            decoded = zlib.decompress(content, 16 + zlib.MAX_WBITS if encoding == "gzip" else zlib.MAX_WBITS)
+        elif encoding in ("", "identity"):
+            decoded = content
+        else:
+            return headers, content
+        body = json.loads(decoded)
+    except (ValueError, zlib.error):
+        return headers, content
+
+    body, changed = _redact_json(body, bool(SECRET_VALUE_PATHS.search(url.path)))
+    if not changed:
+        return headers, content
+    # Stored uncompressed - length and encoding no longer match the original
+    headers = [(key, value) for key, value in headers if key.lower() not in ("content-length", "content-encoding")]
+    return headers, json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+
+def _body_hash(content: bytes) -> str:
+    return hashlib.sha1(content).hexdigest()[:16] if content else ""
+
+
+def _encode_body(content: bytes) -> Tuple[str, str]:
+    try:
+        return content.decode("utf-8"), "utf-8"
+    except UnicodeDecodeError:
+        return base64.b64encode(content).decode("ascii"), "base64"
+
+
+def _default_cassette_name() -> str:
+    name = os.getenv("RADIOX_CASSETTE_NAME") or os.getenv("SERVICE_NAME")
+    if name:
+        return name
+    # python services/<svc>/main.py - the service directory names the cassette. Under
+    # uvicorn / gunicorn / python -m, argv[0] is the launcher and every service would
+    # share (and overwrite) one cassette, as would every image with WORKDIR /app.
+    script = Path(sys.argv[0]).resolve() if sys.argv and sys.argv[0] else None
+    if script and script.suffix == ".py" and script.parent.parent.name == "services":
+        return script.parent.name
+    raise RuntimeError(
+        "Cannot derive the cassette name from the command line - "
+        "set RADIOX_CASSETTE_NAME or SERVICE_NAME"
+    )
+
+
+class Cassette:
+    """Recorded interactions of one process, with replay indexes"""
+
+    def __init__(self, path: Path, mode: str, latency_scale: float = 1.0, passthrough: Optional[List[str]] = None):
+        self.path = path
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self.passthrough = {entry.strip().lower() for entry in (passthrough or []) if entry.strip()}
+        self.interactions: List[CassetteInteraction] = []
+        self._by_request: Dict[Tuple[str, str, str], Deque[int]] = defaultdict(deque)
+        self._by_route: Dict[Tuple[str, str], Deque[int]] = defaultdict(deque)
+        self._used: set = set()
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self.stats = {"recorded": 0, "replayed": 0, "fallback_matches": 0, "misses": 0, "passthrough": 0}
+
+        if mode == "replay":
+            self._load()
+        elif mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.exists():
+                self.path.unlink()
+
+    # ------------------------------------------------------------------ io
+
+    def _load(self):
+        if not self.path.exists():
+            raise FileNotFoundError(f"Cassette not found: {self.path}")
+
+        with gzip.open(self.path, "rt", encoding="utf-8") as handle:
+            for line in handle:
+                record = json.loads(line)
+                if record.get("type") == "header":
+                    continue
+                record.pop("type", None)
+                record["headers"] = [tuple(pair) for pair in record["headers"]]
+                self._index(CassetteInteraction(**record))
+        logger.info(f"📼 Cassette loaded: {self.path} ({len(self.interactions)} interactions, latency x{self.latency_scale})")
+
+    def _index(self, interaction: CassetteInteraction):
+        position = len(self.interactions)
+        self.interactions.append(interaction)
+        self._by_request[(interaction.method, interaction.url, interaction.body_hash)].append(position)
+        self._by_route[(interaction.method, interaction.url)].append(position)
+
+    def _append(self, interaction: CassetteInteraction):
+        # Appended gzip members form one valid stream - a crash keeps everything recorded so far
+        with self._lock:
+            new_file = not self.path.exists()
+            with gzip.open(self.path, "at", encoding="utf-8") as handle:
+                if new_file:
+                    header = {"type": "header", "version": CASSETTE_VERSION,
+                              "name": self.path.name, "recorded_at": datetime.now().isoformat()}
+                    handle.write(json.dumps(header) + "\n")
+                handle.write(json.dumps({"type": "interaction", **asdict(interaction)}, ensure_ascii=False) + "\n")
+            self.interactions.append(interaction)
+            self.stats["recorded"] += 1
+
+    # ------------------------------------------------------------------ record / replay
+
+    def is_passthrough(self, request: httpx.Request) -> bool:
+        if not self.passthrough:
+            return False
+        host = (request.url.host or "").lower()
+        return host in self.passthrough or f"{host}:{request.url.port}" in self.passthrough
+
+    def record(self, request: httpx.Request, response: httpx.Response, content: bytes,
+               started: float, ttfb: float, finished: float):
+        headers = [(key, value) for key, value in response.headers.multi_items()
+                   if key.lower() not in DROPPED_RESPONSE_HEADERS]
+        headers, content = _redact_response(request.url, headers, content)
+        body, encoding = _encode_body(content)
+        self._append(CassetteInteraction(
+            method=request.method,
+            url=_normalize_url(request.url),
+            body_hash=_body_hash(request.content),
+            status=response.status_code,
+            headers=headers,
+            body=body,
+            body_encoding=encoding,
+            offset_ms=round((started - self._started) * 1000, 1),
+            ttfb_ms=round((ttfb - started) * 1000, 1),
+            elapsed_ms=round((finished - started) * 1000, 1),
+        ))
+
+    def match(self, request: httpx.Request) -> CassetteInteraction:
+        url = _normalize_url(request.url)
+        with self._lock:
+            for queue, fallback in (
+                (self._by_request.get((request.method, url, _body_hash(request.content))), False),
+                (self._by_route.get((request.method, url)), True),
+            ):
+                while queue:
+                    position = queue.popleft()
+                    if position in self._used:
+                        continue
+                    self._used.add(position)
+                    self.stats["replayed"] += 1
+                    if fallback:
+                        self.stats["fallback_matches"] += 1
+                    return self.interactions[position]
+            self.stats["misses"] += 1
+        raise CassetteMissError(f"No recorded interaction for {request.method} {url}", request=request)
+
+    def replay_delays(self, interaction: CassetteInteraction) -> Tuple[float, float]:
+        """(seconds until headers, seconds until body end) after latency scaling"""
+        ttfb = interaction.ttfb_ms / 1000 * self.latency_scale
+        body = max(0.0, interaction.elapsed_ms - interaction.ttfb_ms) / 1000 * self.latency_scale
+        return ttfb, body
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "path": str(self.path),
+            "latency_scale": self.latency_scale,
+            "interactions": len(self.interactions),
+            **self.stats,
+        }
+
+
+class _DelayedAsyncStream(httpx.AsyncByteStream):
+    def __init__(self, content: bytes, delay: float):
+        self._content, self._delay = content, delay
+
+    async def __aiter__(self):
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        yield self._content
+
+
+class _DelayedSyncStream(httpx.SyncByteStream):
+    def __init__(self, content: bytes, delay: float):
+        self._content, self._delay = content, delay
+
+    def __iter__(self):
+        if self._delay:
+            time.sleep(self._delay)
+        yield self._content
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    """Records through / replays instead of the wrapped async transport"""
+
+    def __init__(self, cassette: Cassette, transport: httpx.AsyncBaseTransport):
+        self.cassette = cassette
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        cassette = self.cassette
+        if cassette.is_passthrough(request):
+            cassette.stats["passthrough"] += 1
+            return await self.transport.handle_async_request(request)
+
+        if cassette.mode == "replay":
+            await request.aread()
+            interaction = cassette.match(request)
+            ttfb, body_delay = cassette.replay_delays(interaction)
+            if ttfb:
+                await asyncio.sleep(ttfb)
+            return httpx.Response(interaction.status, headers=interaction.headers,
+                                  stream=_DelayedAsyncStream(interaction.content, body_delay))
+
+        await request.aread()
+        started = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        ttfb = time.perf_counter()
+        try:
+            content = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        cassette.record(request, response, content, started, ttfb, time.perf_counter())
+        return httpx.Response(response.status_code, headers=response.headers,
+                              content=content, extensions=response.extensions)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+class SyncCassetteTransport(httpx.BaseTransport):
+    """Sync variant - used for the Supabase clients"""
+
+    def __init__(self, cassette: Cassette, transport: httpx.BaseTransport):
+        self.cassette = cassette
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        cassette = self.cassette
+        if cassette.is_passthrough(request):
+            cassette.stats["passthrough"] += 1
+            return self.transport.handle_request(request)
+
+        if cassette.mode == "replay":
+            request.read()
+            interaction = cassette.match(request)
+            ttfb, body_delay = cassette.replay_delays(interaction)
+            if ttfb:
+                time.sleep(ttfb)
+            return httpx.Response(interaction.status, headers=interaction.headers,
+                                  stream=_DelayedSyncStream(interaction.content, body_delay))
+
+        request.read()
+        started = time.perf_counter()
+        response = self.transport.handle_request(request)
+        ttfb = time.perf_counter()
+        try:
+            content = b"".join(response.stream)
+        finally:
+            response.close()
+        cassette.record(request, response, content, started, ttfb, time.perf_counter())
+        return httpx.Response(response.status_code, headers=response.headers,
+                              content=content, extensions=response.extensions)
+
+    def close(self):
+        self.transport.close()
+
+
+# Global cassette - created lazily from the environment
+_cassette: Optional[Cassette] = None
+_cassette_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[Cassette]:
+    """Process-wide cassette, or None when RADIOX_CASSETTE_MODE is off"""
+    global _cassette
+    mode = os.getenv("RADIOX_CASSETTE_MODE", "off").lower()
+    if mode not in ("record", "replay"):
+        return None
+
+    if _cassette is None:
+        with _cassette_lock:
+            if _cassette is None:
+                directory = Path(os.getenv("RADIOX_CASSETTE_DIR", "cassettes"))
+                _cassette = Cassette(
+                    path=directory / f"{_default_cassette_name()}.cassette.jsonl.gz",
+                    mode=mode,
+                    latency_scale=float(os.getenv("RADIOX_CASSETTE_LATENCY_SCALE", "1.0")),
+                    passthrough=os.getenv("RADIOX_CASSETTE_PASSTHROUGH", "").split(","),
+                )
+                logger.info(f"📼 HTTP cassette {mode}: {_cassette.path}")
+    return _cassette
+
+
+def create_async_client(**kwargs) -> httpx.AsyncClient:
+    """httpx.AsyncClient routed through the cassette when one is active"""
+    cassette = get_cassette()
+    if cassette is not None and "transport" not in kwargs:
+        transport_kwargs = {key: kwargs[key] for key in ("verify", "limits", "http2") if key in kwargs}
+        kwargs["transport"] = AsyncCassetteTransport(cassette, httpx.AsyncHTTPTransport(**transport_kwargs))
+    return httpx.AsyncClient(**kwargs)
+
+
+def create_sync_client(**kwargs) -> httpx.Client:
+    """httpx.Client routed through the cassette when one is active"""
+    cassette = get_cassette()
+    if cassette is not None and "transport" not in kwargs:
+        transport_kwargs = {key: kwargs[key] for key in ("verify", "limits", "http2") if key in kwargs}
+        kwargs["transport"] = SyncCassetteTransport(cassette, httpx.HTTPTransport(**transport_kwargs))
+    return httpx.Client(**kwargs)
+
+
+def supabase_client_options(timeout: float = 120.0):
+    """ClientOptions for create_client() - None (library defaults) unless a cassette is active"""
+    if get_cassette() is None:
+        return None
+    from supabase.lib.client_options import SyncClientOptions
+    return SyncClientOptions(httpx_client=create_sync_client(timeout=timeout, follow_redirects=True))
+
+
+def cassette_stats() -> Optional[Dict[str, Any]]:
+    cassette = get_cassette()
+    return cassette.summary() if cassette else None
+
+
+def summarize_cassette(path: Path) -> Dict[str, Any]:
+    """Per-host call counts and time spent - for reading a recorded run"""
+    hosts: Dict[str, Dict[str, float]] = defaultdict(lambda: {"calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+    span_ms = 0.0
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        for line in handle:
+            record = json.loads(line)
+            if record.get("type") == "header":
+                continue
+            host = hosts[f"{record['method']} {urlsplit(record['url']).netloc}"]
+            host["calls"] += 1
+            host["total_ms"] += record["elapsed_ms"]
+            host["max_ms"] = max(host["max_ms"], record["elapsed_ms"])
+            span_ms = max(span_ms, record["offset_ms"] + record["elapsed_ms"])
+    return {"path": str(path), "span_ms": round(span_ms, 1),
+            "hosts": {name: {k: round(v, 1) for k, v in stats.items()} for name, stats in hosts.items()}}
+
+
+if __name__ == "__main__":
+    # python -m config.http_cassette cassettes/show-service.cassette.jsonl.gz
+    for cassette_path in sys.argv[1:]:
+        print(json.dumps(summarize_cassette(Path(cassette_path)), indent=2))
@@ -32,18 +32,12 @@ import httpx
 from httpx import AsyncClient, Response, Timeout, Limits
 
 from config.simple_settings import get_simple_settings
+from config.http_cassette import cassette_stats, create_async_client
+from config.request_types import REQUEST_TIMEOUTS, RequestType
 
 settings = get_simple_settings()
 
 
-class RequestType(Enum):
-    """Request types for different timeout configurations"""
-    FAST = "fast"           # 5s timeout - health checks, config
-    STANDARD = "standard"   # 30s timeout - content, data
-    SLOW = "slow"          # 120s timeout - audio processing
-    ULTRA_SLOW = "ultra_slow"  # 300s timeout - show generation
-
-
 class CircuitState(Enum):
     """Circuit breaker states"""
     CLOSED = "closed"       # Normal operation
@@ -141,12 +135,7 @@ class HTTPClientFactory:
         self._client_lock = threading.Lock()
         
         # Timeout configurations
-        self.timeout_configs = {
-            RequestType.FAST: Timeout(5.0, connect=2.0),
-            RequestType.STANDARD: Timeout(30.0, connect=5.0),
-            RequestType.SLOW: Timeout(120.0, connect=10.0),
-            RequestType.ULTRA_SLOW: Timeout(300.0, connect=15.0)
-        }
+        self.timeout_configs = dict(REQUEST_TIMEOUTS)
         
         # Connection limits for optimal performance
         self.connection_limits = Limits(
@@ -176,7 +165,7 @@ class HTTPClientFactory:
         }
         
         for request_type, timeout in self.timeout_configs.items():
-            self._clients[request_type] = AsyncClient(
+            self._clients[request_type] = create_async_client(
                 timeout=timeout,
                 limits=self.connection_limits,
                 headers=common_headers,
@@ -369,6 +358,7 @@ class HTTPClientFactory:
                     "max_keepalive": self.connection_limits.max_keepalive_connections
                 }
             },
+            "cassette": cassette_stats(),
             "uptime": {
                 "hours": round(self._stats.uptime_hours, 2),
                 "start_time": self._stats.uptime_start.isoformat()
@@ -447,7 +437,7 @@ class RadioXHttpClient:
     """Zentraler HTTP Client mit automatischem Key Management"""
     
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = create_async_client(timeout=30.0)
         self.key_service_url = os.getenv("KEY_SERVICE_URL", "http://key-service:8001")
         self.api_keys: Dict[str, str] = {}
         self.keys_loaded = False
@@ -10,6 +10,8 @@ import asyncio
 from typing import Dict, Optional, Any
 from loguru import logger
 
+from config.http_cassette import create_async_client
+
 class KeyServiceClient:
     """Client für den zentralen Key Service"""
     
@@ -22,7 +24,7 @@ class KeyServiceClient:
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client"""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=10.0)
+            self._client = create_async_client(timeout=10.0)
         return self._client
         
     async def load_api_keys(self) -> bool:
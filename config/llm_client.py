@@ -0,0 +1,638 @@
+"""
+RadioX LLM Client - Hedged, Multi-Route Chat Completions
+One client for every OpenAI-compatible endpoint the services call
+
+A client has a list of routes (provider base URL + model + key). Each call:
+- goes to the route with the lowest expected latency - the latency EWMA,
+  inflated by the route's error rate. Routes without samples keep their
+  configured order; a route failing failure_threshold times in a row is
+  skipped for cooldown_seconds (unless every route is cooling down)
+- is hedged: if no answer arrived after the hedge delay, a second request
+  goes to the next route and the first answer wins, the other request is
+  cancelled. With no other route, streams hedge on the same route (the loser
+  is cancelled at the winner's first token); non-streamed calls only do so
+  with hedge_same_route - a duplicate of a long completion is billed in full.
+  The delay is fixed (hedge_after) or the p95 of the route's recent
+  latencies (time to first token for streams), hedge_default until
+  min_samples are observed
+- fails over to the next route when a request errors
+
+Every call returns an LLMCall record - winning route, latency, tokens, cost
+(MODEL_PRICES, per 1M tokens) and the attempts behind it. A cancelled
+non-streamed loser is booked at its worst case (prompt + max_tokens) - the
+provider may finish and bill it. summary() serves the per-route numbers for /llm.
+
+Hedges run inside the caller's scheduler slot: they add at most max_hedges
+upstream requests per call, never queue places. Routes are configured as a
+JSON list in the environment (routes_from_env) and work against the local
+stand-ins (benchmarks/standins.py) like against OpenAI.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from config.http_cassette import create_async_client
+from config.prompt_budget import count_tokens
+
+# USD per 1M tokens (prompt, completion) - longest matching model prefix wins
+MODEL_PRICES = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4-turbo": (10.00, 30.00),
+    "gpt-4": (30.00, 60.00),
+    "gpt-3.5-turbo": (0.50, 1.50),
+}
+
+LATENCY_SAMPLES = 200
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+
+class LLMError(Exception):
+    """Every attempt of a call failed"""
+
+    def __init__(self, message: str, attempts: Optional[List[Dict[str, Any]]] = None):
+        super().__init__(message)
+        self.attempts = attempts or []
+
+
+@dataclass
+class LLMRoute:
+    """One OpenAI-compatible endpoint and model"""
+    name: str
+    base_url: str
+    model: str
+    api_key: Optional[str] = None
+    api_key_env: Optional[str] = None        # key read from this variable at call time
+    input_price: Optional[float] = None      # USD per 1M prompt tokens (default: MODEL_PRICES)
+    output_price: Optional[float] = None     # USD per 1M completion tokens
+
+    def key(self, default: Optional[str] = None) -> Optional[str]:
+        return self.api_key or (os.getenv(self.api_key_env) if self.api_key_env else None) or default
+
+    def cost(self, prompt_tokens: int, completion_tokens: int) -> float:
+        prices = next((MODEL_PRICES[prefix] for prefix in sorted(MODEL_PRICES, key=len, reverse=True)
+                       if self.model.startswith(prefix)), (0.0, 0.0))
+        input_price = prices[0] if self.input_price is None else self.input_price
+        output_price = prices[1] if self.output_price is None else self.output_price
+        return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+
+def routes_from_env(var: str, model: str, base_url: str,
+                    api_key_env: Optional[str] = "OPENAI_API_KEY") -> List[LLMRoute]:
+    """Routes from a JSON list in var - one route (base_url, model) if unset
+
+    SCRIPT_LLM_ROUTES='[{"name": "openai", "base_url": "https://api.openai.com/v1", "model": "gpt-4o",
+                        "api_key_env": "OPENAI_API_KEY"},
+                       {"name": "backup", "base_url": "https://llm.example.com/v1", "model": "gpt-4o",
+                        "api_key_env": "BACKUP_LLM_KEY"}]'
+    """
+    value = os.getenv(var)
+    if not value:
+        return [LLMRoute(name="openai", base_url=base_url, model=model, api_key_env=api_key_env)]
+    try:
+        entries = json.loads(value)
+        routes = [LLMRoute(**{"model": model, **entry}) for entry in entries]
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"{var} must be a JSON list of routes: {e}")
+    if not routes:
+        raise ValueError(f"{var} contains no routes")
+    for route in routes:
+        route.base_url = route.base_url.rstrip("/")
+    return routes
+
+
+def env_seconds(var: str) -> Optional[float]:
+    """Seconds from the environment - None if unset or "auto" """
+    value = os.getenv(var, "").strip().lower()
+    return float(value) if value and value != "auto" else None
+
+
+@dataclass
+class RouteStats:
+    """Observed behaviour of one route"""
+    calls: int = 0
+    wins: int = 0
+    failures: int = 0
+    cancelled: int = 0
+    consecutive_failures: int = 0
+    cooling_until: float = 0.0
+    latency_ewma_ms: Optional[float] = None
+    error_rate: float = 0.0
+    latencies_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+    first_token_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float = 0.0
+    last_error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        latencies = list(self.latencies_ms)
+        first_tokens = list(self.first_token_ms)
+        return {
+            "calls": self.calls,
+            "wins": self.wins,
+            "failures": self.failures,
+            "cancelled": self.cancelled,
+            "error_rate": round(self.error_rate, 3),
+            "cooling": self.cooling_until > time.time(),
+            "latency_ms": {
+                "ewma": round(self.latency_ewma_ms, 1) if self.latency_ewma_ms is not None else None,
+                "p50": round(_percentile(latencies, 50), 1),
+                "p95": round(_percentile(latencies, 95), 1),
+            },
+            "first_token_ms": {
+                "p50": round(_percentile(first_tokens, 50), 1),
+                "p95": round(_percentile(first_tokens, 95), 1),
+            },
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+            "last_error": self.last_error,
+        }
+
+
+@dataclass
+class LLMCall:
+    """Accounting of one call - winning route, latency, tokens, cost, attempts"""
+    client: str
+    route: str
+    model: str
+    latency_ms: float
+    prompt_tokens: int
+    completion_tokens: int
+    cost_usd: float
+    first_token_ms: Optional[float] = None
+    usage_estimated: bool = False
+    hedges: int = 0
+    hedge_won: bool = False
+    attempts: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.__dict__,
+            "latency_ms": round(self.latency_ms, 1),
+            "first_token_ms": round(self.first_token_ms, 1) if self.first_token_ms is not None else None,
+            "cost_usd": round(self.cost_usd, 6),
+        }
+
+
+def message_text(data: Dict[str, Any]) -> str:
+    """Assistant message of a chat completion"""
+    choices = data.get("choices") or []
+    return ((choices[0].get("message") or {}).get("content") or "") if choices else ""
+
+
+@dataclass
+class LLMResponse:
+    data: Dict[str, Any]
+    call: LLMCall
+
+    @property
+    def text(self) -> str:
+        return message_text(self.data)
+
+
+@dataclass
+class _Attempt:
+    route: LLMRoute
+    role: str                   # primary | hedge | failover
+    started: float
+    task: Optional[asyncio.Task] = None
+    first_token: Optional[float] = None
+
+    def log(self, outcome: str, error: Optional[str] = None) -> Dict[str, Any]:
+        entry = {"route": self.route.name, "role": self.role, "outcome": outcome,
+                 "ms": round((time.perf_counter() - self.started) * 1000, 1)}
+        if error:
+            entry["error"] = error
+        return entry
+
+
+class LLMStream:
+    """Text deltas of a streamed call - call holds the LLMCall once the stream is done"""
+
+    def __init__(self, client: "LLMClient", payload: Dict[str, Any], timeout: float):
+        self._client = client
+        self._payload = payload
+        self._timeout = timeout
+        self.call: Optional[LLMCall] = None
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self._client._stream(self, self._payload, self._timeout)
+
+
+class LLMClient:
+    """Chat completions over latency-ranked routes with hedging and failover"""
+
+    def __init__(self, name: str, routes: List[LLMRoute], hedge_after: Optional[float] = None,
+                 hedge_default: float = 30.0, first_token_hedge_default: float = 8.0,
+                 hedge_percentile: float = 95.0, min_samples: int = 20, max_hedges: int = 1,
+                 failure_threshold: int = 3, cooldown_seconds: float = 30.0, ewma_alpha: float = 0.2,
+                 default_api_key: Optional[str] = None, hedge_same_route: bool = False):
+        if not routes:
+            raise ValueError(f"LLM client {name} needs at least one route")
+        self.name = name
+        self.routes = routes
+        self.hedge_after = hedge_after
+        self.hedge_default = hedge_default
+        self.first_token_hedge_default = first_token_hedge_default
+        self.hedge_percentile = hedge_percentile
+        self.min_samples = min_samples
+        self.max_hedges = max_hedges
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.ewma_alpha = ewma_alpha
+        self.default_api_key = default_api_key
+        self.hedge_same_route = hedge_same_route
+        self._stats: Dict[str, RouteStats] = {route.name: RouteStats() for route in routes}
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.totals = {"calls": 0, "failed_calls": 0, "hedges": 0, "hedge_wins": 0, "failovers": 0,
+                       "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0}
+
+    def configured(self) -> bool:
+        """At least one route has an API key"""
+        return any(route.key(self.default_api_key) for route in self.routes)
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def ranked(self) -> List[LLMRoute]:
+        """Routes by expected latency - cooling routes last, unobserved routes in configured order"""
+        now = time.time()
+
+        def expected(item: Tuple[int, LLMRoute]):
+            index, route = item
+            stats = self._stats[route.name]
+            cooling = stats.cooling_until > now
+            if stats.latency_ewma_ms is None:
+                return (cooling, 1, 0.0, index)
+            return (cooling, 0, stats.latency_ewma_ms / max(0.05, 1.0 - stats.error_rate), index)
+
+        return [route for _, route in sorted(enumerate(self.routes), key=expected)]
+
+    def hedge_delay(self, route: LLMRoute, first_token: bool = False) -> float:
+        """Seconds before a call on route is hedged"""
+        if self.hedge_after is not None:
+            return self.hedge_after
+        stats = self._stats[route.name]
+        samples = list(stats.first_token_ms if first_token else stats.latencies_ms)
+        if len(samples) < self.min_samples:
+            return self.first_token_hedge_default if first_token else self.hedge_default
+        return _percentile(samples, self.hedge_percentile) / 1000
+
+    def _record_success(self, route: LLMRoute, latency_ms: float, first_token_ms: Optional[float],
+                        prompt_tokens: int, completion_tokens: int) -> float:
+        stats = self._stats[route.name]
+        alpha = self.ewma_alpha
+        stats.calls += 1
+        stats.wins += 1
+        stats.consecutive_failures = 0
+        stats.error_rate = (1 - alpha) * stats.error_rate
+        stats.latency_ewma_ms = latency_ms if stats.latency_ewma_ms is None else \
+            (1 - alpha) * stats.latency_ewma_ms + alpha * latency_ms
+        stats.latencies_ms.append(latency_ms)
+        if first_token_ms is not None:
+            stats.first_token_ms.append(first_token_ms)
+        cost = route.cost(prompt_tokens, completion_tokens)
+        stats.prompt_tokens += prompt_tokens
+        stats.completion_tokens += completion_tokens
+        stats.cost_usd += cost
+        return cost
+
+    def _record_failure(self, route: LLMRoute, error: Exception):
+        stats = self._stats[route.name]
+        stats.calls += 1
+        stats.failures += 1
+        stats.consecutive_failures += 1
+        stats.error_rate = (1 - self.ewma_alpha) * stats.error_rate + self.ewma_alpha
+        stats.last_error = str(error)[:200]
+        if stats.consecutive_failures >= self.failure_threshold:
+            stats.cooling_until = time.time() + self.cooldown_seconds
+            logger.warning(f"⚠️ LLM route {self.name}/{route.name} failed {stats.consecutive_failures}x - "
+                           f"cooling down {self.cooldown_seconds:g}s")
+
+    def _record_cancelled(self, route: LLMRoute, prompt_tokens: int, completion_tokens: int = 0):
+        """An attempt that lost - billed anyway (completion_tokens: what it may still generate)"""
+        stats = self._stats[route.name]
+        stats.cancelled += 1
+        cost = route.cost(prompt_tokens, completion_tokens)
+        stats.prompt_tokens += prompt_tokens
+        stats.completion_tokens += completion_tokens
+        stats.cost_usd += cost
+        self.totals["prompt_tokens"] += prompt_tokens
+        self.totals["completion_tokens"] += completion_tokens
+        self.totals["cost_usd"] += cost
+
+    def _prompt_tokens(self, payload: Dict[str, Any], model: str) -> int:
+        return count_tokens("\n".join(str(message.get("content") or "") for message in payload.get("messages", [])),
+                            model)
+
+    def _request(self, route: LLMRoute, payload: Dict[str, Any]) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        api_key = route.key(self.default_api_key)
+        if not api_key:
+            raise LLMError(f"No API key for LLM route {route.name}")
+        headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+        return f"{route.base_url}/chat/completions", headers, {**payload, "model": route.model}
+
+    def _next_route(self, ranked: List[LLMRoute], tried: List[str], reuse: bool) -> Optional[LLMRoute]:
+        """Next untried route - with reuse, the best route again when every route is in use"""
+        untried = [route for route in ranked if route.name not in tried]
+        if untried:
+            return untried[0]
+        return ranked[0] if reuse else None
+
+    def _finish(self, attempt: _Attempt, start: float, prompt_tokens: int, completion_tokens: int,
+                estimated: bool, hedges: int, attempts: List[Dict[str, Any]]) -> LLMCall:
+        latency_ms = (time.perf_counter() - start) * 1000
+        attempt_ms = (time.perf_counter() - attempt.started) * 1000
+        first_token_ms = (attempt.first_token - attempt.started) * 1000 if attempt.first_token else None
+        cost = self._record_success(attempt.route, attempt_ms, first_token_ms, prompt_tokens, completion_tokens)
+        call = LLMCall(
+            client=self.name,
+            route=attempt.route.name,
+            model=attempt.route.model,
+            latency_ms=latency_ms,
+            first_token_ms=(attempt.first_token - start) * 1000 if attempt.first_token else None,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cost_usd=cost,
+            usage_estimated=estimated,
+            hedges=hedges,
+            hedge_won=attempt.role == "hedge",
+            attempts=attempts,
+        )
+        self._latencies.append(latency_ms)
+        self.totals["calls"] += 1
+        self.totals["hedges"] += hedges
+        self.totals["hedge_wins"] += int(call.hedge_won)
+        self.totals["failovers"] += sum(1 for entry in attempts if entry["role"] == "failover")
+        self.totals["prompt_tokens"] += prompt_tokens
+        self.totals["completion_tokens"] += completion_tokens
+        self.totals["cost_usd"] += cost
+        return call
+
+    def _fail(self, attempts: List[Dict[str, Any]], hedges: int) -> LLMError:
+        self.totals["failed_calls"] += 1
+        self.totals["hedges"] += hedges
+        summary = "; ".join(f"{entry['route']}: {entry.get('error', entry['outcome'])}" for entry in attempts)
+        return LLMError(f"LLM {self.name}: all attempts failed ({summary})", attempts)
+
+    # ------------------------------------------------------------------
+    # Completions
+    # ------------------------------------------------------------------
+
+    async def _complete(self, route: LLMRoute, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        url, headers, body = self._request(route, payload)
+        async with create_async_client(timeout=timeout) as client:
+            response = await client.post(url, headers=headers, json=body)
+        if response.status_code != 200:
+            raise LLMError(f"HTTP {response.status_code}: {response.text[:200]}")
+        return response.json()
+
+    async def chat(self, payload: Dict[str, Any], timeout: float = 60.0) -> LLMResponse:
+        """Chat completion - hedged and failed over across the routes (payload model is set per route)"""
+        start = time.perf_counter()
+        ranked = self.ranked()
+        delay = self.hedge_delay(ranked[0])
+        pending: Dict[asyncio.Task, _Attempt] = {}
+        attempts: List[Dict[str, Any]] = []
+        tried: List[str] = []
+        hedges = 0
+        can_hedge = True
+        prompt_estimate: Dict[str, int] = {}
+        # Worst case of a cancelled loser - it may run to max_tokens and be billed for them
+        loser_completion = payload.get("max_tokens")
+
+        def launch(role: str) -> bool:
+            route = self._next_route(ranked, tried, reuse=role == "hedge" and self.hedge_same_route)
+            if route is None:
+                return False
+            tried.append(route.name)
+            attempt = _Attempt(route=route, role=role, started=time.perf_counter())
+            attempt.task = asyncio.create_task(self._complete(route, payload, timeout))
+            pending[attempt.task] = attempt
+            return True
+
+        launch("primary")
+        hedge_at = start + delay
+        try:
+            while pending:
+                wait = max(0.0, hedge_at - time.perf_counter()) if can_hedge and hedges < self.max_hedges else None
+                done, _ = await asyncio.wait(pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    if not launch("hedge"):
+                        can_hedge = False  # no other route - keep waiting for the running request
+                        continue
+                    hedges += 1
+                    hedge_at = time.perf_counter() + delay
+                    logger.info(f"⏱️ LLM {self.name}: no answer after {delay:.1f}s - hedged "
+                                f"({', '.join(a.route.name for a in pending.values())})")
+                    continue
+
+                for task in done:
+                    attempt = pending.pop(task)
+                    error = task.exception()
+                    if error is not None:
+                        self._record_failure(attempt.route, error)
+                        attempts.append(attempt.log("failed", str(error)[:200]))
+                        logger.warning(f"⚠️ LLM {self.name}/{attempt.route.name} failed: {error}")
+                        if not pending and launch("failover"):
+                            hedge_at = time.perf_counter() + delay
+                        continue
+
+                    data = task.result()
+                    usage = data.get("usage") or {}
+                    estimated = not usage
+                    prompt_tokens = usage.get("prompt_tokens") or self._prompt_tokens(payload, attempt.route.model)
+                    completion_tokens = usage.get("completion_tokens") or count_tokens(message_text(data),
+                                                                                       attempt.route.model)
+                    attempts.append(attempt.log("won"))
+                    for loser in pending.values():
+                        attempts.append(loser.log("cancelled"))
+                        prompt_estimate.setdefault(loser.route.model,
+                                                   self._prompt_tokens(payload, loser.route.model))
+                        self._record_cancelled(loser.route, prompt_estimate[loser.route.model],
+                                               loser_completion or completion_tokens)
+                    return LLMResponse(data=data, call=self._finish(attempt, start, prompt_tokens,
+                                                                    completion_tokens, estimated, hedges, attempts))
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise self._fail(attempts, hedges)
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    def stream_chat(self, payload: Dict[str, Any], timeout: float = 60.0) -> LLMStream:
+        """Streamed chat completion - hedged on time to first token
+
+        async for text in stream: ... - stream.call holds the LLMCall afterwards.
+        """
+        return LLMStream(self, payload, timeout)
+
+    async def _stream_attempt(self, number: int, route: LLMRoute, payload: Dict[str, Any], timeout: float,
+                              events: asyncio.Queue):
+        try:
+            url, headers, body = self._request(route, payload)
+            body = {**body, "stream": True, "stream_options": {"include_usage": True}}
+            usage: Dict[str, Any] = {}
+            async with create_async_client(timeout=timeout) as client:
+                async with client.stream("POST", url, headers=headers, json=body) as response:
+                    if response.status_code != 200:
+                        text = (await response.aread()).decode(errors="replace")
+                        raise LLMError(f"HTTP {response.status_code}: {text[:200]}")
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == "[DONE]":
+                            break
+                        chunk = json.loads(data)
+                        usage = chunk.get("usage") or usage
+                        choices = chunk.get("choices") or []
+                        text = (choices[0].get("delta") or {}).get("content") if choices else None
+                        if text:
+                            await events.put((number, "delta", text))
+            await events.put((number, "done", usage))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await events.put((number, "error", e))
+
+    async def _stream(self, stream: LLMStream, payload: Dict[str, Any], timeout: float) -> AsyncIterator[str]:
+        start = time.perf_counter()
+        ranked = self.ranked()
+        delay = self.hedge_delay(ranked[0], first_token=True)
+        events: asyncio.Queue = asyncio.Queue()
+        running: Dict[int, _Attempt] = {}
+        attempts: List[Dict[str, Any]] = []
+        tried: List[str] = []
+        hedges = 0
+        winner: Optional[_Attempt] = None
+        winner_number: Optional[int] = None
+        parts: List[str] = []
+
+        def launch(role: str) -> bool:
+            route = self._next_route(ranked, tried, reuse=role == "hedge")
+            if route is None:
+                return False
+            tried.append(route.name)
+            number = len(tried)
+            attempt = _Attempt(route=route, role=role, started=time.perf_counter())
+            attempt.task = asyncio.create_task(self._stream_attempt(number, route, payload, timeout, events))
+            running[number] = attempt
+            return True
+
+        def crown(number: int):
+            nonlocal winner
+            winner = running.pop(number)
+            winner.first_token = time.perf_counter()
+            for loser in running.values():
+                loser.task.cancel()
+                attempts.append(loser.log("cancelled"))
+                self._record_cancelled(loser.route, self._prompt_tokens(payload, loser.route.model))
+            running.clear()
+
+        launch("primary")
+        hedge_at = start + delay
+        try:
+            while True:
+                wait = None
+                if winner is None and hedges < self.max_hedges:
+                    wait = max(0.0, hedge_at - time.perf_counter())
+                try:
+                    number, kind, value = await asyncio.wait_for(events.get(), timeout=wait)
+                except asyncio.TimeoutError:
+                    hedges += 1
+                    launch("hedge")
+                    hedge_at = time.perf_counter() + delay
+                    logger.info(f"⏱️ LLM {self.name}: no first token after {delay:.1f}s - hedged "
+                                f"({', '.join(a.route.name for a in running.values())})")
+                    continue
+
+                if winner is not None and number != winner_number:
+                    continue
+
+                if kind == "error":
+                    attempt = winner if winner is not None else running.pop(number)
+                    self._record_failure(attempt.route, value)
+                    attempts.append(attempt.log("failed", str(value)[:200]))
+                    logger.warning(f"⚠️ LLM {self.name}/{attempt.route.name} stream failed: {value}")
+                    # Tokens already went out - a failed winner cannot be replaced
+                    if winner is None and running:
+                        continue
+                    if winner is None and launch("failover"):
+                        hedge_at = time.perf_counter() + delay
+                        continue
+                    raise self._fail(attempts, hedges)
+
+                if winner is None:
+                    winner_number = number
+                    crown(number)
+
+                if kind == "delta":
+                    parts.append(value)
+                    yield value
+                    continue
+
+                # done
+                usage = value or {}
+                text = "".join(parts)
+                attempts.append(winner.log("won"))
+                stream.call = self._finish(
+                    winner, start,
+                    usage.get("prompt_tokens") or self._prompt_tokens(payload, winner.route.model),
+                    usage.get("completion_tokens") or count_tokens(text, winner.route.model),
+                    not usage, hedges, attempts,
+                )
+                return
+        finally:
+            for attempt in running.values():
+                attempt.task.cancel()
+            if winner is not None and stream.call is None:
+                winner.task.cancel()
+
+    # ------------------------------------------------------------------
+
+    def summary(self) -> Dict[str, Any]:
+        latencies = list(self._latencies)
+        return {
+            "name": self.name,
+            "hedge_after_s": self.hedge_after if self.hedge_after is not None else "auto",
+            "max_hedges": self.max_hedges,
+            "hedge_same_route": self.hedge_same_route,
+            "order": [route.name for route in self.ranked()],
+            "latency_ms": {
+                "p50": round(_percentile(latencies, 50), 1),
+                "p95": round(_percentile(latencies, 95), 1),
+                "max": round(max(latencies), 1) if latencies else 0.0,
+            },
+            **{key: round(value, 6) if isinstance(value, float) else value for key, value in self.totals.items()},
+            "routes": {
+                route.name: {
+                    "model": route.model,
+                    "base_url": route.base_url,
+                    "hedge_delay_s": round(self.hedge_delay(route), 2),
+                    **self._stats[route.name].to_dict(),
+                }
+                for route in self.routes
+            },
+        }
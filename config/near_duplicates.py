@@ -0,0 +1,222 @@
+"""
+RadioX Near-Duplicates - The Same Story Across Feeds, Clustered
+MinHash signatures and an LSH index, updated incrementally as feeds are ingested
+
+NZZ, Tages-Anzeiger and SRF report the same story with slightly different
+titles. Each article gets a MinHash signature of its words (title plus the
+start of the summary, stop words removed). The signature is cut into bands;
+articles sharing a band are candidates, and a candidate joins a cluster if the
+estimated word overlap (Jaccard) with one of its members reaches threshold.
+
+The index lives across collections: an article seen before is looked up by
+its link, not hashed again, and a story keeps its cluster (story_id) while
+new feeds add to it. Clusters not seen for max_age_hours are pruned.
+
+dedupe() keeps one representative per cluster (the most informative summary)
+with the merged attribution - sources and the links of the other versions.
+"""
+
+import hashlib
+import json
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from config.prompt_budget import count_tokens
+from config.relevance_ranker import tokenize
+
+_MERSENNE = np.uint64((1 << 31) - 1)
+
+STOP_WORDS = {
+    "der", "die", "das", "den", "dem", "des", "ein", "eine", "einer", "eines", "einem", "einen",
+    "und", "oder", "aber", "mit", "von", "vom", "zum", "zur", "auf", "aus", "bei", "nach", "fur",
+    "uber", "unter", "ist", "sind", "war", "wird", "werden", "hat", "haben", "nicht", "auch",
+    "sich", "wie", "als", "noch", "nur", "mehr", "neue", "neuer", "neues", "heute",
+    "the", "and", "for", "with", "from", "that", "this", "are", "was", "les", "des", "une", "pour",
+}
+
+
+@dataclass
+class StoryCluster:
+    story_id: str
+    signatures: List[np.ndarray] = field(default_factory=list)
+    band_keys: Set[Tuple[int, bytes]] = field(default_factory=set)
+    article_keys: Set[str] = field(default_factory=set)
+    sources: Set[str] = field(default_factory=set)
+    first_seen: float = field(default_factory=time.time)
+    last_seen: float = field(default_factory=time.time)
+
+
+@dataclass
+class DedupReport:
+    """What clustering did to one article list"""
+    articles_in: int
+    articles_out: int
+    payload_bytes_before: int
+    payload_bytes_after: int
+    prompt_tokens_before: int
+    prompt_tokens_after: int
+    elapsed_ms: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.__dict__,
+            "duplicates_merged": self.articles_in - self.articles_out,
+            "elapsed_ms": round(self.elapsed_ms, 2),
+        }
+
+
+def _payload_bytes(articles: List[Dict[str, Any]]) -> int:
+    return len(json.dumps(articles, default=str).encode("utf-8"))
+
+
+def _prompt_tokens(articles: List[Dict[str, Any]]) -> int:
+    """Tokens of the articles as a prompt lists them (title - summary)"""
+    return count_tokens("\n".join(f"{a.get('title', '')} - {a.get('summary') or a.get('description') or ''}"
+                                  for a in articles))
+
+
+class DuplicateIndex:
+    """Incremental MinHash LSH index of news stories"""
+
+    def __init__(self, num_perm: int = 64, bands: int = 32, threshold: float = 0.5,
+                 max_age_hours: float = 48.0, text_chars: int = 300, max_signatures: int = 8, seed: int = 7):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.max_age_seconds = max_age_hours * 3600
+        self.text_chars = text_chars
+        self.max_signatures = max_signatures
+        generator = np.random.default_rng(seed)
+        self._a = generator.integers(1, int(_MERSENNE), size=num_perm, dtype=np.uint64)
+        self._b = generator.integers(0, int(_MERSENNE), size=num_perm, dtype=np.uint64)
+        self._buckets: Dict[Tuple[int, bytes], Set[str]] = {}
+        self._clusters: Dict[str, StoryCluster] = {}
+        self._seen: Dict[str, str] = {}
+        self.stats = {"articles_indexed": 0, "articles_known": 0, "merged": 0, "pruned": 0}
+
+    @staticmethod
+    def article_key(article: Dict[str, Any]) -> str:
+        return article.get("link") or f"{article.get('source', '')}|{article.get('title', '')}"
+
+    def signature(self, article: Dict[str, Any]) -> Optional[np.ndarray]:
+        """MinHash of the article's words - None if it has no content words"""
+        text = f"{article.get('title', '')} {str(article.get('summary') or article.get('description') or '')[:self.text_chars]}"
+        words = {word for word in tokenize(text) if len(word) > 2 and word not in STOP_WORDS}
+        if not words:
+            return None
+        hashes = np.fromiter((zlib.crc32(word.encode("utf-8")) for word in words), dtype=np.uint64, count=len(words))
+        # (a * x + b) mod p per permutation, minimum over the words - a < 2^31, x < 2^32: no overflow
+        return ((self._a[:, None] * hashes[None, :] + self._b[:, None]) % _MERSENNE).min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> List[Tuple[int, bytes]]:
+        return [(band, signature[band * self.rows:(band + 1) * self.rows].tobytes()) for band in range(self.bands)]
+
+    def _similarity(self, signature: np.ndarray, cluster: StoryCluster) -> float:
+        return max(float(np.mean(signature == member)) for member in cluster.signatures)
+
+    def add(self, article: Dict[str, Any]) -> str:
+        """Story id of an article - joins the most similar cluster above threshold, else starts one"""
+        now = time.time()
+        key = self.article_key(article)
+        story_id = self._seen.get(key)
+        if story_id in self._clusters:
+            self._clusters[story_id].last_seen = now
+            self.stats["articles_known"] += 1
+            return story_id
+
+        self.stats["articles_indexed"] += 1
+        signature = self.signature(article)
+        cluster = None
+        if signature is not None:
+            band_keys = self._band_keys(signature)
+            candidates = set().union(*(self._buckets.get(band_key, ()) for band_key in band_keys))
+            scored = [(self._similarity(signature, self._clusters[c]), c) for c in candidates if c in self._clusters]
+            best = max(scored, default=None)
+            if best and best[0] >= self.threshold:
+                cluster = self._clusters[best[1]]
+                self.stats["merged"] += 1
+
+        if cluster is None:
+            cluster = StoryCluster(story_id=hashlib.sha1(key.encode("utf-8")).hexdigest()[:12])
+            self._clusters[cluster.story_id] = cluster
+
+        # Every member's bands point to the cluster - later versions can match any of them
+        if signature is not None and len(cluster.signatures) < self.max_signatures:
+            cluster.signatures.append(signature)
+            for band_key in band_keys:
+                self._buckets.setdefault(band_key, set()).add(cluster.story_id)
+                cluster.band_keys.add(band_key)
+        cluster.article_keys.add(key)
+        cluster.sources.add(article.get("source") or "")
+        cluster.last_seen = now
+        self._seen[key] = cluster.story_id
+        return cluster.story_id
+
+    def ingest(self, articles: List[Dict[str, Any]]) -> List[str]:
+        """Index a feed's articles as they arrive"""
+        return [self.add(article) for article in articles]
+
+    def dedupe(self, articles: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], DedupReport]:
+        """One representative per story (in first-seen order) with merged source attribution"""
+        start = time.perf_counter()
+        groups: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        for article in articles:
+            story_id = self._seen.get(self.article_key(article))
+            if story_id not in self._clusters:
+                story_id = self.add(article)
+            groups.setdefault(story_id, []).append(article)
+
+        deduped = []
+        for story_id, group in groups.items():
+            # Most informative version represents the story (ties: first seen)
+            representative = max(group, key=lambda a: len(str(a.get("summary") or a.get("description") or "")))
+            entry = {**representative, "story_id": story_id,
+                     "sources": list(dict.fromkeys(a.get("source") for a in group if a.get("source")))}
+            if len(group) > 1:
+                entry["related_links"] = [a.get("link") for a in group if a is not representative and a.get("link")]
+            deduped.append(entry)
+
+        self.prune()
+        report = DedupReport(
+            articles_in=len(articles),
+            articles_out=len(deduped),
+            payload_bytes_before=_payload_bytes(articles),
+            payload_bytes_after=_payload_bytes(deduped),
+            prompt_tokens_before=_prompt_tokens(articles),
+            prompt_tokens_after=_prompt_tokens(deduped),
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+        )
+        return deduped, report
+
+    def prune(self, now: Optional[float] = None):
+        """Forget stories not seen for max_age_hours"""
+        cutoff = (now or time.time()) - self.max_age_seconds
+        for story_id in [s for s, cluster in self._clusters.items() if cluster.last_seen < cutoff]:
+            cluster = self._clusters.pop(story_id)
+            for band_key in cluster.band_keys:
+                members = self._buckets.get(band_key)
+                if members:
+                    members.discard(story_id)
+                    if not members:
+                        del self._buckets[band_key]
+            for key in cluster.article_keys:
+                self._seen.pop(key, None)
+            self.stats["pruned"] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        multi = [cluster for cluster in self._clusters.values() if len(cluster.article_keys) > 1]
+        return {
+            "stories": len(self._clusters),
+            "articles": len(self._seen),
+            "multi_source_stories": len(multi),
+            "buckets": len(self._buckets),
+            **self.stats,
+        }
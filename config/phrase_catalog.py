@@ -0,0 +1,162 @@
+"""
+RadioX Phrase Catalog - Fixed Recurring Phrases for Pre-rendered Audio
+Station IDs, time announcements, greetings and sign-offs per language / speaker
+
+dynamic_config rows (category "phrases"):
+- phrases_<language>            e.g. phrases_de        -> ["Bleibt dran bei RadioX!", ...]
+- phrases_<language>_<speaker>  e.g. phrases_de_marcel -> ["Ich bin Marcel."]
+
+Templates may use {hour} (0-23, "17"), {hh} ("17:00" style, zero padded) and
+{location} (location display names) - they are expanded into the concrete
+phrase set that the audio service pre-renders. plan() splits a segment into
+sentences and marks every sentence that exactly matches a catalog phrase, so
+cached audio can be spliced in and only the rest goes to TTS.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+PHRASE_CATEGORY = "phrases"
+PHRASE_KEY_PREFIX = "phrases_"
+
+# Built-in defaults - recurring lines of the saved *-show.txt scripts
+DEFAULT_PHRASES: Dict[Tuple[str, Optional[str]], List[str]] = {
+    ("de", None): [
+        "Es ist {hour} Uhr.",
+        "Es ist {hh} Uhr.",
+        "Es ist {hour} Uhr, und ihr hört RadioX.",
+        "Es ist {hh} Uhr und ihr hört RadioX.",
+        "Es ist {hh} Uhr und ihr hört RadioX mit den aktuellen News.",
+        "Ihr hört RadioX.",
+        "RadioX {location}.",
+        "Guten Morgen {location}!",
+        "Guten Tag {location}!",
+        "Guten Abend {location}!",
+        "Hallo zusammen!",
+        "Das waren die wichtigsten News für euch.",
+        "Wir sind gleich zurück mit Musik!",
+        "Bleibt dran bei RadioX!",
+        "Bleibt dran bei RadioX - eurem lokalen Sender für {location}!",
+    ],
+    ("de", "marcel"): [
+        "Ich bin Marcel, und mit mir im Studio ist Jarvis.",
+    ],
+}
+
+DEFAULT_LOCATIONS = ["Zürich"]
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_phrase(text: str) -> str:
+    """Canonical form for exact matching (whitespace only - wording must match)"""
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+@dataclass
+class PhrasePart:
+    """One piece of a planned segment"""
+    text: str
+    cached: bool
+
+
+class PhraseCatalog:
+    """Expanded fixed phrases per (language, speaker) with sentence-level matching"""
+
+    def __init__(self):
+        self._templates: Dict[Tuple[str, Optional[str]], List[str]] = {}
+        self._locations: List[str] = list(DEFAULT_LOCATIONS)
+        self._expanded: Dict[Tuple[str, Optional[str]], Set[str]] = {}
+        self.version = 0
+        self.load_templates(DEFAULT_PHRASES)
+
+    @staticmethod
+    def _expand_template(template: str, locations: List[str]) -> Set[str]:
+        variants = [template]
+        if "{hour}" in template or "{hh}" in template:
+            variants = [
+                variant.replace("{hour}", str(hour)).replace("{hh}", f"{hour:02d}:00")
+                for variant in variants for hour in range(24)
+            ]
+        if "{location}" in template:
+            variants = [variant.replace("{location}", location) for variant in variants for location in locations]
+        return {normalize_phrase(variant) for variant in variants}
+
+    def load_templates(self, templates: Dict[Tuple[str, Optional[str]], List[str]],
+                       locations: Optional[Iterable[str]] = None):
+        """Replace all templates and re-expand the phrase sets"""
+        if locations is not None:
+            self._locations = sorted({location for location in locations if location}) or list(DEFAULT_LOCATIONS)
+        self._templates = {scope: list(entries) for scope, entries in templates.items()}
+        self._expanded = {
+            scope: set().union(*(self._expand_template(template, self._locations) for template in entries))
+            if entries else set()
+            for scope, entries in self._templates.items()
+        }
+        self.version += 1
+
+    def load_config_rows(self, rows: Iterable[Dict[str, Any]], locations: Optional[Iterable[str]] = None):
+        """Load dynamic_config rows (category "phrases"), keeping built-ins as base"""
+        templates = {scope: list(entries) for scope, entries in DEFAULT_PHRASES.items()}
+
+        for row in rows:
+            key = row.get("config_key") or ""
+            if not key.startswith(PHRASE_KEY_PREFIX):
+                continue
+            entries = row.get("config_json") or row.get("config_value")
+            if isinstance(entries, str):
+                entries = [line for line in entries.splitlines() if line.strip()]
+            if not isinstance(entries, list):
+                continue
+
+            language, _, speaker = key[len(PHRASE_KEY_PREFIX):].partition("_")
+            scope = (language.lower(), speaker.lower() or None)
+            templates.setdefault(scope, []).extend(str(entry) for entry in entries)
+
+        self.load_templates(templates, locations)
+
+    def phrases_for(self, language: str = "de", speaker: Optional[str] = None) -> Set[str]:
+        """All concrete phrases a speaker may say in a language"""
+        language = (language or "de").lower()
+        phrases = set(self._expanded.get((language, None), set()))
+        if speaker:
+            phrases |= self._expanded.get((language, speaker.lower()), set())
+        return phrases
+
+    def plan(self, text: str, language: str = "de", speaker: Optional[str] = None,
+             available: Optional[Set[str]] = None) -> List[PhrasePart]:
+        """Split a segment into cached / TTS parts (adjacent TTS sentences stay together)
+
+        available restricts cache hits to phrases that are actually rendered.
+        """
+        normalized = normalize_phrase(text)
+        phrases = available if available is not None else self.phrases_for(language, speaker)
+        if not phrases or not normalized:
+            return [PhrasePart(normalized, False)] if normalized else []
+        if normalized in phrases:
+            return [PhrasePart(normalized, True)]
+
+        parts: List[PhrasePart] = []
+        for sentence in _SENTENCE_SPLIT.split(normalized):
+            cached = sentence in phrases
+            if not cached and parts and not parts[-1].cached:
+                parts[-1] = PhrasePart(f"{parts[-1].text} {sentence}", False)
+            else:
+                parts.append(PhrasePart(sentence, cached))
+        return parts
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "locations": self._locations,
+            "scopes": {
+                f"{language}:{speaker or '*'}": len(phrases)
+                for (language, speaker), phrases in self._expanded.items()
+            },
+        }
+
+
+# Global instance
+phrase_catalog = PhraseCatalog()
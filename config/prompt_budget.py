@@ -0,0 +1,242 @@
+"""
+RadioX Prompt Budget - Token-Budgeted Prompt Assembly
+Counts tokens locally, gives every prompt section a budget and trims the
+lowest-value content first
+
+Token counts use tiktoken when it is installed (exact for OpenAI models) and a
+local estimate otherwise (one token per ~4 word characters and per
+punctuation mark - close enough for budgeting German and English prose).
+
+A prompt is a list of sections in output order; each has a priority
+(0 = most valuable). build():
+1. caps every item at its section's item_tokens (cut at a sentence boundary)
+2. caps every section at its max_tokens (trailing items dropped)
+3. while the prompt is over budget, the least valuable section that still has
+   optional content gives up its last item - first compacted (e.g. headline
+   instead of full text), then dropped
+Required sections are never trimmed. Raw API payloads are reduced to the
+fields a prompt actually uses with weather_line() / bitcoin_line().
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+DEFAULT_MODEL = "gpt-4o"
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+_SENTENCE_END = re.compile(r"[.!?…](?=\s|$)")
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    """tiktoken encoding of a model - None if tiktoken (or its encoding files) are unavailable"""
+    try:
+        import tiktoken
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str, model: str = DEFAULT_MODEL) -> int:
+    """Prompt tokens of a text (exact with tiktoken, estimated without)"""
+    if not text:
+        return 0
+    encoding = _encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return sum((len(token) + 3) // 4 if token[0].isalnum() or token[0] == "_" else 1
+               for token in _TOKEN_PATTERN.findall(text))
+
+
+def truncate_tokens(text: str, max_tokens: int, model: str = DEFAULT_MODEL, ellipsis: str = "...") -> str:
+    """Longest prefix within max_tokens, cut at a sentence end (or word) boundary"""
+    if max_tokens <= 0:
+        return ""
+    if count_tokens(text, model) <= max_tokens:
+        return text
+
+    budget = max(1, max_tokens - count_tokens(ellipsis, model))
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if count_tokens(text[:middle], model) <= budget:
+            low = middle
+        else:
+            high = middle - 1
+    cut = text[:low]
+
+    # Prefer a whole sentence if one ends in the last 40% of the cut
+    sentence_ends = [match.end() for match in _SENTENCE_END.finditer(cut)]
+    if sentence_ends and sentence_ends[-1] >= len(cut) * 0.6:
+        return cut[:sentence_ends[-1]]
+    space = cut.rfind(" ")
+    if space > len(cut) * 0.6:
+        cut = cut[:space]
+    return cut.rstrip(" ,;:-") + ellipsis
+
+
+def weather_line(weather: Optional[Dict[str, Any]], location: Optional[str] = None) -> str:
+    """Weather payload -> the fields prompts use (temperature, description)"""
+    if not weather:
+        return ""
+    temperature = weather.get("temperature")
+    description = weather.get("description") or "keine Beschreibung"
+    place = location or weather.get("location") or ""
+    if isinstance(temperature, (int, float)):
+        temperature = f"{temperature:.0f}°C"
+    return f"Wetter{' in ' + place if place else ''}: {temperature or 'N/A'}, {description}"
+
+
+def bitcoin_line(bitcoin: Optional[Dict[str, Any]]) -> str:
+    """Bitcoin payload -> price and 24h change (collector: price_usd, older payloads: price)"""
+    if not bitcoin:
+        return ""
+    price = bitcoin.get("price_usd", bitcoin.get("price"))
+    change = bitcoin.get("change_24h")
+    if not isinstance(price, (int, float)):
+        return f"Bitcoin: {price or 'N/A'}"
+    line = f"Bitcoin: ${price:,.0f}"
+    if isinstance(change, (int, float)):
+        line += f" ({change:+.1f}% 24h)"
+    return line
+
+
+@dataclass
+class PromptItem:
+    """One droppable unit of a section (an article, a data line)"""
+    text: str
+    compact: Optional[str] = None   # shorter form used before the item is dropped
+    compacted: bool = False
+
+
+@dataclass
+class PromptSection:
+    name: str
+    items: List[PromptItem]
+    priority: int = 0                  # 0 = most valuable - trimmed last
+    required: bool = False             # never trimmed (configuration, instructions)
+    header: str = ""
+    separator: str = "\n"
+    max_tokens: Optional[int] = None   # cap of the whole section
+    item_tokens: Optional[int] = None  # cap of every single item
+    min_items: int = 0                 # items that are compacted but never dropped
+
+    def render(self) -> str:
+        if not self.items:
+            return ""
+        body = self.separator.join(item.text for item in self.items)
+        return f"{self.header}{body}" if self.header else body
+
+
+@dataclass
+class PromptBuild:
+    """Assembled prompt and what the budget did to it"""
+    text: str
+    budget_tokens: int
+    tokens_before: int
+    tokens_after: int
+    sections: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "budget": self.budget_tokens,
+            "before": self.tokens_before,
+            "after": self.tokens_after,
+            "saved": self.tokens_before - self.tokens_after,
+            "sections": self.sections,
+        }
+
+
+class PromptBudget:
+    """Builds a prompt from sections within a token budget"""
+
+    def __init__(self, budget_tokens: int, model: str = DEFAULT_MODEL, joiner: str = "\n\n"):
+        self.budget_tokens = budget_tokens
+        self.model = model
+        self.joiner = joiner
+        self.sections: List[PromptSection] = []
+
+    def add(self, name: str, items: List[Any], **options) -> "PromptBudget":
+        """Add a section - items are strings or PromptItems (in value order, most valuable first)"""
+        self.sections.append(PromptSection(
+            name=name,
+            items=[item if isinstance(item, PromptItem) else PromptItem(str(item)) for item in items if item],
+            **options
+        ))
+        return self
+
+    def text(self, name: str, text: str, **options) -> "PromptBudget":
+        """Add a single-text section (required unless a priority is given)"""
+        options.setdefault("required", "priority" not in options)
+        return self.add(name, [text] if text else [], **options)
+
+    def _render(self) -> str:
+        return self.joiner.join(rendered for rendered in (section.render() for section in self.sections) if rendered)
+
+    def _tokens(self, section: PromptSection) -> int:
+        return count_tokens(section.render(), self.model)
+
+    def build(self) -> PromptBuild:
+        tokens_before = count_tokens(self._render(), self.model)
+        stats = {section.name: {"items": len(section.items), "compacted": 0, "dropped": 0} for section in self.sections}
+
+        # 1. + 2. Per-item and per-section caps
+        for section in self.sections:
+            if section.required:
+                continue
+            if section.item_tokens:
+                for item in section.items:
+                    item.text = truncate_tokens(item.text, section.item_tokens, self.model)
+            if section.max_tokens:
+                while len(section.items) > section.min_items and self._tokens(section) > section.max_tokens:
+                    section.items.pop()
+                    stats[section.name]["dropped"] += 1
+
+        # 3. Over budget - least valuable content goes first
+        section_tokens = {section.name: self._tokens(section) for section in self.sections}
+        joins = count_tokens(self.joiner, self.model)
+        candidates = sorted((s for s in self.sections if not s.required), key=lambda s: -s.priority)
+
+        def total() -> int:
+            rendered = [tokens for tokens in section_tokens.values() if tokens]
+            return sum(rendered) + joins * max(0, len(rendered) - 1)
+
+        while total() > self.budget_tokens:
+            section = next((s for s in candidates if self._trim_one(s, stats[s.name])), None)
+            if section is None:
+                logger.warning(f"⚠️ Prompt over budget ({total()} > {self.budget_tokens} tokens) "
+                               f"after trimming all optional content")
+                break
+            section_tokens[section.name] = self._tokens(section)
+
+        text = self._render()
+        for section in self.sections:
+            stats[section.name]["tokens"] = section_tokens[section.name]
+        return PromptBuild(
+            text=text,
+            budget_tokens=self.budget_tokens,
+            tokens_before=tokens_before,
+            tokens_after=count_tokens(text, self.model),
+            sections=stats,
+        )
+
+    @staticmethod
+    def _trim_one(section: PromptSection, stats: Dict[str, int]) -> bool:
+        """Compact, else drop, the last item of a section - False if nothing is left to trim"""
+        for item in reversed(section.items):
+            if item.compact is not None and not item.compacted and item.compact != item.text:
+                item.text, item.compacted = item.compact, True
+                stats["compacted"] += 1
+                return True
+        if len(section.items) > section.min_items:
+            section.items.pop()
+            stats["dropped"] += 1
+            return True
+        return False
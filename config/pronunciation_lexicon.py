@@ -0,0 +1,246 @@
+"""
+RadioX Pronunciation Lexicon - Aho-Corasick Text Preprocessing for TTS
+Data-driven replacements per language and per speaker, loaded from dynamic_config
+
+dynamic_config rows (category "pronunciation"):
+- lexicon_<language>            e.g. lexicon_de        -> {"RadioX": "Radio X", "AI": "A I"}
+- lexicon_<language>_<speaker>  e.g. lexicon_de_marcel -> {"!": "!!"}
+
+Speaker entries override language entries with the same pattern. All entries of
+a (language, speaker) pair are compiled into one automaton, so preprocessing a
+segment is a single pass whose cost does not grow with the lexicon size.
+Patterns that start/end with a word character only match on word boundaries
+("AI" matches "AI" but not "FAIR" or "Kaiser").
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+LEXICON_CATEGORY = "pronunciation"
+LEXICON_KEY_PREFIX = "lexicon_"
+
+# Built-in defaults - used until dynamic_config has been loaded
+DEFAULT_LEXICONS: Dict[Tuple[str, Optional[str]], Dict[str, str]] = {
+    ("de", None): {
+        "RadioX": "Radio X",
+        "AI": "A I",
+        "API": "A P I",
+    },
+    ("de", "marcel"): {
+        "!": "!!",
+    },
+    ("de", "jarvis"): {
+        "...": "... ",
+    },
+}
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+@dataclass
+class _Pattern:
+    text: str
+    replacement: str
+    length: int
+    boundary_start: bool
+    boundary_end: bool
+
+
+class PronunciationAutomaton:
+    """Aho-Corasick automaton with leftmost-longest, word-boundary-aware replacement"""
+
+    def __init__(self, entries: Dict[str, str]):
+        self.patterns: List[_Pattern] = [
+            _Pattern(
+                text=pattern,
+                replacement=replacement,
+                length=len(pattern),
+                boundary_start=_is_word_char(pattern[0]),
+                boundary_end=_is_word_char(pattern[-1]),
+            )
+            for pattern, replacement in entries.items()
+            if pattern
+        ]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _build(self):
+        """Build trie, failure links and merged output sets (BFS)"""
+        goto, out = self._goto, {0: []}
+
+        for pattern_id, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern.text:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    out[next_state] = []
+                state = next_state
+            out[state].append(pattern_id)
+
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                candidate = goto[fallback].get(char, 0)
+                fail[next_state] = candidate if candidate != next_state else 0
+                out[next_state].extend(out[fail[next_state]])
+
+        self._fail = fail
+        # Longest patterns first so the first valid hit per end position wins ties
+        self._out = [
+            tuple(sorted(out[state], key=lambda pid: -self.patterns[pid].length))
+            for state in range(len(goto))
+        ]
+
+    def apply(self, text: str) -> str:
+        """Replace all lexicon matches in one pass (leftmost-longest, non-overlapping)"""
+        if not self.patterns or not text:
+            return text
+
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        root = goto[0]
+        text_length = len(text)
+        matches: List[Tuple[int, int, int]] = []
+        state = 0
+
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0) if state else root.get(char, 0)
+            if not state:
+                continue
+
+            for pattern_id in out[state]:
+                pattern = patterns[pattern_id]
+                start = position - pattern.length + 1
+                if pattern.boundary_start and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if pattern.boundary_end and position + 1 < text_length and _is_word_char(text[position + 1]):
+                    continue
+                matches.append((start, -pattern.length, pattern_id))
+
+        if not matches:
+            return text
+
+        matches.sort()
+        pieces: List[str] = []
+        cursor = 0
+        for start, negative_length, pattern_id in matches:
+            if start < cursor:
+                continue  # Overlaps an earlier (leftmost-longest) match
+            pieces.append(text[cursor:start])
+            pieces.append(patterns[pattern_id].replacement)
+            cursor = start - negative_length
+        pieces.append(text[cursor:])
+        return "".join(pieces)
+
+
+class PronunciationLexicon:
+    """Per-language / per-speaker lexicons with lazily compiled, cached automata"""
+
+    def __init__(self):
+        self._scopes: Dict[Tuple[str, Optional[str]], Dict[str, str]] = {}
+        self._fingerprints: Dict[Tuple[str, Optional[str]], str] = {}
+        self._automata: Dict[Tuple[str, Optional[str]], PronunciationAutomaton] = {}
+        self.version = 0
+        self.load_scopes(DEFAULT_LEXICONS)
+
+    @staticmethod
+    def _fingerprint(entries: Dict[str, str]) -> str:
+        payload = json.dumps(entries, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def load_scopes(self, scopes: Dict[Tuple[str, Optional[str]], Dict[str, str]]) -> int:
+        """Replace all lexicon scopes, recompiling only the ones that changed"""
+        fingerprints = {scope: self._fingerprint(entries) for scope, entries in scopes.items()}
+        changed = {
+            scope for scope in set(fingerprints) | set(self._fingerprints)
+            if fingerprints.get(scope) != self._fingerprints.get(scope)
+        }
+
+        self._scopes = {scope: dict(entries) for scope, entries in scopes.items()}
+        self._fingerprints = fingerprints
+
+        if changed:
+            # Drop compiled automata that include a changed scope - rebuilt on next use
+            changed_languages = {language for language, speaker in changed if speaker is None}
+            self._automata = {
+                key: automaton for key, automaton in self._automata.items()
+                if key not in changed and key[0] not in changed_languages
+            }
+            self.version += 1
+        return len(changed)
+
+    def load_config_rows(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Load dynamic_config rows (category "pronunciation"), keeping built-ins as base"""
+        scopes = {scope: dict(entries) for scope, entries in DEFAULT_LEXICONS.items()}
+
+        for row in rows:
+            key = row.get("config_key") or ""
+            if not key.startswith(LEXICON_KEY_PREFIX):
+                continue
+
+            entries = row.get("config_json") or row.get("config_value")
+            if isinstance(entries, str):
+                try:
+                    entries = json.loads(entries)
+                except json.JSONDecodeError:
+                    continue
+            if not isinstance(entries, dict):
+                continue
+
+            language, _, speaker = key[len(LEXICON_KEY_PREFIX):].partition("_")
+            scope = (language.lower(), speaker.lower() or None)
+            scopes.setdefault(scope, {}).update({str(k): str(v) for k, v in entries.items()})
+
+        return self.load_scopes(scopes)
+
+    def get_automaton(self, language: str = "de", speaker: Optional[str] = None) -> PronunciationAutomaton:
+        """Get (and cache) the merged automaton for a language/speaker pair"""
+        key = ((language or "de").lower(), speaker.lower() if speaker else None)
+        automaton = self._automata.get(key)
+        if automaton is None:
+            entries = dict(self._scopes.get((key[0], None), {}))
+            if key[1]:
+                entries.update(self._scopes.get(key, {}))
+            automaton = PronunciationAutomaton(entries)
+            self._automata[key] = automaton
+        return automaton
+
+    def apply(self, text: str, language: str = "de", speaker: Optional[str] = None) -> str:
+        """Preprocess text for speech synthesis"""
+        return self.get_automaton(language, speaker).apply(text)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "scopes": {
+                f"{language}:{speaker or '*'}": len(entries)
+                for (language, speaker), entries in self._scopes.items()
+            },
+            "compiled_automata": len(self._automata),
+        }
+
+
+# Global instance
+pronunciation_lexicon = PronunciationLexicon()
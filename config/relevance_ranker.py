@@ -0,0 +1,228 @@
+"""
+RadioX Relevance Ranker - Local Pre-Ranking of News Articles
+Scores the whole article pool in one vectorized pass (NumPy) before any LLM sees it
+
+score = weighted sum of five features (each 0..1):
+- recency: exponential decay with the article age (half_life_hours)
+- source: per-source weight ("nzz=1.2,20min=0.8"), scaled to the heaviest source
+- location: location keywords in the title (1.0) or the text (0.5)
+- category: category keywords in the title (1.0) or the text (0.5)
+- novelty: 1 - highest title similarity to recently aired articles
+
+Texts are hashed bags of words (feature hashing, no vocabulary to maintain),
+so keyword hits and title similarities are array operations - thousands of
+articles rank in milliseconds. The shortlist skips near-identical titles
+(duplicate_threshold), so a story carried by five feeds takes one slot.
+"""
+
+import re
+import time
+import unicodedata
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+_WORD = re.compile(r"\w+")
+_HTML_TAG = re.compile(r"<[^>]+>")
+_COMBINING = re.compile(r"[\u0300-\u036f]")
+_UMLAUTS = {"ä": "ae", "ö": "oe", "ü": "ue"}
+
+
+def _fold(text: str) -> str:
+    """Zürich -> zurich (tags and accents removed, lower case)"""
+    return _COMBINING.sub("", unicodedata.normalize("NFKD", _HTML_TAG.sub(" ", text).lower()))
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Words of a text, folded (see _fold)"""
+    if not text:
+        return []
+    return [word for word in _WORD.findall(_fold(str(text))) if len(word) > 1]
+
+
+def keywords(*values: Any) -> List[str]:
+    """Keywords of locations / categories - strings or objects with display_name, location_code, weather_api_name"""
+    words = set()
+    for value in values:
+        if not value:
+            continue
+        if isinstance(value, str):
+            texts = [value]
+        else:
+            texts = [getattr(value, name, None) for name in ("display_name", "location_code", "weather_api_name")]
+        for text in filter(None, texts):
+            # Zürich is also written Zuerich
+            spelled = text.lower()
+            for umlaut, replacement in _UMLAUTS.items():
+                spelled = spelled.replace(umlaut, replacement)
+            words.update(tokenize(text))
+            words.update(tokenize(spelled))
+    return sorted(words)
+
+
+def _parse_time(value: Any) -> Optional[float]:
+    if isinstance(value, datetime):
+        moment = value
+    elif isinstance(value, str) and value:
+        try:
+            moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+    if moment.tzinfo is None:
+        return moment.timestamp()   # collector timestamps are naive local time
+    return moment.astimezone(timezone.utc).timestamp()
+
+
+@dataclass
+class RankWeights:
+    recency: float = 0.35
+    source: float = 0.15
+    location: float = 0.25
+    category: float = 0.10
+    novelty: float = 0.15
+
+
+@dataclass
+class Ranking:
+    """Shortlist (indices into the ranked pool, best first) and the scores behind it"""
+    indices: List[int]
+    scores: np.ndarray
+    features: Dict[str, np.ndarray] = field(default_factory=dict)
+    pool_size: int = 0
+    duplicates_skipped: int = 0
+    elapsed_ms: float = 0.0
+
+    def pick(self, articles: Sequence[Dict[str, Any]], count: Optional[int] = None) -> List[Dict[str, Any]]:
+        return [articles[i] for i in self.indices[:count]]
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "pool": self.pool_size,
+            "shortlist": len(self.indices),
+            "duplicates_skipped": self.duplicates_skipped,
+            "ms": round(self.elapsed_ms, 2),
+            "top": [{
+                "index": i,
+                "score": round(float(self.scores[i]), 3),
+                **{name: round(float(values[i]), 2) for name, values in self.features.items()},
+            } for i in self.indices[:5]],
+        }
+
+
+class RelevanceRanker:
+    """Vectorized relevance scoring of an article pool"""
+
+    def __init__(self, weights: Optional[RankWeights] = None, half_life_hours: float = 6.0,
+                 source_weights: Optional[Dict[str, float]] = None, dim: int = 1024,
+                 duplicate_threshold: float = 0.8, body_chars: int = 400):
+        self.weights = weights or RankWeights()
+        self.half_life_hours = half_life_hours
+        self.source_weights = {source.lower(): weight for source, weight in (source_weights or {}).items()}
+        self.dim = dim
+        self.duplicate_threshold = duplicate_threshold
+        self.body_chars = body_chars
+
+    def _buckets(self, texts: Sequence[str]):
+        """(row, bucket) pairs of every distinct word per text"""
+        rows: List[int] = []
+        cols: List[int] = []
+        dim = self.dim
+        # One fold over the whole pool instead of one per text (\x1e is not a word character)
+        for row, text in enumerate(_fold("\x1e".join(texts)).split("\x1e")):
+            words = {hash(word) % dim for word in _WORD.findall(text) if len(word) > 1}
+            rows.extend([row] * len(words))
+            cols.extend(words)
+        return np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)
+
+    def _vectors(self, texts: Sequence[str], buckets=None) -> np.ndarray:
+        """L2-normalized hashed bag of words per text (cosine similarity = dot product)"""
+        rows, cols = buckets if buckets is not None else self._buckets(texts)
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        matrix[rows, cols] = 1.0
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-9)
+
+    def _hits(self, rows: np.ndarray, cols: np.ndarray, words: List[str], size: int) -> np.ndarray:
+        if not words or not len(cols):
+            return np.zeros(size, dtype=bool)
+        wanted = np.fromiter((hash(word) % self.dim for word in words), dtype=np.int64)
+        return np.bincount(rows[np.isin(cols, wanted)], minlength=size) > 0
+
+    def rank(self, articles: Sequence[Dict[str, Any]], location: Any = None, category: Any = None,
+             aired_titles: Sequence[str] = (), top_k: int = 15, now: Optional[float] = None) -> Ranking:
+        start = time.perf_counter()
+        size = len(articles)
+        if not size:
+            return Ranking(indices=[], scores=np.zeros(0), pool_size=0)
+        now = now or time.time()
+
+        titles = [str(article.get("title") or "") for article in articles]
+        # Location / category mentions come early - the start of the text is enough
+        bodies = [str(article.get("summary") or article.get("description") or "")[:self.body_chars]
+                  for article in articles]
+
+        # Recency - unknown publication time counts as half a half-life old
+        published = np.array([_parse_time(article.get("timestamp") or article.get("published")) or np.nan
+                              for article in articles], dtype=np.float64)
+        age_hours = np.clip((now - published) / 3600.0, 0.0, None)
+        recency = np.where(np.isnan(age_hours), 0.5 ** 0.5, 0.5 ** (age_hours / self.half_life_hours))
+
+        # Source weight - scaled to the heaviest configured source (unconfigured = 1.0)
+        source = np.array([self.source_weights.get(str(article.get("source", "")).lower(), 1.0)
+                           for article in articles], dtype=np.float64)
+        source /= max(1.0, float(source.max()))
+
+        # Location / category keywords - title hit 1.0, text hit 0.5
+        title_rows, title_cols = self._buckets(titles)
+        body_rows, body_cols = self._buckets(bodies)
+
+        def keyword_score(words: List[str]) -> np.ndarray:
+            in_title = self._hits(title_rows, title_cols, words, size)
+            in_body = self._hits(body_rows, body_cols, words, size)
+            return np.where(in_title, 1.0, np.where(in_body, 0.5, 0.0))
+
+        location_score = keyword_score(keywords(location))
+        category_score = keyword_score(keywords(*(category.split(",") if isinstance(category, str) else [category])))
+        own_category = np.array([str(article.get("category") or article.get("feed_category") or "").lower()
+                                 for article in articles])
+        if isinstance(category, str) and category:
+            category_score = np.where(np.isin(own_category, [c.strip().lower() for c in category.split(",")]),
+                                      1.0, category_score)
+
+        # Novelty - similarity of titles to what went on air recently
+        title_vectors = self._vectors(titles, (title_rows, title_cols))
+        if aired_titles:
+            similarity = title_vectors @ self._vectors(list(aired_titles)).T
+            novelty = 1.0 - np.clip(similarity.max(axis=1), 0.0, 1.0)
+        else:
+            novelty = np.ones(size)
+
+        features = {"recency": recency, "source": source, "location": location_score,
+                    "category": category_score, "novelty": novelty}
+        w = self.weights
+        scores = (w.recency * recency + w.source * source + w.location * location_score
+                  + w.category * category_score + w.novelty * novelty)
+
+        # Shortlist - best first, near-identical titles (same story, other feed) skipped
+        indices: List[int] = []
+        skipped = 0
+        for i in np.argsort(-scores, kind="stable"):
+            if len(indices) >= top_k:
+                break
+            if indices and float((title_vectors[indices] @ title_vectors[i]).max()) >= self.duplicate_threshold:
+                skipped += 1
+                continue
+            indices.append(int(i))
+
+        return Ranking(
+            indices=indices,
+            scores=scores,
+            features=features,
+            pool_size=size,
+            duplicates_skipped=skipped,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+        )
@@ -0,0 +1,25 @@
+"""
+RadioX Request Types - Timeout Classes for Internal HTTP Calls
+Shared by the HTTP client factory and the API gateway proxy (no settings needed)
+"""
+
+from enum import Enum
+from typing import Dict
+
+from httpx import Timeout
+
+
+class RequestType(Enum):
+    """Request types for different timeout configurations"""
+    FAST = "fast"           # 5s timeout - health checks, config
+    STANDARD = "standard"   # 30s timeout - content, data
+    SLOW = "slow"          # 120s timeout - audio processing
+    ULTRA_SLOW = "ultra_slow"  # 300s timeout - show generation
+
+
+REQUEST_TIMEOUTS: Dict[RequestType, Timeout] = {
+    RequestType.FAST: Timeout(5.0, connect=2.0),
+    RequestType.STANDARD: Timeout(30.0, connect=5.0),
+    RequestType.SLOW: Timeout(120.0, connect=10.0),
+    RequestType.ULTRA_SLOW: Timeout(300.0, connect=15.0),
+}
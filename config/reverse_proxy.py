@@ -0,0 +1,244 @@
+"""
+RadioX Reverse Proxy - Pooled, Streaming Pass-Through to Upstream Services
+The API gateway's forwarding core
+
+- one keep-alive connection pool (httpx.AsyncClient) per upstream service,
+  opened on first use; when the service's URL changes the old pool is closed
+  once its in-flight streams have finished
+- request and response bodies are streamed through as raw bytes - never
+  buffered, JSON-decoded or re-encoded (audio and large listings pass in
+  constant memory, compressed responses stay compressed)
+- hop-by-hop headers (RFC 7230 6.1, plus any named in Connection) are
+  dropped in both directions; X-Forwarded-For / -Host / -Proto are added
+- the timeout class of a route is a RequestType (config.request_types);
+  the read timeout applies between chunks, so long streams stay open
+- upstream status codes and bodies pass through unchanged; an unreachable
+  upstream is a 502, a timeout a 504
+
+Timings per upstream for /proxy:
+- headers_overhead_ms  gateway time to response headers minus the upstream's
+                       (also sent as Server-Timing) - excludes the body
+- total_ms             gateway time from request to last body byte forwarded
+- upstream_ms          upstream time to response headers
+The latency a client really gains from the gateway is end-to-end: compare
+against calling the service directly (benchmarks/bench_gateway_proxy.py).
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple
+
+import httpx
+from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
+from httpx import Limits
+from loguru import logger
+
+from config.http_cassette import create_async_client
+from config.request_types import REQUEST_TIMEOUTS, RequestType
+
+HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "proxy-connection",
+    "te", "trailer", "transfer-encoding", "upgrade",
+}
+
+TIMING_SAMPLES = 1000
+
+
+def _percentile(values, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+
+def forwardable_headers(headers: httpx.Headers, drop: Tuple[str, ...] = ()) -> List[Tuple[str, str]]:
+    """End-to-end headers only - hop-by-hop, Connection-listed and the given names removed"""
+    listed = {name.strip().lower() for value in headers.get_list("connection") for name in value.split(",")}
+    skip = HOP_BY_HOP_HEADERS | listed | set(drop)
+    return [(name, value) for name, value in headers.multi_items() if name.lower() not in skip]
+
+
+@dataclass
+class UpstreamStats:
+    requests: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    interrupted: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    headers_overhead_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=TIMING_SAMPLES))
+    total_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=TIMING_SAMPLES))
+    upstream_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=TIMING_SAMPLES))
+
+    def to_dict(self) -> Dict[str, Any]:
+        overhead = list(self.headers_overhead_ms)
+        total = list(self.total_ms)
+        upstream = list(self.upstream_ms)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "interrupted_streams": self.interrupted,
+            "request_bytes": self.bytes_in,
+            "response_bytes": self.bytes_out,
+            "headers_overhead_ms": {
+                "p50": round(_percentile(overhead, 50), 3),
+                "p95": round(_percentile(overhead, 95), 3),
+                "p99": round(_percentile(overhead, 99), 3),
+            },
+            "total_ms": {
+                "p50": round(_percentile(total, 50), 1),
+                "p95": round(_percentile(total, 95), 1),
+            },
+            "upstream_headers_ms": {
+                "p50": round(_percentile(upstream, 50), 1),
+                "p95": round(_percentile(upstream, 95), 1),
+            },
+        }
+
+
+class ReverseProxy:
+    """Streams requests to upstream services over pooled keep-alive connections"""
+
+    def __init__(self, resolve: Callable[[str], str], max_connections: int = 100,
+                 max_keepalive_connections: int = 20, keepalive_expiry: float = 30.0):
+        self.resolve = resolve
+        self.limits = Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections,
+                             keepalive_expiry=keepalive_expiry)
+        self._clients: Dict[str, Tuple[str, httpx.AsyncClient]] = {}   # service -> (base_url, pool)
+        self._in_flight: Dict[httpx.AsyncClient, int] = {}
+        self._retired: List[httpx.AsyncClient] = []
+        self._stats: Dict[str, UpstreamStats] = {}
+
+    def client(self, service: str, base_url: str) -> httpx.AsyncClient:
+        """Pooled client of a service - a new URL (config reload) gets a fresh pool, the old one is retired"""
+        current = self._clients.get(service)
+        if current and current[0] == base_url:
+            return current[1]
+        if current:
+            logger.info(f"🔀 {service} moved to {base_url} - retiring pool for {current[0]}")
+            self._retired.append(current[1])
+            self._close_if_idle(current[1])
+        client = create_async_client(limits=self.limits, timeout=REQUEST_TIMEOUTS[RequestType.STANDARD])
+        self._clients[service] = (base_url, client)
+        return client
+
+    def _close_if_idle(self, client: httpx.AsyncClient):
+        if client in self._retired and not self._in_flight.get(client):
+            self._retired.remove(client)
+            self._in_flight.pop(client, None)
+            asyncio.create_task(client.aclose())
+
+    def _done(self, client: httpx.AsyncClient):
+        self._in_flight[client] -= 1
+        self._close_if_idle(client)
+
+    async def forward(self, request: Request, service: str, path: str,
+                      request_type: RequestType = RequestType.STANDARD,
+                      params: Optional[Dict[str, Any]] = None,
+                      stream_error: Optional[Callable[[Exception], bytes]] = None) -> StreamingResponse:
+        """Forward request to service/path - params (non-None) override the incoming query
+
+        stream_error renders a failure after the response started (e.g. an SSE
+        error event) - the status code is already out by then.
+        """
+        start = time.perf_counter()
+        stats = self._stats.setdefault(service, UpstreamStats())
+        stats.requests += 1
+        base_url = self.resolve(service)
+
+        query = httpx.QueryParams(request.url.query)
+        for key, value in (params or {}).items():
+            if value is not None:
+                query = query.set(key, value)
+
+        outgoing = forwardable_headers(httpx.Headers(request.headers.raw), drop=("host",))
+        client_host = request.client.host if request.client else None
+        forwarded_for = request.headers.get("x-forwarded-for")
+        if client_host:
+            outgoing.append(("x-forwarded-for", f"{forwarded_for}, {client_host}" if forwarded_for else client_host))
+        outgoing.append(("x-forwarded-host", request.headers.get("host", "")))
+        outgoing.append(("x-forwarded-proto", request.url.scheme))
+
+        has_body = request.headers.get("content-length", "0") != "0" or "transfer-encoding" in request.headers
+
+        async def request_body() -> AsyncIterator[bytes]:
+            async for chunk in request.stream():
+                stats.bytes_in += len(chunk)
+                yield chunk
+
+        client = self.client(service, base_url)
+        upstream_request = client.build_request(
+            request.method, f"{base_url}{path}", params=query, headers=outgoing,
+            content=request_body() if has_body else None,
+            timeout=REQUEST_TIMEOUTS[request_type],
+        )
+        self._in_flight[client] = self._in_flight.get(client, 0) + 1
+        sent = time.perf_counter()
+        try:
+            upstream = await client.send(upstream_request, stream=True)
+        except httpx.TimeoutException:
+            self._done(client)
+            stats.timeouts += 1
+            logger.warning(f"⏱️ {service} timed out ({request_type.value}) on {request.method} {path}")
+            raise HTTPException(status_code=504, detail=f"{service} service timeout")
+        except httpx.HTTPError as e:
+            self._done(client)
+            stats.errors += 1
+            logger.error(f"❌ {service} unreachable on {request.method} {path}: {e}")
+            raise HTTPException(status_code=502, detail=f"{service} service unavailable: {e}")
+        received = time.perf_counter()
+
+        async def response_body() -> AsyncIterator[bytes]:
+            try:
+                async for chunk in upstream.aiter_raw():
+                    stats.bytes_out += len(chunk)
+                    yield chunk
+            except httpx.HTTPError as e:
+                stats.interrupted += 1
+                logger.warning(f"⚠️ {service} stream interrupted on {request.method} {path}: {e}")
+                if stream_error:
+                    yield stream_error(e)
+            finally:
+                await upstream.aclose()
+                stats.total_ms.append((time.perf_counter() - start) * 1000)
+                self._done(client)
+
+        # Date / Server are set by the gateway's own server
+        response_headers = forwardable_headers(upstream.headers, drop=("date", "server"))
+        upstream_ms = (received - sent) * 1000
+        headers_overhead_ms = ((sent - start) + (time.perf_counter() - received)) * 1000
+        response_headers.append(("server-timing",
+                                 f"gateway-headers;dur={headers_overhead_ms:.3f}, upstream;dur={upstream_ms:.1f}"))
+        stats.upstream_ms.append(upstream_ms)
+        stats.headers_overhead_ms.append(headers_overhead_ms)
+
+        response = StreamingResponse(response_body(), status_code=upstream.status_code)
+        # Raw multi-value headers (Set-Cookie) - StreamingResponse(headers=) would fold them
+        response.raw_headers = [(name.lower().encode("latin-1"), value.encode("latin-1"))
+                                for name, value in response_headers]
+        return response
+
+    async def aclose(self):
+        for _, client in self._clients.values():
+            await client.aclose()
+        for client in self._retired:
+            await client.aclose()
+        self._clients.clear()
+        self._retired.clear()
+        self._in_flight.clear()
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "pools": {service: base_url for service, (base_url, _) in self._clients.items()},
+            "retired_pools": len(self._retired),
+            "limits": {
+                "max_connections": self.limits.max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+                "keepalive_expiry": self.limits.keepalive_expiry,
+            },
+            "upstreams": {service: stats.to_dict() for service, stats in self._stats.items()},
+        }
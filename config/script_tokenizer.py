@@ -0,0 +1,283 @@
+"""
+RadioX Script Tokenizer - Single-Pass Speaker Segmentation
+Shared by Show Service and Audio Service
+
+Recognised speaker tag styles (one precompiled pattern, one pass per script):
+- [MARCEL] text        (GPT output / show-service)
+- **[MARCEL]** text    (markdown show exports)
+- MARCEL: text         (legacy audio-service format, also **MARCEL:** text)
+
+Speaker names are resolved through an alias table (e.g. MARCELO -> marcel)
+that is loaded once from dynamic_config and shared by every tokenizer.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple
+
+
+# One marker pattern recognises every segment boundary. A tag only starts a
+# segment when it names a known speaker - bracket tags may carry extras
+# ("[MARCEL (Moderator)]"), colon tags must be an exact alias, so "Wichtig: ..."
+# and "[Musik]" stay text.
+_MARKER_PATTERN = re.compile(
+    r"""(?:
+        (?P<skip>\#.*|[-=*_]{3,}$)
+      | \*{0,2}\[(?P<bracket>[^\]]{1,40})\]\*{0,2}(?:[ \t]*:)?
+      | \*{0,2}(?P<colon>[^\W\d_][\w \-]{0,29}?)\*{0,2}[ \t]*:(?!\d)\*{0,2}
+    )[ \t]*""",
+    re.VERBOSE,
+)
+
+# Cheap first-character prefilter - most lines are plain continuation text
+_MARKER_START = frozenset("[*#-=_")
+_COLON_WINDOW = 34
+
+# Resolved tags kept per alias table - only hits, so stray "[Musik]" style tags cannot grow it
+_RESOLVED_CACHE_SIZE = 512
+
+DEFAULT_SPEAKER = "marcel"
+
+BUILTIN_SPEAKER_ALIASES: Dict[str, str] = {
+    "marcel": "marcel",
+    "marcelo": "marcel",
+    "jarvis": "jarvis",
+    "brad": "brad",
+    "lucy": "lucy",
+}
+
+
+@dataclass
+class ScriptSegment:
+    """One contiguous block of text spoken by a single speaker"""
+    speaker: str
+    text: str
+    original_speaker: str
+    index: int = 0
+
+    @property
+    def word_count(self) -> int:
+        return len(self.text.split())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "speaker": self.speaker,
+            "text": self.text,
+            "original_speaker": self.original_speaker,
+        }
+
+
+@dataclass
+class SpeakerAliasTable:
+    """Maps raw speaker tags (MARCELO, Marcel, jarvis) to canonical speaker names"""
+    aliases: Dict[str, str] = field(default_factory=lambda: dict(BUILTIN_SPEAKER_ALIASES))
+    default_speaker: str = DEFAULT_SPEAKER
+    _resolved: Dict[Tuple[str, bool], str] = field(default_factory=dict, repr=False)
+    _fuzzy: Optional[Pattern] = field(default=None, repr=False)
+
+    def update(self, mapping: Optional[Dict[str, str]]):
+        """Merge additional aliases (e.g. from dynamic_config) into the table"""
+        if not mapping:
+            return
+        for alias, speaker in mapping.items():
+            if alias and speaker:
+                self.aliases[str(alias).strip().lower()] = str(speaker).strip().lower()
+        self._resolved.clear()
+        self._fuzzy = None
+
+    def add_speakers(self, speaker_names: Iterable[str]):
+        """Register canonical speaker names (e.g. from voice_configurations)"""
+        self.update({name: name for name in speaker_names if name})
+
+    def lookup(self, raw: str, fuzzy: bool = True) -> Optional[str]:
+        """Resolve a raw tag to a canonical speaker, or None if unknown
+
+        fuzzy: also match tags that contain an alias as a whole word
+        ("marcel (moderator)", but not "bradley cooper" for brad)
+        """
+        cache_key = (raw, fuzzy)
+        speaker = self._resolved.get(cache_key)
+        if speaker:
+            return speaker
+
+        key = raw.strip().strip("*").strip().lower()
+        speaker = self.aliases.get(key)
+
+        if speaker is None and key and fuzzy:
+            if self._fuzzy is None:
+                # Longest alias first - "marcelo" wins over "marcel"
+                names = sorted(self.aliases, key=len, reverse=True)
+                self._fuzzy = re.compile(r"(?<!\w)(?:%s)(?!\w)" % "|".join(map(re.escape, names)))
+            match = self._fuzzy.search(key)
+            if match:
+                speaker = self.aliases[match.group()]
+
+        if speaker and len(self._resolved) < _RESOLVED_CACHE_SIZE:
+            self._resolved[cache_key] = speaker
+        return speaker
+
+    def resolve(self, raw: str) -> str:
+        """Resolve a raw tag, falling back to the default speaker"""
+        return self.lookup(raw) or self.default_speaker
+
+
+class ScriptTokenizer:
+    """Single-pass script tokenizer with incremental (streaming) support"""
+
+    def __init__(self, aliases: Optional[SpeakerAliasTable] = None):
+        self.aliases = aliases or get_speaker_aliases()
+        self._buffer = ""
+        self._speaker: Optional[str] = None
+        self._original: Optional[str] = None
+        self._parts: List[str] = []
+        self._index = 0
+
+    def tokenize(self, script: str) -> List[ScriptSegment]:
+        """Tokenize a complete script into speaker segments"""
+        self.reset()
+        segments = self.feed(script)
+        segments.extend(self.close())
+        return segments
+
+    def feed(self, chunk: str) -> List[ScriptSegment]:
+        """Feed a chunk of streamed text, return the segments completed so far"""
+        if not chunk:
+            return []
+
+        # Older show exports contain literal "\n" sequences instead of line breaks.
+        # Replaced on the buffer, so a "\" + "n" split across chunks is caught too -
+        # a trailing lone "\" stays in the partial line until its next character arrives.
+        joined = len(self._buffer) - 1
+        self._buffer += chunk
+        if self._buffer.find("\\n", max(joined, 0)) >= 0:
+            self._buffer = self._buffer.replace("\\n", "\n")
+        cut = self._buffer.rfind("\n")
+        if cut < 0:
+            return []
+
+        # Only complete lines are scanned - a tag may still be arriving
+        complete, self._buffer = self._buffer[:cut + 1], self._buffer[cut + 1:]
+        return self._scan(complete)
+
+    def close(self) -> List[ScriptSegment]:
+        """Flush the trailing partial line and the open segment"""
+        completed = self._scan(self._buffer) if self._buffer else []
+        self._buffer = ""
+
+        segment = self._flush()
+        if segment:
+            completed.append(segment)
+        return completed
+
+    def reset(self):
+        """Reset streaming state"""
+        self._buffer = ""
+        self._speaker = None
+        self._original = None
+        self._parts = []
+        self._index = 0
+
+    def _scan(self, text: str) -> List[ScriptSegment]:
+        """Single pass over complete lines - one precompiled match per candidate line"""
+        completed: List[ScriptSegment] = []
+        aliases = self.aliases
+
+        for line in text.split("\n"):
+            line = line.strip()
+            if not line:
+                continue
+
+            raw = None
+            speaker = None
+            first = line[0]
+
+            if first == "[":
+                # Fast path for the canonical "[SPEAKER] text" form
+                end = line.find("]", 1, 42)
+                if end > 0:
+                    speaker = aliases.lookup(line[1:end])
+                    if speaker:
+                        raw = line[1:end]
+                        line = line[end + 1:].lstrip()
+                        if line[:1] == ":":
+                            line = line[1:].lstrip()  # "[JARVIS]: text"
+            elif first in _MARKER_START or ":" in line[:_COLON_WINDOW]:
+                match = _MARKER_PATTERN.match(line)
+                if match:
+                    if match.group("skip") is not None:
+                        continue  # Comment / heading / rule - no spoken content
+                    bracket = match.group("bracket")
+                    if bracket is not None:
+                        raw, speaker = bracket, aliases.lookup(bracket)
+                    else:
+                        raw = match.group("colon")
+                        speaker = aliases.lookup(raw, fuzzy=False)
+                    if speaker:
+                        line = line[match.end():]
+
+            if speaker:
+                if self._parts:
+                    completed.append(self._flush())
+                self._speaker = speaker
+                self._original = raw.strip()
+                if line:
+                    self._parts.append(line)
+                continue
+
+            # Untagged text before the first tag goes to the default speaker
+            if self._speaker is None:
+                self._speaker = aliases.default_speaker
+                self._original = "default"
+            self._parts.append(line)
+
+        return completed
+
+    def _flush(self) -> Optional[ScriptSegment]:
+        """Close the currently open segment"""
+        if self._speaker is None or not self._parts:
+            return None
+
+        segment = ScriptSegment(
+            speaker=self._speaker,
+            text=" ".join(self._parts),
+            original_speaker=self._original or self._speaker,
+            index=self._index,
+        )
+        self._index += 1
+        self._parts = []
+        return segment
+
+
+def render_script(segments: Iterable[ScriptSegment]) -> str:
+    """Render segments back into canonical "[SPEAKER] text" form"""
+    return "\n\n".join(f"[{segment.speaker.upper()}] {segment.text}" for segment in segments)
+
+
+# Global alias table - loaded once at service startup
+_speaker_aliases = SpeakerAliasTable()
+
+
+def get_speaker_aliases() -> SpeakerAliasTable:
+    """Get the shared speaker alias table"""
+    return _speaker_aliases
+
+
+def configure_speaker_aliases(mapping: Any = None, speaker_names: Optional[Iterable[str]] = None) -> SpeakerAliasTable:
+    """Load aliases from dynamic_config (speakers.speaker_name_mapping) and voice_configurations"""
+    if isinstance(mapping, str):
+        try:
+            mapping = json.loads(mapping)
+        except json.JSONDecodeError:
+            mapping = None
+
+    if isinstance(mapping, dict):
+        _speaker_aliases.update(mapping)
+    if speaker_names:
+        _speaker_aliases.add_speakers(speaker_names)
+    return _speaker_aliases
+
+
+def tokenize_script(script: str) -> List[ScriptSegment]:
+    """Tokenize a complete script with the shared alias table"""
+    return ScriptTokenizer().tokenize(script)
@@ -43,7 +43,9 @@ class DatabaseSettings(BaseSettings):
     
     @validator("supabase_url")
     def validate_supabase_url(cls, v):
-        if not str(v).startswith("https://"):
+        # Plain HTTP only for local stand-ins (benchmarks/standins.py)
+        url = str(v)
+        if not url.startswith("https://") and not url.startswith(("http://localhost", "http://127.0.0.1")):
             raise ValueError("Supabase URL must use HTTPS")
         return v
     
@@ -0,0 +1,197 @@
+"""
+RadioX Single Flight - Coalescing of Identical In-Flight Requests
+One execution per key, shared by every concurrent caller
+
+In-process: the first caller for a key starts the work as a task, later
+callers await the same task (shielded - a disconnecting caller does not
+cancel the others' result).
+
+Across replicas (optional Redis): the task first takes a lock
+singleflight:<name>:lock:<key> (SET NX PX). The lock holder runs the work
+and broadcasts the outcome - PUBLISH on singleflight:<name>:result:<key>
+plus a short-lived copy under the same key for callers that subscribe a
+moment too late. Everyone else waits for that broadcast instead of
+repeating the upstream calls. If the leader fails, disappears or takes
+longer than wait_timeout, a waiting replica runs the work itself - a
+coalescing problem must never turn into a failed request.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from loguru import logger
+
+FLIGHT_PREFIX = "singleflight"
+
+# Compare-and-delete - only the holder releases the lock
+_UNLOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+_NO_RESULT = object()
+
+
+def flight_key(*parts: Any, **params: Any) -> str:
+    """Normalized key of a request - argument order, None values and case of strings do not matter"""
+    def normalize(value: Any) -> Any:
+        if isinstance(value, str):
+            return value.strip().lower()
+        if isinstance(value, dict):
+            return {str(k): normalize(v) for k, v in value.items() if v is not None}
+        if isinstance(value, (list, tuple)):
+            return [normalize(v) for v in value]
+        return value
+
+    payload = json.dumps({"parts": normalize(list(parts)), "params": normalize(params)}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:24]
+
+
+class SingleFlight:
+    """Shares one execution of identical concurrent requests (in-process and via Redis)"""
+
+    def __init__(self, name: str, redis_client=None, lock_ttl: float = 120.0,
+                 wait_timeout: Optional[float] = None, result_ttl: float = 30.0, poll_interval: float = 0.5):
+        self.name = name
+        self.redis = redis_client
+        self.lock_ttl = lock_ttl
+        self.wait_timeout = wait_timeout if wait_timeout is not None else lock_ttl
+        self.result_ttl = result_ttl
+        self.poll_interval = poll_interval
+        self._flights: Dict[str, asyncio.Task] = {}
+        self.stats = {"executed": 0, "joined_local": 0, "joined_remote": 0, "remote_fallback": 0, "failed": 0}
+
+    def attach(self, redis_client):
+        """Enable cross-replica coalescing (services connect Redis at startup)"""
+        self.redis = redis_client
+
+    def _redis_key(self, kind: str, key: str) -> str:
+        return f"{FLIGHT_PREFIX}:{self.name}:{kind}:{key}"
+
+    async def do(self, key: str, work: Callable[[], Awaitable[Any]],
+                 encode: Callable[[Any], Any] = lambda value: value,
+                 decode: Callable[[Any], Any] = lambda value: value) -> Any:
+        """Result of work() for key - joins a running execution if there is one
+
+        encode / decode convert the result to and from JSON for the Redis broadcast.
+        """
+        task = self._flights.get(key)
+        if task:
+            self.stats["joined_local"] += 1
+        else:
+            task = asyncio.create_task(self._execute(key, work, encode, decode))
+            self._flights[key] = task
+            task.add_done_callback(lambda done: self._flights.pop(key, None) if self._flights.get(key) is done else None)
+        return await asyncio.shield(task)
+
+    async def _run(self, work: Callable[[], Awaitable[Any]]) -> Any:
+        self.stats["executed"] += 1
+        try:
+            return await work()
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+
+    async def _execute(self, key: str, work: Callable[[], Awaitable[Any]],
+                       encode: Callable[[Any], Any], decode: Callable[[Any], Any]) -> Any:
+        if not self.redis:
+            return await self._run(work)
+
+        lock_key = self._redis_key("lock", key)
+        token = uuid.uuid4().hex
+        try:
+            leader = await self.redis.set(lock_key, token, nx=True, px=int(self.lock_ttl * 1000))
+        except Exception as e:
+            logger.warning(f"⚠️ Single-flight lock unavailable ({self.name}), running locally: {e}")
+            return await self._run(work)
+
+        if leader:
+            return await self._lead(key, lock_key, token, work, encode)
+
+        result = await self._follow(key, lock_key, decode)
+        if result is not _NO_RESULT:
+            self.stats["joined_remote"] += 1
+            return result
+        self.stats["remote_fallback"] += 1
+        return await self._run(work)
+
+    async def _lead(self, key: str, lock_key: str, token: str,
+                    work: Callable[[], Awaitable[Any]], encode: Callable[[Any], Any]) -> Any:
+        try:
+            # An outcome left over from the previous flight of this key must not answer this one
+            await self.redis.delete(self._redis_key("result", key))
+        except Exception as e:
+            logger.warning(f"⚠️ Single-flight result reset failed ({self.name}): {e}")
+        try:
+            result = await self._run(work)
+        except Exception as e:
+            await self._broadcast(key, {"ok": False, "error": str(e)})
+            raise
+        else:
+            await self._broadcast(key, {"ok": True, "result": encode(result)})
+            return result
+        finally:
+            try:
+                await self.redis.eval(_UNLOCK_SCRIPT, 1, lock_key, token)
+            except Exception as e:
+                logger.warning(f"⚠️ Single-flight unlock failed ({self.name}): {e}")
+
+    async def _broadcast(self, key: str, envelope: Dict[str, Any]):
+        result_key = self._redis_key("result", key)
+        payload = json.dumps(envelope, default=str)
+        try:
+            await self.redis.setex(result_key, max(1, int(self.result_ttl)), payload)
+            await self.redis.publish(result_key, payload)
+        except Exception as e:
+            logger.warning(f"⚠️ Single-flight result not shared ({self.name}): {e}")
+
+    async def _follow(self, key: str, lock_key: str, decode: Callable[[Any], Any]) -> Any:
+        """Wait for another replica's result - _NO_RESULT if it failed, vanished or took too long"""
+        result_key = self._redis_key("result", key)
+        deadline = time.time() + self.wait_timeout
+        pubsub = self.redis.pubsub()
+        try:
+            await pubsub.subscribe(result_key)
+            while time.time() < deadline:
+                # Checked after subscribing - a result published just before is not missed
+                payload = await self.redis.get(result_key)
+                if payload is None:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=self.poll_interval)
+                    payload = message["data"] if message else None
+                if payload is not None:
+                    envelope = json.loads(payload)
+                    if envelope.get("ok"):
+                        return decode(envelope["result"])
+                    logger.warning(f"⚠️ Single-flight leader failed ({self.name}): {envelope.get('error')}")
+                    return _NO_RESULT
+                if not await self.redis.exists(lock_key):
+                    # Leader released without a result we could see (crash, lock expiry) - last look, then run
+                    payload = await self.redis.get(result_key)
+                    if payload is not None and json.loads(payload).get("ok"):
+                        return decode(json.loads(payload)["result"])
+                    return _NO_RESULT
+            logger.warning(f"⚠️ Single-flight wait timed out ({self.name}) after {self.wait_timeout:.0f}s")
+            return _NO_RESULT
+        except Exception as e:
+            logger.warning(f"⚠️ Single-flight wait failed ({self.name}): {e}")
+            return _NO_RESULT
+        finally:
+            try:
+                await pubsub.unsubscribe(result_key)
+                await pubsub.aclose()
+            except Exception:
+                pass
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "in_flight": len(self._flights),
+            "cross_replica": self.redis is not None,
+            **self.stats,
+        }
@@ -0,0 +1,272 @@
+"""
+RadioX Work Scheduler - Priority Classes with Weighted Fair Sharing
+Shared admission control for scarce upstream capacity (ElevenLabs TTS, OpenAI)
+
+Priority classes:
+- on_air       show going on air imminently - always first
+- interactive  user waiting on a preview / ad-hoc show
+- batch        pre-renders, final upgrades, phrase cache warming
+
+Every job carries a deadline (absolute epoch, class default if none given).
+A free slot goes to the waiter with the lowest effective class, then the
+tenant (channel / preset) with the smallest weighted share used so far, then
+the longest wait, then the earliest deadline. Starvation protection: a waiter
+moves up one class for every aging_seconds it waits, and a job within
+urgent_seconds of a deadline its caller set (air time, show deadline) is
+treated as on_air - class default deadlines only order and account, they
+never promote. Queue wait per class is recorded for /scheduler.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+
+from loguru import logger
+
+
+class PriorityClass(str, Enum):
+    ON_AIR = "on_air"
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+CLASS_RANK = {
+    PriorityClass.ON_AIR: 0,
+    PriorityClass.INTERACTIVE: 1,
+    PriorityClass.BATCH: 2,
+}
+
+# Deadline of a job that does not bring its own (seconds from enqueue)
+DEFAULT_DEADLINE_SECONDS = {
+    PriorityClass.ON_AIR: 120,
+    PriorityClass.INTERACTIVE: 30,
+    PriorityClass.BATCH: 3600,
+}
+
+_PRIORITY_ALIASES = {
+    "on-air": PriorityClass.ON_AIR,
+    "on-air-imminent": PriorityClass.ON_AIR,
+    "onair": PriorityClass.ON_AIR,
+    "preview": PriorityClass.INTERACTIVE,
+    "adhoc": PriorityClass.INTERACTIVE,
+    "background": PriorityClass.BATCH,
+    "prerender": PriorityClass.BATCH,
+}
+
+WAIT_SAMPLES = 500
+
+
+def parse_priority(value: Any, default: PriorityClass = PriorityClass.INTERACTIVE) -> PriorityClass:
+    """Priority class from a request field ("on_air", "on-air-imminent", "batch", ...)"""
+    if isinstance(value, PriorityClass):
+        return value
+    if not value:
+        return default
+    key = str(value).strip().lower()
+    try:
+        return PriorityClass(key.replace("-", "_"))
+    except ValueError:
+        return _PRIORITY_ALIASES.get(key, default)
+
+
+def default_deadline(priority: PriorityClass, now: Optional[float] = None) -> float:
+    return (now or time.time()) + DEFAULT_DEADLINE_SECONDS[priority]
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+
+@dataclass
+class _Waiter:
+    priority: PriorityClass
+    tenant: str
+    deadline: float
+    cost: float
+    sequence: int
+    future: asyncio.Future
+    explicit_deadline: bool = True   # False: class default - no urgent promotion
+    enqueued_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class ClassStats:
+    """Queue-wait accounting of one priority class"""
+    granted: int = 0
+    missed_deadlines: int = 0   # slot granted after the job's deadline had passed
+    promoted: int = 0           # granted above its class (aging or urgent deadline)
+    cancelled: int = 0
+    waits: Deque[float] = field(default_factory=lambda: deque(maxlen=WAIT_SAMPLES))
+
+    def to_dict(self, queued: int) -> Dict[str, Any]:
+        waits = list(self.waits)
+        return {
+            "queued": queued,
+            "granted": self.granted,
+            "missed_deadlines": self.missed_deadlines,
+            "promoted": self.promoted,
+            "cancelled": self.cancelled,
+            "wait_ms": {
+                "p50": round(_percentile(waits, 50) * 1000, 1),
+                "p95": round(_percentile(waits, 95) * 1000, 1),
+                "max": round(max(waits) * 1000, 1) if waits else 0.0,
+            },
+        }
+
+
+class WorkScheduler:
+    """Bounded concurrency with priority classes, fair share per tenant and aging"""
+
+    def __init__(self, name: str, capacity: int, tenant_weights: Optional[Dict[str, float]] = None,
+                 aging_seconds: float = 30.0, urgent_seconds: float = 60.0):
+        self.name = name
+        self.capacity = max(1, capacity)
+        self.tenant_weights: Dict[str, float] = dict(tenant_weights or {})
+        self.aging_seconds = aging_seconds
+        self.urgent_seconds = urgent_seconds
+
+        self.in_use = 0
+        self._waiters: List[_Waiter] = []
+        self._sequence = 0
+        self._passes: Dict[str, float] = {}   # weighted work granted per tenant (stride scheduling)
+        self._virtual_time = 0.0
+        self._tenant_granted: Dict[str, int] = {}
+        self.class_stats: Dict[PriorityClass, ClassStats] = {cls: ClassStats() for cls in PriorityClass}
+
+    def _weight(self, tenant: str) -> float:
+        return max(0.01, self.tenant_weights.get(tenant, 1.0))
+
+    def _aged(self, waiter: _Waiter, now: float) -> int:
+        return int((now - waiter.enqueued_at) // self.aging_seconds) if self.aging_seconds > 0 else 0
+
+    def _effective_rank(self, waiter: _Waiter, now: float) -> int:
+        if waiter.explicit_deadline and waiter.deadline - now <= self.urgent_seconds:
+            return 0
+        return max(0, CLASS_RANK[waiter.priority] - self._aged(waiter, now))
+
+    def _pick(self, now: float) -> _Waiter:
+        # Longer waits win ties before deadlines - a far-deadline batch job cannot be overtaken forever
+        return min(self._waiters, key=lambda w: (
+            self._effective_rank(w, now),
+            self._passes.get(w.tenant, self._virtual_time),
+            -self._aged(w, now),
+            w.deadline,
+            w.sequence,
+        ))
+
+    def _grant(self, waiter: _Waiter, now: float):
+        rank = self._effective_rank(waiter, now)
+        tenant_pass = max(self._passes.get(waiter.tenant, self._virtual_time), self._virtual_time)
+        self._virtual_time = tenant_pass
+        self._passes[waiter.tenant] = tenant_pass + waiter.cost / self._weight(waiter.tenant)
+        self._tenant_granted[waiter.tenant] = self._tenant_granted.get(waiter.tenant, 0) + 1
+
+        stats = self.class_stats[waiter.priority]
+        stats.granted += 1
+        stats.waits.append(now - waiter.enqueued_at)
+        if now > waiter.deadline:
+            stats.missed_deadlines += 1
+        if rank < CLASS_RANK[waiter.priority]:
+            stats.promoted += 1
+
+        self.in_use += 1
+        waiter.future.set_result(True)
+
+    def _dispatch(self):
+        now = time.time()
+        while self._waiters and self.in_use < self.capacity:
+            waiter = self._pick(now)
+            self._waiters.remove(waiter)
+            self._grant(waiter, now)
+
+    def _release(self):
+        self.in_use -= 1
+        self._dispatch()
+
+    async def acquire(self, priority: PriorityClass = PriorityClass.INTERACTIVE, tenant: str = "default",
+                      deadline: Optional[float] = None, cost: float = 1.0):
+        """Wait for a slot - pair with release(), or use slot()
+
+        Pass deadline only for a real one (air time, show deadline); None takes
+        the class default, which does not make the job urgent.
+        """
+        self._sequence += 1
+        waiter = _Waiter(
+            priority=priority,
+            tenant=tenant or "default",
+            deadline=deadline or default_deadline(priority),
+            cost=max(cost, 0.0),
+            sequence=self._sequence,
+            future=asyncio.get_running_loop().create_future(),
+            explicit_deadline=deadline is not None,
+        )
+        self._waiters.append(waiter)
+        self._dispatch()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                self.class_stats[priority].cancelled += 1
+            elif waiter.future.done() and not waiter.future.cancelled():
+                self._release()  # granted in the same tick we were cancelled
+            raise
+
+    def release(self):
+        self._release()
+
+    @asynccontextmanager
+    async def slot(self, priority: PriorityClass = PriorityClass.INTERACTIVE, tenant: str = "default",
+                   deadline: Optional[float] = None, cost: float = 1.0) -> AsyncIterator[None]:
+        await self.acquire(priority, tenant, deadline, cost)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def set_tenant_weights(self, weights: Dict[str, float]):
+        self.tenant_weights = dict(weights)
+        logger.info(f"⚖️ {self.name} scheduler tenant weights: {self.tenant_weights}")
+
+    def stats(self) -> Dict[str, Any]:
+        queued = {cls: 0 for cls in PriorityClass}
+        for waiter in self._waiters:
+            queued[waiter.priority] += 1
+        return {
+            "name": self.name,
+            "capacity": self.capacity,
+            "in_use": self.in_use,
+            "queued": len(self._waiters),
+            "aging_seconds": self.aging_seconds,
+            "urgent_seconds": self.urgent_seconds,
+            "classes": {cls.value: self.class_stats[cls].to_dict(queued[cls]) for cls in PriorityClass},
+            "tenants": {
+                tenant: {
+                    "granted": count,
+                    "weight": self._weight(tenant),
+                    "share_used": round(self._passes.get(tenant, 0.0), 2),
+                }
+                for tenant, count in sorted(self._tenant_granted.items())
+            },
+        }
+
+
+def parse_tenant_weights(value: Optional[str]) -> Dict[str, float]:
+    """"zurich=2,basel=1" -> {"zurich": 2.0, "basel": 1.0} (env SCHEDULER_TENANT_WEIGHTS)"""
+    weights: Dict[str, float] = {}
+    for item in (value or "").split(","):
+        tenant, _, weight = item.partition("=")
+        if tenant.strip() and weight.strip():
+            try:
+                weights[tenant.strip()] = float(weight)
+            except ValueError:
+                logger.warning(f"⚠️ Invalid tenant weight: {item}")
+    return weights
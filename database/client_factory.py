@@ -29,6 +29,7 @@ from loguru import logger
 
 from supabase import create_client, Client
 from config.simple_settings import get_simple_settings
+from config.http_cassette import supabase_client_options
 
 settings = get_simple_settings()
 
@@ -131,7 +132,8 @@ class DatabaseClientFactory:
         if settings.supabase_url and settings.supabase_anon_key:
             self._clients[ConnectionType.REGULAR] = create_client(
                 settings.supabase_url, 
-                settings.supabase_anon_key
+                settings.supabase_anon_key,
+                options=supabase_client_options()
             )
             self._client_locks[ConnectionType.REGULAR] = threading.Lock()
             logger.info("✅ Regular Supabase client initialized")
@@ -140,7 +142,8 @@ class DatabaseClientFactory:
         if settings.supabase_url and settings.supabase_service_key:
             self._clients[ConnectionType.ADMIN] = create_client(
                 settings.supabase_url,
-                settings.supabase_service_key
+                settings.supabase_service_key,
+                options=supabase_client_options()
             )
             self._client_locks[ConnectionType.ADMIN] = threading.Lock()
             logger.info("✅ Admin Supabase client initialized")
@@ -149,7 +152,8 @@ class DatabaseClientFactory:
         if settings.supabase_url and settings.supabase_anon_key:
             self._clients[ConnectionType.READONLY] = create_client(
                 settings.supabase_url,
-                settings.supabase_anon_key
+                settings.supabase_anon_key,
+                options=supabase_client_options()
             )
             self._client_locks[ConnectionType.READONLY] = threading.Lock()
             logger.info("✅ Read-only Supabase client initialized")
@@ -2,9 +2,14 @@
 Modular Configuration Manager for RadioX
 Replaces all hardcoded values with database lookups
 """
+import asyncio
 import json
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+import os
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Set, Tuple
+from dataclasses import dataclass, field, fields
+from loguru import logger
 from .supabase_client import get_db
 
 
@@ -52,182 +57,367 @@ class ShowPreset:
     gpt_selection_instructions: str
 
 
+def _from_row(cls, row: Dict[str, Any]):
+    """Build a config dataclass from a table row, ignoring extra columns (id, is_active, ...)"""
+    names = {f.name for f in fields(cls)}
+    return cls(**{key: value for key, value in row.items() if key in names})
+
+
+# Snapshot refresh: version check interval, max age without Redis, invalidation channel
+CONFIG_VERSION_CHECK_SECONDS = float(os.getenv("CONFIG_VERSION_CHECK_SECONDS", "30"))
+CONFIG_SNAPSHOT_MAX_AGE_SECONDS = float(os.getenv("CONFIG_SNAPSHOT_MAX_AGE_SECONDS", "900"))
+CONFIG_VERSION_KEY = "config:version"
+CONFIG_INVALIDATE_CHANNEL = "config:invalidate"
+
+
+def _config_value(row: Dict[str, Any]) -> Any:
+    return row['config_json'] if row.get('config_json') else row.get('config_value')
+
+
+def _template_from_row(row: Dict[str, Any]) -> ShowTemplate:
+    return ShowTemplate(
+        template_name=row['template_name'],
+        display_name=row['display_name'],
+        language=row['language'],
+        system_prompt=row['system_prompt'],
+        format_instructions=row['format_instructions'],
+        speaker_tags=row.get('speaker_tags', {})
+    )
+
+
+def _resolve_preset(row: Dict[str, Any], location: Optional[Location], style: Optional[BroadcastStyle],
+                    template: Optional[ShowTemplate]) -> Optional[ShowPreset]:
+    """Denormalize one show_presets row - None if a referenced row is missing or inactive"""
+    if not (location and style and template):
+        logger.warning(f"⚠️ Show preset {row.get('preset_name')} references a missing location, style or template")
+        return None
+    return ShowPreset(
+        preset_name=row['preset_name'],
+        display_name=row['display_name'],
+        primary_speaker=row['primary_speaker'],
+        secondary_speaker=row.get('secondary_speaker'),
+        weather_speaker=row.get('weather_speaker'),
+        location=location,
+        broadcast_style=style,
+        template=template,
+        gpt_selection_instructions=row.get('gpt_selection_instructions')
+    )
+
+
+def _row_digest(row: Dict[str, Any]) -> str:
+    return json.dumps(row, sort_keys=True, default=str)
+
+
+@dataclass
+class ConfigSnapshot:
+    """Immutable, indexed copy of all active configuration rows"""
+    version: int
+    source_version: Optional[str]                        # Redis config:version at load time
+    loaded_at: float
+    styles: Dict[str, BroadcastStyle]
+    style_by_hour: List[Optional[BroadcastStyle]]        # 24 entries - hour -> style
+    locations: Dict[str, Location]
+    templates: Dict[str, ShowTemplate]
+    dynamic: Dict[Tuple[str, str], Any]                  # (category, key) -> value
+    categories: Dict[str, Dict[str, Any]]                # category -> {key: parsed value}
+    defaults: Dict[str, str]
+    preset_rows: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    presets: Dict[str, ShowPreset] = field(default_factory=dict)          # fully resolved
+    preset_sources: Dict[str, Tuple] = field(default_factory=dict)        # what each preset was built from
+    missing_presets: Set[str] = field(default_factory=set)                # negative lookups until next load
+    preset_stats: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, tables: Dict[str, List[Dict[str, Any]]], version: int,
+              source_version: Optional[str]) -> "ConfigSnapshot":
+        style_rows = tables.get('broadcast_styles') or []
+        styles_ordered = [_from_row(BroadcastStyle, row) for row in style_rows]
+
+        # Same rule as the old per-request query: first style whose range covers the hour
+        # (ranges may wrap midnight), otherwise the first active style
+        style_by_hour: List[Optional[BroadcastStyle]] = []
+        for hour in range(24):
+            match = None
+            for style in styles_ordered:
+                start, end = style.time_range_start, style.time_range_end
+                if (start > end and (hour >= start or hour <= end)) or (start <= hour <= end):
+                    match = style
+                    break
+            style_by_hour.append(match or (styles_ordered[0] if styles_ordered else None))
+
+        dynamic: Dict[Tuple[str, str], Any] = {}
+        categories: Dict[str, Dict[str, Any]] = {}
+        defaults: Dict[str, str] = {}
+        for row in tables.get('dynamic_config') or []:
+            category, key = row['config_category'], row['config_key']
+            value = _config_value(row)
+            dynamic.setdefault((category, key), value)
+
+            # Category view parses JSON-looking strings
+            if isinstance(value, str) and (value.startswith('{') or value.startswith('[')):
+                try:
+                    value = json.loads(value)
+                except json.JSONDecodeError:
+                    pass  # Keep as string if not valid JSON
+            categories.setdefault(category, {})[key] = value
+            if category == 'defaults':
+                defaults[key] = row.get('config_value')
+
+        return cls(
+            version=version,
+            source_version=source_version,
+            loaded_at=time.time(),
+            styles={style.style_name: style for style in reversed(styles_ordered)},
+            style_by_hour=style_by_hour,
+            locations={
+                row['location_code']: _from_row(Location, row)
+                for row in reversed(tables.get('locations') or [])
+            },
+            templates={
+                row['template_name']: _template_from_row(row)
+                for row in reversed(tables.get('show_templates') or [])
+            },
+            dynamic=dynamic,
+            categories=categories,
+            defaults=defaults,
+            preset_rows={row['preset_name']: row for row in reversed(tables.get('show_presets') or [])},
+        )
+
+    def resolve_presets(self, previous: Optional["ConfigSnapshot"] = None):
+        """Denormalize all presets, reusing every preset whose row and references are unchanged"""
+        reused = rebuilt = 0
+        for preset_name, row in self.preset_rows.items():
+            location = self.locations.get(row.get('location_code'))
+            style = self.styles.get(row.get('broadcast_style_name'))
+            template = self.templates.get(row.get('template_name'))
+            sources = (_row_digest(row), location, style, template)
+
+            if previous and previous.preset_sources.get(preset_name) == sources and preset_name in previous.presets:
+                self.presets[preset_name] = previous.presets[preset_name]
+                reused += 1
+            else:
+                preset = _resolve_preset(row, location, style, template)
+                if not preset:
+                    continue
+                self.presets[preset_name] = preset
+                rebuilt += 1
+            self.preset_sources[preset_name] = sources
+        self.preset_stats = {"resolved": len(self.presets), "reused": reused, "rebuilt": rebuilt}
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "source_version": self.source_version,
+            "loaded_at": datetime.fromtimestamp(self.loaded_at).isoformat(),
+            "age_seconds": round(time.time() - self.loaded_at, 1),
+            "broadcast_styles": len(self.styles),
+            "locations": len(self.locations),
+            "show_templates": len(self.templates),
+            "show_presets": len(self.preset_rows),
+            "presets_resolved": self.preset_stats,
+            "fallback_presets": sorted(set(self.presets) - set(self.preset_rows)),
+            "dynamic_config": len(self.dynamic),
+        }
+
+
 class ModularConfig:
-    """Central configuration manager that replaces all hardcoded values"""
+    """Central configuration manager that replaces all hardcoded values
+    
+    All lookups are served from an in-memory ConfigSnapshot: one bulk load of
+    every active config table (off the event loop), replaced atomically when
+    the Redis config:version changes, a config:invalidate message arrives or
+    the snapshot is older than CONFIG_SNAPSHOT_MAX_AGE_SECONDS.
+    """
+    
+    SNAPSHOT_TABLES = ['broadcast_styles', 'locations', 'show_templates', 'dynamic_config', 'show_presets']
     
     def __init__(self):
         self.db_client = get_db()
         self.supabase = self.db_client.client  # Access the underlying Supabase client
-        self._cache = {}
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._load_lock: Optional[asyncio.Lock] = None
+        self._checked_at = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._watch_task: Optional[asyncio.Task] = None
+        self._redis = None
+        self._version = 0
+    
+    # ------------------------------------------------------------------
+    # Snapshot lifecycle
+    # ------------------------------------------------------------------
+    
+    def _load_tables(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Bulk read of all active config rows (blocking - run in a thread)"""
+        return {
+            table: self.supabase.table(table).select('*').eq('is_active', True).execute().data or []
+            for table in self.SNAPSHOT_TABLES
+        }
+    
+    async def _source_version(self) -> Optional[str]:
+        if not self._redis:
+            return None
+        try:
+            return await self._redis.get(CONFIG_VERSION_KEY)
+        except Exception as e:
+            logger.warning(f"⚠️ Config version check failed: {e}")
+            return None
+    
+    def _lock(self) -> asyncio.Lock:
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        return self._load_lock
+    
+    async def _load(self) -> ConfigSnapshot:
+        source_version = await self._source_version()
+        tables = await asyncio.to_thread(self._load_tables)
+        self._version += 1
+        snapshot = ConfigSnapshot.build(tables, self._version, source_version)
+        snapshot.resolve_presets(previous=self._snapshot)
+        self._snapshot = snapshot
+        self._checked_at = time.time()
+        logger.info(f"🗂️ Config snapshot v{self._version} loaded: "
+                    f"{len(self._snapshot.styles)} styles, {len(self._snapshot.locations)} locations, "
+                    f"{len(self._snapshot.templates)} templates, {len(self._snapshot.presets)} presets "
+                    f"({self._snapshot.preset_stats.get('rebuilt', 0)} rebuilt), {len(self._snapshot.dynamic)} config rows")
+        return self._snapshot
+    
+    async def reload(self) -> ConfigSnapshot:
+        """Load a fresh snapshot and swap it in (readers keep the old one until then)"""
+        async with self._lock():
+            return await self._load()
+    
+    async def _refresh_if_stale(self):
+        snapshot = self._snapshot
+        try:
+            source_version = await self._source_version()
+            too_old = time.time() - snapshot.loaded_at > CONFIG_SNAPSHOT_MAX_AGE_SECONDS
+            if too_old or (source_version is not None and source_version != snapshot.source_version):
+                await self.reload()
+        except Exception as e:
+            logger.warning(f"⚠️ Config snapshot refresh failed - serving v{snapshot.version}: {e}")
+    
+    async def snapshot(self) -> ConfigSnapshot:
+        """Current snapshot - loads once, afterwards never waits for the database"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            async with self._lock():
+                return self._snapshot or await self._load()
+        
+        # Version check in the background - this request is served from memory
+        if time.time() - self._checked_at > CONFIG_VERSION_CHECK_SECONDS and \
+                (self._refresh_task is None or self._refresh_task.done()):
+            self._checked_at = time.time()
+            self._refresh_task = asyncio.create_task(self._refresh_if_stale())
+        return snapshot
+    
+    async def start_watching(self, redis_client):
+        """Follow config:version and config:invalidate on the service's Redis connection"""
+        self._redis = redis_client
+        await self.reload()
+        self._watch_task = asyncio.create_task(self._watch())
+    
+    async def _watch(self):
+        while True:
+            try:
+                pubsub = self._redis.pubsub()
+                await pubsub.subscribe(CONFIG_INVALIDATE_CHANNEL)
+                logger.info(f"👂 Watching {CONFIG_INVALIDATE_CHANNEL} for config changes")
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        logger.info(f"🔄 Config invalidated ({message.get('data')}) - reloading snapshot")
+                        await self.reload()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ Config invalidation listener failed, retrying: {e}")
+                await asyncio.sleep(5)
+    
+    async def stop_watching(self):
+        if self._watch_task:
+            self._watch_task.cancel()
+            await asyncio.gather(self._watch_task, return_exceptions=True)
+            self._watch_task = None
+    
+    async def invalidate(self, reason: str = "manual") -> ConfigSnapshot:
+        """Bump config:version, notify every replica and reload locally"""
+        if self._redis:
+            try:
+                await self._redis.incr(CONFIG_VERSION_KEY)
+                await self._redis.publish(CONFIG_INVALIDATE_CHANNEL, reason)
+            except Exception as e:
+                logger.warning(f"⚠️ Config invalidation not published: {e}")
+        return await self.reload()
+    
+    def snapshot_info(self) -> Dict[str, Any]:
+        return self._snapshot.summary() if self._snapshot else {"version": None}
+    
+    # ------------------------------------------------------------------
+    # Lookups (O(1) against the snapshot)
+    # ------------------------------------------------------------------
     
     async def get_dynamic_config(self, category: str, key: str) -> Any:
         """Get dynamic configuration value"""
-        cache_key = f"{category}:{key}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-        
-        result = self.supabase.table('dynamic_config').select('*').eq('config_category', category).eq('config_key', key).eq('is_active', True).execute()
-        
-        if result.data:
-            config = result.data[0]
-            value = config['config_json'] if config['config_json'] else config['config_value']
-            self._cache[cache_key] = value
-            return value
-        return None
+        return (await self.snapshot()).dynamic.get((category, key))
     
     async def get_config_by_category(self, category: str) -> Dict[str, Any]:
         """Get all configuration values for a category"""
-        cache_key = f"category:{category}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-        
-        result = self.supabase.table('dynamic_config').select('*').eq('config_category', category).eq('is_active', True).execute()
-        
-        config_dict = {}
-        for item in result.data:
-            key = item['config_key']
-            value = item['config_json'] if item['config_json'] else item['config_value']
-            
-            # Try to parse JSON if it's a string that looks like JSON
-            if isinstance(value, str) and (value.startswith('{') or value.startswith('[')):
-                try:
-                    value = json.loads(value)
-                except json.JSONDecodeError:
-                    pass  # Keep as string if not valid JSON
-            
-            config_dict[key] = value
-        
-        self._cache[cache_key] = config_dict
-        return config_dict
+        return dict((await self.snapshot()).categories.get(category, {}))
     
     async def get_default_values(self) -> Dict[str, str]:
         """Get all default values"""
-        if 'defaults' in self._cache:
-            return self._cache['defaults']
-        
-        result = self.supabase.table('dynamic_config').select('*').eq('config_category', 'defaults').eq('is_active', True).execute()
-        
-        defaults = {}
-        for item in result.data:
-            defaults[item['config_key']] = item['config_value']
-        
-        self._cache['defaults'] = defaults
-        return defaults
+        return dict((await self.snapshot()).defaults)
     
     async def get_broadcast_style_by_time(self, hour: int) -> Optional[BroadcastStyle]:
         """Get broadcast style based on current hour"""
-        result = self.supabase.table('broadcast_styles').select('*').eq('is_active', True).execute()
-        
-        for style_data in result.data:
-            start = style_data['time_range_start']
-            end = style_data['time_range_end']
-            
-            # Handle overnight ranges (e.g., 23-5)
-            if start > end:
-                if hour >= start or hour <= end:
-                    return BroadcastStyle(**style_data)
-            else:
-                if start <= hour <= end:
-                    return BroadcastStyle(**style_data)
-        
-        # Fallback to first active style
-        if result.data:
-            return BroadcastStyle(**result.data[0])
-        return None
+        return (await self.snapshot()).style_by_hour[hour % 24]
     
     async def get_broadcast_style(self, style_name: str) -> Optional[BroadcastStyle]:
         """Get specific broadcast style by name"""
-        result = self.supabase.table('broadcast_styles').select('*').eq('style_name', style_name).eq('is_active', True).execute()
-        
-        if result.data:
-            return BroadcastStyle(**result.data[0])
-        return None
+        return (await self.snapshot()).styles.get(style_name)
     
     async def get_location(self, location_code: str) -> Optional[Location]:
         """Get location by code"""
-        result = self.supabase.table('locations').select('*').eq('location_code', location_code).eq('is_active', True).execute()
-        
-        if result.data:
-            return Location(**result.data[0])
-        return None
+        return (await self.snapshot()).locations.get(location_code)
     
     async def get_show_template(self, template_name: str) -> Optional[ShowTemplate]:
         """Get show template by name"""
-        result = self.supabase.table('show_templates').select('*').eq('template_name', template_name).eq('is_active', True).execute()
-        
-        if result.data:
-            template_data = result.data[0]
-            return ShowTemplate(
-                template_name=template_data['template_name'],
-                display_name=template_data['display_name'],
-                language=template_data['language'],
-                system_prompt=template_data['system_prompt'],
-                format_instructions=template_data['format_instructions'],
-                speaker_tags=template_data.get('speaker_tags', {})
-            )
-        return None
+        return (await self.snapshot()).templates.get(template_name)
     
     async def get_show_preset(self, preset_name: str) -> Optional[ShowPreset]:
-        """Get complete show preset with all related data"""
-        query = """
-        SELECT 
-            sp.*,
-            l.location_code, l.display_name as location_display, l.timezone, l.weather_api_name, l.latitude, l.longitude,
-            bs.style_name, bs.display_name as style_display, bs.marcel_mood, bs.jarvis_mood, bs.duration_target, bs.time_range_start, bs.time_range_end,
-            st.template_name, st.display_name as template_display, st.language, st.system_prompt, st.format_instructions, st.speaker_tags
-        FROM show_presets sp
-        LEFT JOIN locations l ON sp.location_code = l.location_code
-        LEFT JOIN broadcast_styles bs ON sp.broadcast_style_name = bs.style_name
-        LEFT JOIN show_templates st ON sp.template_name = st.template_name
-        WHERE sp.preset_name = %s AND sp.is_active = true
-        """
-        
-        result = self.supabase.rpc('execute_sql', {'query': query, 'params': [preset_name]}).execute()
+        """Get complete show preset with all related data (resolved once per snapshot)"""
+        snapshot = await self.snapshot()
+        preset = snapshot.presets.get(preset_name)
+        if preset or preset_name in snapshot.missing_presets or preset_name in snapshot.preset_rows:
+            return preset
         
-        if result.data:
-            data = result.data[0]
-            
-            location = Location(
-                location_code=data['location_code'],
-                display_name=data['location_display'],
-                timezone=data['timezone'],
-                weather_api_name=data['weather_api_name'],
-                latitude=data['latitude'],
-                longitude=data['longitude']
-            )
-            
-            broadcast_style = BroadcastStyle(
-                style_name=data['style_name'],
-                display_name=data['style_display'],
-                marcel_mood=data['marcel_mood'],
-                jarvis_mood=data['jarvis_mood'],
-                duration_target=data['duration_target'],
-                time_range_start=data['time_range_start'],
-                time_range_end=data['time_range_end']
-            )
-            
-            template = ShowTemplate(
-                template_name=data['template_name'],
-                display_name=data['template_display'],
-                language=data['language'],
-                system_prompt=data['system_prompt'],
-                format_instructions=data['format_instructions'],
-                speaker_tags=data.get('speaker_tags', {})
-            )
-            
-            return ShowPreset(
-                preset_name=data['preset_name'],
-                display_name=data['display_name'],
-                primary_speaker=data['primary_speaker'],
-                secondary_speaker=data['secondary_speaker'],
-                weather_speaker=data['weather_speaker'],
-                location=location,
-                broadcast_style=broadcast_style,
-                template=template,
-                gpt_selection_instructions=data['gpt_selection_instructions']
-            )
+        # Not in the snapshot (created since the last load) - plain table reads, no SQL RPC
+        preset = await asyncio.to_thread(self._fetch_show_preset, preset_name)
+        if preset:
+            snapshot.presets[preset_name] = preset
+        else:
+            snapshot.missing_presets.add(preset_name)
+        return preset
+    
+    def _fetch_show_preset(self, preset_name: str) -> Optional[ShowPreset]:
+        """Resolve one preset with four single-row reads (blocking - run in a thread)"""
+        def first(table: str, column: str, value: Any) -> Optional[Dict[str, Any]]:
+            if value is None:
+                return None
+            rows = self.supabase.table(table).select('*').eq(column, value).eq('is_active', True).limit(1).execute().data
+            return rows[0] if rows else None
         
-        return None
+        row = first('show_presets', 'preset_name', preset_name)
+        if not row:
+            return None
+        location_row = first('locations', 'location_code', row.get('location_code'))
+        style_row = first('broadcast_styles', 'style_name', row.get('broadcast_style_name'))
+        template_row = first('show_templates', 'template_name', row.get('template_name'))
+        return _resolve_preset(
+            row,
+            _from_row(Location, location_row) if location_row else None,
+            _from_row(BroadcastStyle, style_row) if style_row else None,
+            _template_from_row(template_row) if template_row else None
+        )
     
     async def normalize_speaker_name(self, speaker_name: str) -> str:
         """Normalize speaker name using mapping"""
@@ -256,8 +446,8 @@ class ModularConfig:
         return location_code
     
     def clear_cache(self):
-        """Clear configuration cache"""
-        self._cache.clear()
+        """Drop the snapshot - the next lookup loads a fresh one"""
+        self._snapshot = None
 
 
 # Global instance
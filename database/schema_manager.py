@@ -11,6 +11,7 @@ Current Tables:
 - elevenlabs_models   - Available AI voice models  
 - rss_feed_preferences - RSS feed configuration
 - show_presets       - Show generation templates
+- show_schedule      - Scheduled slots for pre-generation
 - shows              - Normalized show data (single source of truth)
 - voice_configurations - Speaker voice settings
 """
@@ -86,6 +87,13 @@ class RadioXSchemaManager:
                 sql="-- Table exists and is managed"
             ),
             
+            "show_schedule": TableSchema(
+                name="show_schedule",
+                dependencies=["show_presets"],
+                description="Scheduled show slots for speculative pre-generation",
+                sql="-- Table exists and is managed"
+            ),
+            
             "shows": TableSchema(
                 name="shows",
                 dependencies=["show_presets"],
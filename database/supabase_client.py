@@ -28,6 +28,7 @@ load_dotenv()
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from config.settings import get_settings
+from config.http_cassette import supabase_client_options
 
 settings = get_settings()
 
@@ -72,7 +73,8 @@ class SupabaseClient:
         # Core client
         self.client: Client = create_client(
             settings.supabase_url or "",
-            settings.supabase_anon_key or ""
+            settings.supabase_anon_key or "",
+            options=supabase_client_options()
         )
         
         # ⚡ CONNECTION POOL & PERFORMANCE OPTIMIZATION
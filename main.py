@@ -15,9 +15,11 @@ from datetime import datetime
 import sys
 from bs4 import BeautifulSoup
 import re
+import time
 
 # Import service configuration
 from config.service_config import config
+from config.prompt_budget import PromptBudget, PromptItem, bitcoin_line, weather_line
 
 # Service URLs - Environment based
 SERVICES = {
@@ -26,6 +28,10 @@ SERVICES = {
     "data_collector": config.DATA_COLLECTOR_URL
 }
 
+# Script prompt budget - full article text is capped per article, then reduced to the summary
+PROMPT_BUDGET_TOKENS = int(os.getenv("PROMPT_BUDGET_TOKENS", "2500"))
+PROMPT_ARTICLE_TOKENS = int(os.getenv("PROMPT_ARTICLE_TOKENS", "400"))
+
 async def get_hierarchical_config(category: str, key: str = None) -> str:
     """Get configuration from Database Service hierarchical config"""
     
@@ -285,47 +291,33 @@ FORMAT: [SPRECHER] Text
 
 INHALT: Nutze die bereitgestellten Artikel-Inhalte"""
 
-    # Build detailed news section with full content
-    news_section = "=== VOLLSTÄNDIGE ARTIKEL-INHALTE ===\n\n"
+    # Articles: full extracted text (capped per article), reduced to the summary when over budget
+    articles = []
     for i, article in enumerate(news[:3]):
-        news_section += f"ARTIKEL {i+1}:\n"
-        news_section += f"Titel: {article.get('title', 'Unbekannt')}\n"
-        news_section += f"Quelle: {article.get('source', 'Unbekannt')}\n"
-        news_section += f"URL: {article.get('link', '')}\n"
-        
-        # Include full content if available
+        heading = f"ARTIKEL {i+1}:\nTitel: {article.get('title', 'Unbekannt')}\nQuelle: {article.get('source', 'Unbekannt')}\n"
+        summary = f"{heading}ZUSAMMENFASSUNG: {article.get('summary', 'Keine Zusammenfassung verfügbar')}"
         if article.get('full_content'):
-            news_section += f"VOLLSTÄNDIGER INHALT:\n{article['full_content']}\n"
-            news_section += f"(Extrahiert: {article.get('content_length', 0)} Zeichen)\n"
+            articles.append(PromptItem(f"{heading}VOLLSTÄNDIGER INHALT:\n{article['full_content']}", compact=summary))
         else:
-            news_section += f"ZUSAMMENFASSUNG: {article.get('summary', 'Keine Zusammenfassung verfügbar')}\n"
-            news_section += f"(Vollständiger Inhalt nicht verfügbar: {article.get('extraction_status', 'unknown')})\n"
-        
-        news_section += "\n" + "-"*80 + "\n\n"
-
-    # Build user prompt with full article content
-    user_prompt = f"""SHOW PRESET: {preset_name}
-TARGET TIME: {target_time} Uhr
-LANGUAGE: {language}
-
-=== AKTUELLE DATEN ===
-
-WETTER ZÜRICH:
-{json.dumps(weather, indent=2, ensure_ascii=False) if weather else "Keine Wetter-Daten verfügbar"}
-
-BITCOIN:
-{json.dumps(bitcoin, indent=2, ensure_ascii=False) if bitcoin else "Keine Bitcoin-Daten verfügbar"}
-
-{news_section}
+            articles.append(PromptItem(summary))
 
-=== ANWEISUNGEN ===
+    # Build user prompt within the token budget - weather / bitcoin reduced to the fields the script uses
+    prompt = PromptBudget(PROMPT_BUDGET_TOKENS, model="gpt-4o")
+    prompt.text("show", f"SHOW PRESET: {preset_name}\nTARGET TIME: {target_time} Uhr\nLANGUAGE: {language}\n\n=== AKTUELLE DATEN ===")
+    prompt.text("weather", weather_line(weather, "Zürich") or "Keine Wetter-Daten verfügbar", priority=2)
+    prompt.text("bitcoin", bitcoin_line(bitcoin) or "Keine Bitcoin-Daten verfügbar", priority=3)
+    prompt.add("news", articles, priority=1, header="=== VOLLSTÄNDIGE ARTIKEL-INHALTE ===\n\n",
+               separator="\n\n", item_tokens=PROMPT_ARTICLE_TOKENS, min_items=1)
+    prompt.text("instructions", """=== ANWEISUNGEN ===
 1. Schreibe ein 3-5 Minuten Radio-Script
 2. Beginne mit Begrüssung und Zeit
 3. Nutze die VOLLSTÄNDIGEN Artikel-Inhalte für informative und detaillierte Berichterstattung
 4. Integriere Wetter und Bitcoin natürlich
 5. Verwende konkrete Details aus den Artikeln, nicht nur Titel/Zusammenfassungen
 6. Beende mit Verabschiedung
-7. Verwende authentische Zürich-Referenzen wenn möglich"""
+7. Verwende authentische Zürich-Referenzen wenn möglich""")
+    prompt_build = prompt.build()
+    user_prompt = prompt_build.text
 
     print("\n" + "="*80)
     print("📤 SENDING TO GPT-4 WITH FULL ARTICLE CONTENT:")
@@ -333,6 +325,7 @@ BITCOIN:
     print("🧠 SYSTEM PROMPT:")
     print(system_prompt)
     print(f"\n🎯 USER PROMPT: ({len(user_prompt)} characters)")
+    print(f"📏 Prompt tokens: {prompt_build.tokens_after} (untrimmed {prompt_build.tokens_before}, budget {prompt_build.budget_tokens})")
     print("📰 Article content included:", len([a for a in news if a.get('full_content')]), "full articles")
     print("="*80)
     
@@ -352,6 +345,7 @@ BITCOIN:
             print("🚀 MAKING OPENAI API CALL WITH ENRICHED CONTENT...")
             print(f"📊 Request: model={openai_request['model']}, tokens={openai_request['max_tokens']}, temp={openai_request['temperature']}")
             
+            gpt_start = time.perf_counter()
             response = await client.post(
                 "https://api.openai.com/v1/chat/completions",
                 headers={
@@ -373,6 +367,7 @@ BITCOIN:
                 print(f"   📝 Completion tokens: {usage.get('completion_tokens', 'N/A')}")
                 print(f"   📦 Total tokens: {usage.get('total_tokens', 'N/A')}")
                 print(f"   🧠 Model: {response_data.get('model', 'N/A')}")
+                print(f"   ⏱️ GPT latency: {(time.perf_counter() - gpt_start) * 1000:.0f} ms")
                 
                 script_content = response_data['choices'][0]['message']['content']
                 
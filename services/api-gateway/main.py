@@ -7,15 +7,21 @@ ENHANCED: Complete database-driven configuration, zero hardcoding
 from fastapi import FastAPI, Depends, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-import httpx
 from typing import Dict, Any, Optional
 import os
+import sys
 from loguru import logger
 from datetime import datetime
 import asyncio
 from contextlib import asynccontextmanager
 import json
 
+# Add parent directory to path for shared config modules
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config.health_monitor import HealthMonitor
+from config.request_types import RequestType
+from config.reverse_proxy import ReverseProxy
+
 # Global configuration cache
 services_config: Dict[str, str] = {}
 default_config: Dict[str, Any] = {}
@@ -42,6 +48,13 @@ HARDCODED_DEFAULTS = {
     "location": "zurich"
 }
 
+# Downstream health - probed in the background, /health serves the snapshot
+health_monitor = HealthMonitor(
+    "api-gateway",
+    interval=float(os.getenv("HEALTH_PROBE_INTERVAL", "15")),
+    probe_timeout=HARDCODED_DEFAULTS["timeout_short"]
+)
+
 # Configuration required - no fallbacks
 
 async def load_service_config_from_data_service() -> Dict[str, str]:
@@ -77,6 +90,13 @@ def get_service_url(service_name: str) -> str:
     port = port_map.get(service_name, 8000)
     return f"http://localhost:{port}"
 
+# Route forwarding - one pooled keep-alive client per upstream, bodies streamed through
+proxy = ReverseProxy(
+    get_service_url,
+    max_connections=int(os.getenv("GATEWAY_MAX_CONNECTIONS", "100")),
+    max_keepalive_connections=int(os.getenv("GATEWAY_MAX_KEEPALIVE", "20")),
+)
+
 # 🦄 ULTIMATE LIFESPAN MANAGEMENT - MODULAR
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -95,9 +115,16 @@ async def lifespan(app: FastAPI):
         services_config = HARDCODED_SERVICES
         default_config = HARDCODED_DEFAULTS
     
+    # Background health probing of all services (non-critical - gateway stays up)
+    for service_name, service_url in services_config.items():
+        health_monitor.register_http(service_name, f"{service_url}/health", critical=False)
+    await health_monitor.start()
+    
     yield
     
     # Cleanup
+    await health_monitor.stop()
+    await proxy.aclose()
     logger.info("🧹 API Gateway shutdown complete")
 
 # 🚀 ULTIMATE FASTAPI APP - MODULAR
@@ -115,6 +142,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Has-More"],
 )
 
 @app.get("/")
@@ -136,299 +164,134 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """🏥 Ultimate health check - Modular"""
-    try:
-        # Service health checks with dynamic URLs
-        service_health = {}
-        
-        # Get timeout from configuration
-        health_timeout = await get_config_value("defaults", "timeout_short", 10.0)
-        
-        # Build service list from configuration
-        health_tasks = []
-        service_names = []
-        
-        for service_name, service_url in services_config.items():
-            service_names.append(service_name)
-            health_tasks.append(check_service_health(service_name, service_url, health_timeout))
-        
-        # Parallel health checks - ULTIMATE PERFORMANCE!
-        health_results = await asyncio.gather(*health_tasks, return_exceptions=True)
-        
-        for i, result in enumerate(health_results):
-            service_name = service_names[i]
-            if isinstance(result, Exception):
-                service_health[service_name] = {
-                    "status": "error",
-                    "error": str(result),
-                    "url": services_config[service_name]
-                }
-            else:
-                service_health[service_name] = result
-        
-        return {
-            "status": "🚀 MODULAR HEALTHY!",
-            "timestamp": datetime.now().isoformat(),
-            "version": "3.0.0-modular",
-            "modular_config": True,
-            "services": service_health,
-            "environment": os.getenv("ENVIRONMENT", "development")
-        }
-        
-    except Exception as e:
-        logger.error(f"❌ Health check failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Health check failed: {str(e)}")
+    """🏥 Ultimate health check - serves the background snapshot (no fan-out per request)"""
+    snapshot = health_monitor.snapshot()
+    
+    return {
+        "status": "🚀 MODULAR HEALTHY!",
+        "timestamp": snapshot["timestamp"],
+        "version": "3.0.0-modular",
+        "modular_config": True,
+        "services_status": snapshot["status"],
+        "services": snapshot["dependencies"],
+        "snapshot": snapshot["snapshot"],
+        "environment": os.getenv("ENVIRONMENT", "development")
+    }
 
-async def check_service_health(service_name: str, service_url: str, timeout: float) -> Dict[str, Any]:
-    """Check individual service health"""
-    try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(f"{service_url}/health")
-            
-            if response.status_code == 200:
-                return {
-                    "status": "healthy",
-                    "url": service_url,
-                    "response_time": response.elapsed.total_seconds()
-                }
-            else:
-                return {
-                    "status": "unhealthy",
-                    "url": service_url,
-                    "status_code": response.status_code
-                }
-    except Exception as e:
-        return {
-            "status": "error",
-            "url": service_url,
-            "error": str(e)
-        }
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe - touches nothing external"""
+    return health_monitor.liveness()
 
 # 🎙️ SHOW SERVICE - AI Generation & Show Management - MODULAR
 @app.post("/shows/generate")
-async def generate_show(request: Dict[str, Any]):
+async def generate_show(request: Request):
     """Generate a new radio show - Modular"""
-    try:
-        show_service_url = get_service_url("show")
-        timeout = await get_config_value("defaults", "timeout_long", 300.0)
-        
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(f"{show_service_url}/generate", json=request)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                raise HTTPException(status_code=response.status_code, detail=response.text)
-                
-    except httpx.TimeoutException:
-        raise HTTPException(status_code=504, detail="Show generation timeout")
-    except Exception as e:
-        logger.error(f"Show generation failed: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await proxy.forward(request, "show", "/generate", RequestType.ULTRA_SLOW)
+
+@app.post("/shows/generate/batch")
+async def generate_show_batch(request: Request):
+    """Generate several shows at once (shared collection and script calls) - Modular"""
+    return await proxy.forward(request, "show", "/generate/batch", RequestType.ULTRA_SLOW)
+
+def sse_error_event(error: Exception) -> bytes:
+    """Error event for a show stream cut off after it started"""
+    detail = {'status_code': 502, 'detail': str(error) or 'stream interrupted'}
+    return f"event: error\ndata: {json.dumps(detail)}\n\n".encode()
+
+@app.post("/shows/generate/stream")
+async def generate_show_stream(request: Request):
+    """Generate a new radio show as Server-Sent Events - relayed chunk by chunk, never buffered"""
+    # Read timeout applies between events - the show service sends keep-alives while a stage runs
+    return await proxy.forward(request, "show", "/generate/stream", RequestType.ULTRA_SLOW,
+                               stream_error=sse_error_event)
 
 @app.get("/shows/styles")
-async def get_broadcast_styles():
+async def get_broadcast_styles(request: Request):
     """Get available broadcast styles - Modular"""
-    try:
-        show_service_url = get_service_url("show")
-        timeout = await get_config_value("defaults", "timeout_short", 10.0)
-        
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(f"{show_service_url}/styles")
-            return response.json()
-    except Exception as e:
-        logger.error(f"Failed to get broadcast styles: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await proxy.forward(request, "show", "/styles", RequestType.FAST)
 
 @app.get("/shows")
-async def list_shows(limit: int = 10, offset: int = 0):
-    """List all shows - Modular"""
-    try:
-        data_service_url = get_service_url("data")
-        timeout = await get_config_value("defaults", "timeout_medium", 30.0)
-        
-        params = {"limit": limit, "offset": offset}
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(f"{data_service_url}/shows", params=params)
-            return response.json()
-    except Exception as e:
-        logger.error(f"Failed to list shows: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+async def list_shows(request: Request, limit: int = 10, cursor: Optional[str] = None):
+    """List all shows - Modular (keyset pagination via the X-Next-Cursor header)"""
+    return await proxy.forward(request, "data", "/shows", RequestType.STANDARD,
+                               params={"limit": limit, "cursor": cursor})
 
 @app.get("/shows/{session_id}")
-async def get_show(session_id: str):
+async def get_show(request: Request, session_id: str):
     """Get specific show - Modular"""
-    try:
-        data_service_url = get_service_url("data")
-        timeout = await get_config_value("defaults", "timeout_short", 10.0)
-        
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(f"{data_service_url}/shows/{session_id}")
-            
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 404:
-                raise HTTPException(status_code=404, detail="Show not found")
-            else:
-                raise HTTPException(status_code=response.status_code, detail=response.text)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get show {session_id}: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await proxy.forward(request, "data", f"/shows/{session_id}", RequestType.FAST)
 
 @app.get("/shows/stats")
-async def get_shows_stats():
+async def get_shows_stats(request: Request):
     """Get show statistics - Modular"""
-    try:
-        analytics_service_url = get_service_url("analytics")
-        timeout = await get_config_value("defaults", "timeout_short", 10.0)
-        
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(f"{analytics_service_url}/shows/stats")
-            return response.json()
-    except Exception as e:
-        logger.error(f"Failed to get show stats: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await proxy.forward(request, "analytics", "/shows/stats", RequestType.FAST)
 
 # 📰 CONTENT SERVICE - NEWS & DATA - MODULAR
 @app.get("/content")
 async def get_content(
+    request: Request,
     news_count: Optional[int] = None, 
     language: Optional[str] = None, 
     location: Optional[str] = None
 ):
     """Get content for radio show - Modular"""
-    try:
-        # Apply dynamic defaults
-        if news_count is None:
-            news_count = await get_config_value("defaults", "news_count", 3)
-        if language is None:
-            language = await get_config_value("defaults", "language", "de")
-        if location is None:
-            location = await get_config_value("defaults", "location", "zurich")
-        
-        content_service_url = get_service_url("content")
-        timeout = await get_config_value("defaults", "timeout_medium", 30.0)
-        
-        params = {
-            "news_count": news_count,
-            "language": language,
-            "location": location
-        }
-        
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(f"{content_service_url}/content", params=params)
-            return response.json()
-    except Exception as e:
-        logger.error(f"Failed to get content: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Apply dynamic defaults
+    if news_count is None:
+        news_count = await get_config_value("defaults", "news_count", 3)
+    if language is None:
+        language = await get_config_value("defaults", "language", "de")
+    if location is None:
+        location = await get_config_value("defaults", "location", "zurich")
+    
+    params = {
+        "news_count": news_count,
+        "language": language,
+        "location": location
+    }
+    return await proxy.forward(request, "content", "/content", RequestType.STANDARD, params=params)
 
 # 🎵 AUDIO SERVICE - AUDIO PROCESSING - MODULAR
 @app.post("/audio/script")
-async def generate_audio_from_script(request: Dict[str, Any]):
-    """Generate audio from script - Modular"""
-    try:
-        audio_service_url = get_service_url("audio")
-        timeout = await get_config_value("defaults", "timeout_long", 300.0)
-        
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(f"{audio_service_url}/script", json=request)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                raise HTTPException(status_code=response.status_code, detail=response.text)
-                
-    except httpx.TimeoutException:
-        raise HTTPException(status_code=504, detail="Audio generation timeout")
-    except Exception as e:
-        logger.error(f"Audio generation failed: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+async def generate_audio_from_script(request: Request):
+    """Generate audio from script - Modular (whole shows: 300s class like show generation)"""
+    return await proxy.forward(request, "audio", "/script", RequestType.ULTRA_SLOW)
 
 # 📸 MEDIA SERVICE - IMAGE & MEDIA MANAGEMENT - MODULAR
 @app.post("/media/upload")
-async def upload_media(request: Dict[str, Any]):
+async def upload_media(request: Request):
     """Upload media files - Modular"""
-    try:
-        media_service_url = get_service_url("media")
-        timeout = await get_config_value("defaults", "timeout_medium", 30.0)
-        
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(f"{media_service_url}/upload", json=request)
-            return response.json()
-    except Exception as e:
-        logger.error(f"Media upload failed: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await proxy.forward(request, "media", "/upload", RequestType.STANDARD)
 
 # 🎤 SPEAKER SERVICE - VOICE MANAGEMENT - MODULAR
 @app.get("/speakers")
-async def get_speakers():
+async def get_speakers(request: Request):
     """Get all available speakers - Modular"""
-    try:
-        speaker_service_url = get_service_url("speaker")
-        timeout = await get_config_value("defaults", "timeout_short", 10.0)
-        
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(f"{speaker_service_url}/speakers")
-            return response.json()
-    except Exception as e:
-        logger.error(f"Failed to get speakers: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await proxy.forward(request, "speaker", "/speakers", RequestType.FAST)
 
 @app.get("/speakers/{speaker_name}")
-async def get_speaker_config(speaker_name: str):
+async def get_speaker_config(request: Request, speaker_name: str):
     """Get speaker configuration - Modular"""
-    try:
-        speaker_service_url = get_service_url("speaker")
-        timeout = await get_config_value("defaults", "timeout_short", 10.0)
-        
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(f"{speaker_service_url}/speakers/{speaker_name}")
-            
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 404:
-                raise HTTPException(status_code=404, detail="Speaker not found")
-            else:
-                raise HTTPException(status_code=response.status_code, detail=response.text)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get speaker {speaker_name}: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await proxy.forward(request, "speaker", f"/speakers/{speaker_name}", RequestType.FAST)
 
 # 💾 DATA SERVICE - DATABASE OPERATIONS - MODULAR
 @app.get("/config")
-async def get_system_config():
+async def get_system_config(request: Request):
     """Get system configuration - Modular"""
-    try:
-        data_service_url = get_service_url("data")
-        timeout = await get_config_value("defaults", "timeout_short", 10.0)
-        
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(f"{data_service_url}/config")
-            return response.json()
-    except Exception as e:
-        logger.error(f"Failed to get system config: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await proxy.forward(request, "data", "/config", RequestType.FAST)
 
 # 📊 ANALYTICS SERVICE - PERFORMANCE MONITORING - MODULAR
 @app.get("/analytics/stats")
-async def get_analytics():
+async def get_analytics(request: Request):
     """Get analytics data - Modular"""
-    try:
-        analytics_service_url = get_service_url("analytics")
-        timeout = await get_config_value("defaults", "timeout_short", 10.0)
-        
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(f"{analytics_service_url}/stats")
-            return response.json()
-    except Exception as e:
-        logger.error(f"Failed to get analytics: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await proxy.forward(request, "analytics", "/stats", RequestType.FAST)
 
 # 🔧 CONFIGURATION ENDPOINTS - MODULAR
+@app.get("/proxy")
+async def get_proxy_stats():
+    """Forwarding - connection pools, bytes, time-to-headers overhead and total time per upstream"""
+    return proxy.summary()
+
 @app.get("/config/services")
 async def get_services_config():
     """Get current service configuration"""
@@ -10,16 +10,30 @@ import httpx
 import redis.asyncio as redis
 import json
 import asyncio
+import base64
+import hashlib
 import os
+import sys
 import tempfile
 import subprocess
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 from loguru import logger
 from pydantic import BaseModel
 from supabase import create_client, Client
 
+# Add parent directory to path for shared config modules
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config.script_tokenizer import configure_speaker_aliases, get_speaker_aliases, tokenize_script
+from config.http_cassette import create_async_client, supabase_client_options
+from config.pronunciation_lexicon import LEXICON_CATEGORY, pronunciation_lexicon
+from config.phrase_catalog import PHRASE_CATEGORY, PhrasePart, phrase_catalog
+from config.health_monitor import HealthMonitor
+from config.work_scheduler import PriorityClass, WorkScheduler, parse_priority, parse_tenant_weights
+
 app = FastAPI(
     title="RadioX Audio Service",
     description="ElevenLabs TTS and Audio Processing Service", 
@@ -33,6 +47,64 @@ redis_client: Optional[redis.Redis] = None
 supabase_client: Optional[Client] = None  # Regular operations (anon key)
 supabase_admin: Optional[Client] = None   # Admin operations (service key)
 
+# Show listing - list columns only (no script_content), first page cached per archive version
+SHOW_LIST_COLUMNS = (
+    "id,session_id,show_title,show_description,audio_file_url,audio_duration_seconds,"
+    "audio_file_size,preset_name,created_at,speakers:data->speakers"
+)
+SHOW_LIST_VERSION_KEY = "audio:shows:version"
+SHOW_LIST_CACHE_TTL = 300
+
+# ElevenLabs model per voice quality
+VOICE_QUALITY_MODELS = {
+    "low": "eleven_turbo_v2_5",
+    "mid": "eleven_multilingual_v2",
+    "high": "eleven_multilingual_v2",
+    "ultra": "eleven_multilingual_v2"
+}
+DEFAULT_VOICE_MODEL = "eleven_multilingual_v2"
+
+# Pre-rendered fixed phrases (station IDs, time announcements, sign-offs)
+PHRASE_CACHE_DIR = Path(os.getenv("PHRASE_CACHE_DIR", str(Path(tempfile.gettempdir()) / "radiox_audio" / "phrases")))
+PHRASE_CACHE_REFRESH_SECONDS = float(os.getenv("PHRASE_CACHE_REFRESH_SECONDS", "21600"))
+PHRASE_CACHE_VOICE_QUALITIES = [q.strip() for q in os.getenv("PHRASE_CACHE_VOICE_QUALITIES", "mid").split(",") if q.strip()]
+# Opt-in - warming renders every catalog phrase per speaker and voice quality (ElevenLabs credits);
+# disabled, phrases already on disk (persistent PHRASE_CACHE_DIR, POST /phrases/warm) are still used
+PHRASE_CACHE_ENABLED = os.getenv("PHRASE_CACHE_ENABLED", "false").lower() == "true"
+
+# Content-addressed segment audio for regenerate (local copy + storage objects)
+SEGMENT_STORE_DIR = Path(os.getenv("SEGMENT_STORE_DIR", str(Path(tempfile.gettempdir()) / "radiox_audio" / "segments")))
+SEGMENT_STORAGE_PREFIX = "segments"
+SEGMENT_STORE_MAX_AGE_SECONDS = float(os.getenv("SEGMENT_STORE_MAX_AGE_SECONDS", "86400"))
+SEGMENT_STORAGE_RETENTION_DAYS = float(os.getenv("SEGMENT_STORAGE_RETENTION_DAYS", "7"))   # segments/ objects in storage
+SEGMENT_STORAGE_PRUNE_INTERVAL_SECONDS = 3600
+
+# Two-phase rendering - turbo preview first, final quality upgraded in the background
+PREVIEW_VOICE_QUALITY = "low"
+FINAL_RENDER_WORKERS = int(os.getenv("FINAL_RENDER_WORKERS", "1"))
+FINAL_RENDER_DEFAULT_HORIZON_SECONDS = 3600  # assumed distance to air when no air_time is given
+
+# ElevenLabs admission - one scheduler for every TTS call of this service (on_air > interactive > batch)
+tts_scheduler = WorkScheduler(
+    "tts",
+    capacity=int(os.getenv("TTS_MAX_CONCURRENCY", "5")),
+    tenant_weights=parse_tenant_weights(os.getenv("SCHEDULER_TENANT_WEIGHTS")),
+    aging_seconds=float(os.getenv("SCHEDULER_AGING_SECONDS", "30")),
+    urgent_seconds=float(os.getenv("SCHEDULER_URGENT_SECONDS", "60")),
+)
+
+def parse_air_time(air_time: Optional[str]) -> Optional[float]:
+    """ISO on-air time -> epoch (None if missing or invalid)"""
+    if air_time:
+        try:
+            return datetime.fromisoformat(air_time.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            logger.warning(f"⚠️ Invalid air_time {air_time}")
+    return None
+
+# Dependency health - probed in the background, /health serves the snapshot
+health_monitor = HealthMonitor("audio-service", interval=float(os.getenv("HEALTH_PROBE_INTERVAL", "15")))
+
 @app.on_event("startup")
 async def startup_event():
     global redis_client, supabase_client, supabase_admin
@@ -52,7 +124,7 @@ async def startup_event():
     # FIXED: Load ElevenLabs API Key from Key Service - FAIL FAST
     try:
         key_service_url = os.getenv("KEY_SERVICE_URL", "http://localhost:8002")
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with create_async_client(timeout=10.0) as client:
             # Test Key Service connection
             health_response = await client.get(f"{key_service_url}/health")
             if health_response.status_code != 200:
@@ -84,7 +156,7 @@ async def startup_event():
         raise Exception("Audio Service REQUIRES Supabase credentials (SUPABASE_URL, SUPABASE_ANON_KEY)")
     
     try:
-        supabase_client = create_client(supabase_url, supabase_key)
+        supabase_client = create_client(supabase_url, supabase_key, options=supabase_client_options())
         # Test connection immediately
         test_response = supabase_client.table('shows').select('session_id').limit(1).execute()
         logger.info("✅ Supabase (anon) connection verified")
@@ -92,6 +164,24 @@ async def startup_event():
         logger.error(f"❌ FAIL FAST: Supabase connection failed: {e}")
         raise Exception(f"Audio Service REQUIRES Supabase database connection: {e}")
     
+    # Load speaker alias table once (MARCELO -> marcel etc.)
+    try:
+        await load_speaker_aliases()
+    except Exception as e:
+        logger.warning(f"⚠️ Speaker alias table unavailable, using built-in aliases: {e}")
+    
+    # Compile pronunciation lexicons (per language / speaker) from dynamic_config
+    try:
+        await load_pronunciation_lexicon()
+    except Exception as e:
+        logger.warning(f"⚠️ Pronunciation lexicon unavailable, using built-in entries: {e}")
+    
+    # Fixed phrase catalog (templates from dynamic_config, locations for {location})
+    try:
+        await load_phrase_catalog()
+    except Exception as e:
+        logger.warning(f"⚠️ Phrase catalog unavailable, using built-in phrases: {e}")
+    
     # Initialize Supabase for admin operations (storage) - FAIL FAST
     supabase_service_key = os.getenv("SUPABASE_SERVICE_KEY")
     if not supabase_service_key:
@@ -99,7 +189,7 @@ async def startup_event():
         raise Exception("Audio Service REQUIRES SUPABASE_SERVICE_KEY for storage operations")
     
     try:
-        supabase_admin = create_client(supabase_url, supabase_service_key)
+        supabase_admin = create_client(supabase_url, supabase_service_key, options=supabase_client_options())
         # Test storage connection
         storage = supabase_admin.storage.from_("radio-shows")
         logger.info("✅ Supabase (admin) storage connection verified")
@@ -107,20 +197,79 @@ async def startup_event():
         logger.error(f"❌ FAIL FAST: Supabase storage connection failed: {e}")
         raise Exception(f"Audio Service REQUIRES Supabase storage connection: {e}")
     
+    health_monitor.register("redis", probe_redis)
+    health_monitor.register("supabase", probe_supabase)
+    await health_monitor.start()
+    
+    final_render_queue.start(FINAL_RENDER_WORKERS)
+    
+    # Pre-render fixed phrases in the background - startup does not wait for TTS
+    if PHRASE_CACHE_ENABLED:
+        audio_service.phrase_cache.start(PHRASE_CACHE_REFRESH_SECONDS)
+    else:
+        asyncio.create_task(audio_service.phrase_cache.index_existing())
+    
     logger.info("✅ Audio Service startup complete - ALL DEPENDENCIES VERIFIED")
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    await health_monitor.stop()
+    await audio_service.phrase_cache.stop()
+    await final_render_queue.stop()
     if redis_client:
         await redis_client.close()
     logger.info("Audio Service shutdown complete")
 
+async def load_speaker_aliases():
+    """Load speaker aliases from dynamic_config and voice_configurations (once per process)"""
+    def _query():
+        mapping_result = supabase_client.table('dynamic_config').select('config_value,config_json')\
+            .eq('config_category', 'speakers').eq('config_key', 'speaker_name_mapping').eq('is_active', True).execute()
+        speakers_result = supabase_client.table('voice_configurations').select('speaker_name').eq('is_active', True).execute()
+        return mapping_result.data, speakers_result.data
+    
+    mapping_rows, speaker_rows = await asyncio.to_thread(_query)
+    
+    mapping = None
+    if mapping_rows:
+        mapping = mapping_rows[0].get('config_json') or mapping_rows[0].get('config_value')
+    
+    aliases = configure_speaker_aliases(mapping, [row.get('speaker_name') for row in speaker_rows or []])
+    logger.info(f"✅ Speaker aliases loaded: {len(aliases.aliases)} entries")
+
+async def load_pronunciation_lexicon() -> int:
+    """Load pronunciation lexicons from dynamic_config - only changed scopes are recompiled"""
+    def _query():
+        return supabase_client.table('dynamic_config').select('config_key,config_value,config_json')\
+            .eq('config_category', LEXICON_CATEGORY).eq('is_active', True).execute().data
+    
+    rows = await asyncio.to_thread(_query)
+    changed = pronunciation_lexicon.load_config_rows(rows or [])
+    logger.info(f"✅ Pronunciation lexicon loaded: {len(rows or [])} rows, {changed} scopes changed")
+    return changed
+
+async def load_phrase_catalog():
+    """Load fixed phrase templates and location names for pre-rendering"""
+    def _query():
+        phrase_rows = supabase_client.table('dynamic_config').select('config_key,config_value,config_json')\
+            .eq('config_category', PHRASE_CATEGORY).eq('is_active', True).execute().data
+        location_rows = supabase_client.table('locations').select('display_name').eq('is_active', True).execute().data
+        return phrase_rows, location_rows
+    
+    phrase_rows, location_rows = await asyncio.to_thread(_query)
+    phrase_catalog.load_config_rows(
+        phrase_rows or [],
+        locations=[row.get('display_name') for row in location_rows or []] or None
+    )
+    logger.info(f"✅ Phrase catalog loaded: {phrase_catalog.stats()['scopes']}")
+
 # Pydantic Models
 class AudioRequest(BaseModel):
     text: str
     speaker: str = "marcel"
     voice_quality: str = "mid"
     model_id: Optional[str] = None
+    language: str = "de"
 
 class ScriptAudioRequest(BaseModel):
     script_content: str
@@ -128,13 +277,19 @@ class ScriptAudioRequest(BaseModel):
     include_music: bool = False
     export_format: str = "mp3"
     voice_quality: str = "mid"
+    language: str = "de"
+    previous_session_id: Optional[str] = None  # Regenerate: reuse audio of unchanged segments
+    render_mode: str = "final"                 # final | preview (turbo preview now, final quality in background)
+    air_time: Optional[str] = None             # ISO on-air time - final upgrades closest to air run first
+    priority: Optional[str] = None             # on_air | interactive | batch (TTS scheduling class)
+    tenant: Optional[str] = None               # channel / preset - fair share of TTS capacity
 
 class ElevenLabsService:
     """ElevenLabs TTS Integration Service"""
     
     def __init__(self):
         self.api_key = os.getenv("ELEVENLABS_API_KEY")
-        self.base_url = "https://api.elevenlabs.io/v1"
+        self.base_url = os.getenv("ELEVENLABS_BASE_URL", "https://api.elevenlabs.io/v1")
         self.database_service_url = os.getenv("DATABASE_SERVICE_URL", "http://localhost:8001")
         
         # Audio configuration
@@ -147,23 +302,15 @@ class ElevenLabsService:
     async def get_voice_config(self, speaker: str, voice_quality: str = "mid") -> Optional[Dict[str, Any]]:
         """Get voice configuration from Data Service"""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with create_async_client(timeout=10.0) as client:
                 response = await client.get(f"{self.database_service_url}/speakers/{speaker}")
                 
                 if response.status_code == 200:
                     voice_data = response.json()
                     
-                    # Get model based on quality
-                    model_mapping = {
-                        "low": "eleven_turbo_v2_5",
-                        "mid": "eleven_multilingual_v2", 
-                        "high": "eleven_multilingual_v2",
-                        "ultra": "eleven_multilingual_v2"
-                    }
-                    
                     return {
                         "voice_id": voice_data["voice_id"],
-                        "model_id": model_mapping.get(voice_quality, "eleven_multilingual_v2"),
+                        "model_id": VOICE_QUALITY_MODELS.get(voice_quality, DEFAULT_VOICE_MODEL),
                         "stability": 0.5,
                         "similarity_boost": 0.8,
                         "style": 0.0,
@@ -195,7 +342,7 @@ class ElevenLabsService:
             url = f"{self.base_url}/text-to-speech/{voice_id}"
             
             payload = {
-                "text": self._enhance_text_for_speech(request.text, request.speaker),
+                "text": self._enhance_text_for_speech(request.text, request.speaker, request.language),
                 "model_id": request.model_id or voice_config["model_id"],
                 "voice_settings": {
                     "stability": voice_config["stability"],
@@ -213,7 +360,7 @@ class ElevenLabsService:
             
             logger.info(f"🎤 Generating speech for {request.speaker} with voice ID: {voice_id}")
             
-            async with httpx.AsyncClient(timeout=self.config["request_timeout"]) as client:
+            async with create_async_client(timeout=self.config["request_timeout"]) as client:
                 response = await client.post(url, json=payload, headers=headers)
                 
                 if response.status_code == 200:
@@ -229,26 +376,279 @@ class ElevenLabsService:
             logger.error(f"❌ Speech generation failed: {str(e)}")
             return None
     
-    def _enhance_text_for_speech(self, text: str, speaker: str) -> str:
-        """Enhance text for better speech synthesis"""
-        enhanced_text = text
-        
-        # Speaker-specific enhancements
-        if speaker.lower() == "marcel":
-            # Marcel: More emotional, enthusiastic
-            enhanced_text = enhanced_text.replace("!", "!!")
-            enhanced_text = enhanced_text.replace("Bitcoin", "Bitcoin")  # Emphasis
-        elif speaker.lower() == "jarvis":
-            # Jarvis: More analytical, precise
-            enhanced_text = enhanced_text.replace("...", "... ")
-            enhanced_text = enhanced_text.replace(".", ". ")
+    def _enhance_text_for_speech(self, text: str, speaker: str, language: str = "de") -> str:
+        """Enhance text for better speech synthesis (single-pass pronunciation lexicon)"""
+        return pronunciation_lexicon.apply(text, language, speaker)
+
+class PhraseAudioCache:
+    """Pre-rendered audio for fixed catalog phrases, per speaker / voice / model
+    
+    Files live in PHRASE_CACHE_DIR named by a hash of language, speaker, voice,
+    model and text - a voice or model change renders new files, existing ones
+    survive restarts when the directory is persistent.
+    """
+    
+    def __init__(self, elevenlabs: ElevenLabsService, directory: Path):
+        self.elevenlabs = elevenlabs
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # (language, speaker, voice_id, model_id) -> {phrase text: audio file}
+        self._rendered: Dict[tuple, Dict[str, Path]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._warm_lock: Optional[asyncio.Lock] = None
+        self.last_warmed: Optional[str] = None
+        self.stats = {"hits": 0, "rendered": 0, "render_failures": 0}
+    
+    def _path(self, language: str, speaker: str, voice_id: str, model_id: str, text: str) -> Path:
+        digest = hashlib.sha1(f"{language}|{speaker}|{voice_id}|{model_id}|{text}".encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.mp3"
+    
+    def rendered(self, language: str, speaker: str, voice_id: str, voice_quality: str) -> Dict[str, Path]:
+        """Phrases with audio ready for this speaker, voice and voice quality"""
+        model_id = VOICE_QUALITY_MODELS.get(voice_quality, DEFAULT_VOICE_MODEL)
+        return self._rendered.get(((language or "de").lower(), speaker, voice_id, model_id), {})
+    
+    async def _render(self, text: str, speaker: str, voice_quality: str, language: str, path: Path) -> bool:
+        async with tts_scheduler.slot(PriorityClass.BATCH, tenant="phrase-cache"):
+            audio_data = await self.elevenlabs.generate_speech(AudioRequest(
+                text=text, speaker=speaker, voice_quality=voice_quality, language=language
+            ))
+        if not audio_data:
+            self.stats["render_failures"] += 1
+            return False
         
-        # General enhancements
-        enhanced_text = enhanced_text.replace("RadioX", "Radio X")
-        enhanced_text = enhanced_text.replace("AI", "A I")
-        enhanced_text = enhanced_text.replace("API", "A P I")
+        # Write then rename - a reader never sees a half-written file
+        partial = path.with_suffix(".part")
+        partial.write_bytes(audio_data)
+        partial.replace(path)
+        self.stats["rendered"] += 1
+        return True
+    
+    async def warm(self, speakers: List[str], voice_qualities: List[str], language: str = "de",
+                   render: bool = True) -> Dict[str, int]:
+        """Render every catalog phrase that has no audio yet (bounded parallelism)
         
-        return enhanced_text
+        render=False only indexes the phrases already on disk - no TTS calls.
+        """
+        if self._warm_lock is None:
+            self._warm_lock = asyncio.Lock()
+        async with self._warm_lock:
+            semaphore = asyncio.Semaphore(self.elevenlabs.config["max_parallel_segments"])
+            summary = {"phrases": 0, "rendered": 0, "failed": 0}
+            
+            for voice_quality in voice_qualities:
+                model_id = VOICE_QUALITY_MODELS.get(voice_quality, DEFAULT_VOICE_MODEL)
+                for speaker in speakers:
+                    voice_config = await self.elevenlabs.get_voice_config(speaker, voice_quality)
+                    if not voice_config:
+                        continue
+                    
+                    voice_id = voice_config["voice_id"]
+                    index: Dict[str, Path] = {}
+                    missing = []
+                    for text in sorted(phrase_catalog.phrases_for(language, speaker)):
+                        path = self._path(language, speaker, voice_id, model_id, text)
+                        if path.exists():
+                            index[text] = path
+                        else:
+                            missing.append((text, path))
+                    
+                    async def render_phrase(text: str, path: Path):
+                        async with semaphore:
+                            if await self._render(text, speaker, voice_quality, language, path):
+                                index[text] = path
+                    
+                    if render:
+                        await asyncio.gather(*(render_phrase(text, path) for text, path in missing))
+                    else:
+                        missing = []
+                    # A changed voice replaces the previous voice's index
+                    self._rendered = {key: value for key, value in self._rendered.items()
+                                      if (key[0], key[1], key[3]) != (language, speaker, model_id)}
+                    self._rendered[(language, speaker, voice_id, model_id)] = index
+                    
+                    summary["phrases"] += len(index)
+                    summary["rendered"] += sum(1 for text, _ in missing if text in index)
+                    summary["failed"] += sum(1 for text, _ in missing if text not in index)
+            
+            self.last_warmed = datetime.now().isoformat()
+            logger.info(f"✅ Phrase cache warm: {summary['phrases']} phrases ready, "
+                        f"{summary['rendered']} rendered, {summary['failed']} failed")
+            return summary
+    
+    async def warm_all(self, render: bool = True) -> Dict[str, int]:
+        speakers = sorted(set(get_speaker_aliases().aliases.values()))
+        return await self.warm(speakers, PHRASE_CACHE_VOICE_QUALITIES, render=render)
+    
+    async def index_existing(self):
+        """Use phrases rendered earlier (persistent directory) without rendering new ones"""
+        try:
+            await self.warm_all(render=False)
+        except Exception as e:
+            logger.warning(f"⚠️ Phrase cache index failed: {e}")
+    
+    async def _loop(self, interval: float):
+        while True:
+            try:
+                await self.warm_all()
+            except Exception as e:
+                logger.error(f"❌ Phrase cache warm failed: {e}")
+            await asyncio.sleep(interval)
+    
+    def start(self, interval: float):
+        """Warm now, then re-warm on a schedule (picks up catalog and voice changes)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop(interval))
+    
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "enabled": PHRASE_CACHE_ENABLED,
+            "directory": str(self.directory),
+            "last_warmed": self.last_warmed,
+            "ready": {f"{language}:{speaker}:{voice_id}:{model}": len(index)
+                      for (language, speaker, voice_id, model), index in self._rendered.items()},
+            **self.stats,
+            "catalog": phrase_catalog.stats()
+        }
+
+@dataclass
+class SegmentRenderContext:
+    """Per-request segment rendering state"""
+    reusable: set = field(default_factory=set)                # segment keys of the previous show
+    segment_keys: Dict[int, str] = field(default_factory=dict)  # index -> key of this show
+    stats: Dict[str, int] = field(default_factory=lambda: {
+        "reused_segments": 0, "rendered_segments": 0, "phrase_cache_hits": 0, "tts_requests": 0
+    })
+    priority: PriorityClass = PriorityClass.INTERACTIVE       # TTS scheduling class
+    tenant: str = "default"
+    deadline: Optional[float] = None                            # epoch - air time (None: class default)
+    voice_ids: Dict[str, str] = field(default_factory=dict)    # speaker -> ElevenLabs voice of this render
+
+class SegmentAudioStore:
+    """Segment audio keyed by what is synthesized (language, speaker, voice, model, spoken text)
+    
+    Every rendered segment is kept locally and uploaded to storage in the
+    background; a show's segment manifest lists the keys, so a regenerate can
+    fetch unchanged segments instead of synthesizing them again. Storage
+    objects are removed SEGMENT_STORAGE_RETENTION_DAYS after their upload.
+    """
+    
+    def __init__(self, directory: Path, bucket: str):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.bucket = bucket
+        self._uploaded: set = set()
+        self._storage_pruned_at = 0.0
+    
+    @staticmethod
+    def key(speaker: str, voice_id: str, text: str, voice_quality: str, language: str) -> str:
+        """Content key - a new voice or a changed pronunciation lexicon entry gives a new key"""
+        model_id = VOICE_QUALITY_MODELS.get(voice_quality, DEFAULT_VOICE_MODEL)
+        spoken = pronunciation_lexicon.apply(" ".join(text.split()), language, speaker)
+        return hashlib.sha1(f"{language}|{speaker}|{voice_id}|{model_id}|{spoken}".encode("utf-8")).hexdigest()[:24]
+    
+    def _local(self, key: str) -> Path:
+        return self.directory / f"{key}.mp3"
+    
+    def save_local(self, key: str, audio_data: bytes):
+        path = self._local(key)
+        if not path.exists():
+            partial = path.with_suffix(".part")
+            partial.write_bytes(audio_data)
+            partial.replace(path)
+    
+    async def load(self, key: str) -> Optional[bytes]:
+        """Local copy first, then the storage object"""
+        path = self._local(key)
+        if path.exists():
+            return path.read_bytes()
+        if not supabase_admin:
+            return None
+        try:
+            audio_data = await asyncio.to_thread(
+                lambda: supabase_admin.storage.from_(self.bucket).download(f"{SEGMENT_STORAGE_PREFIX}/{key}.mp3")
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Segment {key} not in storage: {e}")
+            return None
+        if audio_data:
+            self.save_local(key, audio_data)
+            self._uploaded.add(key)
+        return audio_data or None
+    
+    async def upload(self, keys: List[str]):
+        """Upload segments that storage does not have yet (runs after the response)"""
+        if not supabase_admin:
+            return
+        for key in keys:
+            path = self._local(key)
+            if key in self._uploaded or not path.exists():
+                continue
+            try:
+                await asyncio.to_thread(
+                    lambda: supabase_admin.storage.from_(self.bucket).upload(
+                        f"{SEGMENT_STORAGE_PREFIX}/{key}.mp3",
+                        path.read_bytes(),
+                        file_options={"content-type": "audio/mpeg", "upsert": "true"}
+                    )
+                )
+                self._uploaded.add(key)
+            except Exception as e:
+                logger.warning(f"⚠️ Segment upload failed for {key}: {e}")
+        self.prune()
+        if time.time() - self._storage_pruned_at >= SEGMENT_STORAGE_PRUNE_INTERVAL_SECONDS:
+            self._storage_pruned_at = time.time()
+            await self.prune_storage()
+    
+    async def prune_storage(self, retention_days: float = SEGMENT_STORAGE_RETENTION_DAYS) -> int:
+        """Remove segment objects uploaded more than retention_days ago - a regenerate re-renders them"""
+        if not supabase_admin:
+            return 0
+        cutoff = (datetime.utcnow() - timedelta(days=retention_days)).isoformat()
+        bucket = supabase_admin.storage.from_(self.bucket)
+        try:
+            expired = []
+            offset = 0
+            while True:
+                page = await asyncio.to_thread(lambda: bucket.list(SEGMENT_STORAGE_PREFIX, {
+                    "limit": 1000, "offset": offset, "sortBy": {"column": "created_at", "order": "asc"}
+                }))
+                old = [entry["name"] for entry in page or [] if (entry.get("created_at") or "") < cutoff]
+                expired.extend(old)
+                # Oldest first - stop at the first page that reaches into the retention window
+                if len(old) < len(page or []) or len(page or []) < 1000:
+                    break
+                offset += len(page)
+            for start in range(0, len(expired), 100):
+                chunk = [f"{SEGMENT_STORAGE_PREFIX}/{name}" for name in expired[start:start + 100]]
+                await asyncio.to_thread(lambda: bucket.remove(chunk))
+            for name in expired:
+                self._uploaded.discard(Path(name).stem)
+            if expired:
+                logger.info(f"🧹 Removed {len(expired)} segment objects older than {retention_days:g} days from storage")
+            return len(expired)
+        except Exception as e:
+            logger.warning(f"⚠️ Segment storage cleanup failed: {e}")
+            return 0
+    
+    def prune(self, max_age_seconds: float = SEGMENT_STORE_MAX_AGE_SECONDS):
+        """Drop local copies older than max_age - storage keeps the objects"""
+        cutoff = time.time() - max_age_seconds
+        for path in self.directory.glob("*.mp3"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except FileNotFoundError:
+                continue
 
 class AudioProcessingService:
     """Audio processing and script handling service"""
@@ -257,8 +657,10 @@ class AudioProcessingService:
         self.elevenlabs = ElevenLabsService()
         self.temp_dir = Path(tempfile.gettempdir()) / "radiox_audio"
         self.temp_dir.mkdir(exist_ok=True)
+        self.phrase_cache = PhraseAudioCache(self.elevenlabs, PHRASE_CACHE_DIR)
         self.ffmpeg_path = self._find_ffmpeg()
         self.storage_bucket = "radio-shows"
+        self.segment_store = SegmentAudioStore(SEGMENT_STORE_DIR, self.storage_bucket)
     
     def _find_ffmpeg(self) -> Optional[str]:
         """Find available ffmpeg executable"""
@@ -278,82 +680,58 @@ class AudioProcessingService:
         return None
     
     def _parse_script_into_segments(self, script_content: str) -> List[Dict[str, Any]]:
-        """Parse script into speaker segments"""
+        """Parse script into speaker segments ([SPEAKER] text and SPEAKER: text)"""
         if not script_content:
             return []
         
-        segments = []
-        lines = script_content.strip().split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            
-            # Parse speaker format: "SPEAKER: text"
-            if ':' in line:
-                parts = line.split(':', 1)
-                speaker_raw = parts[0].strip()
-                text = parts[1].strip()
-                
-                if text:
-                    speaker = self._normalize_speaker_name(speaker_raw)
-                    segments.append({
-                        "speaker": speaker,
-                        "text": text,
-                        "original_speaker": speaker_raw
-                    })
-            else:
-                # Default to marcel for untagged lines
-                segments.append({
-                    "speaker": "marcel",
-                    "text": line,
-                    "original_speaker": "default"
-                })
-        
-        return segments
+        return [segment.to_dict() for segment in tokenize_script(script_content)]
     
     def _normalize_speaker_name(self, speaker_raw: str) -> str:
-        """Normalize speaker names"""
-        speaker_lower = speaker_raw.lower().strip()
-        
-        # Direct mappings
-        mappings = {
-            "marcel": "marcel",
-            "jarvis": "jarvis", 
-            "brad": "brad",
-            "lucy": "lucy"
-        }
-        
-        # Check exact matches first
-        if speaker_lower in mappings:
-            return mappings[speaker_lower]
-        
-        # Fuzzy matching
-        for key, value in mappings.items():
-            if key in speaker_lower:
-                return value
-        
-        # Default fallback
-        return "marcel"
+        """Normalize speaker names via the shared alias table"""
+        return get_speaker_aliases().resolve(speaker_raw)
     
-    async def generate_audio_from_script(self, request: ScriptAudioRequest) -> Dict[str, Any]:
-        """Generate complete audio from script"""
+    async def generate_audio_from_script(self, request: ScriptAudioRequest, render_phase: str = "final") -> Dict[str, Any]:
+        """Generate complete audio from script
+        
+        render_phase: final (insert show), preview (insert show, turbo audio) or
+        upgrade (final quality for an existing preview - swaps its audio URL)
+        """
         try:
             session_id = request.session_id or f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            stage_timings: Dict[str, float] = {}
+            stage_start = time.perf_counter()
+            
+            def mark_stage(stage: str):
+                nonlocal stage_start
+                now = time.perf_counter()
+                stage_timings[stage] = round((now - stage_start) * 1000, 1)
+                stage_start = now
             
             logger.info(f"🎭 Generating audio for session: {session_id}")
             
             # Parse script into segments
             segments = self._parse_script_into_segments(request.script_content)
+            mark_stage("parse")
             
             if not segments:
                 raise HTTPException(status_code=400, detail="No segments parsed from script")
             
             logger.info(f"📝 Parsed {len(segments)} segments")
             
-            # Generate audio for each segment
-            audio_files = await self._generate_segments_parallel(segments, session_id, request.voice_quality)
+            # Regenerate: segment keys of the previous show can be reused as-is
+            context = self._render_context(request, render_phase)
+            context.voice_ids = await self._voice_ids({seg["speaker"] for seg in segments}, request.voice_quality)
+            if request.previous_session_id:
+                context.reusable = await self._load_segment_manifest(request.previous_session_id)
+                logger.info(f"♻️ Regenerating from {request.previous_session_id}: "
+                            f"{len(context.reusable)} reusable segments")
+            
+            # Generate audio for each segment (fixed phrases spliced in from the phrase cache)
+            audio_files = await self._generate_segments_parallel(
+                segments, session_id, request.voice_quality, request.language, context
+            )
+            
+            mark_stage("tts")
             
             # Filter valid files
             valid_files = [f for f in audio_files if f and Path(f).exists()]
@@ -377,17 +755,20 @@ class AudioProcessingService:
             # Get audio info
             duration = await self._get_audio_duration(final_audio) if final_audio else 0
             file_size = final_audio.stat().st_size if final_audio and final_audio.exists() else 0
+            mark_stage("combine")
             
             # Prepare metadata for storage upload
             upload_metadata = {
                 "preset_name": getattr(request, 'preset_name', 'default'),
                 "speakers": {seg["speaker"] for seg in segments},
                 "duration_minutes": getattr(request, 'duration_minutes', 
-                                          max(1, int(duration / 60)) if duration > 0 else 1)
+                                          max(1, int(duration / 60)) if duration > 0 else 1),
+                "render_phase": render_phase
             }
             
             # Upload to Supabase Storage
             storage_url = await self.upload_to_storage(final_audio, session_id, upload_metadata) if final_audio else None
+            mark_stage("upload")
             
             # Prepare response data
             result_data = {
@@ -400,9 +781,20 @@ class AudioProcessingService:
                 "file_size_bytes": file_size,
                 "format": request.export_format,
                 "generated_at": datetime.now().isoformat(),
-                "storage_uploaded": storage_url is not None
+                "storage_uploaded": storage_url is not None,
+                "stage_timings_ms": stage_timings,
+                "previous_session_id": request.previous_session_id,
+                "render_phase": render_phase,
+                **context.stats
             }
             
+            # Keep segment audio available for future regenerates (after the response)
+            segment_manifest = [
+                {"index": index, "speaker": segments[index]["speaker"], "key": key}
+                for index, key in sorted(context.segment_keys.items())
+            ]
+            asyncio.create_task(self.segment_store.upload([entry["key"] for entry in segment_manifest]))
+            
             # Save to database if storage upload succeeded
             if storage_url:
                 show_data = {
@@ -415,19 +807,73 @@ class AudioProcessingService:
                     "preset_name": getattr(request, 'preset_name', 'default'),
                     "show_title": f"RadioX Show {datetime.now().strftime('%H:%M')}",
                     "show_description": f"AI-generated show with {len(segments)} segments",
-                    "speakers": {seg["speaker"] for seg in segments}
+                    "speakers": {seg["speaker"] for seg in segments},
+                    "segment_manifest": segment_manifest,
+                    "voice_quality": request.voice_quality,
+                    "language": request.language,
+                    "render_phase": render_phase
                 }
                 
-                await self.save_show_to_database(session_id, show_data, storage_url)
+                # Upgrade swaps the preview's audio URL in one row update; insert only if there is no preview row
+                swap = await self.swap_show_audio(session_id, show_data, storage_url) if render_phase == "upgrade" else "missing"
+                if swap == "missing":
+                    await self.save_show_to_database(session_id, show_data, storage_url)
+                mark_stage("save")
             
             return result_data
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"❌ Audio generation failed: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Audio generation failed: {str(e)}")
     
+    async def _load_segment_manifest(self, previous_session_id: str) -> set:
+        """Segment keys of a previously generated show (404 if the show does not exist)"""
+        if not supabase_client:
+            raise HTTPException(status_code=503, detail="Database not available")
+        
+        result = await asyncio.to_thread(
+            lambda: supabase_client.table("broadcast_logs")
+            .select("session_id,manifest:data->segment_manifest")
+            .eq("session_id", previous_session_id)
+            .limit(1)
+            .execute()
+        )
+        if not result.data:
+            raise HTTPException(status_code=404, detail=f"Previous show not found: {previous_session_id}")
+        
+        manifest = result.data[0].get("manifest") or []
+        if isinstance(manifest, str):
+            manifest = json.loads(manifest)
+        return {entry["key"] for entry in manifest if isinstance(entry, dict) and entry.get("key")}
+    
+    @staticmethod
+    def _render_context(request: ScriptAudioRequest, render_phase: str) -> SegmentRenderContext:
+        """Scheduling class, tenant and deadline of this render's TTS calls
+        
+        Previews are interactive, background upgrades batch; an upgrade whose air
+        time comes within the urgent window is promoted by the scheduler itself.
+        """
+        if render_phase == "upgrade":
+            priority = PriorityClass.BATCH
+        else:
+            priority = parse_priority(request.priority, PriorityClass.INTERACTIVE)
+        return SegmentRenderContext(
+            priority=priority,
+            tenant=request.tenant or "default",
+            deadline=parse_air_time(request.air_time)  # None: class default (never urgent)
+        )
+    
+    async def _voice_ids(self, speakers: set, voice_quality: str) -> Dict[str, str]:
+        """Current ElevenLabs voice per speaker - part of the segment keys"""
+        speakers = sorted(speakers)
+        configs = await asyncio.gather(*(self.elevenlabs.get_voice_config(speaker, voice_quality) for speaker in speakers))
+        return {speaker: config["voice_id"] for speaker, config in zip(speakers, configs) if config}
+    
     async def _generate_segments_parallel(
-        self, segments: List[Dict[str, Any]], session_id: str, voice_quality: str
+        self, segments: List[Dict[str, Any]], session_id: str, voice_quality: str, language: str = "de",
+        context: Optional[SegmentRenderContext] = None
     ) -> List[Optional[str]]:
         """Generate audio segments in parallel"""
         
@@ -435,7 +881,9 @@ class AudioProcessingService:
         
         async def limited_generation(segment: Dict[str, Any], index: int) -> Optional[str]:
             async with semaphore:
-                return await self._generate_single_segment(segment, session_id, index, voice_quality)
+                return await self._generate_single_segment(
+                    segment, session_id, index, voice_quality, language, context
+                )
         
         tasks = [
             limited_generation(segment, i) 
@@ -446,9 +894,11 @@ class AudioProcessingService:
         return [r for r in results if isinstance(r, str)]
     
     async def _generate_single_segment(
-        self, segment: Dict[str, Any], session_id: str, index: int, voice_quality: str
+        self, segment: Dict[str, Any], session_id: str, index: int, voice_quality: str, language: str = "de",
+        context: Optional[SegmentRenderContext] = None
     ) -> Optional[str]:
         """Generate single audio segment"""
+        context = context or SegmentRenderContext()
         try:
             speaker = segment.get("speaker", "marcel")
             text = segment.get("text", "").strip()
@@ -456,25 +906,57 @@ class AudioProcessingService:
             if not text:
                 return None
             
-            # Generate speech
-            audio_request = AudioRequest(
-                text=text,
-                speaker=speaker,
-                voice_quality=voice_quality
-            )
+            filename = f"{session_id}_segment_{index:03d}_{speaker}.mp3"
+            filepath = self.temp_dir / filename
+            segment_key = self.segment_store.key(speaker, context.voice_ids.get(speaker, ""), text, voice_quality, language)
             
-            audio_data = await self.elevenlabs.generate_speech(audio_request)
+            # Unchanged since the previous show - reuse its audio
+            if segment_key in context.reusable:
+                audio_data = await self.segment_store.load(segment_key)
+                if audio_data:
+                    filepath.write_bytes(audio_data)
+                    context.segment_keys[index] = segment_key
+                    context.stats["reused_segments"] += 1
+                    logger.info(f"♻️ Reused segment {index}: {speaker} ({len(text)} chars)")
+                    return str(filepath)
             
-            if not audio_data:
-                return None
+            # Exact catalog phrases come from the phrase cache, the rest goes to TTS
+            rendered = self.phrase_cache.rendered(language, speaker, context.voice_ids.get(speaker, ""), voice_quality)
+            parts = phrase_catalog.plan(text, language, speaker, available=rendered.keys()) \
+                if rendered else [PhrasePart(text, False)]
             
-            # Save audio file
-            filename = f"{session_id}_segment_{index:03d}_{speaker}.mp3"
-            filepath = self.temp_dir / filename
+            chunks: List[bytes] = []
+            for part in parts:
+                if part.cached:
+                    chunks.append(rendered[part.text].read_bytes())
+                    self.phrase_cache.stats["hits"] += 1
+                    context.stats["phrase_cache_hits"] += 1
+                    continue
+                
+                audio_request = AudioRequest(
+                    text=part.text,
+                    speaker=speaker,
+                    voice_quality=voice_quality,
+                    language=language
+                )
+                async with tts_scheduler.slot(context.priority, context.tenant, context.deadline):
+                    part_audio = await self.elevenlabs.generate_speech(audio_request)
+                context.stats["tts_requests"] += 1
+                if not part_audio:
+                    return None
+                chunks.append(part_audio)
+            
+            # MP3 is a frame stream - concatenated parts form one valid segment file
+            audio_data = b"".join(chunks)
             
+            # Save audio file
             with open(filepath, 'wb') as f:
                 f.write(audio_data)
             
+            self.segment_store.save_local(segment_key, audio_data)
+            context.segment_keys[index] = segment_key
+            context.stats["rendered_segments"] += 1
+            
             logger.info(f"✅ Generated segment {index}: {speaker} ({len(text)} chars)")
             return str(filepath)
             
@@ -618,6 +1100,11 @@ class AudioProcessingService:
             import re
             filename_base = re.sub(r'[^a-zA-Z0-9_-]', '', filename_base)
             
+            # Session suffix keeps shows rendered in the same minute apart (preview + final)
+            filename_base += "_" + hashlib.sha1(session_id.encode()).hexdigest()[:6]
+            if show_metadata and show_metadata.get("render_phase") == "preview":
+                filename_base += "_preview"
+            
             filename = f"shows/{filename_base}.mp3"
             
             # Read file data
@@ -672,15 +1159,22 @@ class AudioProcessingService:
                     "segments_count": show_data.get("segments_count", 0),
                     "format": show_data.get("format", "mp3"),
                     "generated_at": show_data.get("generated_at"),
-                    "speakers": list(show_data.get("speakers", set())) if isinstance(show_data.get("speakers"), set) else show_data.get("speakers", [])
+                    "speakers": list(show_data.get("speakers", set())) if isinstance(show_data.get("speakers"), set) else show_data.get("speakers", []),
+                    "segment_manifest": show_data.get("segment_manifest", []),
+                    "voice_quality": show_data.get("voice_quality"),
+                    "language": show_data.get("language"),
+                    "render_phase": show_data.get("render_phase", "final")
                 }
             }
             
-            # Insert into database
-            result = supabase_client.table("broadcast_logs").insert(show_record).execute()
+            # Insert into database (sync client - keep it off the event loop)
+            result = await asyncio.to_thread(
+                lambda: supabase_client.table("broadcast_logs").insert(show_record).execute()
+            )
             
             if result.data:
                 logger.info(f"✅ Show saved to database: {session_id}")
+                await invalidate_show_list_cache()
                 return True
             else:
                 logger.error("❌ Database insert failed")
@@ -690,60 +1184,198 @@ class AudioProcessingService:
             logger.error(f"❌ Database save error: {str(e)}")
             return False
 
-audio_service = AudioProcessingService()
-
-# Health Check
-@app.get("/health")
-async def health_check():
-    """Enhanced health check with dependency validation"""
-    try:
-        # Test ElevenLabs API Key
-        elevenlabs_status = "configured" if os.getenv("ELEVENLABS_API_KEY") else "missing"
+    async def swap_show_audio(self, session_id: str, show_data: Dict[str, Any], audio_url: str) -> str:
+        """Point an existing show at its final audio - one row update, readers see preview or final
         
-        # Test Redis connection
-        redis_status = "unknown"
-        if redis_client:
-            try:
-                await redis_client.ping()
-                redis_status = "healthy"
-            except:
-                redis_status = "unhealthy"
-        
-        # Test Supabase connection
-        supabase_status = "unknown"
-        if supabase_client:
-            try:
-                test_response = supabase_client.table('shows').select('session_id').limit(1).execute()
-                supabase_status = "healthy"
-            except:
-                supabase_status = "unhealthy"
-        else:
-            supabase_status = "not_configured"
+        Returns "swapped", "missing" (no row for the session - caller inserts one)
+        or "failed" (row exists but the update did not go through - never insert then).
+        """
+        global supabase_client
         
-        # FAIL FAST: Return unhealthy if critical dependencies fail
-        if elevenlabs_status == "missing":
-            raise HTTPException(status_code=503, detail="Audio Service: ElevenLabs API key missing")
+        if not supabase_client:
+            return "failed"
         
-        if supabase_status == "not_configured":
-            raise HTTPException(status_code=503, detail="Audio Service: Supabase not configured")
+        try:
+            existing = await asyncio.to_thread(
+                lambda: supabase_client.table("broadcast_logs").select("audio_file_url,data")
+                .eq("session_id", session_id).limit(1).execute()
+            )
+        except Exception as e:
+            logger.error(f"❌ Preview lookup failed for {session_id}: {str(e)}")
+            return "failed"
+        if not existing.data:
+            return "missing"
         
-        if supabase_status == "unhealthy" or redis_status == "unhealthy":
-            raise HTTPException(status_code=503, detail="Audio Service: Critical dependencies unhealthy")
+        try:
+            data = existing.data[0].get("data") or {}
+            if isinstance(data, str):
+                data = json.loads(data)  # rows written by older versions store the JSON as text
+            data = dict(data)
+            data.update({
+                "render_phase": "final",
+                "preview_audio_url": existing.data[0].get("audio_file_url"),
+                "final_rendered_at": datetime.now().isoformat(),
+                "segment_manifest": show_data.get("segment_manifest", []),
+                "voice_quality": show_data.get("voice_quality"),
+                "segments_count": show_data.get("segments_count", 0)
+            })
+            
+            result = await asyncio.to_thread(
+                lambda: supabase_client.table("broadcast_logs").update({
+                    "audio_file_url": audio_url,
+                    "audio_file_size": show_data.get("file_size_bytes", 0),
+                    "audio_duration_seconds": show_data.get("duration_seconds", 0),
+                    "data": data
+                }).eq("session_id", session_id).execute()
+            )
+            
+            if result.data:
+                logger.info(f"✅ Final audio swapped in: {session_id}")
+                await invalidate_show_list_cache()
+                return "swapped"
+            logger.error(f"❌ Final audio swap updated no row for {session_id}")
+            return "failed"
+            
+        except Exception as e:
+            logger.error(f"❌ Final audio swap failed for {session_id}: {str(e)}")
+            return "failed"
+    
+    async def generate_preview(self, request: ScriptAudioRequest) -> Dict[str, Any]:
+        """Turbo preview now, final quality queued for the background workers"""
+        session_id = request.session_id or f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        preview_request = request.model_copy(update={
+            "session_id": session_id, "voice_quality": PREVIEW_VOICE_QUALITY, "render_mode": "final"
+        })
+        result = await self.generate_audio_from_script(preview_request, render_phase="preview")
         
+        final_request = request.model_copy(update={"session_id": session_id, "render_mode": "final"})
+        job = await final_render_queue.enqueue(final_request)
+        result["final_render"] = job.to_dict()
+        return result
+
+audio_service = AudioProcessingService()
+
+@dataclass
+class FinalRenderJob:
+    """Background final-quality render of a previewed show"""
+    session_id: str
+    request: ScriptAudioRequest
+    deadline: float                      # on-air time (epoch) - earliest first
+    status: str = "queued"               # queued, rendering, done, failed
+    enqueued_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    audio_url: Optional[str] = None
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
         return {
-            "status": "healthy",
-            "service": "audio-service", 
-            "dependencies": {
-                "elevenlabs_api": elevenlabs_status,
-                "redis": redis_status,
-                "supabase": supabase_status
-            },
-            "timestamp": datetime.now().isoformat()
+            "session_id": self.session_id,
+            "status": self.status,
+            "voice_quality": self.request.voice_quality,
+            "air_time": datetime.fromtimestamp(self.deadline).isoformat(),
+            "queued_seconds": round((self.started_at or time.time()) - self.enqueued_at, 1),
+            "render_seconds": round(self.finished_at - self.started_at, 1) if self.finished_at and self.started_at else None,
+            "audio_url": self.audio_url,
+            "error": self.error
         }
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Audio Service health check failed: {str(e)}")
+
+class FinalRenderQueue:
+    """Earliest-air-time-first queue of final renders, drained by a few workers"""
+    
+    def __init__(self):
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._workers: List[asyncio.Task] = []
+        self._sequence = 0
+        self.jobs: Dict[str, FinalRenderJob] = {}
+    
+    @staticmethod
+    def _deadline(air_time: Optional[str]) -> float:
+        return parse_air_time(air_time) or time.time() + FINAL_RENDER_DEFAULT_HORIZON_SECONDS
+    
+    def _ensure_queue(self) -> asyncio.PriorityQueue:
+        if self._queue is None:
+            self._queue = asyncio.PriorityQueue()
+        return self._queue
+    
+    async def enqueue(self, request: ScriptAudioRequest) -> FinalRenderJob:
+        # Forget finished jobs after an hour
+        cutoff = time.time() - 3600
+        self.jobs = {sid: j for sid, j in self.jobs.items() if not j.finished_at or j.finished_at > cutoff}
+        
+        job = FinalRenderJob(session_id=request.session_id, request=request, deadline=self._deadline(request.air_time))
+        self.jobs[job.session_id] = job
+        self._sequence += 1
+        await self._ensure_queue().put((job.deadline, self._sequence, job))
+        logger.info(f"📥 Final render queued: {job.session_id} (air {datetime.fromtimestamp(job.deadline):%H:%M})")
+        return job
+    
+    async def _worker(self, worker_id: int):
+        queue = self._ensure_queue()
+        while True:
+            _, _, job = await queue.get()
+            job.status, job.started_at = "rendering", time.time()
+            try:
+                result = await audio_service.generate_audio_from_script(job.request, render_phase="upgrade")
+                job.audio_url = result.get("audio_url")
+                job.status = "done"
+            except Exception as e:
+                job.status, job.error = "failed", str(e)
+                logger.error(f"❌ Final render failed for {job.session_id}: {e}")
+            finally:
+                job.finished_at = time.time()
+                queue.task_done()
+    
+    def start(self, workers: int):
+        self._ensure_queue()
+        self._workers = [asyncio.create_task(self._worker(i)) for i in range(max(1, workers))]
+        logger.info(f"✅ Final render queue started ({len(self._workers)} workers)")
+    
+    async def stop(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+    
+    def summary(self) -> Dict[str, Any]:
+        by_status: Dict[str, int] = {}
+        for job in self.jobs.values():
+            by_status[job.status] = by_status.get(job.status, 0) + 1
+        return {"workers": len(self._workers), "queued": self._queue.qsize() if self._queue else 0, "jobs": by_status}
+
+final_render_queue = FinalRenderQueue()
+
+# Health Check
+async def probe_redis() -> bool:
+    return bool(redis_client and await redis_client.ping())
+
+async def probe_supabase() -> bool:
+    if not supabase_client:
+        return False
+    await asyncio.to_thread(
+        lambda: supabase_client.table('shows').select('session_id').limit(1).execute()
+    )
+    return True
+
+@app.get("/health")
+async def health_check():
+    """Health check - serves the background dependency snapshot (no live queries)"""
+    # FAIL FAST: Return unhealthy if critical dependencies fail
+    if not os.getenv("ELEVENLABS_API_KEY"):
+        raise HTTPException(status_code=503, detail="Audio Service: ElevenLabs API key missing")
+    
+    snapshot = health_monitor.snapshot()
+    snapshot["dependencies"]["elevenlabs_api"] = {"status": "configured"}
+    
+    if snapshot["status"] == "unhealthy":
+        raise HTTPException(status_code=503, detail=snapshot)
+    
+    return snapshot
+
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe - touches nothing external"""
+    return health_monitor.liveness()
 
 # Audio Generation
 @app.post("/generate")
@@ -772,14 +1404,67 @@ async def generate_audio(request: AudioRequest):
 
 @app.post("/script")
 async def generate_script_audio(request: ScriptAudioRequest):
-    """Generate audio from complete script"""
+    """Generate audio from complete script (render_mode "preview": turbo now, final in background)"""
+    if request.render_mode == "preview":
+        return await audio_service.generate_preview(request)
     return await audio_service.generate_audio_from_script(request)
 
+@app.get("/renders")
+async def get_final_renders():
+    """Final render queue status"""
+    return final_render_queue.summary()
+
+@app.get("/renders/{session_id}")
+async def get_final_render(session_id: str):
+    """Status of the background final render of a previewed show"""
+    job = final_render_queue.jobs.get(session_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="No final render for this session")
+    return job.to_dict()
+
+@app.get("/scheduler")
+async def get_tts_scheduler():
+    """TTS scheduling - queue wait per priority class, missed deadlines, tenant shares"""
+    return tts_scheduler.stats()
+
+@app.post("/lexicon/reload")
+async def reload_pronunciation_lexicon():
+    """Reload pronunciation lexicons from dynamic_config without restarting"""
+    try:
+        changed = await load_pronunciation_lexicon()
+    except Exception as e:
+        logger.error(f"❌ Pronunciation lexicon reload failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Lexicon reload failed: {str(e)}")
+    
+    return {
+        "success": True,
+        "changed_scopes": changed,
+        **pronunciation_lexicon.stats(),
+        "reloaded_at": datetime.now().isoformat()
+    }
+
+@app.get("/phrases")
+async def get_phrase_cache():
+    """Phrase cache status - catalog size and pre-rendered phrases per speaker/model"""
+    return audio_service.phrase_cache.summary()
+
+@app.post("/phrases/warm")
+async def warm_phrase_cache():
+    """Reload the phrase catalog and render missing phrases now"""
+    try:
+        await load_phrase_catalog()
+        summary = await audio_service.phrase_cache.warm_all()
+    except Exception as e:
+        logger.error(f"❌ Phrase cache warm failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Phrase cache warm failed: {str(e)}")
+    
+    return {"success": True, **summary, "warmed_at": audio_service.phrase_cache.last_warmed}
+
 @app.get("/voices")
 async def get_available_voices():
     """Get available voice configurations"""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with create_async_client(timeout=10.0) as client:
             response = await client.get(f"{audio_service.elevenlabs.database_service_url}/speakers")
             
             if response.status_code == 200:
@@ -851,31 +1536,89 @@ async def get_temp_file(filename: str):
         logger.error(f"❌ Failed to serve temp file {filename}: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to serve audio file")
 
+def _encode_show_cursor(record: Dict[str, Any]) -> str:
+    """Encode the (created_at, id) keyset position of the last listed show"""
+    payload = json.dumps([record.get("created_at"), record.get("id")])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def _decode_show_cursor(cursor: str) -> tuple:
+    """Decode a show listing cursor - 400 on anything malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, show_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not created_at or show_id is None:
+            raise ValueError("empty cursor position")
+        return str(created_at), str(show_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+async def invalidate_show_list_cache():
+    """Bump the archive version - cached first pages of older versions are never read again"""
+    if not redis_client:
+        return
+    try:
+        await redis_client.incr(SHOW_LIST_VERSION_KEY)
+    except Exception as e:
+        logger.warning(f"⚠️ Show list cache invalidation failed: {e}")
+
 @app.get("/shows")
-async def list_shows(limit: int = 10, offset: int = 0):
-    """List shows from database"""
+async def list_shows(limit: int = 10, cursor: Optional[str] = None, offset: int = 0):
+    """List shows from database (keyset pagination on created_at, id)"""
     global supabase_client
     
     if not supabase_client:
         raise HTTPException(status_code=503, detail="Database not available")
     
-    try:
-        result = supabase_client.table("broadcast_logs")\
-            .select("*")\
+    limit = max(1, min(limit, 100))
+    position = _decode_show_cursor(cursor) if cursor else None
+    first_page = position is None and offset == 0
+    
+    cache_key = None
+    if first_page and redis_client:
+        try:
+            version = await redis_client.get(SHOW_LIST_VERSION_KEY) or "0"
+            cache_key = f"audio:shows:first_page:v{version}:{limit}"
+            cached = await redis_client.get(cache_key)
+            if cached:
+                return json.loads(cached)
+        except Exception as e:
+            logger.warning(f"⚠️ Show list cache unavailable: {e}")
+            cache_key = None
+    
+    def _query():
+        query = supabase_client.table("broadcast_logs")\
+            .select(SHOW_LIST_COLUMNS)\
             .order("created_at", desc=True)\
-            .range(offset, offset + limit - 1)\
-            .execute()
+            .order("id", desc=True)
+        
+        if position:
+            created_at, show_id = position
+            query = query.or_(
+                f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt."{show_id}")'
+            )
+            return query.limit(limit + 1).execute()
+        
+        if offset:
+            # Legacy offset pagination - cost grows with offset, prefer cursor
+            return query.range(offset, offset + limit).execute()
+        
+        return query.limit(limit + 1).execute()
+    
+    try:
+        result = await asyncio.to_thread(_query)
+        
+        records = result.data or []
+        has_more = len(records) > limit
+        records = records[:limit]
         
         shows = []
-        for record in result.data:
-            # Parse data field if it's a string
-            data_field = record.get("data", {})
-            if isinstance(data_field, str):
+        for record in records:
+            speakers = record.get("speakers") or []
+            if isinstance(speakers, str):
                 try:
-                    import json
-                    data_field = json.loads(data_field)
-                except:
-                    data_field = {}
+                    speakers = json.loads(speakers)
+                except json.JSONDecodeError:
+                    speakers = []
             
             shows.append({
                 "id": record.get("id"),
@@ -887,17 +1630,27 @@ async def list_shows(limit: int = 10, offset: int = 0):
                 "file_size_bytes": record.get("audio_file_size", 0),
                 "preset_name": record.get("preset_name", "default"),
                 "created_at": record.get("created_at"),
-                "speakers": data_field.get("speakers", []) if isinstance(data_field, dict) else []
+                "speakers": speakers if isinstance(speakers, list) else []
             })
         
-        return {
+        response = {
             "success": True,
             "shows": shows,
             "total": len(shows),
+            "limit": limit,
             "offset": offset,
-            "limit": limit
+            "has_more": has_more,
+            "next_cursor": _encode_show_cursor(records[-1]) if has_more and records else None
         }
         
+        if cache_key:
+            try:
+                await redis_client.setex(cache_key, SHOW_LIST_CACHE_TTL, json.dumps(response))
+            except Exception as e:
+                logger.warning(f"⚠️ Show list cache write failed: {e}")
+        
+        return response
+        
     except Exception as e:
         logger.error(f"❌ Shows listing failed: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to list shows")
@@ -911,11 +1664,13 @@ async def get_show(session_id: str):
         raise HTTPException(status_code=503, detail="Database not available")
     
     try:
-        result = supabase_client.table("broadcast_logs")\
-            .select("*")\
-            .eq("session_id", session_id)\
-            .single()\
+        result = await asyncio.to_thread(
+            lambda: supabase_client.table("broadcast_logs")
+            .select("*")
+            .eq("session_id", session_id)
+            .single()
             .execute()
+        )
         
         if not result.data:
             raise HTTPException(status_code=404, detail="Show not found")
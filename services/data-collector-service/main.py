@@ -12,7 +12,7 @@ import redis.asyncio as redis
 import json
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set
 import os
 import sys
 from loguru import logger
@@ -22,7 +22,11 @@ import feedparser
 # Add parent directory to path for config import
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from config.service_config import config
+from config.http_cassette import create_async_client
 from config.retry_decorator import retry_async
+from config.single_flight import SingleFlight, flight_key
+from config.near_duplicates import DuplicateIndex
+from config.health_monitor import HealthMonitor
 
 app = FastAPI(
     title="RadioX Data Collector Service - Fail Fast",
@@ -34,6 +38,25 @@ app = FastAPI(
 redis_client: Optional[redis.Redis] = None
 api_keys_cache: Dict[str, str] = {}
 
+# Simultaneous cache misses share one upstream fetch (across replicas via Redis)
+collector_flight = SingleFlight("collector", lock_ttl=float(os.getenv("COLLECTOR_FLIGHT_LOCK_SECONDS", "90")))
+
+# Same story from several feeds -> one article with merged sources (index kept across collections)
+story_index = DuplicateIndex(
+    threshold=float(os.getenv("DEDUP_THRESHOLD", "0.5")),
+    max_age_hours=float(os.getenv("DEDUP_MAX_AGE_HOURS", "48"))
+)
+dedup_reports: Dict[str, Dict[str, Any]] = {}   # last clustering effect per news cache key
+
+# Ingestion events - subscribers (data selector) re-curate when a collection changes the article set
+NEWS_UPDATED_CHANNEL = os.getenv("NEWS_UPDATED_CHANNEL", "news:updated")
+NEWS_INGEST_INTERVAL = float(os.getenv("NEWS_INGEST_INTERVAL", "300"))   # 0 = collect on demand only
+published_article_ids: Dict[str, Set[str]] = {}
+ingest_task: Optional[asyncio.Task] = None
+
+# Dependency health is probed in the background - /health serves the snapshot
+health_monitor = HealthMonitor("data-collector-service", interval=float(os.getenv("HEALTH_PROBE_INTERVAL", "15")))
+
 @app.on_event("startup")
 async def startup_event():
     global redis_client, api_keys_cache
@@ -44,6 +67,7 @@ async def startup_event():
     try:
         redis_client = redis.from_url(config.REDIS_URL, decode_responses=True)
         await redis_client.ping()
+        collector_flight.attach(redis_client)
         logger.info("✅ Redis connection verified")
     except Exception as e:
         logger.error(f"❌ FAIL FAST: Redis connection failed: {e}")
@@ -51,7 +75,7 @@ async def startup_event():
     
     # Test Key Service connection - FAIL FAST (REQUIRED for API keys)
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
+        async with create_async_client(timeout=5.0) as client:
             response = await client.get(f"{config.KEY_SERVICE_URL}/health")
             if response.status_code != 200:
                 raise Exception(f"Key Service unhealthy: {response.status_code}")
@@ -62,7 +86,7 @@ async def startup_event():
     
     # Test Database Service connection - FAIL FAST (REQUIRED for RSS feeds)
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
+        async with create_async_client(timeout=5.0) as client:
             response = await client.get(f"{config.DATABASE_URL}/health")
             if response.status_code != 200:
                 raise Exception(f"Database Service unhealthy: {response.status_code}")
@@ -78,12 +102,24 @@ async def startup_event():
         logger.error(f"❌ FAIL FAST: API keys loading failed: {e}")
         raise Exception(f"Data Collector Service REQUIRES API keys from Key Service: {e}")
     
+    # Periodic ingestion - keeps the news cache warm and publishes news:updated events
+    global ingest_task
+    if NEWS_INGEST_INTERVAL > 0:
+        ingest_task = asyncio.create_task(news_ingest_loop())
+        logger.info(f"🔁 News ingestion every {NEWS_INGEST_INTERVAL:.0f}s (events on {NEWS_UPDATED_CHANNEL})")
+    
+    # Background dependency probing (replaces live checks in /health)
+    health_monitor.register("redis", lambda: redis_client.ping())
+    health_monitor.register_http("key_service", f"{config.KEY_SERVICE_URL}/health")
+    health_monitor.register_http("database_service", f"{config.DATABASE_URL}/health")
+    await health_monitor.start()
+    
     logger.info("✅ Data Collector Service startup complete - ALL DEPENDENCIES VERIFIED")
 
 async def load_api_keys_from_key_service() -> Dict[str, str]:
     """Load API keys from Key Service - FAIL FAST if unavailable"""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with create_async_client(timeout=10.0) as client:
             # Get OpenWeather API key
             response = await client.get(f"{config.KEY_SERVICE_URL}/keys/openweather_api_key")
             if response.status_code != 200:
@@ -122,6 +158,9 @@ async def load_api_keys_from_key_service() -> Dict[str, str]:
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    await health_monitor.stop()
+    if ingest_task:
+        ingest_task.cancel()
     if redis_client:
         await redis_client.close()
     logger.info("Data Collector Service shutdown complete")
@@ -141,7 +180,7 @@ class SimpleRSSCollector:
         try:
             logger.info("🔍 Fetching RSS feeds from Database Service")
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with create_async_client(timeout=10.0) as client:
                 response = await client.get(f"{config.DATABASE_URL}/rss-feeds")
                 
                 if response.status_code == 200:
@@ -176,7 +215,17 @@ class SimpleRSSCollector:
                 detail=f"Data Collector Service: Database Service connection required for RSS feeds: {e}"
             )
     
-    async def collect_all_news(self, hours_back: int = 24, feed_categories: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def collect_all_news(self, hours_back: int = 24, feed_categories: Optional[str] = None,
+                               refresh: bool = False) -> List[Dict[str, Any]]:
+        """Collect news - concurrent identical requests share one RSS fetch (refresh: bypass the cache)"""
+        categories = sorted(category.strip() for category in feed_categories.split(',')) if feed_categories else []
+        return await collector_flight.do(
+            flight_key("news", hours_back, categories, refresh=refresh),
+            lambda: self._collect_all_news(hours_back, feed_categories, refresh)
+        )
+    
+    async def _collect_all_news(self, hours_back: int = 24, feed_categories: Optional[str] = None,
+                                refresh: bool = False) -> List[Dict[str, Any]]:
         """Collect news from RSS feeds - optionally filtered by categories - FAIL FAST if Database Service unavailable"""
         try:
             # Check Redis cache first - include categories in cache key
@@ -186,7 +235,7 @@ class SimpleRSSCollector:
                 categories_hash = "_".join(sorted(feed_categories.split(',')))
                 cache_key = f"news_articles_{hours_back}h_{categories_hash}"
                 
-            if redis_client:
+            if redis_client and not refresh:
                 cached_news = await redis_client.get(cache_key)
                 if cached_news:
                     import json
@@ -203,7 +252,7 @@ class SimpleRSSCollector:
             else:
                 logger.info(f"🔄 Collecting fresh news from {len(feeds)} RSS feeds...")
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with create_async_client(timeout=30.0) as client:
                 for source, feed_url in feeds.items():
                     try:
                         logger.info(f"📰 Fetching RSS from {source}...")
@@ -218,6 +267,7 @@ class SimpleRSSCollector:
                         
                         response = await fetch_rss_with_retry()
                         news_items = self._parse_rss_simple(response.text, source)
+                        story_index.ingest(news_items)
                         all_news.extend(news_items)
                         logger.info(f"✅ {len(news_items)} articles from {source}")
                         
@@ -232,12 +282,21 @@ class SimpleRSSCollector:
                 if item.get('timestamp', datetime.min) > cutoff_time
             ]
             
+            # Near-duplicates across feeds - one representative per story, smaller cache and prompts
+            recent_news, report = story_index.dedupe(recent_news)
+            dedup_reports[cache_key] = {**report.to_dict(), "collected_at": datetime.now().isoformat()}
+            logger.info(f"🧬 {report.articles_in} articles -> {report.articles_out} stories "
+                        f"(payload {report.payload_bytes_before} -> {report.payload_bytes_after} bytes, "
+                        f"prompt {report.prompt_tokens_before} -> {report.prompt_tokens_after} tokens)")
+            
             # Cache the results for 10 minutes - news don't change very often
             if redis_client:
                 import json
                 await redis_client.setex(cache_key, 600, json.dumps(recent_news, default=str))
                 logger.info(f"💾 {len(recent_news)} news articles cached for 10 minutes")
             
+            await publish_news_update(cache_key, hours_back, feed_categories, recent_news)
+            
             if feed_categories:
                 logger.info(f"📰 Collected {len(recent_news)} recent articles (filtered by: {feed_categories})")
             else:
@@ -293,13 +352,43 @@ class SimpleRSSCollector:
             logger.error(f"❌ RSS parsing failed for {source}: {str(e)}")
             return []
 
+async def publish_news_update(cache_key: str, hours_back: int, feed_categories: Optional[str],
+                              articles: List[Dict[str, Any]]):
+    """news:updated event with the article ids - only when a collection changed the article set"""
+    article_ids = {str(a.get('story_id') or a.get('link') or a.get('title') or '') for a in articles}
+    previous = published_article_ids.get(cache_key, set())
+    if article_ids == previous:
+        return
+    published_article_ids[cache_key] = article_ids
+    if not redis_client:
+        return
+    
+    event = {
+        "hours_back": hours_back,
+        "feed_categories": feed_categories,
+        "article_ids": sorted(article_ids),
+        "added": sorted(article_ids - previous),
+        "removed": len(previous - article_ids),
+        "collected_at": datetime.now().isoformat()
+    }
+    try:
+        receivers = await redis_client.publish(NEWS_UPDATED_CHANNEL, json.dumps(event))
+        logger.info(f"📣 {NEWS_UPDATED_CHANNEL}: {len(event['added'])} new, {event['removed']} removed "
+                    f"({receivers} subscribers)")
+    except Exception as e:
+        logger.warning(f"⚠️ News update event not published: {e}")
+
 class SimpleWeatherCollector:
     """Simple Weather Data Collector - FAIL FAST ONLY"""
     
     def __init__(self):
-        self.base_url = "https://api.openweathermap.org/data/2.5/weather"
+        self.base_url = f"{os.getenv('OPENWEATHER_BASE_URL', 'https://api.openweathermap.org/data/2.5')}/weather"
     
     async def collect_weather(self, location: str = "Zurich") -> Dict[str, Any]:
+        """Collect weather - concurrent requests for a location share one API call"""
+        return await collector_flight.do(flight_key("weather", location), lambda: self._collect_weather(location))
+    
+    async def _collect_weather(self, location: str = "Zurich") -> Dict[str, Any]:
         """Collect raw weather data - FAIL FAST if API key missing"""
         try:
             # Check Redis cache first - weather doesn't change often
@@ -330,7 +419,7 @@ class SimpleWeatherCollector:
             
             logger.info(f"🌤️ Fetching fresh weather data for {location}...")
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with create_async_client(timeout=10.0) as client:
                 response = await client.get(self.base_url, params=params)
                 
                 if response.status_code == 200:
@@ -378,9 +467,13 @@ class SimpleBitcoinCollector:
     """Simple Bitcoin Data Collector - FAIL FAST ONLY"""
     
     def __init__(self):
-        self.base_url = "https://api.coingecko.com/api/v3/simple/price"
+        self.base_url = f"{os.getenv('COINGECKO_BASE_URL', 'https://api.coingecko.com/api/v3')}/simple/price"
     
     async def collect_bitcoin(self) -> Dict[str, Any]:
+        """Collect Bitcoin data - concurrent requests share one API call"""
+        return await collector_flight.do(flight_key("bitcoin"), self._collect_bitcoin)
+    
+    async def _collect_bitcoin(self) -> Dict[str, Any]:
         """Collect raw Bitcoin data - FAIL FAST if API unavailable"""
         try:
             # Check Redis cache first - crypto prices change frequently, short cache
@@ -410,7 +503,7 @@ class SimpleBitcoinCollector:
             
             logger.info("💰 Fetching fresh Bitcoin data...")
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with create_async_client(timeout=10.0) as client:
                 response = await client.get(self.base_url, params=params)
                 
                 if response.status_code == 200:
@@ -520,20 +613,38 @@ class PureDataCollector:
 # Initialize collector
 data_collector = PureDataCollector()
 
+async def news_ingest_loop():
+    """Collect all feeds every NEWS_INGEST_INTERVAL - a changed article set is published as news:updated"""
+    while True:
+        try:
+            await data_collector.rss_collector.collect_all_news(24, refresh=True)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"⚠️ Scheduled news ingestion failed: {e}")
+        await asyncio.sleep(NEWS_INGEST_INTERVAL)
+
 # API Endpoints - FAIL FAST
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "data-collector-service",
+    """Health check - serves the background dependency snapshot (no live calls)"""
+    snapshot = health_monitor.snapshot()
+    snapshot.update({
         "version": "3.0.0-fail-fast",
         "description": "Pure Data Collector - FAIL FAST PRINCIPLE",
-        "dependencies": ["Key Service", "Database Service", "Redis"],
         "api_keys_loaded": list(api_keys_cache.keys()),
-        "fail_fast_enabled": True,
-        "timestamp": datetime.now().isoformat()
-    }
+        "fail_fast_enabled": True
+    })
+    
+    if snapshot["status"] == "unhealthy":
+        raise HTTPException(status_code=503, detail=snapshot)
+    
+    return snapshot
+
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe - touches nothing external"""
+    return health_monitor.liveness()
 
 @app.get("/content")
 async def get_content(
@@ -591,6 +702,16 @@ async def get_rss_feeds(feed_categories: Optional[str] = None):
         "fail_fast_enabled": True
     }
 
+@app.get("/single-flight")
+async def get_single_flight():
+    """Coalesced upstream fetches - executions vs joined callers (local / other replicas)"""
+    return collector_flight.summary()
+
+@app.get("/dedup")
+async def get_dedup_status():
+    """Near-duplicate clustering - story index size and the effect on the last collections"""
+    return {"index": story_index.summary(), "collections": dedup_reports}
+
 @app.get("/api-keys")
 async def get_api_keys_status():
     """Get API keys status - for debugging"""
@@ -19,15 +19,29 @@ DEPENDENCIES:
 """
 
 import os
+import sys
 import asyncio
+import hashlib
 import json
-from typing import Dict, List, Any, Optional
+import time
+from typing import Dict, List, Any, Optional, Set
 from datetime import datetime, timedelta
 import httpx
 import redis.asyncio as redis
 from fastapi import FastAPI, HTTPException
 from loguru import logger
 
+# Add parent directory to path for shared config modules
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config.health_monitor import HealthMonitor
+from config.http_cassette import create_async_client
+from config.work_scheduler import PriorityClass, WorkScheduler, parse_priority, parse_tenant_weights
+from config.single_flight import SingleFlight, flight_key
+from config.prompt_budget import PromptBudget, PromptItem
+from config.relevance_ranker import RelevanceRanker
+from config.article_digest import clean_text
+from config.llm_client import LLMClient, env_seconds, routes_from_env
+
 # FastAPI app initialization
 app = FastAPI(
     title="RadioX Data Selector Service", 
@@ -43,8 +57,61 @@ openai_api_key: Optional[str] = None
 KEY_SERVICE_URL = os.getenv("KEY_SERVICE_URL", "http://localhost:8002")
 DATA_COLLECTOR_SERVICE_URL = os.getenv("DATA_COLLECTOR_SERVICE_URL", "http://localhost:8004")
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
 DATA_SELECTOR_SERVICE_PORT = int(os.getenv("DATA_SELECTOR_SERVICE_PORT", "8005"))
 
+# OpenAI admission - curation calls queue by priority class (on_air > interactive > batch)
+gpt_scheduler = WorkScheduler(
+    "gpt",
+    capacity=int(os.getenv("GPT_MAX_CONCURRENCY", "4")),
+    tenant_weights=parse_tenant_weights(os.getenv("SCHEDULER_TENANT_WEIGHTS")),
+    aging_seconds=float(os.getenv("SCHEDULER_AGING_SECONDS", "30")),
+    urgent_seconds=float(os.getenv("SCHEDULER_URGENT_SECONDS", "60")),
+)
+
+# Curation prompt budget - descriptions are capped, then reduced to titles, then trailing articles dropped
+CURATION_PROMPT_BUDGET_TOKENS = int(os.getenv("CURATION_PROMPT_BUDGET_TOKENS", "1200"))
+CURATION_ARTICLE_TOKENS = int(os.getenv("CURATION_ARTICLE_TOKENS", "40"))
+
+# Local pre-ranking - GPT-4 only sees the shortlist, the ranking is the fallback when it is slow or fails
+CURATION_SHORTLIST_SIZE = int(os.getenv("CURATION_SHORTLIST_SIZE", "15"))
+CURATION_FALLBACK_COUNT = int(os.getenv("CURATION_FALLBACK_COUNT", "3"))
+CURATION_GPT_TIMEOUT = float(os.getenv("CURATION_GPT_TIMEOUT", "20"))       # queue wait + call
+CURATION_NOVELTY_HOURS = float(os.getenv("CURATION_NOVELTY_HOURS", "12"))   # selections count as aired this long
+AIRED_KEY = "curation:aired"
+
+# Curation cache - per scope (preset / instructions, categories, location) and article-set fingerprint
+CURATION_PREFIX = "curation:"
+CURATION_CACHE_TTL = int(os.getenv("CURATION_CACHE_TTL", "1800"))          # result per fingerprint (30 min)
+CURATION_LATEST_TTL = int(os.getenv("CURATION_LATEST_TTL", "21600"))       # base for incremental re-curation (6h)
+CURATION_INCREMENTAL_MAX_NEW = int(os.getenv("CURATION_INCREMENTAL_MAX_NEW", "10"))
+
+# Event-driven re-curation - news:updated from the collector, debounced, for recently requested scopes
+NEWS_UPDATED_CHANNEL = os.getenv("NEWS_UPDATED_CHANNEL", "news:updated")
+CURATION_DEBOUNCE_SECONDS = float(os.getenv("CURATION_DEBOUNCE_SECONDS", "20"))
+CURATION_DEBOUNCE_MAX_SECONDS = float(os.getenv("CURATION_DEBOUNCE_MAX_SECONDS", "120"))
+CURATION_WARM_SCOPE_HOURS = float(os.getenv("CURATION_WARM_SCOPE_HOURS", "24"))
+SCOPES_KEY = "curation:scopes"   # hash scope -> {"params", "requested_at"}
+# Curation LLM - JSON list of OpenAI-compatible routes (default: OPENAI_BASE_URL with the key service key),
+# ranked by observed latency / error rate, hedged after a fixed delay or the p95
+curation_llm = LLMClient(
+    "curation",
+    routes_from_env("CURATION_LLM_ROUTES", "gpt-4", OPENAI_BASE_URL, api_key_env=None),
+    hedge_after=env_seconds("CURATION_LLM_HEDGE_SECONDS"),
+    hedge_default=6.0,
+    max_hedges=int(os.getenv("CURATION_LLM_MAX_HEDGES", "1")),
+)
+relevance_ranker = RelevanceRanker(
+    half_life_hours=float(os.getenv("CURATION_HALF_LIFE_HOURS", "6")),
+    source_weights=parse_tenant_weights(os.getenv("CURATION_SOURCE_WEIGHTS")),
+)
+
+# Simultaneous cache misses share one collector fetch + GPT-4 curation (across replicas via Redis)
+curation_flight = SingleFlight("curation", lock_ttl=float(os.getenv("CURATION_FLIGHT_LOCK_SECONDS", "180")))
+
+# Dependency health - probed in the background, /health serves the snapshot
+health_monitor = HealthMonitor("data-selector-service", interval=float(os.getenv("HEALTH_PROBE_INTERVAL", "15")))
+
 @app.on_event("startup")
 async def startup_event():
     """Service startup with fail-fast dependency validation"""
@@ -56,6 +123,7 @@ async def startup_event():
     try:
         redis_client = redis.from_url(REDIS_URL, decode_responses=True)
         await redis_client.ping()
+        curation_flight.attach(redis_client)
         logger.info("✅ Redis connection verified")
     except Exception as e:
         logger.error(f"❌ FAIL FAST: Redis connection failed - {e}")
@@ -63,7 +131,7 @@ async def startup_event():
     
     # 2. Key Service dependency validation (REQUIRED for OpenAI key)
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with create_async_client(timeout=10.0) as client:
             response = await client.get(f"{KEY_SERVICE_URL}/health")
             if response.status_code != 200:
                 raise Exception(f"Key Service unhealthy: {response.status_code}")
@@ -74,7 +142,7 @@ async def startup_event():
     
     # 3. Data Collector Service dependency validation (REQUIRED for raw data)
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with create_async_client(timeout=10.0) as client:
             response = await client.get(f"{DATA_COLLECTOR_SERVICE_URL}/health")
             if response.status_code != 200:
                 raise Exception(f"Data Collector Service unhealthy: {response.status_code}")
@@ -88,11 +156,21 @@ async def startup_event():
         openai_api_key = await load_openai_key_from_key_service()
         if not openai_api_key:
             raise Exception("OpenAI API key not available")
+        curation_llm.default_api_key = openai_api_key
         logger.info("✅ OpenAI API key loaded for GPT-4 curation")
     except Exception as e:
         logger.error(f"❌ FAIL FAST: OpenAI API key loading failed - {e}")
         raise RuntimeError("OpenAI API key required for intelligent news curation")
     
+    # 5. Re-curate in the background when the collector reports new articles
+    curation_refresher.start()
+    
+    # 6. Background dependency probing (replaces live checks in /health)
+    health_monitor.register_http("key_service", f"{KEY_SERVICE_URL}/health")
+    health_monitor.register_http("data_collector_service", f"{DATA_COLLECTOR_SERVICE_URL}/health")
+    health_monitor.register("redis", lambda: redis_client.ping())
+    await health_monitor.start()
+    
     logger.info("✅ Data Selector Service startup complete - INTELLIGENT CURATION READY")
 
 @app.on_event("shutdown")
@@ -100,6 +178,8 @@ async def shutdown_event():
     """Service shutdown"""
     global redis_client
     
+    await health_monitor.stop()
+    await curation_refresher.stop()
     if redis_client:
         await redis_client.close()
     logger.info("🛑 Data Selector Service shutdown complete")
@@ -107,7 +187,7 @@ async def shutdown_event():
 async def load_openai_key_from_key_service() -> Optional[str]:
     """Load OpenAI API key from Key Service"""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with create_async_client(timeout=10.0) as client:
             response = await client.get(f"{KEY_SERVICE_URL}/keys/openai_api_key")
             if response.status_code == 200:
                 key_data = response.json()
@@ -117,12 +197,13 @@ async def load_openai_key_from_key_service() -> Optional[str]:
         logger.warning(f"⚠️ OpenAI API key loading failed: {e}")
         return None
 
-async def fetch_raw_data_from_collector() -> Dict[str, Any]:
+async def fetch_raw_data_from_collector(feed_categories: Optional[str] = None) -> Dict[str, Any]:
     """Fetch raw news, weather, bitcoin data from Data Collector Service"""
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Get all raw data from Data Collector
-            response = await client.get(f"{DATA_COLLECTOR_SERVICE_URL}/content")
+        async with create_async_client(timeout=30.0) as client:
+            # Get all raw data from Data Collector (the collector caches news for 10 minutes)
+            params = {"feed_categories": feed_categories} if feed_categories else None
+            response = await client.get(f"{DATA_COLLECTOR_SERVICE_URL}/content", params=params)
             if response.status_code == 200:
                 raw_data = response.json()
                 logger.info(f"📡 Fetched raw data: {len(raw_data.get('news', []))} articles, weather, bitcoin")
@@ -133,8 +214,65 @@ async def fetch_raw_data_from_collector() -> Dict[str, Any]:
         logger.error(f"❌ Failed to fetch raw data from Data Collector Service: {e}")
         raise HTTPException(status_code=503, detail="Data Collector Service unavailable")
 
-async def curate_news_with_gpt4(raw_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Use GPT-4 to intelligently select most relevant news for Swiss radio"""
+async def fetch_live_values_from_collector() -> Optional[Dict[str, Any]]:
+    """Fetch current weather and bitcoin only (cached minutes in the collector) - None on failure"""
+    try:
+        async with create_async_client(timeout=10.0) as client:
+            weather, bitcoin = await asyncio.gather(
+                client.get(f"{DATA_COLLECTOR_SERVICE_URL}/weather"),
+                client.get(f"{DATA_COLLECTOR_SERVICE_URL}/bitcoin")
+            )
+        if weather.status_code != 200 or bitcoin.status_code != 200:
+            raise Exception(f"Data Collector returned {weather.status_code}/{bitcoin.status_code}")
+        return {"weather": weather.json(), "bitcoin": bitcoin.json()}
+    except Exception as e:
+        logger.warning(f"⚠️ Live weather/bitcoin not available from Data Collector: {e}")
+        return None
+
+def article_id(article: Dict[str, Any]) -> str:
+    """Stable identity of an article (collector story_id, else link, else title)"""
+    return str(article.get("story_id") or article.get("link") or article.get("title") or "")
+
+def article_set_fingerprint(articles: List[Dict[str, Any]]) -> str:
+    """Hash of the article pool - order independent, same pool same curation"""
+    return hashlib.sha1("\n".join(sorted(article_id(a) for a in articles)).encode("utf-8")).hexdigest()[:16]
+
+def curation_scope(preset: Optional[str], instructions: Optional[str], category: Optional[str],
+                   location: Optional[str]) -> str:
+    """What a curation depends on besides the articles - each scope is cached separately"""
+    categories = sorted(c.strip() for c in category.split(",") if c.strip()) if category else None
+    return flight_key("curation", preset=preset, instructions=instructions, categories=categories, location=location)
+
+async def load_aired_titles() -> List[str]:
+    """Titles selected within CURATION_NOVELTY_HOURS - the ranker prefers news the listeners have not heard"""
+    if not redis_client:
+        return []
+    try:
+        await redis_client.zremrangebyscore(AIRED_KEY, 0, time.time() - CURATION_NOVELTY_HOURS * 3600)
+        return await redis_client.zrange(AIRED_KEY, 0, -1)
+    except Exception as e:
+        logger.warning(f"⚠️ Aired titles unavailable: {e}")
+        return []
+
+async def remember_aired(articles: List[Dict[str, Any]]):
+    titles = {article.get("title"): time.time() for article in articles if article.get("title")}
+    if redis_client and titles:
+        try:
+            await redis_client.zadd(AIRED_KEY, titles)
+        except Exception as e:
+            logger.warning(f"⚠️ Aired titles not recorded: {e}")
+
+async def curate_news_with_gpt4(
+    raw_data: Dict[str, Any], priority: PriorityClass = PriorityClass.INTERACTIVE, tenant: str = "curation",
+    location: Optional[str] = None, category: Optional[str] = None, instructions: Optional[str] = None,
+    aired_titles: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Use GPT-4 to intelligently select most relevant news for Swiss radio
+    
+    The pool is pre-ranked locally (recency, source, location, category,
+    novelty) - GPT-4 picks from the top CURATION_SHORTLIST_SIZE, and the
+    top of the ranking is used when GPT-4 fails or exceeds CURATION_GPT_TIMEOUT.
+    """
     news_articles = raw_data.get("news", [])
     weather_data = raw_data.get("weather", {})
     bitcoin_data = raw_data.get("bitcoin", {})
@@ -142,185 +280,443 @@ async def curate_news_with_gpt4(raw_data: Dict[str, Any]) -> Dict[str, Any]:
     if not news_articles:
         raise HTTPException(status_code=400, detail="No news articles available for curation")
     
-    # Prepare news articles for GPT-4 curation
-    news_summaries = []
-    for i, article in enumerate(news_articles[:20]):  # Limit to 20 articles for GPT-4
-        summary = f"{i+1}. {article.get('title', 'No title')} - {article.get('description', 'No description')[:100]}..."
-        news_summaries.append(summary)
+    ranking = relevance_ranker.rank(
+        news_articles, location=location, category=category,
+        aired_titles=await load_aired_titles() if aired_titles is None else aired_titles,
+        top_k=CURATION_SHORTLIST_SIZE
+    )
+    shortlist = ranking.pick(news_articles)
+    logger.info(f"📊 Ranked {ranking.pool_size} articles in {ranking.elapsed_ms:.1f} ms - "
+                f"shortlist {len(shortlist)} ({ranking.duplicates_skipped} duplicates skipped)")
     
-    # GPT-4 curation prompt
-    curation_prompt = f"""Du bist ein erfahrener Schweizer Radio-Redakteur. Analysiere die folgenden {len(news_summaries)} Nachrichten und wähle die 3-5 relevantesten Artikel für eine Schweizer Radio-Sendung aus.
-
-KRITERIEN:
+    def fallback(reason: Dict[str, Any]) -> Dict[str, Any]:
+        selected = shortlist[:CURATION_FALLBACK_COUNT]
+        return {
+            "curated_news": selected,
+            "weather": weather_data,
+            "bitcoin": bitcoin_data,
+            "curation_metadata": {
+                "total_articles_analyzed": len(news_articles),
+                "articles_selected": len(selected),
+                "curation_timestamp": datetime.now().isoformat(),
+                "ranking": ranking.report(),
+                **reason
+            }
+        }
+    
+    # Prepare the shortlist for GPT-4 curation (numbering = index into shortlist)
+    news_items = []
+    for i, article in enumerate(shortlist):
+        title = f"{i+1}. {article.get('title', 'No title')}"
+        description = clean_text(article.get('description') or article.get('summary')) or 'No description'
+        news_items.append(PromptItem(f"{title} - {description}", compact=title))
+    
+    # GPT-4 curation prompt - within the token budget (trailing articles may be dropped, so no count)
+    prompt = PromptBudget(CURATION_PROMPT_BUDGET_TOKENS, model="gpt-4")
+    prompt.text("intro", "Du bist ein erfahrener Schweizer Radio-Redakteur. Analysiere die folgenden Nachrichten "
+                         "und wähle die 3-5 relevantesten Artikel für eine Schweizer Radio-Sendung aus.")
+    prompt.text("criteria", """KRITERIEN:
 - Relevanz für Schweizer Hörer
 - Aktuelle Wichtigkeit
 - Ausgewogenheit (lokale + internationale News)
-- Interessanter Mix
-
-VERFÜGBARE NACHRICHTEN:
-{chr(10).join(news_summaries)}
-
-ANTWORT: Gib nur die Nummern der ausgewählten Artikel zurück, getrennt durch Kommas (z.B. "1,5,8,12,15")"""
+- Interessanter Mix""")
+    if instructions:
+        prompt.text("instructions", f"REDAKTIONELLE VORGABEN:\n{instructions}")
+    prompt.add("news", news_items, priority=1, header="VERFÜGBARE NACHRICHTEN:\n",
+               item_tokens=CURATION_ARTICLE_TOKENS, min_items=3)
+    prompt.text("answer", 'ANTWORT: Gib nur die Nummern der ausgewählten Artikel zurück, getrennt durch Kommas (z.B. "1,5,8,12,15")')
+    curation_prompt = prompt.build()
+    logger.info(f"📏 Curation prompt: {curation_prompt.tokens_after} tokens "
+                f"(untrimmed {curation_prompt.tokens_before}, budget {curation_prompt.budget_tokens})")
+    
+    async def ask_gpt4():
+        # Model is set per route (curation_llm)
+        payload = {
+            "messages": [
+                {"role": "system", "content": "Du bist ein professioneller Schweizer Radio-Redakteur."},
+                {"role": "user", "content": curation_prompt.text}
+            ],
+            "max_tokens": 50,
+            "temperature": 0.3
+        }
+        
+        async with gpt_scheduler.slot(priority, tenant):
+            return await curation_llm.chat(payload, timeout=CURATION_GPT_TIMEOUT)
     
     try:
-        # GPT-4 API call for intelligent curation
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            headers = {
-                "Authorization": f"Bearer {openai_api_key}",
-                "Content-Type": "application/json"
-            }
+        # GPT-4 API call for intelligent curation - bounded, the ranking stands in when it is slow
+        response = await asyncio.wait_for(ask_gpt4(), timeout=CURATION_GPT_TIMEOUT)
+        # GPT latency without the queue wait - correlate with prompt_tokens
+        gpt_ms = round(response.call.latency_ms, 1)
+        selected_indices_str = response.text.strip()
+        
+        # Parse selected indices
+        try:
+            selected_indices = [int(x.strip()) - 1 for x in selected_indices_str.split(",")]  # Convert to 0-based
+            selected_articles = [shortlist[i] for i in selected_indices if 0 <= i < len(shortlist)]
+            if not selected_articles:
+                raise ValueError(f"no valid article number in {selected_indices_str!r}")
             
-            payload = {
-                "model": "gpt-4",
-                "messages": [
-                    {"role": "system", "content": "Du bist ein professioneller Schweizer Radio-Redakteur."},
-                    {"role": "user", "content": curation_prompt}
-                ],
-                "max_tokens": 50,
-                "temperature": 0.3
-            }
+            logger.info(f"🧠 GPT-4 selected {len(selected_articles)} articles from {len(shortlist)} shortlisted "
+                        f"({len(news_articles)} available)")
             
-            response = await client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers=headers,
-                json=payload
-            )
+            return {
+                "curated_news": selected_articles,
+                "weather": weather_data,
+                "bitcoin": bitcoin_data,
+                "curation_metadata": {
+                    "total_articles_analyzed": len(news_articles),
+                    "articles_selected": len(selected_articles),
+                    "curation_timestamp": datetime.now().isoformat(),
+                    "gpt4_selection": selected_indices_str,
+                    "ranking": ranking.report(),
+                    "prompt_tokens": curation_prompt.report(),
+                    "gpt_ms": gpt_ms,
+                    "llm": response.call.to_dict()
+                }
+            }
             
-            if response.status_code == 200:
-                gpt_response = response.json()
-                selected_indices_str = gpt_response["choices"][0]["message"]["content"].strip()
-                
-                # Parse selected indices
-                try:
-                    selected_indices = [int(x.strip()) - 1 for x in selected_indices_str.split(",")]  # Convert to 0-based
-                    selected_articles = [news_articles[i] for i in selected_indices if 0 <= i < len(news_articles)]
-                    
-                    logger.info(f"🧠 GPT-4 selected {len(selected_articles)} articles from {len(news_articles)} available")
-                    
-                    return {
-                        "curated_news": selected_articles,
-                        "weather": weather_data,
-                        "bitcoin": bitcoin_data,
-                        "curation_metadata": {
-                            "total_articles_analyzed": len(news_articles),
-                            "articles_selected": len(selected_articles),
-                            "curation_timestamp": datetime.now().isoformat(),
-                            "gpt4_selection": selected_indices_str
-                        }
-                    }
-                    
-                except (ValueError, IndexError) as e:
-                    logger.warning(f"⚠️ GPT-4 selection parsing failed: {e}, using first 3 articles as fallback")
-                    # Fallback: select first 3 articles
-                    return {
-                        "curated_news": news_articles[:3],
-                        "weather": weather_data,
-                        "bitcoin": bitcoin_data,
-                        "curation_metadata": {
-                            "total_articles_analyzed": len(news_articles),
-                            "articles_selected": 3,
-                            "curation_timestamp": datetime.now().isoformat(),
-                            "fallback_used": True
-                        }
-                    }
-            else:
-                raise Exception(f"OpenAI API returned {response.status_code}")
-                
+        except (ValueError, IndexError) as e:
+            logger.warning(f"⚠️ GPT-4 selection parsing failed: {e}, using top ranked articles as fallback")
+            return fallback({
+                "fallback_used": True,
+                "prompt_tokens": curation_prompt.report(),
+                "gpt_ms": gpt_ms,
+                "llm": response.call.to_dict()
+            })
+    
+    except asyncio.TimeoutError:
+        logger.warning(f"⏱️ GPT-4 curation exceeded {CURATION_GPT_TIMEOUT:g}s - using top ranked articles")
+        return fallback({"error_fallback": f"timeout after {CURATION_GPT_TIMEOUT:g}s"})
     except Exception as e:
         logger.error(f"❌ GPT-4 curation failed: {e}")
-        # Fallback: use first 3 articles without AI curation
-        return {
-            "curated_news": news_articles[:3],
-            "weather": weather_data,
-            "bitcoin": bitcoin_data,
-            "curation_metadata": {
-                "total_articles_analyzed": len(news_articles),
-                "articles_selected": 3,
-                "curation_timestamp": datetime.now().isoformat(),
-                "error_fallback": str(e)
-            }
-        }
+        # Fallback: top ranked articles without AI curation
+        return fallback({"error_fallback": str(e)})
 
 # HEALTH ENDPOINT
 @app.get("/health")
 async def health_check():
-    """Health check with dependency validation"""
+    """Health check - serves the background dependency snapshot (no live calls)"""
+    snapshot = health_monitor.snapshot()
+    snapshot["port"] = DATA_SELECTOR_SERVICE_PORT
+    snapshot["dependencies"]["openai_key_available"] = bool(openai_api_key)
+    
+    if snapshot["status"] == "unhealthy":
+        raise HTTPException(status_code=503, detail=snapshot)
+    
+    return snapshot
+
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe - touches nothing external"""
+    return health_monitor.liveness()
+
+async def curation_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    if not redis_client:
+        return None
     try:
-        # Check Key Service dependency
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            key_service_response = await client.get(f"{KEY_SERVICE_URL}/health")
-            key_service_healthy = key_service_response.status_code == 200
+        cached = await redis_client.get(key)
+        return json.loads(cached) if cached else None
+    except Exception as e:
+        logger.warning(f"⚠️ Redis cache read failed: {e}")
+        return None
+
+async def curate_delta(
+    raw_data: Dict[str, Any], previous: Optional[Dict[str, Any]], priority: PriorityClass,
+    location: Optional[str], category: Optional[str], instructions: Optional[str]
+) -> Dict[str, Any]:
+    """Curation of a changed pool - incremental when only a few articles are new
+    
+    previous: the scope's last curation ({"result", "article_ids"}). If all of
+    its picks are still in the pool and at most CURATION_INCREMENTAL_MAX_NEW
+    articles arrived, GPT-4 only chooses among the previous picks and the new
+    articles; with no new articles the previous selection stands as it is.
+    """
+    news = raw_data.get("news", [])
+    current = {article_id(article): article for article in news}
+    
+    if previous:
+        previous_ids = set(previous.get("article_ids", []))
+        picks = [article_id(article) for article in previous["result"].get("curated_news", [])]
+        added = [article for key, article in current.items() if key not in previous_ids]
+        delta = {"added": len(added), "removed": len(previous_ids - set(current)), "previous_picks": len(picks)}
         
-        # Check Data Collector Service dependency
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            collector_response = await client.get(f"{DATA_COLLECTOR_SERVICE_URL}/health")
-            collector_healthy = collector_response.status_code == 200
+        if picks and all(key in current for key in picks) and len(added) <= CURATION_INCREMENTAL_MAX_NEW:
+            if not added:
+                logger.info(f"♻️ Article pool only shrank ({delta['removed']} removed) - previous selection stands")
+                result = {**previous["result"], "weather": raw_data.get("weather", {}), "bitcoin": raw_data.get("bitcoin", {})}
+                result["curation_metadata"] = {**result["curation_metadata"], "curation_mode": "reused", "delta": delta}
+                return result
             
-        # Check Redis
-        redis_healthy = await redis_client.ping() if redis_client else False
-        
+            logger.info(f"🧩 Incremental re-curation: {len(picks)} previous picks + {len(added)} new articles")
+            candidates = [current[key] for key in picks] + added
+            # Previous picks were recorded as aired by this very curation - no novelty penalty against them
+            pick_titles = {current[key].get("title") for key in picks}
+            aired = [title for title in await load_aired_titles() if title not in pick_titles]
+            result = await curate_news_with_gpt4(
+                {**raw_data, "news": candidates}, priority, location=location, category=category,
+                instructions=instructions, aired_titles=aired
+            )
+            result["curation_metadata"].update({"curation_mode": "incremental", "delta": delta, "pool_size": len(news)})
+            return result
+    else:
+        delta = {"added": len(current), "removed": 0, "previous_picks": 0}
+    
+    result = await curate_news_with_gpt4(
+        raw_data, priority, location=location, category=category, instructions=instructions
+    )
+    result["curation_metadata"].update({"curation_mode": "full", "delta": delta, "pool_size": len(news)})
+    return result
+
+async def register_scope(scope: str, params: Dict[str, Optional[str]]):
+    """Remember a requested scope - the refresher keeps it warm for CURATION_WARM_SCOPE_HOURS"""
+    if not redis_client:
+        return
+    try:
+        await redis_client.hset(SCOPES_KEY, scope, json.dumps({"params": params, "requested_at": time.time()}))
+    except Exception as e:
+        logger.warning(f"⚠️ Curation scope not registered: {e}")
+
+async def load_warm_scopes() -> List[Dict[str, Optional[str]]]:
+    if not redis_client:
+        return []
+    scopes = await redis_client.hgetall(SCOPES_KEY)
+    cutoff = time.time() - CURATION_WARM_SCOPE_HOURS * 3600
+    warm, cold = [], []
+    for scope, entry in scopes.items():
+        entry = json.loads(entry)
+        if entry.get("requested_at", 0) >= cutoff:
+            warm.append(entry["params"])
+        else:
+            cold.append(scope)
+    if cold:
+        await redis_client.hdel(SCOPES_KEY, *cold)
+    return warm
+
+async def curate_scope(params: Dict[str, Optional[str]], priority: PriorityClass) -> Dict[str, Any]:
+    """Curation of a scope for the current article pool - cached per fingerprint, incremental on small deltas"""
+    scope = curation_scope(**params)
+    raw_data = await fetch_raw_data_from_collector(params.get("category"))
+    fingerprint = article_set_fingerprint(raw_data.get("news", []))
+    cache_key = f"{CURATION_PREFIX}{scope}:{fingerprint}"
+    latest_key = f"{CURATION_PREFIX}{scope}:latest"
+    
+    cached_data = await curation_cache_get(cache_key)
+    if cached_data:
+        logger.info(f"📦 Returning cached curated data (fingerprint {fingerprint})")
+        # Selection depends on the articles only - weather and bitcoin are served fresh
         return {
-            "status": "healthy",
-            "service": "data-selector-service",
-            "port": DATA_SELECTOR_SERVICE_PORT,
-            "dependencies": {
-                "key_service": key_service_healthy,
-                "data_collector_service": collector_healthy,
-                "redis": redis_healthy,
-                "openai_key_available": bool(openai_api_key)
-            },
-            "timestamp": datetime.now().isoformat()
+            **cached_data,
+            "weather": raw_data.get("weather", {}),
+            "bitcoin": raw_data.get("bitcoin", {}),
+            "curation_metadata": {**cached_data["curation_metadata"], "curation_mode": "cached"}
         }
-    except Exception as e:
-        raise HTTPException(status_code=503, detail=f"Health check failed: {e}")
+    
+    async def curate() -> Dict[str, Any]:
+        previous = await curation_cache_get(latest_key)
+        curated_data = await curate_delta(
+            raw_data, previous, priority, params.get("location"), params.get("category"), params.get("instructions")
+        )
+        curated_data["curation_metadata"]["article_set_fingerprint"] = fingerprint
+        if curated_data["curation_metadata"]["curation_mode"] != "reused":
+            await remember_aired(curated_data["curated_news"])
+        
+        # Cache the result for this pool and as the scope's base for the next incremental curation
+        if redis_client:
+            try:
+                await redis_client.setex(cache_key, CURATION_CACHE_TTL, json.dumps(curated_data, default=str))
+                await redis_client.setex(latest_key, CURATION_LATEST_TTL, json.dumps({
+                    "result": curated_data,
+                    "article_ids": [article_id(article) for article in raw_data.get("news", [])],
+                    "stored_at": time.time()
+                }, default=str))
+                logger.info(f"💾 Curated data cached (fingerprint {fingerprint})")
+            except Exception as e:
+                logger.warning(f"⚠️ Redis cache write failed: {e}")
+        
+        return curated_data
+    
+    # The first caller's priority class applies to the shared GPT-4 call
+    return await curation_flight.do(f"{scope}:{fingerprint}", curate)
 
-# CURATED DATA ENDPOINT
-@app.get("/curated-data")
-async def get_curated_data():
-    """Get intelligently curated news data for radio show generation"""
+class CurationRefresher:
+    """Re-curates recently requested scopes when the collector publishes news:updated
     
-    # Check Redis cache first (30 minute cache)
-    cache_key = "curated_data"
-    if redis_client:
-        try:
-            cached_data = await redis_client.get(cache_key)
-            if cached_data:
-                logger.info("📦 Returning cached curated data")
-                return json.loads(cached_data)
-        except Exception as e:
-            logger.warning(f"⚠️ Redis cache read failed: {e}")
+    Events are debounced - a refresh runs CURATION_DEBOUNCE_SECONDS after the
+    last event (at most CURATION_DEBOUNCE_MAX_SECONDS after the first), so a
+    burst of feed updates costs one re-curation per scope. While subscribed,
+    /curated-data serves the scope's latest curation without touching the
+    collector or GPT-4.
+    """
     
-    # Fetch fresh raw data from Data Collector
-    raw_data = await fetch_raw_data_from_collector()
+    def __init__(self):
+        self.task: Optional[asyncio.Task] = None
+        self.live = False
+        self._first_event: Optional[float] = None
+        self._last_event: Optional[float] = None
+        self._added: Set[str] = set()
+        self._events = 0
+        self.stats = {"events": 0, "refreshes": 0, "scopes_refreshed": 0, "failures": 0, "last_refresh_at": None}
     
-    # Curate with GPT-4
-    curated_data = await curate_news_with_gpt4(raw_data)
+    def start(self):
+        self.task = asyncio.create_task(self._run())
     
-    # Cache the curated result (30 minutes)
-    if redis_client:
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+    
+    async def _run(self):
+        backoff = 1.0
+        while True:
+            pubsub = redis_client.pubsub()
+            try:
+                await pubsub.subscribe(NEWS_UPDATED_CHANNEL)
+                self.live = True
+                backoff = 1.0
+                logger.info(f"📡 Subscribed to {NEWS_UPDATED_CHANNEL} - event-driven re-curation active")
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message:
+                        self._on_event(message["data"])
+                    if self._due():
+                        await self._refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Not subscribed - requests fall back to curating on the request path
+                self.live = False
+                logger.warning(f"⚠️ {NEWS_UPDATED_CHANNEL} subscription lost, retrying in {backoff:.0f}s: {e}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                self.live = False
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+    
+    def _on_event(self, data: str):
         try:
-            await redis_client.setex(cache_key, 1800, json.dumps(curated_data))  # 30 minutes
-            logger.info("💾 Curated data cached for 30 minutes")
-        except Exception as e:
-            logger.warning(f"⚠️ Redis cache write failed: {e}")
+            event = json.loads(data)
+        except ValueError:
+            logger.warning(f"⚠️ Invalid {NEWS_UPDATED_CHANNEL} event ignored")
+            return
+        now = time.time()
+        self._first_event = self._first_event or now
+        self._last_event = now
+        self._added.update(event.get("added", []))
+        self._events += 1
+        self.stats["events"] += 1
+    
+    def _due(self) -> bool:
+        if self._last_event is None:
+            return False
+        now = time.time()
+        return now - self._last_event >= CURATION_DEBOUNCE_SECONDS or now - self._first_event >= CURATION_DEBOUNCE_MAX_SECONDS
     
-    return curated_data
+    async def _refresh(self):
+        events, added = self._events, len(self._added)
+        self._first_event = self._last_event = None
+        self._added = set()
+        self._events = 0
+        
+        scopes = await load_warm_scopes()
+        results = await asyncio.gather(
+            *(curate_scope(params, PriorityClass.BATCH) for params in scopes), return_exceptions=True
+        )
+        failures = [result for result in results if isinstance(result, Exception)]
+        for failure in failures:
+            logger.warning(f"⚠️ Background re-curation failed: {failure}")
+        self.stats["refreshes"] += 1
+        self.stats["scopes_refreshed"] += len(results) - len(failures)
+        self.stats["failures"] += len(failures)
+        self.stats["last_refresh_at"] = datetime.now().isoformat()
+        logger.info(f"🔄 Re-curated {len(results) - len(failures)}/{len(scopes)} scopes after "
+                    f"{events} {NEWS_UPDATED_CHANNEL} events ({added} new articles)")
+    
+    def summary(self) -> Dict[str, Any]:
+        return {"live": self.live, "pending_events": self._events, **self.stats}
+
+curation_refresher = CurationRefresher()
+
+# CURATED DATA ENDPOINT
+@app.get("/curated-data")
+async def get_curated_data(priority: Optional[str] = None, location: Optional[str] = None,
+                           category: Optional[str] = None, preset: Optional[str] = None,
+                           instructions: Optional[str] = None):
+    """Get intelligently curated news data for radio show generation
+    
+    priority: on_air | interactive | batch - queue class of the GPT-4 call on a cache miss
+    location: ranking preference (e.g. "Zürich")
+    category: comma-separated feed categories - collected and ranked for
+    preset / instructions: selection instructions (instructions are added to the prompt)
+    
+    Warm read while the refresher is subscribed to news:updated (selection
+    re-curated in the background on ingestion, weather and bitcoin fetched
+    fresh). Otherwise cached per scope and article-set fingerprint,
+    re-curated incrementally for a few new articles.
+    """
+    params = {"location": location, "category": category, "preset": preset, "instructions": instructions}
+    scope = curation_scope(**params)
+    await register_scope(scope, params)
+    
+    if curation_refresher.live:
+        latest = await curation_cache_get(f"{CURATION_PREFIX}{scope}:latest")
+        # The stored selection only changes with the news - weather and bitcoin are served fresh
+        live_values = await fetch_live_values_from_collector() if latest else None
+        if latest and live_values:
+            result = latest["result"]
+            return {**result, **live_values, "curation_metadata": {
+                **result["curation_metadata"],
+                "curated_as": result["curation_metadata"].get("curation_mode"),
+                "curation_mode": "warm",
+                "age_seconds": round(time.time() - latest.get("stored_at", time.time()), 1)
+            }}
+    
+    return await curate_scope(params, parse_priority(priority))
+
+@app.get("/scheduler")
+async def get_gpt_scheduler():
+    """GPT scheduling - queue wait per priority class, missed deadlines, tenant shares"""
+    return gpt_scheduler.stats()
+
+@app.get("/llm")
+async def get_llm():
+    """Curation LLM routing - per-route latency, error rate, hedges and cost"""
+    return curation_llm.summary()
+
+@app.get("/curation-events")
+async def get_curation_events():
+    """Event-driven re-curation - subscription state, events received, scopes refreshed"""
+    return curation_refresher.summary()
+
+@app.get("/single-flight")
+async def get_single_flight():
+    """Coalesced curation requests - executions vs joined callers (local / other replicas)"""
+    return curation_flight.summary()
 
 # REFRESH CURATION ENDPOINT
 @app.post("/refresh-curation")
 async def refresh_curation():
     """Force refresh of curated data (clear cache and regenerate)"""
     
-    # Clear cache
+    # Clear cache (all scopes and fingerprints - the next curation is a full one)
     if redis_client:
         try:
-            await redis_client.delete("curated_data")
-            logger.info("🗑️ Curated data cache cleared")
+            keys = [key async for key in redis_client.scan_iter(match=f"{CURATION_PREFIX}*")
+                    if key not in (AIRED_KEY, SCOPES_KEY)]
+            if keys:
+                await redis_client.delete(*keys)
+            logger.info(f"🗑️ Curated data cache cleared ({len(keys)} entries)")
         except Exception as e:
             logger.warning(f"⚠️ Cache clear failed: {e}")
     
-    # Generate fresh curated data
-    curated_data = await get_curated_data()
+    # Generate fresh curated data (background refresh - yields to on-air work)
+    curated_data = await get_curated_data(priority=PriorityClass.BATCH.value)
     
     return {
         "status": "success",
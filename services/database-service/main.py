@@ -5,13 +5,15 @@ Follows Google Design Principles for Microservices
 """
 
 import asyncio
+import base64
 import json
 import os
+import sys
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
 import redis
 import httpx
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
@@ -20,6 +22,11 @@ from loguru import logger
 # Direct Supabase imports for this service only
 from supabase import create_client, Client
 
+# Add parent directory to path for shared config modules
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config.health_monitor import HealthMonitor
+from config.http_cassette import supabase_client_options
+
 app = FastAPI(
     title="RadioX Database Service",
     description="Pure Data Access Layer - Clean Architecture Foundation",
@@ -43,6 +50,17 @@ CACHE_TIMEOUT_SHORT = 300   # 5 minutes for keys/configuration
 CACHE_TIMEOUT_MEDIUM = 600  # 10 minutes for presets/feeds
 CACHE_TIMEOUT_LONG = 1800   # 30 minutes for static data
 
+# Show listing - list columns only, first page cached per archive version
+# (writers bump SHOWS_VERSION_KEY after inserting into `shows`)
+SHOW_LIST_COLUMNS = (
+    "session_id,title,script_preview,broadcast_style,channel,language,audio_url,"
+    "audio_duration_seconds,estimated_duration_minutes,news_count,created_at"
+)
+SHOWS_VERSION_KEY = "database:shows:version"
+
+# Dependency health - probed in the background, /health serves the snapshot
+health_monitor = HealthMonitor("database-service", interval=float(os.getenv("HEALTH_PROBE_INTERVAL", "15")))
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize connections with fail-fast pattern"""
@@ -66,7 +84,7 @@ async def startup_event():
         if not supabase_url or not supabase_key:
             raise Exception("Missing SUPABASE_URL or SUPABASE_ANON_KEY")
             
-        supabase_client = create_client(supabase_url, supabase_key)
+        supabase_client = create_client(supabase_url, supabase_key, options=supabase_client_options())
         
         # Test connection with a simple query
         test_response = supabase_client.table('keys').select('id').limit(1).execute()
@@ -76,28 +94,39 @@ async def startup_event():
         logger.error(f"❌ FAIL FAST: Supabase connection failed: {e}")
         raise Exception(f"Database Service REQUIRES Supabase connection: {e}")
     
+    # Background dependency probing (sync clients - probed off the event loop)
+    health_monitor.register("redis", lambda: asyncio.to_thread(redis_client.ping))
+    health_monitor.register(
+        "supabase",
+        lambda: asyncio.to_thread(lambda: bool(supabase_client.table('keys').select('id').limit(1).execute()))
+    )
+    await health_monitor.start()
+    
     logger.info("✅ Database Service startup complete - DATA ACCESS LAYER READY")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await health_monitor.stop()
+
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    try:
-        # Test Redis
-        redis_client.ping()
-        
-        # Test Supabase 
-        supabase_client.table('keys').select('id').limit(1).execute()
-        
-        return {
-            "status": "🏥 DATABASE HEALTHY", 
-            "timestamp": datetime.now().isoformat(),
-            "services": {
-                "redis": "connected",
-                "supabase": "connected"
-            }
-        }
-    except Exception as e:
-        raise HTTPException(status_code=503, detail=f"Database Service unhealthy: {e}")
+    """Health check endpoint - serves the background dependency snapshot"""
+    snapshot = health_monitor.snapshot()
+    
+    if snapshot["status"] == "unhealthy":
+        raise HTTPException(status_code=503, detail=f"Database Service unhealthy: {snapshot['dependencies']}")
+    
+    return {
+        "status": "🏥 DATABASE HEALTHY",
+        "timestamp": snapshot["timestamp"],
+        "services": snapshot["dependencies"],
+        "snapshot": snapshot["snapshot"]
+    }
+
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe - touches nothing external"""
+    return health_monitor.liveness()
 
 # ============================================================================
 # API KEYS ENDPOINTS
@@ -319,15 +348,103 @@ async def get_speakers():
         logger.error(f"❌ Database query failed: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch speakers: {e}")
 
+@app.get("/speakers/{speaker_name}")
+async def get_speaker(speaker_name: str):
+    """Get voice configuration for a single speaker (used by Audio Service)"""
+    cache_key = f"database:speaker:{speaker_name.lower()}"
+    
+    cached_data = redis_client.get(cache_key)
+    if cached_data:
+        return json.loads(cached_data)
+    
+    try:
+        response = await asyncio.to_thread(
+            lambda: supabase_client.table('voice_configurations').select('*')
+            .eq('speaker_name', speaker_name.lower()).eq('is_active', True).limit(1).execute()
+        )
+    except Exception as e:
+        logger.error(f"❌ Database query failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to fetch speaker: {e}")
+    
+    if not response.data:
+        raise HTTPException(status_code=404, detail=f"Speaker not found: {speaker_name}")
+    
+    redis_client.setex(cache_key, CACHE_TIMEOUT_MEDIUM, json.dumps(response.data[0]))
+    return response.data[0]
+
+def _encode_show_cursor(record: Dict[str, Any]) -> str:
+    """Encode the (created_at, session_id) keyset position of the last listed show"""
+    payload = json.dumps([record.get("created_at"), record.get("session_id")])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def _decode_show_cursor(cursor: str) -> tuple:
+    """Decode a show listing cursor - 400 on anything malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, session_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not created_at or session_id is None:
+            raise ValueError("empty cursor position")
+        return str(created_at), str(session_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def _set_page_headers(response: Response, page: Dict[str, Any]):
+    """Pagination travels in headers - the body stays the plain list of shows"""
+    response.headers["X-Has-More"] = "true" if page["has_more"] else "false"
+    if page["next_cursor"]:
+        response.headers["X-Next-Cursor"] = page["next_cursor"]
+
 @app.get("/shows")
-async def get_shows(limit: int = 10):
-    """Get recent shows"""
+async def get_shows(response: Response, limit: int = 10, cursor: Optional[str] = None):
+    """Get recent shows (keyset pagination on created_at, session_id)
+    
+    Returns the list of shows; X-Next-Cursor (pass as cursor for the next
+    page) and X-Has-More carry the pagination.
+    """
+    limit = max(1, min(limit, 100))
+    position = _decode_show_cursor(cursor) if cursor else None
+    
+    cache_key = None
+    if position is None:
+        version = redis_client.get(SHOWS_VERSION_KEY) or "0"
+        cache_key = f"database:shows:first_page:v{version}:{limit}"
+        cached_data = redis_client.get(cache_key)
+        if cached_data:
+            logger.info("📦 Recent shows loaded from cache")
+            page = json.loads(cached_data)
+            _set_page_headers(response, page)
+            return page["shows"]
+    
+    def _query():
+        query = supabase_client.table('shows').select(SHOW_LIST_COLUMNS)\
+            .order('created_at', desc=True).order('session_id', desc=True)
+        if position:
+            created_at, session_id = position
+            query = query.or_(
+                f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",session_id.lt."{session_id}")'
+            )
+        return query.limit(limit + 1).execute()
+    
     try:
-        logger.info(f"🔍 Fetching {limit} recent shows from database")
-        response = supabase_client.table('shows').select('*').order('created_at', desc=True).limit(limit).execute()
+        logger.info(f"🔍 Fetching {limit} shows from database")
+        result = await asyncio.to_thread(_query)
         
-        logger.info(f"✅ Fetched {len(response.data)} recent shows")
-        return response.data
+        records = result.data or []
+        has_more = len(records) > limit
+        records = records[:limit]
+        
+        page = {
+            "shows": records,
+            "has_more": has_more,
+            "next_cursor": _encode_show_cursor(records[-1]) if has_more and records else None
+        }
+        
+        if cache_key:
+            redis_client.setex(cache_key, CACHE_TIMEOUT_SHORT, json.dumps(page))
+        
+        logger.info(f"✅ Fetched {len(records)} shows")
+        _set_page_headers(response, page)
+        return records
         
     except Exception as e:
         logger.error(f"❌ Database query failed: {e}")
@@ -18,6 +18,7 @@ import httpx
 # Add parent directory to path for config import
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from config.service_config import config
+from config.http_cassette import create_async_client
 
 # Logging Setup
 logging.basicConfig(level=logging.INFO)
@@ -36,7 +37,7 @@ class KeyService:
     async def initialize(self):
         """Initialisiere Database Service Client"""
         try:
-            self.database_client = httpx.AsyncClient(
+            self.database_client = create_async_client(
                 base_url=config.DATABASE_URL,
                 timeout=30.0
             )
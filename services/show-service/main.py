@@ -5,13 +5,17 @@ ALLE HARDCODED WERTE DURCH DATABASE LOOKUPS ERSETZT!
 """
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 import httpx
 import redis.asyncio as redis
 import json
 import asyncio
+import hashlib
+import time
 import uuid
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Awaitable, Callable, Dict, Any, Optional, List, Tuple
 import os
 from loguru import logger
 from pydantic import BaseModel
@@ -20,6 +24,14 @@ import pytz
 # 🚀 MODULAR CONFIGURATION IMPORTS
 from database.modular_config import modular_config, ShowPreset, BroadcastStyle, Location
 from database.client_factory import get_db_client, ConnectionType
+from config.script_tokenizer import ScriptSegment, ScriptTokenizer, configure_speaker_aliases, render_script, tokenize_script
+from config.http_cassette import create_async_client
+from config.work_scheduler import PriorityClass, WorkScheduler, parse_priority, parse_tenant_weights
+from config.single_flight import SingleFlight, flight_key
+from config.prompt_budget import PromptBudget, PromptBuild, PromptItem, bitcoin_line, weather_line
+from config.article_digest import ArticleDigestCache, article_hash
+from config.llm_client import LLMCall, LLMClient, env_seconds, routes_from_env
+from config.health_monitor import HealthMonitor
 
 app = FastAPI(
     title="RadioX Show Service - Modular", 
@@ -30,6 +42,61 @@ app = FastAPI(
 # Redis Connection
 redis_client: Optional[redis.Redis] = None
 
+# Service / API endpoints (overridable for local stand-ins and benchmarks)
+DATABASE_SERVICE_URL = os.getenv("DATABASE_SERVICE_URL", "http://localhost:8001")
+DATA_COLLECTOR_SERVICE_URL = os.getenv("DATA_COLLECTOR_SERVICE_URL", "http://data-collector-service:8004")
+AUDIO_SERVICE_URL = os.getenv("AUDIO_SERVICE_URL", "http://audio-service:8007")
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+
+# Script prompt budget - article summaries are capped, then compacted to headlines
+PROMPT_BUDGET_TOKENS = int(os.getenv("PROMPT_BUDGET_TOKENS", "1500"))
+PROMPT_ARTICLE_TOKENS = int(os.getenv("PROMPT_ARTICLE_TOKENS", "120"))
+PROMPT_NEWS_ARTICLES = 3
+
+# Article digests - condensed once per article content (batched, in the background), reused by every show
+DIGEST_MODEL = os.getenv("DIGEST_MODEL", "gpt-4o-mini")
+DIGEST_MAX_WORDS = int(os.getenv("DIGEST_MAX_WORDS", "45"))
+DIGEST_BATCH_SIZE = int(os.getenv("DIGEST_BATCH_SIZE", "20"))
+DIGEST_TTL_SECONDS = int(os.getenv("DIGEST_TTL_SECONDS", "259200"))   # 3 days
+DIGEST_SYSTEM_PROMPT = f"""Du verdichtest Nachrichtenartikel für ein Radio-Skript.
+Schreibe pro Artikel einen Digest mit höchstens {DIGEST_MAX_WORDS} Wörtern in der Sprache des Artikels:
+die Kernaussage mit den wichtigsten Fakten (wer, was, wo, Zahlen), vorlesbar, ohne Links oder Markup.
+Antworte als JSON: {{"articles": [{{"id": "<ID>", "digest": "<Text>"}}]}}"""
+
+# LLM routes - JSON lists of OpenAI-compatible endpoints (default: OPENAI_BASE_URL), ranked by observed
+# latency / error rate; a call without an answer after the hedge delay (fixed, else p95) goes to the next
+# route as well (a single route is only hedged for streams - there the loser never generates)
+script_llm = LLMClient(
+    "script",
+    routes_from_env("SCRIPT_LLM_ROUTES", "gpt-4o", OPENAI_BASE_URL),
+    hedge_after=env_seconds("SCRIPT_LLM_HEDGE_SECONDS"),
+    hedge_default=60.0,
+    first_token_hedge_default=8.0,
+    max_hedges=int(os.getenv("SCRIPT_LLM_MAX_HEDGES", "1")),
+)
+digest_llm = LLMClient(
+    "digest",
+    routes_from_env("DIGEST_LLM_ROUTES", DIGEST_MODEL, OPENAI_BASE_URL),
+    hedge_after=env_seconds("DIGEST_LLM_HEDGE_SECONDS"),
+    hedge_default=20.0,
+    max_hedges=int(os.getenv("DIGEST_LLM_MAX_HEDGES", "1")),
+)
+
+# OpenAI admission - script calls queue by priority class (on_air > interactive > batch)
+gpt_scheduler = WorkScheduler(
+    "gpt",
+    capacity=int(os.getenv("GPT_MAX_CONCURRENCY", "4")),
+    tenant_weights=parse_tenant_weights(os.getenv("SCHEDULER_TENANT_WEIGHTS")),
+    aging_seconds=float(os.getenv("SCHEDULER_AGING_SECONDS", "30")),
+    urgent_seconds=float(os.getenv("SCHEDULER_URGENT_SECONDS", "60")),
+)
+
+# Dependency health is probed in the background - /health serves the snapshot
+health_monitor = HealthMonitor("show-service", interval=float(os.getenv("HEALTH_PROBE_INTERVAL", "15")))
+
+# Identical concurrent /generate requests share one pipeline (across replicas via Redis)
+show_flight = SingleFlight("show", lock_ttl=float(os.getenv("SHOW_FLIGHT_LOCK_SECONDS", "300")))
+
 @app.on_event("startup")
 async def startup_event():
     global redis_client
@@ -41,6 +108,8 @@ async def startup_event():
         redis_url = os.getenv("REDIS_URL", "redis://redis:6379")
         redis_client = redis.from_url(redis_url, decode_responses=True)
         await redis_client.ping()  # Test connection immediately
+        show_flight.attach(redis_client)
+        article_digests.attach(redis_client)
         logger.info("✅ Redis connection verified")
     except Exception as e:
         logger.error(f"❌ FAIL FAST: Redis connection failed: {e}")
@@ -56,23 +125,30 @@ async def startup_event():
     # Test Database Factory connection - FAIL FAST
     try:
         db_client = get_db_client(ConnectionType.REGULAR)
-        # Test actual database connection
-        await modular_config.get_default_values()  # This should work if DB is connected
+        # Bulk-load the config snapshot and follow config:version / config:invalidate
+        await modular_config.start_watching(redis_client)
         logger.info("✅ Database factory connection verified")
     except Exception as e:
         logger.error(f"❌ FAIL FAST: Database factory connection failed: {e}")
         raise Exception(f"Show Service REQUIRES Database factory connection: {e}")
     
+    # Load speaker alias table once (MARCELO -> marcel etc.)
+    try:
+        aliases = configure_speaker_aliases(await modular_config.get_dynamic_config('speakers', 'speaker_name_mapping'))
+        logger.info(f"✅ Speaker aliases loaded: {len(aliases.aliases)} entries")
+    except Exception as e:
+        logger.warning(f"⚠️ Speaker alias mapping unavailable, using built-in aliases: {e}")
+    
     # Test critical microservice dependencies - FAIL FAST
     required_services = [
-        ("Data Service", "http://localhost:8001"),
-        ("Data Collector Service", "http://data-collector-service:8004"),
-        ("Audio Service", "http://audio-service:8004")
+        ("Data Service", DATABASE_SERVICE_URL),
+        ("Data Collector Service", DATA_COLLECTOR_SERVICE_URL),
+        ("Audio Service", AUDIO_SERVICE_URL)
     ]
     
     for service_name, service_url in required_services:
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with create_async_client(timeout=5.0) as client:
                 response = await client.get(f"{service_url}/health")
                 if response.status_code != 200:
                     raise Exception(f"{service_name} unhealthy: {response.status_code}")
@@ -81,10 +157,28 @@ async def startup_event():
             logger.error(f"❌ FAIL FAST: {service_name} connection failed: {e}")
             raise Exception(f"Show Service REQUIRES {service_name} connection: {e}")
     
+    # Background dependency probing (replaces live checks in /health)
+    health_monitor.register("redis", lambda: redis_client.ping())
+    health_monitor.register_http("database_service", f"{DATABASE_SERVICE_URL}/health")
+    health_monitor.register_http("data_collector_service", f"{DATA_COLLECTOR_SERVICE_URL}/health")
+    health_monitor.register_http("audio_service", f"{AUDIO_SERVICE_URL}/health")
+    await health_monitor.start()
+    
+    # Scheduled shows are generated ahead of their slot in the background
+    if PREGEN_ENABLED:
+        try:
+            await show_pregenerator.load_schedule()
+        except Exception as e:
+            logger.warning(f"⚠️ Show schedule unavailable - retrying in background: {e}")
+        show_pregenerator.start()
+    
     logger.info("✅ Show Service startup complete - ALL DEPENDENCIES VERIFIED")
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    await health_monitor.stop()
+    await show_pregenerator.stop()
+    await modular_config.stop_watching()
     if redis_client:
         await redis_client.close()
     logger.info("Show Service shutdown complete")
@@ -99,6 +193,10 @@ class ShowRequest(BaseModel):
     primary_speaker: Optional[str] = None  # Wird aus DB geladen
     secondary_speaker: Optional[str] = None  # Wird aus DB geladen
     duration_minutes: Optional[int] = None  # Wird aus Broadcast Style geladen
+    generate_audio: bool = True  # False: nur Script (Audio separat via /audio/script)
+    priority: Optional[str] = None  # on_air | interactive | batch (GPT/TTS Scheduling-Klasse)
+    air_time: Optional[str] = None  # ISO Sendezeit - Deadline für GPT und TTS
+    deadline: Optional[str] = None  # ISO Zeitpunkt, bis zu dem die Show fertig sein muss (Default: air_time)
 
 class ShowResponse(BaseModel):
     session_id: str
@@ -108,6 +206,9 @@ class ShowResponse(BaseModel):
     segments: List[Dict[str, Any]]
     metadata: Dict[str, Any]
 
+class ShowBatchRequest(BaseModel):
+    shows: List[ShowRequest]  # z.B. Morgen-Lineup: mehrere Presets / Orte / Sprachen
+
 class ModularBroadcastStyleService:
     """Vollmodularer Broadcast Style Service - alle Werte aus DB"""
     
@@ -139,89 +240,287 @@ class ModularBroadcastStyleService:
         # Zeitbasierte Auswahl aus DB
         return await modular_config.get_broadcast_style_by_time(hour)
 
+def content_fingerprint(content: Dict[str, Any]) -> str:
+    """Hash of the source data a script is based on (news, weather - not the minute-by-minute bitcoin price)"""
+    weather = content.get("weather") or {}
+    parts = [f"{article.get('title', '')}|{article.get('link', '')}" for article in content.get("news") or []]
+    parts.append(f"{weather.get('description', '')}|{round(float(weather.get('temperature') or 0))}")
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+# Deadline-aware generation - latency priors until real stage timings have been observed
+DEADLINE_SAFETY_FACTOR = float(os.getenv("DEADLINE_SAFETY_FACTOR", "0.85"))  # plan with 85% of the remaining time
+CONTENT_SNAPSHOT_TTL = int(os.getenv("CONTENT_SNAPSHOT_TTL", "21600"))       # last good content per location (6h)
+DEGRADATION_LADDER = ["fewer_articles", "shorter_duration", "turbo_tts", "headlines_only", "cached_content"]
+
+class StageLatencyModel:
+    """EWMA of observed stage timings - predicts the remaining work of a show"""
+    
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self.estimates_ms: Dict[str, float] = {
+            "collect": 3000.0,
+            "collect_cached": 50.0,
+            "script_base": 1500.0,        # request + time to first token
+            "script_per_minute": 4000.0,  # GPT output per show minute
+            "script_per_article": 500.0,  # prompt + coverage per article (prompt uses up to 3)
+            "store": 300.0,
+            "audio_per_minute": 12000.0,  # TTS + combine + upload per show minute
+        }
+    
+    def observe(self, key: str, value_ms: float):
+        current = self.estimates_ms.get(key)
+        self.estimates_ms[key] = value_ms if current is None else (1 - self.alpha) * current + self.alpha * value_ms
+    
+    def observe_script(self, script_ms: float, minutes: int):
+        self.observe("script_per_minute", max(0.0, script_ms - self.estimates_ms["script_base"]) / max(1, minutes))
+
+@dataclass
+class DegradationPlan:
+    """Current knobs of a show generation and the ladder steps applied so far"""
+    news_count: int
+    duration_minutes: int
+    generate_audio: bool
+    voice_quality: str = "mid"
+    headlines_only: bool = False
+    cached_content: bool = False
+    applied: List[str] = field(default_factory=list)
+    
+    def predict_ms(self, model: StageLatencyModel, collected: bool) -> float:
+        """Predicted time for everything still to do"""
+        estimates = model.estimates_ms
+        total = 0.0
+        if not collected:
+            total += estimates["collect_cached"] if self.cached_content else estimates["collect"]
+        per_minute = estimates["script_per_minute"] * (0.85 if self.headlines_only else 1.0)
+        total += estimates["script_base"] + per_minute * self.duration_minutes + estimates["store"]
+        total += estimates["script_per_article"] * min(self.news_count, 3)
+        if self.generate_audio:
+            total += estimates["audio_per_minute"] * self.duration_minutes * (0.5 if self.voice_quality == "low" else 1.0)
+        return total
+    
+    def apply(self, step: str, collected: bool) -> bool:
+        """Apply one ladder step - False if it cannot change anything (anymore)"""
+        if step == "fewer_articles" and self.news_count > 1:
+            self.news_count = max(1, self.news_count // 2)
+        elif step == "shorter_duration" and self.duration_minutes > 1:
+            self.duration_minutes = max(1, self.duration_minutes // 2)
+        elif step == "turbo_tts" and self.generate_audio and self.voice_quality != "low":
+            self.voice_quality = "low"
+        elif step == "headlines_only" and not self.headlines_only:
+            self.headlines_only = True
+        elif step == "cached_content" and not collected and not self.cached_content:
+            self.cached_content = True
+        else:
+            return False
+        if step not in self.applied:
+            self.applied.append(step)
+        return True
+
+class ShowTimeBudget:
+    """Time left until a show's deadline, shared by all stages"""
+    
+    def __init__(self, deadline: float, model: StageLatencyModel):
+        self.deadline = deadline
+        self.model = model
+    
+    def remaining_ms(self) -> float:
+        return (self.deadline - time.time()) * 1000
+    
+    def degrade(self, plan: DegradationPlan, collected: bool) -> List[str]:
+        """Walk down the ladder until the predicted remaining work fits the budget"""
+        target_ms = self.remaining_ms() * DEADLINE_SAFETY_FACTOR
+        newly_applied = []
+        for step in DEGRADATION_LADDER:
+            if plan.predict_ms(self.model, collected) <= target_ms:
+                break
+            if step in plan.applied and step != "shorter_duration":
+                continue
+            if plan.apply(step, collected):
+                newly_applied.append(step)
+                # Halve the duration until it fits (down to one minute)
+                while step == "shorter_duration" and plan.duration_minutes > 1 \
+                        and plan.predict_ms(self.model, collected) > target_ms:
+                    plan.duration_minutes = max(1, plan.duration_minutes // 2)
+        if newly_applied:
+            logger.warning(f"⏱️ Deadline at risk ({self.remaining_ms():.0f} ms left) - degraded: {', '.join(newly_applied)}")
+        return newly_applied
+    
+    def timeout(self, default: float, floor: float = 2.0) -> float:
+        """HTTP timeout for the next call - never beyond the deadline (but at least floor seconds)"""
+        return min(default, max(floor, self.remaining_ms() / 1000))
+
+# Streaming generation (/generate/stream) - SSE comment line while a stage is still busy
+SSE_KEEPALIVE_SECONDS = float(os.getenv("SSE_KEEPALIVE_SECONDS", "15"))
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+class ShowProgress:
+    """Event sink of one streamed show generation - rendered as Server-Sent Events
+
+    Events: started, stage (config / collect / script / store / tts / upload with
+    its timing), token (script text as GPT streams it), segment (completed speaker
+    segment), complete (full ShowResponse) and error.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.task: Optional[asyncio.Task] = None  # the generation feeding this stream
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    def emit(self, event: str, **data):
+        data.setdefault("elapsed_ms", round((time.perf_counter() - self.started) * 1000, 1))
+        self._queue.put_nowait((event, data))
+
+    def close(self):
+        self._queue.put_nowait(None)
+
+    async def events(self):
+        """SSE frames until close() - keep-alive comments keep proxies from timing out"""
+        while True:
+            try:
+                item = await asyncio.wait_for(self._queue.get(), SSE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if item is None:
+                return
+            event, data = item
+            yield f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+# Batch generation (/generate/batch)
+BATCH_MAX_SHOWS = int(os.getenv("BATCH_MAX_SHOWS", "50"))
+
+class ShowBatch:
+    """Shared work of one batch generation - identical collections and script prompts run once
+
+    Collections are keyed by (location, feed category, language) and fetch the
+    largest news_count any show of the group asked for. Scripts are keyed by
+    the full GPT request (model, system prompt, prompt) - same articles, same
+    selection instructions and template give the same prompt.
+    """
+
+    def __init__(self):
+        self.news_counts: Dict[str, int] = {}   # collection key -> largest news_count in the batch
+        self._tasks: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._hits: Dict[Tuple[str, str], int] = {}
+        self._elapsed_ms: Dict[Tuple[str, str], float] = {}
+
+    @staticmethod
+    def collection_key(request: ShowRequest, show_preset: ShowPreset) -> str:
+        category = getattr(show_preset, 'feed_category', None) or 'all'
+        return f"{show_preset.location.weather_api_name}|{category}|{request.language}"
+
+    async def _run(self, work_key: Tuple[str, str], work: Callable[[], Awaitable[Any]]) -> Any:
+        started = time.perf_counter()
+        try:
+            return await work()
+        finally:
+            self._elapsed_ms[work_key] = round((time.perf_counter() - started) * 1000, 1)
+
+    async def shared(self, kind: str, key: str, work: Callable[[], Awaitable[Any]]) -> Any:
+        """Result of work for this key - the first caller runs it, later callers await the same task"""
+        work_key = (kind, key)
+        self._hits[work_key] = self._hits.get(work_key, 0) + 1
+        if work_key not in self._tasks:
+            self._tasks[work_key] = asyncio.create_task(self._run(work_key, work))
+        # Shielded - one show failing its deadline must not cancel the others' shared work
+        return await asyncio.shield(self._tasks[work_key])
+
+    def work_summary(self) -> Dict[str, Any]:
+        """Calls made versus N independent generations, and the time the shared calls saved"""
+        summary: Dict[str, Any] = {}
+        for kind in ("collect", "script"):
+            keys = [work_key for work_key in self._tasks if work_key[0] == kind]
+            independent = sum(self._hits[work_key] for work_key in keys)
+            summary[kind] = {
+                "independent_calls": independent,
+                "executed_calls": len(keys),
+                "saved_calls": independent - len(keys),
+                "saved_ms": round(sum(
+                    self._elapsed_ms.get(work_key, 0.0) * (self._hits[work_key] - 1) for work_key in keys
+                ), 1),
+            }
+        summary["saved_ms_total"] = round(summary["collect"]["saved_ms"] + summary["script"]["saved_ms"], 1)
+        return summary
+
 class ModularGPTScriptGenerator:
     """Vollmodularer GPT Script Generator - Templates aus DB"""
     
     def __init__(self):
-        self.openai_api_key = None
         self.gpt_config = {
-            "model": "gpt-4o",
+            "model": script_llm.routes[0].model,   # prompt budget / request identity
             "max_tokens": 4000,
             "temperature": 0.8,
             "timeout": 180
         }
     
-    async def _get_openai_api_key(self) -> Optional[str]:
-        """Get OpenAI API key from environment"""
-        if self.openai_api_key:
-            return self.openai_api_key
-        
-        self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        
-        if not self.openai_api_key:
-            logger.warning("⚠️ OPENAI_API_KEY not found in environment variables")
-            return None
-            
-        logger.info("✅ OpenAI API key loaded from environment")
-        return self.openai_api_key
-    
     async def generate_script(
         self, 
         content: Dict[str, Any],
-        show_preset: ShowPreset
-    ) -> str:
-        """Generate radio script using GPT-4 with modular templates"""
+        show_preset: ShowPreset,
+        priority: PriorityClass = PriorityClass.INTERACTIVE,
+        deadline: Optional[float] = None,
+        headlines_only: bool = False,
+        timeout: Optional[float] = None,
+        progress: Optional[ShowProgress] = None,
+        report: Optional[Dict[str, Any]] = None
+    ) -> List[ScriptSegment]:
+        """Generate radio script segments using GPT-4 with modular templates
+
+        With progress the completion is streamed - tokens and finished speaker
+        segments are emitted while GPT is still writing. report (if given)
+        receives the prompt token budget, the GPT call latency and the
+        LLM call record (route, hedges, tokens, cost).
+        """
         
-        api_key = await self._get_openai_api_key()
-        if not api_key:
-                    raise HTTPException(
-            status_code=503,
-            detail="Show Service: OpenAI API key required for script generation"
-        )
+        if not script_llm.configured():
+            raise HTTPException(
+                status_code=503,
+                detail="Show Service: OpenAI API key required for script generation"
+            )
         
         logger.info("🤖 Generating script with GPT-4 using modular templates...")
         
         try:
-            prompt = await self._create_modular_gpt_prompt(content, show_preset)
+            prompt = await self._create_modular_gpt_prompt(content, show_preset, headlines_only)
+            logger.info(f"📏 Script prompt: {prompt.tokens_after} tokens "
+                        f"(untrimmed {prompt.tokens_before}, budget {prompt.budget_tokens})")
+            if report is not None:
+                report["prompt_tokens"] = prompt.report()
             
-            async with httpx.AsyncClient(timeout=self.gpt_config["timeout"]) as client:
-                headers = {
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                }
-                
-                data = {
-                    "model": self.gpt_config["model"],
-                    "messages": [
-                        {
-                            "role": "system", 
-                            "content": show_preset.template.system_prompt
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    "max_tokens": self.gpt_config["max_tokens"],
-                    "temperature": self.gpt_config["temperature"]
-                }
-                
-                response = await client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers=headers,
-                    json=data
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    script = result["choices"][0]["message"]["content"].strip()
-                    return await self._post_process_script(script)
+            # Model is set per route (script_llm)
+            data = {
+                "messages": [
+                    {
+                        "role": "system", 
+                        "content": show_preset.template.system_prompt
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt.text
+                    }
+                ],
+                "max_tokens": self.gpt_config["max_tokens"],
+                "temperature": self.gpt_config["temperature"]
+            }
+            
+            tenant = show_preset.preset_name if show_preset.preset_name != 'dynamic' else show_preset.location.location_code
+            async with gpt_scheduler.slot(priority, tenant, deadline):
+                gpt_start = time.perf_counter()
+                if progress:
+                    segments, call = await self._stream_script(data, progress, timeout or self.gpt_config["timeout"])
                 else:
-                    logger.error(f"❌ OpenAI API error: {response.status_code} - {response.text}")
-                    raise HTTPException(
-                        status_code=503,
-                        detail="Show Service: OpenAI API configuration error"
-                    )
+                    response = await script_llm.chat(data, timeout=timeout or self.gpt_config["timeout"])
+                    call = response.call
+                # GPT latency without the queue wait - correlate with prompt_tokens
+                if report is not None:
+                    report["gpt_ms"] = round((time.perf_counter() - gpt_start) * 1000, 1)
+                    report["openai_prompt_tokens"] = call.prompt_tokens
+                    report["llm"] = call.to_dict()
+            
+            if progress:
+                return segments
+            
+            return await self._post_process_script(response.text.strip())
         
         except Exception as e:
             logger.error(f"❌ Script generation failed: {e}")
@@ -229,88 +528,102 @@ class ModularGPTScriptGenerator:
                 status_code=503,
                 detail="Show Service: OpenAI API service unavailable"
             )
+
+    async def _stream_script(
+        self, data: Dict[str, Any], progress: ShowProgress, timeout: float
+    ) -> Tuple[List[ScriptSegment], LLMCall]:
+        """Streamed completion - same segments as _post_process_script, tokenized incrementally"""
+        tokenizer = ScriptTokenizer()
+        segments: List[ScriptSegment] = []
+
+        def collect(completed: List[ScriptSegment]):
+            for segment in completed:
+                segments.append(segment)
+                progress.emit("segment", index=segment.index, speaker=segment.speaker, text=segment.text)
+
+        stream = script_llm.stream_chat(data, timeout=timeout)
+        async for text in stream:
+            progress.emit("token", text=text)
+            collect(tokenizer.feed(text))
+
+        collect(tokenizer.close())
+        return segments, stream.call
+
+    async def condense_articles(self, items: List[Dict[str, str]], priority: PriorityClass = PriorityClass.BATCH,
+                                deadline: Optional[float] = None) -> Dict[str, str]:
+        """Radio-ready digests of many articles in one call - {id: digest} (see article_digests)"""
+        if not digest_llm.configured():
+            raise RuntimeError("OpenAI API key required for article condensation")
+        
+        data = {
+            "messages": [
+                {"role": "system", "content": DIGEST_SYSTEM_PROMPT},
+                {"role": "user", "content": "\n\n".join(
+                    f"ID: {item['id']}\nTITEL: {item['title']}\nTEXT: {item['text']}" for item in items
+                )}
+            ],
+            "response_format": {"type": "json_object"},
+            "max_tokens": 100 + len(items) * DIGEST_MAX_WORDS * 3,
+            "temperature": 0.2
+        }
+        async with gpt_scheduler.slot(priority, "article_digests", deadline):
+            response = await digest_llm.chat(data, timeout=self.gpt_config["timeout"])
+        result = json.loads(response.text)
+        return {entry.get("id"): entry.get("digest") for entry in result.get("articles", []) if isinstance(entry, dict)}
+    
+    async def prompt_key(self, content: Dict[str, Any], show_preset: ShowPreset, headlines_only: bool = False) -> str:
+        """Identity of a script request - batch shows with the same key share one GPT call"""
+        prompt = await self._create_modular_gpt_prompt(content, show_preset, headlines_only)
+        request_text = f"{self.gpt_config['model']}\n{show_preset.template.system_prompt}\n{prompt.text}"
+        return hashlib.sha1(request_text.encode("utf-8")).hexdigest()
     
     async def _create_modular_gpt_prompt(
         self, 
         content: Dict[str, Any], 
-        show_preset: ShowPreset
-    ) -> str:
-        """Create GPT prompt using modular templates from database"""
-        
-        # News content
-        news_section = ""
-        if content.get("news") and isinstance(content["news"], list):
-            news_section = "\n".join([
-                f"- {article.get('title', 'Unbekannter Titel')}: {article.get('summary', article.get('description', 'Keine Beschreibung'))}"
-                for article in content["news"][:3]
-            ])
-        
-        # Weather info
-        weather_section = ""
-        if content.get("weather"):
-            weather_info = content["weather"]
-            temp = weather_info.get("temperature", "N/A")
-            desc = weather_info.get("description", "Keine Wetterdaten")
-            weather_section = f"Wetter in {show_preset.location.display_name}: {temp}°C, {desc}"
-        
-        # Bitcoin info
-        bitcoin_section = ""
-        if content.get("bitcoin"):
-            bitcoin_info = content["bitcoin"]
-            price = bitcoin_info.get("price", "N/A")
-            change = bitcoin_info.get("change_24h", 0)
-            bitcoin_section = f"Bitcoin: ${price:,.0f} ({change:+.1f}% 24h)" if isinstance(price, (int, float)) else f"Bitcoin: {price}"
-        
-        # Build modular prompt
-        prompt = f"""
-SHOW KONFIGURATION:
+        show_preset: ShowPreset,
+        headlines_only: bool = False
+    ) -> PromptBuild:
+        """Create GPT prompt using modular templates from database (within PROMPT_BUDGET_TOKENS)"""
+        
+        # Show configuration and speaker moods - always complete
+        config_section = f"""SHOW KONFIGURATION:
 - Preset: {show_preset.display_name}
 - Stil: {show_preset.broadcast_style.display_name}
 - Sprecher: {show_preset.primary_speaker.title()}"""
         
         if show_preset.secondary_speaker:
-            prompt += f" & {show_preset.secondary_speaker.title()}"
+            config_section += f" & {show_preset.secondary_speaker.title()}"
         
-        prompt += f"""
+        config_section += f"""
 - Ort: {show_preset.location.display_name}
 - Zieldauer: {show_preset.broadcast_style.duration_target} Minuten
 
 SPRECHER-STIMMUNGEN:
 - {show_preset.primary_speaker.title()}: {show_preset.broadcast_style.marcel_mood}
-- {show_preset.secondary_speaker.title() if show_preset.secondary_speaker else 'Jarvis'}: {show_preset.broadcast_style.jarvis_mood}
-
-CONTENT:
-{news_section}
-
-{weather_section}
-
-{bitcoin_section}
-
-{show_preset.template.format_instructions}
-
-GPT SELECTION INSTRUCTIONS:
-{show_preset.gpt_selection_instructions}
-"""
-        
-        return prompt
-    
-    async def _post_process_script(self, script: str) -> str:
-        """Post-process script with modular speaker tags"""
+- {show_preset.secondary_speaker.title() if show_preset.secondary_speaker else 'Jarvis'}: {show_preset.broadcast_style.jarvis_mood}"""
         
-        # Get speaker tags from config
-        speaker_tags = await modular_config.get_speaker_tags()
+        # News: digest (or summary), compacted to the headline when over budget (headlines_only: deadline degradation)
+        articles = []
+        if isinstance(content.get("news"), list):
+            for article in content["news"][:PROMPT_NEWS_ARTICLES]:
+                headline = f"- {article.get('title', 'Unbekannter Titel')}"
+                summary = article.get('digest') or article.get('summary') or article.get('description') or 'Keine Beschreibung'
+                articles.append(PromptItem(headline if headlines_only else f"{headline}: {summary}", compact=headline))
         
-        # Normalisiere Speaker Tags
-        script = script.replace("[Marcel]", "[MARCEL]")
-        script = script.replace("[marcel]", "[MARCEL]")
-        script = script.replace("[Jarvis]", "[JARVIS]")
-        script = script.replace("[jarvis]", "[JARVIS]")
-        
-        # Stelle sicher, dass Script mit einem Sprecher beginnt
-        if not script.startswith("[MARCEL]") and not script.startswith("[JARVIS]"):
-            script = "[MARCEL] " + script
+        prompt = PromptBudget(PROMPT_BUDGET_TOKENS, model=self.gpt_config["model"])
+        prompt.text("config", config_section)
+        prompt.add("news", articles, priority=1, header="CONTENT:\n", item_tokens=PROMPT_ARTICLE_TOKENS, min_items=1)
+        prompt.text("weather", weather_line(content.get("weather"), show_preset.location.display_name), priority=2)
+        prompt.text("bitcoin", bitcoin_line(content.get("bitcoin")), priority=3)
+        prompt.text("format", show_preset.template.format_instructions)
+        prompt.text("selection", f"GPT SELECTION INSTRUCTIONS:\n{show_preset.gpt_selection_instructions}")
+        return prompt.build()
+    
+    async def _post_process_script(self, script: str) -> List[ScriptSegment]:
+        """Post-process script - single tokenizer pass normalizes all speaker tags"""
         
-        return script.strip()
+        # Untagged leading text is assigned to the default speaker by the tokenizer
+        return tokenize_script(script)
     
 
 
@@ -320,87 +633,208 @@ class ModularShowOrchestrationService:
     def __init__(self):
         self.broadcast_service = ModularBroadcastStyleService()
         self.script_generator = ModularGPTScriptGenerator()
+        self.latency_model = StageLatencyModel()
+    
+    async def _resolve_show_preset(self, request: ShowRequest) -> ShowPreset:
+        """Apply DB defaults to the request and resolve its preset (or a dynamic one)"""
+        # 1. Load defaults from database if not provided
+        defaults = await modular_config.get_default_values()
+        
+        # Apply defaults
+        if not request.channel:
+            request.channel = defaults.get('default_channel', 'zurich')
+        if not request.language:
+            request.language = defaults.get('default_language', 'de')
+        if not request.news_count:
+            request.news_count = int(defaults.get('default_news_count', '3'))
+        if not request.primary_speaker:
+            request.primary_speaker = defaults.get('default_primary_speaker', 'marcel')
+        if not request.secondary_speaker:
+            request.secondary_speaker = defaults.get('default_secondary_speaker', 'jarvis')
+        
+        # 2. Load show preset if specified
+        show_preset = None
+        if request.preset_name:
+            show_preset = await modular_config.get_show_preset(request.preset_name)
+            if show_preset:
+                # Override request with preset values
+                request.channel = show_preset.location.location_code
+                request.primary_speaker = show_preset.primary_speaker
+                request.secondary_speaker = show_preset.secondary_speaker
+                logger.info(f"✅ Using preset: {show_preset.display_name}")
+        
+        # 3. If no preset, create one from request
+        if not show_preset:
+            # Load individual components
+            location = await modular_config.get_location(request.channel)
+            if not location:
+                raise HTTPException(status_code=400, detail=f"Unknown location: {request.channel}")
+            
+            broadcast_style = await self.broadcast_service.determine_broadcast_style(request.target_time)
+            if not broadcast_style:
+                raise HTTPException(status_code=500, detail="No broadcast style available")
+            
+            template = await modular_config.get_show_template('radio_show_de')
+            if not template:
+                raise HTTPException(status_code=500, detail="No show template available")
+            
+            # Create temporary preset
+            show_preset = ShowPreset(
+                preset_name='dynamic',
+                display_name='Dynamic Show',
+                primary_speaker=request.primary_speaker,
+                secondary_speaker=request.secondary_speaker,
+                weather_speaker=None,
+                location=location,
+                broadcast_style=broadcast_style,
+                template=template,
+                gpt_selection_instructions='Standard news selection'
+            )
+        
+        return show_preset
     
-    async def generate_show(self, request: ShowRequest) -> ShowResponse:
-        """Generiere Show mit vollmodularer Konfiguration"""
+    async def generate_show(self, request: ShowRequest, progress: Optional[ShowProgress] = None,
+                            batch: Optional[ShowBatch] = None) -> ShowResponse:
+        """Generiere Show mit vollmodularer Konfiguration
+        
+        progress: streamed generation - stage events and script tokens as they
+        happen, audio is awaited so rendering and upload are reported too.
+        batch: part of /generate/batch - collection and script calls are shared.
+        """
         session_id = str(uuid.uuid4())
+        stage_timings: Dict[str, float] = {}
+        stage_start = time.perf_counter()
+        
+        def mark_stage(stage: str, **details):
+            nonlocal stage_start
+            now = time.perf_counter()
+            stage_timings[stage] = round((now - stage_start) * 1000, 1)
+            stage_start = now
+            if progress:
+                progress.emit("stage", stage=stage, ms=stage_timings[stage], **details)
         
         logger.info(f"🎯 Generating modular show: {session_id}")
+        if progress:
+            progress.emit("started", session_id=session_id)
         
         try:
-            # 1. Load defaults from database if not provided
-            defaults = await modular_config.get_default_values()
-            
-            # Apply defaults
-            if not request.channel:
-                request.channel = defaults.get('default_channel', 'zurich')
-            if not request.language:
-                request.language = defaults.get('default_language', 'de')
-            if not request.news_count:
-                request.news_count = int(defaults.get('default_news_count', '3'))
-            if not request.primary_speaker:
-                request.primary_speaker = defaults.get('default_primary_speaker', 'marcel')
-            if not request.secondary_speaker:
-                request.secondary_speaker = defaults.get('default_secondary_speaker', 'jarvis')
+            show_preset = await self._resolve_show_preset(request)
             
-            # 2. Load show preset if specified
-            show_preset = None
-            if request.preset_name:
-                show_preset = await modular_config.get_show_preset(request.preset_name)
-                if show_preset:
-                    # Override request with preset values
-                    request.channel = show_preset.location.location_code
-                    request.primary_speaker = show_preset.primary_speaker
-                    request.secondary_speaker = show_preset.secondary_speaker
-                    logger.info(f"✅ Using preset: {show_preset.display_name}")
+            # Deadline: the show must be ready by then - degrade instead of missing the slot
+            deadline = self._air_deadline(request.deadline or request.air_time)
+            budget = ShowTimeBudget(deadline, self.latency_model) if deadline else None
+            plan = DegradationPlan(
+                news_count=request.news_count,
+                duration_minutes=request.duration_minutes or show_preset.broadcast_style.duration_target,
+                generate_audio=request.generate_audio
+            )
+            if budget:
+                budget.degrade(plan, collected=False)
             
-            # 3. If no preset, create one from request
-            if not show_preset:
-                # Load individual components
-                location = await modular_config.get_location(request.channel)
-                if not location:
-                    raise HTTPException(status_code=400, detail=f"Unknown location: {request.channel}")
-                
-                broadcast_style = await self.broadcast_service.determine_broadcast_style(request.target_time)
-                if not broadcast_style:
-                    raise HTTPException(status_code=500, detail="No broadcast style available")
-                
-                template = await modular_config.get_show_template('radio_show_de')
-                if not template:
-                    raise HTTPException(status_code=500, detail="No show template available")
-                
-                # Create temporary preset
-                show_preset = ShowPreset(
-                    preset_name='dynamic',
-                    display_name='Dynamic Show',
-                    primary_speaker=request.primary_speaker,
-                    secondary_speaker=request.secondary_speaker,
-                    weather_speaker=None,
-                    location=location,
-                    broadcast_style=broadcast_style,
-                    template=template,
-                    gpt_selection_instructions='Standard news selection'
+            # Requested (or degraded) duration overrides the style target (copies - presets may be cached)
+            if plan.duration_minutes != show_preset.broadcast_style.duration_target:
+                show_preset = replace(
+                    show_preset,
+                    broadcast_style=replace(show_preset.broadcast_style, duration_target=plan.duration_minutes)
                 )
+            mark_stage("config", preset=show_preset.preset_name, degradations=list(plan.applied))
+            
+            # 4. Collect content (cached_content: last good snapshot instead of live collection)
+            content = await self._collect_content_within_budget(request, show_preset, plan, budget, batch)
+            mark_stage("collect", news_count=len(content.get("news") or []), cached_content=plan.cached_content)
+            if not plan.cached_content:
+                self.latency_model.observe("collect", stage_timings["collect"])
+            
+            # Collection ran long - re-plan with the time actually left
+            if budget:
+                budget.degrade(plan, collected=True)
+                if plan.duration_minutes != show_preset.broadcast_style.duration_target:
+                    show_preset = replace(
+                        show_preset,
+                        broadcast_style=replace(show_preset.broadcast_style, duration_target=plan.duration_minutes)
+                    )
+            # Shared batch collections fetch the largest news_count of their group
+            if batch or "fewer_articles" in plan.applied:
+                content = {**content, "news": (content.get("news") or [])[:plan.news_count]}
+            
+            # 5. Generate script (already tokenized into speaker segments)
+            priority = parse_priority(request.priority)
+            script_report: Dict[str, Any] = {}
             
-            # 4. Collect content
-            content = await self._collect_content(request, show_preset.location, show_preset)
+            if not plan.headlines_only:
+                content, digested = await self._attach_digests(content)
+                script_report["article_digests"] = digested
+                mark_stage("digest", **digested)
+            
+            def write_script():
+                return self.script_generator.generate_script(
+                    content, show_preset, priority, deadline,
+                    headlines_only=plan.headlines_only,
+                    timeout=budget.timeout(self.script_generator.gpt_config["timeout"], floor=10.0) if budget else None,
+                    progress=progress,
+                    report=script_report
+                )
             
-            # 5. Generate script
-            script = await self.script_generator.generate_script(content, show_preset)
+            if batch:
+                prompt_key = await self.script_generator.prompt_key(content, show_preset, plan.headlines_only)
+                script_segments = await batch.shared("script", prompt_key, write_script)
+            else:
+                script_segments = await write_script()
+            script = render_script(script_segments)
+            mark_stage("script", segments=len(script_segments), degradations=list(plan.applied))
+            self.latency_model.observe_script(stage_timings["script"], plan.duration_minutes)
             
-            # 6. Parse segments
-            segments = self._parse_script_segments(script)
+            # 6. Segment summaries
+            segments = self._parse_script_segments(script_segments)
             
             # 7. Estimate duration
             estimated_duration = self._estimate_duration(script)
             
             # 8. Generate audio asynchronously
-            asyncio.create_task(self._generate_audio(session_id, script, request))
+            audio_task = None
+            if request.generate_audio:
+                audio_task = asyncio.create_task(self._generate_audio(
+                    session_id, script, request, plan.voice_quality, plan.duration_minutes, deadline
+                ))
             
             # 9. Store show data
             await self._store_show_data_modular(
                 session_id, script, content, show_preset, request
             )
+            mark_stage("store")
+            self.latency_model.observe("store", stage_timings["store"])
+            
+            # Streamed: stay on the connection until the audio is rendered and uploaded
+            audio_result = None
+            if progress and audio_task:
+                audio_result = await audio_task or {}
+                audio_timings = audio_result.get("stage_timings_ms", {})
+                progress.emit("stage", stage="tts", ms=audio_timings.get("tts"),
+                              segments=audio_result.get("segments_count", 0))
+                progress.emit("stage", stage="upload", ms=audio_timings.get("upload"),
+                              audio_url=audio_result.get("audio_url"),
+                              uploaded=bool(audio_result.get("storage_uploaded")))
+                mark_stage("audio", audio_stage_timings_ms=audio_timings)
+            
+            metadata = {
+                "preset_used": show_preset.preset_name,
+                "location": show_preset.location.display_name,
+                "speakers": [show_preset.primary_speaker, show_preset.secondary_speaker],
+                "news_count": len(content.get("news", [])),
+                "generation_time": datetime.utcnow().isoformat(),
+                "stage_timings_ms": stage_timings,
+                "content_fingerprint": content_fingerprint(content),
+                "voice_quality": plan.voice_quality,
+                "degradations": plan.applied,
+                **script_report
+            }
+            if audio_result:
+                metadata["audio_url"] = audio_result.get("audio_url")
+                metadata["audio_duration_seconds"] = audio_result.get("duration_seconds")
+            if budget:
+                metadata["deadline"] = datetime.fromtimestamp(deadline).isoformat()
+                metadata["deadline_remaining_ms"] = round(budget.remaining_ms(), 1)
+                metadata["deadline_met"] = budget.remaining_ms() >= 0
             
             return ShowResponse(
                 session_id=session_id,
@@ -408,20 +842,149 @@ class ModularShowOrchestrationService:
                 broadcast_style=show_preset.broadcast_style.display_name,
                 estimated_duration_minutes=estimated_duration,
                 segments=segments,
-                metadata={
-                    "preset_used": show_preset.preset_name,
-                    "location": show_preset.location.display_name,
-                    "speakers": [show_preset.primary_speaker, show_preset.secondary_speaker],
-                    "news_count": len(content.get("news", [])),
-                    "generation_time": datetime.utcnow().isoformat()
-                }
+                metadata=metadata
             )
             
         except Exception as e:
             logger.error(f"❌ Show generation failed: {e}")
             raise HTTPException(status_code=500, detail=f"Show generation failed: {str(e)}")
     
-    async def _collect_content(self, request: ShowRequest, location: Location, show_preset = None) -> Dict[str, Any]:
+    async def generate_batch(self, requests: List[ShowRequest]) -> Dict[str, Any]:
+        """Generate N shows with shared content collection and script calls
+        
+        GPT calls queue in gpt_scheduler and TTS in the audio service's scheduler,
+        so all shows run concurrently under the global limits.
+        """
+        started = time.perf_counter()
+        batch = ShowBatch()
+        # Lineups are background work unless a spec says otherwise
+        specs = [request.model_copy(update={"priority": request.priority or PriorityClass.BATCH.value})
+                 for request in requests]
+        
+        # Dependency plan: which shows share a content collection (and its largest news_count)
+        collections: Dict[str, List[int]] = {}
+        for index, spec in enumerate(specs):
+            try:
+                show_preset = await self._resolve_show_preset(spec)
+            except HTTPException:
+                continue  # reported by generate_show below
+            key = ShowBatch.collection_key(spec, show_preset)
+            batch.news_counts[key] = max(batch.news_counts.get(key, 0), spec.news_count or 0)
+            collections.setdefault(key, []).append(index)
+        
+        logger.info(f"📦 Batch of {len(specs)} shows: {len(collections)} content collections")
+        responses = await asyncio.gather(
+            *(self.generate_show(spec, batch=batch) for spec in specs), return_exceptions=True
+        )
+        
+        results = []
+        for index, response in enumerate(responses):
+            if isinstance(response, ShowResponse):
+                results.append({"index": index, "success": True, "show": response.model_dump()})
+            else:
+                detail = response.detail if isinstance(response, HTTPException) else str(response)
+                results.append({"index": index, "success": False, "error": detail})
+        
+        work = batch.work_summary()
+        logger.info(f"✅ Batch done: {sum(r['success'] for r in results)}/{len(specs)} shows, "
+                    f"saved {work['collect']['saved_calls']} collections / {work['script']['saved_calls']} scripts")
+        return {
+            "results": results,
+            "plan": {
+                "collections": [
+                    {"key": key, "shows": indices, "news_count": batch.news_counts[key]}
+                    for key, indices in collections.items()
+                ]
+            },
+            "work": work,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+        }
+    
+    async def _attach_digests(self, content: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """Known digests for the prompt articles - lookup only, never waits on the LLM
+        
+        Articles of the collected pool without a digest are condensed in the
+        background as batch work; until then they keep their summary.
+        """
+        news = content.get("news") or []
+        prompt_news = news[:PROMPT_NEWS_ARTICLES]
+        if not prompt_news:
+            return content, {"articles": 0, "digested": 0}
+        
+        digests = await article_digests.digests(news, wait=0, priority=PriorityClass.BATCH)
+        with_digests = []
+        for article in prompt_news:
+            digest = digests.get(article_hash(article))
+            with_digests.append({**article, "digest": digest} if digest else article)
+        return {**content, "news": with_digests + news[PROMPT_NEWS_ARTICLES:]}, \
+            {"articles": len(prompt_news), "digested": sum(1 for article in with_digests if article.get("digest"))}
+    
+    @staticmethod
+    def _content_snapshot_key(show_preset: ShowPreset) -> str:
+        return f"show:content:{show_preset.location.location_code}:{getattr(show_preset, 'feed_category', None) or 'all'}"
+    
+    async def _collect_content_within_budget(
+        self, request: ShowRequest, show_preset: ShowPreset, plan: DegradationPlan, budget: Optional[ShowTimeBudget],
+        batch: Optional[ShowBatch] = None
+    ) -> Dict[str, Any]:
+        """Live collection (bounded by the budget) with the last good snapshot as degradation"""
+        snapshot_key = self._content_snapshot_key(show_preset)
+        
+        if plan.cached_content:
+            snapshot = await self._load_content_snapshot(snapshot_key)
+            if snapshot:
+                return snapshot
+            logger.warning("⚠️ No content snapshot available - collecting live despite deadline")
+            plan.cached_content = False
+            plan.applied.remove("cached_content")
+        
+        collection_key = ShowBatch.collection_key(request, show_preset) if batch else None
+        
+        async def collect_live() -> Dict[str, Any]:
+            collect_request = request
+            if batch:
+                collect_request = request.model_copy(update={
+                    "news_count": max(request.news_count or 0, batch.news_counts.get(collection_key, 0)) or None
+                })
+            content = await self._collect_content(
+                collect_request, show_preset.location, show_preset,
+                timeout=budget.timeout(30.0) if budget else 30.0
+            )
+            if redis_client:
+                try:
+                    await redis_client.setex(snapshot_key, CONTENT_SNAPSHOT_TTL, json.dumps(content, default=str))
+                except Exception as e:
+                    logger.warning(f"⚠️ Content snapshot write failed: {e}")
+            return content
+        
+        try:
+            if batch:
+                return await batch.shared("collect", collection_key, collect_live)
+            return await collect_live()
+        except HTTPException:
+            # Live collection failed or ran out of time - an older snapshot still makes the slot
+            snapshot = await self._load_content_snapshot(snapshot_key) if budget else None
+            if not snapshot:
+                raise
+            plan.cached_content = True
+            plan.applied.append("cached_content")
+            return snapshot
+    
+    async def _load_content_snapshot(self, snapshot_key: str) -> Optional[Dict[str, Any]]:
+        if not redis_client:
+            return None
+        try:
+            cached = await redis_client.get(snapshot_key)
+        except Exception as e:
+            logger.warning(f"⚠️ Content snapshot read failed: {e}")
+            return None
+        if cached:
+            logger.info(f"📦 Using content snapshot {snapshot_key}")
+            return json.loads(cached)
+        return None
+    
+    async def _collect_content(self, request: ShowRequest, location: Location, show_preset = None,
+                               timeout: float = 30.0) -> Dict[str, Any]:
         """Collect content using modular configuration with category filtering"""
         try:
             # Build parameters for data collection
@@ -437,9 +1000,9 @@ class ModularShowOrchestrationService:
                 logger.info(f"🎯 Using category filter from preset: {show_preset.feed_category}")
             
             # Use location from database for weather API
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with create_async_client(timeout=timeout) as client:
                 response = await client.get(
-                    "http://data-collector-service:8004/content",
+                    f"{DATA_COLLECTOR_SERVICE_URL}/content",
                     params=params
                 )
                 
@@ -459,47 +1022,26 @@ class ModularShowOrchestrationService:
                 detail="Show Service: Content Service connection failed"
             )
     
-    def _parse_script_segments(self, script: str) -> List[Dict[str, Any]]:
-        """Parse script into speaker segments"""
-        segments = []
-        current_speaker = None
-        current_text = ""
-        
-        for line in script.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            
-            if line.startswith('[MARCEL]'):
-                if current_speaker and current_text:
-                    segments.append({
-                        "speaker": current_speaker,
-                        "text": current_text.strip(),
-                        "duration_estimate": len(current_text.split()) * 0.5
-                    })
-                current_speaker = "marcel"
-                current_text = line[8:].strip()
-            elif line.startswith('[JARVIS]'):
-                if current_speaker and current_text:
-                    segments.append({
-                        "speaker": current_speaker,
-                        "text": current_text.strip(),
-                        "duration_estimate": len(current_text.split()) * 0.5
-                    })
-                current_speaker = "jarvis"
-                current_text = line[8:].strip()
-            else:
-                current_text += " " + line
-        
-        # Add final segment
-        if current_speaker and current_text:
-            segments.append({
-                "speaker": current_speaker,
-                "text": current_text.strip(),
-                "duration_estimate": len(current_text.split()) * 0.5
-            })
-        
-        return segments
+    @staticmethod
+    def _air_deadline(air_time: Optional[str]) -> Optional[float]:
+        """ISO Sendezeit -> epoch (None wenn fehlend oder ungültig)"""
+        if air_time:
+            try:
+                return datetime.fromisoformat(air_time.replace("Z", "+00:00")).timestamp()
+            except ValueError:
+                logger.warning(f"⚠️ Invalid air_time {air_time}")
+        return None
+    
+    def _parse_script_segments(self, script_segments: List[ScriptSegment]) -> List[Dict[str, Any]]:
+        """Convert tokenized script segments into response segments"""
+        return [
+            {
+                "speaker": segment.speaker,
+                "text": segment.text,
+                "duration_estimate": segment.word_count * 0.5
+            }
+            for segment in script_segments
+        ]
     
     def _estimate_duration(self, script: str) -> int:
         """Estimate duration in minutes"""
@@ -547,28 +1089,48 @@ class ModularShowOrchestrationService:
             }
             
             # Use direct Supabase client for insert
-            result = db_client.client.table("shows").insert(show_data).execute()
+            result = await asyncio.to_thread(
+                lambda: db_client.table("shows").insert(show_data).execute()
+            )
+            
+            # Invalidate cached first page of the database-service show listing
+            if redis_client:
+                try:
+                    await redis_client.incr("database:shows:version")
+                except Exception as e:
+                    logger.warning(f"⚠️ Show list cache invalidation failed: {e}")
             
             logger.info(f"✅ Show data stored with modular config: {session_id}")
             
         except Exception as e:
             logger.error(f"❌ Failed to store show data: {e}")
     
-    async def _generate_audio(self, session_id: str, script: str, request: ShowRequest) -> Optional[Dict[str, Any]]:
+    async def _generate_audio(
+        self, session_id: str, script: str, request: ShowRequest, voice_quality: str = "mid",
+        duration_minutes: int = 1, deadline: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
         """Generate audio for the script"""
         try:
-            async with httpx.AsyncClient(timeout=300.0) as client:
+            audio_start = time.perf_counter()
+            async with create_async_client(timeout=300.0) as client:
                 response = await client.post(
-                    "http://audio-service:8004/generate",
+                    f"{AUDIO_SERVICE_URL}/script",
                     json={
                         "session_id": session_id,
-                        "script": script,
-                        "primary_speaker": request.primary_speaker,
-                        "secondary_speaker": request.secondary_speaker
+                        "script_content": script,
+                        "language": request.language or "de",
+                        "priority": request.priority,
+                        "tenant": request.preset_name or request.channel,
+                        "air_time": datetime.fromtimestamp(deadline).isoformat() if deadline else request.air_time,
+                        "voice_quality": voice_quality
                     }
                 )
                 
                 if response.status_code == 200:
+                    if voice_quality != "low":
+                        self.latency_model.observe(
+                            "audio_per_minute", (time.perf_counter() - audio_start) * 1000 / max(1, duration_minutes)
+                        )
                     return response.json()
                 else:
                     logger.warning(f"⚠️ Audio generation failed: {response.status_code}")
@@ -582,23 +1144,488 @@ class ModularShowOrchestrationService:
 
 # Service instances
 orchestration_service = ModularShowOrchestrationService()
+article_digests = ArticleDigestCache(
+    orchestration_service.script_generator.condense_articles,
+    ttl=DIGEST_TTL_SECONDS,
+    batch_size=DIGEST_BATCH_SIZE,
+    model=DIGEST_MODEL,
+)
+
+# Speculative pre-generation of scheduled shows (show_schedule table)
+PREGEN_ENABLED = os.getenv("PREGEN_ENABLED", "false").lower() == "true"   # opt-in - spends GPT / TTS on every slot
+PREGEN_TICK_SECONDS = float(os.getenv("PREGEN_TICK_SECONDS", "30"))
+PREGEN_SCHEDULE_RELOAD_SECONDS = float(os.getenv("PREGEN_SCHEDULE_RELOAD_SECONDS", "300"))
+PREGEN_SLOT_GRACE_MINUTES = 10   # a slot keeps serving its version until 10 minutes after air
+PREGEN_REDIS_PREFIX = "show:pregen:"
+PREGEN_LOCK_PREFIX = "show:pregen:lock:"   # one replica generates / refreshes a slot, the others adopt its version
+PREGEN_LOCK_SECONDS = float(os.getenv("PREGEN_LOCK_SECONDS", "900"))
+_PREGEN_UNLOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+@dataclass
+class ScheduleEntry:
+    """One row of show_schedule - a show that airs at a fixed local time"""
+    preset_name: Optional[str]
+    location_code: Optional[str]
+    air_time: str                     # "17:00" local time of the location
+    days_of_week: List[str]
+    lead_minutes: int = 15            # generate this long before air
+    refresh_minutes: int = 3          # re-check source data this long before air
+    duration_minutes: Optional[int] = None
+    generate_audio: bool = True
+    timezone: str = "Europe/Zurich"
+    
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "ScheduleEntry":
+        days = row.get("days_of_week") or WEEKDAYS
+        if isinstance(days, str):
+            days = [day.strip().lower()[:3] for day in days.split(",") if day.strip()]
+        return cls(
+            preset_name=row.get("preset_name"),
+            location_code=row.get("location_code"),
+            air_time=str(row["air_time"])[:5],
+            days_of_week=list(days),
+            lead_minutes=int(row.get("lead_minutes") or 15),
+            refresh_minutes=int(row.get("refresh_minutes") or 3),
+            duration_minutes=row.get("duration_minutes"),
+            generate_audio=row.get("generate_audio", True) is not False,
+            timezone=row.get("timezone") or "Europe/Zurich"
+        )
+    
+    @property
+    def name(self) -> str:
+        return self.preset_name or self.location_code or "default"
+    
+    def next_air(self, now: datetime) -> Optional[datetime]:
+        """Next (or just started) airing in the entry's timezone"""
+        tz = pytz.timezone(self.timezone)
+        local_now = now.astimezone(tz)
+        hour, minute = (int(part) for part in self.air_time.split(":"))
+        for offset in range(8):
+            day = local_now.date() + timedelta(days=offset)
+            if WEEKDAYS[day.weekday()] not in self.days_of_week:
+                continue
+            air = tz.localize(datetime(day.year, day.month, day.day, hour, minute))
+            if air + timedelta(minutes=PREGEN_SLOT_GRACE_MINUTES) > local_now:
+                return air
+        return None
+    
+    def slot_key(self, air: datetime) -> str:
+        return f"{self.name}@{air:%Y-%m-%dT%H:%M}"
+
+@dataclass
+class PregeneratedShow:
+    """Latest ready version of a scheduled slot"""
+    slot_key: str
+    air_time: str
+    response: Dict[str, Any]
+    fingerprint: str
+    generated_at: float
+    audio: Optional[Dict[str, Any]] = None
+    refreshed: bool = False           # source data re-checked close to air
+    
+    def to_summary(self) -> Dict[str, Any]:
+        return {
+            "slot": self.slot_key,
+            "air_time": self.air_time,
+            "session_id": self.response.get("session_id"),
+            "generated_at": datetime.fromtimestamp(self.generated_at).isoformat(),
+            "fingerprint": self.fingerprint,
+            "audio_url": (self.audio or {}).get("audio_url"),
+            "refreshed": self.refreshed
+        }
+
+class ShowPregenerator:
+    """Pre-generates scheduled shows before their slot and serves them on demand
+    
+    lead_minutes before air: content, script and audio are generated as batch
+    work (the air time is the scheduler deadline). refresh_minutes before air
+    the source data is collected again; only if its fingerprint changed is the
+    show regenerated. Ready versions live in memory and in Redis (other
+    replicas serve them too) until shortly after air. A per-slot Redis lock
+    lets one replica do the work; the others adopt the version it publishes.
+    """
+    
+    def __init__(self, orchestration: ModularShowOrchestrationService):
+        self.orchestration = orchestration
+        self.entries: List[ScheduleEntry] = []
+        self.ready: Dict[str, PregeneratedShow] = {}
+        self._in_flight: set = set()
+        self._task: Optional[asyncio.Task] = None
+        self._schedule_loaded_at = 0.0
+        self.stats = {"generated": 0, "refreshed_unchanged": 0, "regenerated": 0, "served": 0, "failed": 0}
+    
+    async def load_schedule(self) -> int:
+        # Counts as an attempt even if it fails - a missing table is retried per reload interval, not per tick
+        self._schedule_loaded_at = time.time()
+        db_client = get_db_client(ConnectionType.READONLY)
+        result = await asyncio.to_thread(
+            lambda: db_client.table("show_schedule").select("*").eq("is_active", True).execute()
+        )
+        entries = []
+        for row in result.data or []:
+            try:
+                entries.append(ScheduleEntry.from_row(row))
+            except (KeyError, ValueError) as e:
+                logger.warning(f"⚠️ Invalid show_schedule row {row.get('id')}: {e}")
+        self.entries = entries
+        logger.info(f"📅 Show schedule loaded: {len(entries)} slots")
+        return len(entries)
+    
+    def _request_for(self, entry: ScheduleEntry, air: datetime) -> ShowRequest:
+        return ShowRequest(
+            preset_name=entry.preset_name,
+            channel=entry.location_code,
+            target_time=entry.air_time,
+            duration_minutes=entry.duration_minutes,
+            generate_audio=False,
+            priority=PriorityClass.BATCH.value,
+            air_time=air.isoformat()
+        )
+    
+    async def _generate(self, entry: ScheduleEntry, air: datetime, slot_key: str,
+                        refreshed: bool = False) -> PregeneratedShow:
+        request = self._request_for(entry, air)
+        response = await self.orchestration.generate_show(request)
+        audio = None
+        if entry.generate_audio:
+            audio = await self.orchestration._generate_audio(
+                response.session_id, response.script_content, request,
+                voice_quality=response.metadata.get("voice_quality", "mid"),
+                duration_minutes=entry.duration_minutes or response.estimated_duration_minutes,
+                deadline=air.timestamp()
+            )
+        show = PregeneratedShow(
+            slot_key=slot_key,
+            air_time=air.isoformat(),
+            response=response.model_dump(),
+            fingerprint=response.metadata.get("content_fingerprint", ""),
+            generated_at=time.time(),
+            audio=audio,
+            refreshed=refreshed
+        )
+        await self._publish(show, air)
+        logger.info(f"🗓️ Pre-generated {slot_key}: {response.session_id}")
+        return show
+    
+    async def _source_changed(self, entry: ScheduleEntry, show: PregeneratedShow) -> bool:
+        """Collect the slot's content again and compare fingerprints"""
+        request = self._request_for(entry, datetime.fromisoformat(show.air_time))
+        show_preset = await modular_config.get_show_preset(entry.preset_name) if entry.preset_name else None
+        location = show_preset.location if show_preset else await modular_config.get_location(entry.location_code or "zurich")
+        if not location:
+            return False
+        content = await self.orchestration._collect_content(request, location, show_preset)
+        return content_fingerprint(content) != show.fingerprint
+    
+    async def _publish(self, show: PregeneratedShow, air: datetime):
+        self.ready[show.slot_key] = show
+        if redis_client:
+            ttl = max(60, int(air.timestamp() - time.time()) + PREGEN_SLOT_GRACE_MINUTES * 60)
+            try:
+                await redis_client.setex(PREGEN_REDIS_PREFIX + show.slot_key, ttl, json.dumps(show.__dict__, default=str))
+            except Exception as e:
+                logger.warning(f"⚠️ Pre-generated show not shared via Redis: {e}")
+    
+    async def _shared(self, slot_key: str) -> Optional[PregeneratedShow]:
+        """Version of a slot published to Redis (by this or another replica)"""
+        if not redis_client:
+            return None
+        try:
+            cached = await redis_client.get(PREGEN_REDIS_PREFIX + slot_key)
+        except Exception as e:
+            logger.warning(f"⚠️ Pre-generated show lookup failed: {e}")
+            return None
+        return PregeneratedShow(**json.loads(cached)) if cached else None
+    
+    async def _claim(self, slot_key: str) -> Optional[str]:
+        """Per-slot lock token - None while another replica works on the slot"""
+        token = uuid.uuid4().hex
+        if not redis_client:
+            return token
+        try:
+            acquired = await redis_client.set(PREGEN_LOCK_PREFIX + slot_key, token, nx=True, ex=int(PREGEN_LOCK_SECONDS))
+        except Exception as e:
+            logger.warning(f"⚠️ Pre-generation lock unavailable, working on {slot_key} locally: {e}")
+            return token
+        return token if acquired else None
+    
+    async def _release(self, slot_key: str, token: str):
+        if not redis_client:
+            return
+        try:
+            await redis_client.eval(_PREGEN_UNLOCK_SCRIPT, 1, PREGEN_LOCK_PREFIX + slot_key, token)
+        except Exception as e:
+            logger.warning(f"⚠️ Pre-generation unlock failed for {slot_key}: {e}")
+    
+    async def _process(self, entry: ScheduleEntry, now: datetime):
+        air = entry.next_air(now)
+        if not air:
+            return
+        slot_key = entry.slot_key(air)
+        seconds_to_air = (air - now).total_seconds()
+        if slot_key in self._in_flight or seconds_to_air > entry.lead_minutes * 60:
+            return
+        
+        show = self.ready.get(slot_key)
+        if not show or not show.refreshed:
+            # Another replica may already have generated or refreshed the slot
+            shared = await self._shared(slot_key)
+            if shared and (not show or shared.refreshed or shared.generated_at > show.generated_at):
+                self.ready[slot_key] = show = shared
+        needs_refresh = show and not show.refreshed and 0 < seconds_to_air <= entry.refresh_minutes * 60
+        if show and not needs_refresh:
+            return
+        if not show and seconds_to_air <= 0:
+            return  # already on air - too late to pre-generate
+        
+        token = await self._claim(slot_key)
+        if not token:
+            return  # another replica is on it - its version is adopted on a later tick
+        self._in_flight.add(slot_key)
+        try:
+            if not show:
+                await self._generate(entry, air, slot_key)
+                self.stats["generated"] += 1
+            elif await self._source_changed(entry, show):
+                logger.info(f"🔄 Source data changed for {slot_key} - regenerating before air")
+                await self._generate(entry, air, slot_key, refreshed=True)
+                self.stats["regenerated"] += 1
+            else:
+                # Published again so the other replicas skip the refresh too
+                await self._publish(replace(show, refreshed=True), air)
+                self.stats["refreshed_unchanged"] += 1
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.error(f"❌ Pre-generation failed for {slot_key}: {e}")
+        finally:
+            self._in_flight.discard(slot_key)
+            await self._release(slot_key, token)
+    
+    async def tick(self):
+        if time.time() - self._schedule_loaded_at > PREGEN_SCHEDULE_RELOAD_SECONDS:
+            try:
+                await self.load_schedule()
+            except Exception as e:
+                logger.warning(f"⚠️ Show schedule reload failed, keeping {len(self.entries)} slots: {e}")
+        now = datetime.now(pytz.utc)
+        # Forget slots that are off air
+        cutoff = now - timedelta(minutes=PREGEN_SLOT_GRACE_MINUTES)
+        self.ready = {key: show for key, show in self.ready.items() if datetime.fromisoformat(show.air_time) > cutoff}
+        await asyncio.gather(*(self._process(entry, now) for entry in self.entries))
+    
+    async def _loop(self):
+        while True:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error(f"❌ Pre-generation tick failed: {e}")
+            await asyncio.sleep(PREGEN_TICK_SECONDS)
+    
+    def start(self):
+        self._task = asyncio.create_task(self._loop())
+        logger.info(f"✅ Show pre-generation started (tick {PREGEN_TICK_SECONDS:.0f}s)")
+    
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+    
+    def _matching_entry(self, request: ShowRequest, now: datetime) -> Optional[Tuple[ScheduleEntry, datetime]]:
+        requested = request.target_time or request.air_time
+        if not requested:
+            return None
+        for entry in self.entries:
+            if request.preset_name != entry.preset_name:
+                continue
+            if not entry.preset_name and request.channel and request.channel != entry.location_code:
+                continue
+            if request.duration_minutes and request.duration_minutes != entry.duration_minutes:
+                continue
+            air = entry.next_air(now)
+            if not air:
+                continue
+            if request.air_time:
+                try:
+                    requested_air = datetime.fromisoformat(request.air_time.replace("Z", "+00:00"))
+                except ValueError:
+                    return None
+                if requested_air.tzinfo is None:
+                    requested_air = pytz.timezone(entry.timezone).localize(requested_air)
+                if abs((requested_air - air).total_seconds()) < 60:
+                    return entry, air
+            elif requested[:5] == entry.air_time:
+                return entry, air
+        return None
+    
+    async def lookup(self, request: ShowRequest) -> Optional[ShowResponse]:
+        """Ready version of the requested slot (memory, then Redis) - None if not pre-generated"""
+        match = self._matching_entry(request, datetime.now(pytz.utc))
+        if not match:
+            return None
+        entry, air = match
+        slot_key = entry.slot_key(air)
+        
+        show = self.ready.get(slot_key) or await self._shared(slot_key)
+        if not show:
+            return None
+        
+        self.stats["served"] += 1
+        response = dict(show.response)
+        response["metadata"] = {
+            **response.get("metadata", {}),
+            "pregenerated": True,
+            "pregenerated_slot": slot_key,
+            "pregenerated_at": datetime.fromtimestamp(show.generated_at).isoformat(),
+            "audio_url": (show.audio or {}).get("audio_url")
+        }
+        return ShowResponse(**response)
+    
+    def summary(self) -> Dict[str, Any]:
+        now = datetime.now(pytz.utc)
+        slots = []
+        for entry in self.entries:
+            air = entry.next_air(now)
+            slot_key = entry.slot_key(air) if air else None
+            show = self.ready.get(slot_key) if slot_key else None
+            slots.append({
+                "slot": slot_key or entry.name,
+                "air_time": air.isoformat() if air else None,
+                "lead_minutes": entry.lead_minutes,
+                "status": "ready" if show else ("generating" if slot_key in self._in_flight else "pending"),
+                "ready": show.to_summary() if show else None
+            })
+        return {"enabled": PREGEN_ENABLED, "slots": slots, "stats": self.stats}
+
+show_pregenerator = ShowPregenerator(orchestration_service)
 
 # API Endpoints
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    return {
-        "status": "healthy",
+    """Health check - serves the background dependency snapshot (no live calls)"""
+    snapshot = health_monitor.snapshot()
+    snapshot.update({
         "service": "RadioX Show Service - Modular",
         "version": "2.0.0",
         "modular": True,
         "hardcoding": "eliminated"
-    }
+    })
+    
+    if snapshot["status"] == "unhealthy":
+        raise HTTPException(status_code=503, detail=snapshot)
+    
+    return snapshot
+
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe - touches nothing external"""
+    return health_monitor.liveness()
+
+@app.get("/scheduler")
+async def get_gpt_scheduler():
+    """GPT scheduling - queue wait per priority class, missed deadlines, tenant shares"""
+    return gpt_scheduler.stats()
+
+@app.get("/single-flight")
+async def get_single_flight():
+    """Coalesced /generate requests - pipelines run vs callers that joined one"""
+    return show_flight.summary()
+
+@app.get("/article-digests")
+async def get_article_digests():
+    """Article digest cache - hits, condensation batches, tokens saved per article"""
+    return article_digests.summary()
+
+@app.get("/llm")
+async def get_llm():
+    """LLM routing - per-route latency, error rate, hedges and cost of script / digest calls"""
+    return {"script": script_llm.summary(), "digest": digest_llm.summary()}
+
+@app.get("/config/snapshot")
+async def get_config_snapshot():
+    """Version and size of the in-memory configuration snapshot"""
+    return modular_config.snapshot_info()
+
+@app.post("/config/reload")
+async def reload_config_snapshot():
+    """Reload the configuration snapshot here and on every other replica (config:invalidate)"""
+    try:
+        await modular_config.invalidate("show-service /config/reload")
+    except Exception as e:
+        logger.error(f"❌ Config snapshot reload failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Config reload failed: {str(e)}")
+    return {"success": True, **modular_config.snapshot_info()}
+
+@app.get("/schedule")
+async def get_show_schedule():
+    """Scheduled slots and their pre-generated versions"""
+    return show_pregenerator.summary()
+
+@app.post("/schedule/reload")
+async def reload_show_schedule():
+    """Reload show_schedule and run one pre-generation pass now"""
+    try:
+        count = await show_pregenerator.load_schedule()
+        await show_pregenerator.tick()
+    except Exception as e:
+        logger.error(f"❌ Show schedule reload failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Schedule reload failed: {str(e)}")
+    return {"success": True, "slots": count, **show_pregenerator.summary()}
 
 @app.post("/generate", response_model=ShowResponse)
 async def generate_show(request: ShowRequest):
     """Generate a radio show using modular configuration"""
-    return await orchestration_service.generate_show(request)
+    # Pre-generated version of a scheduled slot - served instantly
+    pregenerated = await show_pregenerator.lookup(request)
+    if pregenerated:
+        return pregenerated
+    # Same preset / time / options requested concurrently (refresh, scheduler, manual) - one pipeline
+    # The priority class is not part of the key - a joining caller takes the running show as it is
+    return await show_flight.do(
+        flight_key("generate", request.model_dump(exclude={"priority"})),
+        lambda: orchestration_service.generate_show(request),
+        encode=lambda response: response.model_dump(),
+        decode=lambda data: ShowResponse(**data)
+    )
+
+@app.post("/generate/stream")
+async def generate_show_stream(request: ShowRequest):
+    """Generate a radio show as Server-Sent Events (stage timings, script tokens, segments, audio)"""
+    progress = ShowProgress()
+
+    async def run():
+        try:
+            pregenerated = await show_pregenerator.lookup(request)
+            if pregenerated:
+                progress.emit("started", session_id=pregenerated.session_id, pregenerated=True)
+            response = pregenerated or await orchestration_service.generate_show(request, progress)
+            progress.emit("complete", **response.model_dump())
+        except HTTPException as e:
+            progress.emit("error", status_code=e.status_code, detail=e.detail)
+        except Exception as e:
+            logger.error(f"❌ Streamed show generation failed: {e}")
+            progress.emit("error", status_code=500, detail=str(e))
+        finally:
+            progress.close()
+
+    # Generation continues if the client goes away - the show is still stored
+    progress.task = asyncio.create_task(run())
+    return StreamingResponse(progress.events(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+@app.post("/generate/batch")
+async def generate_show_batch(request: ShowBatchRequest):
+    """Generate several shows at once - shared content collection and script calls, work saved reported"""
+    if not request.shows:
+        raise HTTPException(status_code=400, detail="Batch requires at least one show")
+    if len(request.shows) > BATCH_MAX_SHOWS:
+        raise HTTPException(status_code=400, detail=f"Batch limited to {BATCH_MAX_SHOWS} shows")
+    return await orchestration_service.generate_batch(request.shows)
 
 @app.get("/styles")
 async def get_broadcast_styles():